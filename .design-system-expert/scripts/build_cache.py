@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Build Cache
+Persistent on-disk cache for token pipeline results, keyed by content hash.
+
+Each entry stores the result of one pipeline stage (parsed tree, resolved
+references, validation results) for one source file. Entries are looked up
+by the SHA-256 of the source content, so unchanged files skip the stage
+entirely. The cache directory is bounded in size and evicts the least
+recently used entries first.
+
+write_if_changed replaces a generated file atomically, and only when its
+content differs, so unchanged outputs keep their modification times.
+
+Usage:
+    python build_cache.py --cache-dir .token-cache --stats
+    python build_cache.py --cache-dir .token-cache --clear
+"""
+
+import hashlib
+import json
+import os
+import argparse
+import secrets
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable, TextIO, Tuple
+
+from cli_options import DEFAULT_CACHE_SIZE_MB, add_cache_arguments
+
+
+
+class BuildCache:
+    """Content-addressed cache of pipeline stage results with LRU eviction."""
+    
+    # Bump when the layout or meaning of cached entries changes
+    CACHE_VERSION = 1
+    
+    DEFAULT_MAX_SIZE = DEFAULT_CACHE_SIZE_MB * 1024 * 1024
+    
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """Return the SHA-256 hex digest of a file's content."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def hash_sources(*file_paths: str) -> str:
+        """Return a short digest of source files, used to invalidate entries when code changes."""
+        digest = hashlib.sha256()
+        for file_path in file_paths:
+            with open(file_path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()[:16]
+    
+    def entry_path(self, stage: str, digest: str, params: Optional[Dict[str, Any]] = None) -> Path:
+        """Return the file holding the entry for a stage, content hash and parameters."""
+        key = hashlib.sha256(
+            json.dumps([self.CACHE_VERSION, stage, digest, params], sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        return self.cache_dir / stage / f"{key}.json"
+    
+    def get(self, stage: str, digest: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Return the cached result, or None on a miss."""
+        path = self.entry_path(stage, digest, params)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        
+        # Refresh the access time used for LRU ordering
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        
+        self.hits += 1
+        return value
+    
+    def put(self, stage: str, digest: str, value: Any, params: Optional[Dict[str, Any]] = None) -> None:
+        """Store a result atomically, then evict old entries if over the size limit."""
+        path = self.entry_path(stage, digest, params)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        
+        self.evict()
+    
+    def entries(self):
+        """Return (path, size, last access) for every cached entry."""
+        result = []
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            result.append((path, stat.st_size, stat.st_mtime))
+        return result
+    
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits in max_size."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        
+        return removed
+    
+    def clear(self) -> int:
+        """Remove every cached entry."""
+        removed = 0
+        for path, _, _ in self.entries():
+            path.unlink()
+            removed += 1
+        return removed
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count, total size and hit/miss counters."""
+        entries = self.entries()
+        return {
+            "entries": len(entries),
+            "size": sum(size for _, size, _ in entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+def cache_from_args(args: argparse.Namespace) -> Optional[BuildCache]:
+    """Create a BuildCache from parsed --cache-dir/--cache-size options."""
+    if not args.cache_dir:
+        return None
+    return BuildCache(args.cache_dir, max_size=args.cache_size * 1024 * 1024)
+
+
+def read_text(stream: TextIO, size: int) -> Optional[str]:
+    """Read up to size characters, or return None if the stream is not valid UTF-8."""
+    try:
+        return stream.read(size)
+    except UnicodeDecodeError:
+        return None
+
+
+def make_temp_file(directory: Path, prefix: str = '', suffix: str = '.tmp') -> Tuple[int, str]:
+    """Create a uniquely named file in directory, like tempfile.mkstemp.
+
+    Unlike mkstemp's 0600, the file is created with mode 0666 and the OS
+    applies the umask, so a generated file moved into place gets the
+    permissions open() would give it. Returns (fd, path).
+    """
+    while True:
+        path = os.path.join(directory, f"{prefix}{secrets.token_hex(8)}{suffix}")
+        try:
+            return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), path
+        except FileExistsError:
+            continue
+
+
+def write_if_changed(output_file: Path, chunks: Iterable[str]) -> bool:
+    """Stream chunks to a temporary file and move it into place only if the content differs.
+
+    The existing file is compared chunk by chunk while writing, so neither
+    version is held in memory. Returns whether the file was replaced.
+    """
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = make_temp_file(output_file.parent, prefix=f".{output_file.name}.")
+    try:
+        try:
+            existing = open(output_file, 'r', encoding='utf-8', newline='')
+        except OSError:
+            existing = None
+        try:
+            same = existing is not None
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    if same:
+                        same = read_text(existing, len(chunk)) == chunk
+            if same:
+                same = read_text(existing, 1) == ''
+        finally:
+            if existing is not None:
+                existing.close()
+        
+        if same:
+            os.unlink(tmp_path)
+            return False
+        os.replace(tmp_path, output_file)
+        return True
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Inspect or clear the token build cache'
+    )
+    add_cache_arguments(parser)
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Show cache statistics'
+    )
+    parser.add_argument(
+        '--clear',
+        action='store_true',
+        help='Remove all cache entries'
+    )
+    
+    args = parser.parse_args()
+    
+    if not args.cache_dir:
+        print("Error: --cache-dir is required")
+        return 1
+    
+    cache = cache_from_args(args)
+    
+    if args.clear:
+        removed = cache.clear()
+        print(f"✓ Removed {removed} cache entries from {cache.cache_dir}")
+    
+    if args.stats or not args.clear:
+        stats = cache.stats()
+        print(f"Cache: {cache.cache_dir}")
+        print(f"  Entries: {stats['entries']}")
+        print(f"  Size: {stats['size'] / 1024:.1f} KB / {stats['max_size'] / (1024 * 1024):.0f} MB")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Build Driver
+Builds every platform from one resolved token dictionary, in parallel.
+
+The token sources are loaded, merged, resolved and flattened once into an
+immutable tuple of tokens. Each platform then only runs its own transform
+and format steps against that shared tuple, concurrently in a process pool
+(or thread pool), so the total build time approaches that of the slowest
+platform. Platforms come from sd.config.mjs by default, or from a config
+written by style_dictionary_config_generator.py.
+
+Builds are incremental: the build manifest (see build_manifest.py) maps each
+output back to its tokens, outputs whose tokens and config are unchanged are
+skipped, and files are only rewritten when their content differs. The report
+lists every regenerated output with the reason. --force renders everything.
+
+Usage:
+    python build_driver.py --source 'tokens/**/*.json'
+    python build_driver.py --config config.json --workers 4 --executor thread
+    python build_driver.py --source 'tokens/**/*.json' --force
+"""
+
+import json
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+from build_manifest import BuildManifest, emit_platform_delta
+from platform_emitters import PLATFORMS, Token, load_dictionary, js_key_order, flatten_tokens
+from profiler import Profiler, NULL_PROFILER, add_profile_arguments, profiler_from_args, finish_profile
+
+
+# Tokens shared with the platform workers of a process pool
+_shared_tokens: Tuple[Token, ...] = ()
+
+
+def init_worker(tokens: Tuple[Token, ...]) -> None:
+    """Receive the shared token tuple once per worker process."""
+    global _shared_tokens
+    _shared_tokens = tokens
+
+
+def build_platform_worker(name: str, platform: Dict[str, Any], root: str,
+                          tokens: Optional[Sequence[Token]] = None,
+                          previous: Optional[Dict[str, Dict[str, Any]]] = None,
+                          force: bool = False) -> Dict[str, Any]:
+    """Run one platform's transform and format steps where inputs changed and report its outputs."""
+    start = time.perf_counter()
+    outputs = emit_platform_delta(platform, _shared_tokens if tokens is None else tokens,
+                                  Path(root), previous, force)
+    return {
+        "platform": name,
+        "files": [output['file'] for output in outputs],
+        "outputs": outputs,
+        "elapsed_ms": (time.perf_counter() - start) * 1000
+    }
+
+
+class BuildDriver:
+    """Resolves tokens once and emits all platforms from the shared result."""
+    
+    def __init__(self, platforms: Dict[str, Dict[str, Any]], root: str = '.',
+                 profiler: Optional[Profiler] = None):
+        self.platforms = platforms
+        self.root = root
+        self.profiler = profiler or NULL_PROFILER
+        self.tokens: Tuple[Token, ...] = ()
+        self.timings: Dict[str, float] = {}
+    
+    def load(self, source_patterns: List[str]) -> Tuple[Token, ...]:
+        """Load, merge, resolve and flatten the token sources."""
+        start = time.perf_counter()
+        with self.profiler.stage('parse') as stage:
+            tree = load_dictionary(source_patterns)
+            stage['categories'] = len(tree)
+        with self.profiler.stage('resolve') as stage:
+            self.tokens = flatten_tokens(tree)
+            stage['tokens'] = len(self.tokens)
+        self.timings['resolve'] = (time.perf_counter() - start) * 1000
+        return self.tokens
+    
+    def load_tree(self, tree: Dict[str, Any]) -> Tuple[Token, ...]:
+        """Resolve and flatten a token tree that is already in memory."""
+        start = time.perf_counter()
+        with self.profiler.stage('resolve') as stage:
+            self.tokens = flatten_tokens(js_key_order(tree))
+            stage['tokens'] = len(self.tokens)
+        self.timings['resolve'] = (time.perf_counter() - start) * 1000
+        return self.tokens
+    
+    def build(self, workers: Optional[int] = None, executor: str = 'process',
+              force: bool = False) -> List[Dict[str, Any]]:
+        """Emit every platform whose outputs are out of date, concurrently unless workers is 1."""
+        start = time.perf_counter()
+        names = list(self.platforms)
+        workers = min(workers or os.cpu_count() or 1, len(names)) or 1
+        manifest = BuildManifest(self.root)
+        previous = manifest.load()
+        
+        with self.profiler.stage('emit', platforms=len(names), workers=workers) as stage:
+            results = self.run_platforms(names, workers, executor, previous, force)
+            outputs = [output for result in results for output in result['outputs']]
+            stage['files'] = len(outputs)
+            stage['written'] = sum(1 for output in outputs if output['status'] == 'written')
+        
+        manifest.update(outputs)
+        manifest.save()
+        self.timings['emit'] = (time.perf_counter() - start) * 1000
+        return results
+    
+    def run_platforms(self, names: List[str], workers: int, executor: str,
+                      previous: Optional[Dict[str, Dict[str, Any]]] = None,
+                      force: bool = False) -> List[Dict[str, Any]]:
+        """Run the platform workers serially, in threads or in processes."""
+        configs = [self.platforms[name] for name in names]
+        roots = [self.root] * len(names)
+        previous = [previous or {}] * len(names)
+        forced = [force] * len(names)
+        if workers == 1:
+            results = [
+                build_platform_worker(name, config, self.root, self.tokens, entries, force)
+                for name, config, entries in zip(names, configs, previous)
+            ]
+        elif executor == 'thread':
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(
+                    build_platform_worker, names, configs, roots,
+                    [self.tokens] * len(names), previous, forced
+                ))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                     initargs=(self.tokens,)) as pool:
+                results = list(pool.map(
+                    build_platform_worker, names, configs, roots,
+                    [None] * len(names), previous, forced
+                ))
+        return results
+
+
+def report_outputs(outputs: List[Dict[str, Any]]) -> List[str]:
+    """Return one report line per output: its status, path and why it was rendered."""
+    lines = []
+    for output in outputs:
+        if output['status'] == 'written':
+            lines.append(f"✓ {output['file']} ({'; '.join(output['reasons'])})")
+        elif output['status'] == 'identical':
+            lines.append(f"= {output['file']} (content unchanged; {'; '.join(output['reasons'])})")
+        else:
+            lines.append(f"· {output['file']} (up to date)")
+    return lines
+
+
+def load_platforms(config_file: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Return the platforms of a generated config file, or those of sd.config.mjs."""
+    if not config_file:
+        return dict(PLATFORMS)
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return json.load(f)['platforms']
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Build all token platforms in parallel from one resolved dictionary'
+    )
+    parser.add_argument(
+        '--source',
+        nargs='+',
+        help='Token source glob patterns (default: from --config, else tokens/**/*.json)'
+    )
+    parser.add_argument(
+        '--config',
+        help='Style Dictionary config JSON to take platforms from (default: sd.config.mjs platforms)'
+    )
+    parser.add_argument(
+        '--platforms',
+        help='Comma-separated subset of platforms to build (default: all)'
+    )
+    parser.add_argument(
+        '--root',
+        default='.',
+        help='Directory that build paths are relative to (default: .)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of parallel workers (default: one per platform, up to CPU count)'
+    )
+    parser.add_argument(
+        '--executor',
+        choices=['process', 'thread'],
+        default='process',
+        help='Worker pool type (default: process)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Render every output, even if its inputs are unchanged'
+    )
+    add_profile_arguments(parser)
+    
+    args = parser.parse_args()
+    
+    try:
+        platforms = load_platforms(args.config)
+        sources = args.source
+        if not sources and args.config:
+            with open(args.config, 'r', encoding='utf-8') as f:
+                sources = json.load(f).get('source')
+        sources = sources or ['tokens/**/*.json']
+        
+        if args.platforms:
+            selected = [p.strip() for p in args.platforms.split(',')]
+            unknown = [p for p in selected if p not in platforms]
+            if unknown:
+                print(f"Error: Unknown platform(s): {', '.join(unknown)}")
+                return 1
+            platforms = {name: platforms[name] for name in selected}
+        
+        profiler = profiler_from_args(args)
+        driver = BuildDriver(platforms, root=args.root, profiler=profiler)
+        if not driver.load(sources):
+            print(f"Error: No tokens found in {', '.join(sources)}")
+            return 1
+        
+        results = driver.build(workers=args.workers, executor=args.executor, force=args.force)
+        
+        for result in results:
+            print(f"{result['platform']} ({result['elapsed_ms']:.1f} ms)")
+            for line in report_outputs(result['outputs']):
+                print(f"  {line}")
+        
+        outputs = [output for result in results for output in result['outputs']]
+        written = sum(1 for output in outputs if output['status'] == 'written')
+        slowest = max(result['elapsed_ms'] for result in results)
+        print(
+            f"\n✅ Built {len(results)} platform(s) from {len(driver.tokens)} tokens, "
+            f"regenerated {written} of {len(outputs)} output(s): "
+            f"resolve {driver.timings['resolve']:.1f} ms, emit {driver.timings['emit']:.1f} ms "
+            f"(slowest platform {slowest:.1f} ms)"
+        )
+        finish_profile(profiler, args)
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Build Manifest
+Maps every platform output, and each section within it, back to the tokens
+that feed it, so builds only regenerate what changed.
+
+For each output file the manifest records a digest of its configuration
+(transform group, format, filter, options, the emitter code and whether the
+NumPy color engine is in use) and, per section, the number and digest of
+the resolved tokens in it. A section is a token group, the first two
+segments of a token path (color.brand, text.primary). Tokens are fingerprinted after aliases are resolved (and, on
+native platforms, calc() and var() folded), so editing a palette color also
+changes every section whose references point at it.
+
+A delta build compares the current fingerprints with the manifest and only
+renders the outputs whose inputs changed, or that are missing or were edited
+since they were written. A rendered output replaces the file on disk
+atomically, and only if its content differs. Every output is reported with
+its status and the reasons for it.
+
+Usage:
+    python build_manifest.py --root . --show
+    python build_manifest.py --root . --token color.brand.600
+"""
+
+import hashlib
+import json
+import os
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Sequence
+
+from build_cache import BuildCache, make_temp_file, write_if_changed
+import color_literals
+import css_expressions
+import platform_emitters
+from platform_emitters import Token, fold_expressions, transform_tokens, render_file
+
+# Path segments that make up a section name
+SECTION_DEPTH = 2
+
+# Filters on these attributes select the same tokens before and after the transforms
+STABLE_ATTRIBUTES = {'path', 'type'}
+
+# Sections named in a reason before the rest are only counted
+MAX_NAMED_SECTIONS = 3
+
+_code_version: Optional[str] = None
+
+
+def code_version() -> str:
+    """Return a digest of the emitter code, so outputs are rebuilt when it changes."""
+    global _code_version
+    if _code_version is None:
+        # color_engine is hashed by path, as importing it needs NumPy
+        color_engine = Path(platform_emitters.__file__).with_name('color_engine.py')
+        _code_version = BuildCache.hash_sources(
+            platform_emitters.__file__, css_expressions.__file__, color_literals.__file__,
+            str(color_engine), __file__
+        )
+    return _code_version
+
+
+def section_name(path: Sequence[str]) -> str:
+    return '.'.join(path[:SECTION_DEPTH])
+
+
+def dependency_tokens(tokens: Sequence[Token], file_config: Dict[str, Any]) -> Sequence[Token]:
+    """Return the resolved tokens an output file depends on.
+
+    Filters on anything but path and type are evaluated after the transforms,
+    so such files conservatively depend on every token of the platform.
+    """
+    file_filter = file_config.get('filter')
+    if not file_filter or not set(file_filter) <= STABLE_ATTRIBUTES:
+        return tokens
+    return [token for token in tokens if platform_emitters.matches_filter(token, file_filter)]
+
+
+def fingerprint_sections(tokens: Iterable[Token]) -> Dict[str, List[Any]]:
+    """Return section -> [token count, digest] in the order sections first appear."""
+    sections: Dict[str, List[Any]] = {}
+    for token in tokens:
+        section = sections.get(section_name(token.path))
+        if section is None:
+            section = sections[section_name(token.path)] = [0, hashlib.sha256()]
+        section[0] += 1
+        section[1].update(f"{'.'.join(token.path)}\0{token.type}\0{token.value!r}\n".encode('utf-8'))
+    return {name: [count, digest.hexdigest()[:16]] for name, (count, digest) in sections.items()}
+
+
+def config_digest(platform: Dict[str, Any], file_config: Dict[str, Any]) -> str:
+    # Colors are converted by the NumPy batch engine when it is importable
+    config = [platform['transformGroup'], file_config, code_version(),
+              platform_emitters.convert_values is not None]
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+
+def file_stamp(path: Path) -> Optional[List[int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def name_sections(names: List[str]) -> str:
+    named = ', '.join(names[:MAX_NAMED_SECTIONS])
+    if len(names) > MAX_NAMED_SECTIONS:
+        named += f" (+{len(names) - MAX_NAMED_SECTIONS} more)"
+    return named
+
+
+def change_reasons(previous: Optional[Dict[str, Any]], entry: Dict[str, Any],
+                   output_file: Path) -> List[str]:
+    """Return why an output must be regenerated; an empty list means it is up to date."""
+    if previous is None:
+        return ['not in manifest']
+    
+    reasons = []
+    stamp = file_stamp(output_file)
+    if stamp is None:
+        reasons.append('output missing')
+    elif stamp != previous.get('stamp'):
+        reasons.append('output edited since last build')
+    if previous.get('config') != entry['config']:
+        reasons.append('config or emitter code changed')
+    
+    old, new = previous.get('sections', {}), entry['sections']
+    changed = [name for name in new if name in old and old[name] != new[name]]
+    added = [name for name in new if name not in old]
+    removed = [name for name in old if name not in new]
+    if changed:
+        reasons.append(f"tokens changed in {name_sections(changed)}")
+    if added:
+        reasons.append(f"sections added: {name_sections(added)}")
+    if removed:
+        reasons.append(f"sections removed: {name_sections(removed)}")
+    if not (changed or added or removed) and list(old) != list(new):
+        reasons.append('sections reordered')
+    return reasons
+
+
+def emit_platform_delta(platform: Dict[str, Any], tokens: Sequence[Token], root: Path,
+                        previous: Optional[Dict[str, Dict[str, Any]]] = None,
+                        force: bool = False) -> List[Dict[str, Any]]:
+    """Emit the files of one platform whose inputs changed since the previous manifest.
+
+    previous maps output keys (paths relative to root) to their manifest
+    entries. Returns one record per file with its key, path, status
+    ('written', 'identical' when rendered but unchanged, or 'skipped'),
+    the reasons it was rendered and its new manifest entry.
+    """
+    previous = previous or {}
+    tokens = fold_expressions(tokens, platform['transformGroup'])
+    transformed = None
+    records = []
+    for file_config in platform['files']:
+        key = Path(platform['buildPath'], file_config['destination']).as_posix()
+        output_file = root / key
+        entry = {
+            "config": config_digest(platform, file_config),
+            "sections": fingerprint_sections(dependency_tokens(tokens, file_config))
+        }
+        reasons = ['forced'] if force else change_reasons(previous.get(key), entry, output_file)
+        
+        if reasons:
+            if transformed is None:
+                transformed = transform_tokens(tokens, platform['transformGroup'])
+            written = write_if_changed(output_file, render_file(transformed, file_config))
+            status = 'written' if written else 'identical'
+            entry['stamp'] = file_stamp(output_file)
+        else:
+            status = 'skipped'
+            entry['stamp'] = previous[key]['stamp']
+        
+        records.append({
+            "key": key,
+            "file": str(output_file),
+            "status": status,
+            "reasons": reasons,
+            "entry": entry
+        })
+    return records
+
+
+class BuildManifest:
+    """The dependency map of the last build under a root directory."""
+    
+    # Bump when the layout or meaning of entries changes
+    MANIFEST_VERSION = 1
+    
+    FILE_NAME = '.build-manifest.json'
+    
+    def __init__(self, root: str = '.'):
+        self.path = Path(root) / self.FILE_NAME
+        self.outputs: Dict[str, Dict[str, Any]] = {}
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the manifest; a missing, unreadable or outdated one is empty."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        self.outputs = data.get('outputs', {}) if data.get('version') == self.MANIFEST_VERSION else {}
+        return self.outputs
+    
+    def update(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.outputs[record['key']] = record['entry']
+    
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = make_temp_file(self.path.parent)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"version": self.MANIFEST_VERSION, "outputs": self.outputs}, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def dependents(self, token_path: str) -> List[str]:
+        """Return the outputs whose sections include a token."""
+        section = section_name(token_path.split('.'))
+        return [key for key, entry in self.outputs.items() if section in entry.get('sections', {})]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Show the dependency map recorded by the last delta build'
+    )
+    parser.add_argument(
+        '--root',
+        default='.',
+        help='Directory the build ran in (default: .)'
+    )
+    parser.add_argument(
+        '--show',
+        action='store_true',
+        help='List every output with its sections and token counts'
+    )
+    parser.add_argument(
+        '--token',
+        help='List the outputs that depend on a token path (e.g., color.brand.600)'
+    )
+    
+    args = parser.parse_args()
+    
+    manifest = BuildManifest(args.root)
+    if not manifest.load():
+        print(f"Error: No build manifest in {args.root} (run build_driver.py first)")
+        return 1
+    
+    if args.token:
+        dependents = manifest.dependents(args.token)
+        print(f"{args.token} ({section_name(args.token.split('.'))}) feeds {len(dependents)} output(s):")
+        for key in dependents:
+            print(f"  {key}")
+    
+    if args.show or not args.token:
+        for key, entry in manifest.outputs.items():
+            sections = entry.get('sections', {})
+            tokens = sum(count for count, _ in sections.values())
+            print(f"{key}: {tokens} tokens in {len(sections)} sections")
+            if args.show:
+                for name, (count, _) in sections.items():
+                    print(f"  {name:<40} {count:>6}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
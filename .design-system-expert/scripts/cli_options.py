@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+CLI Options
+Command-line options shared by the pipeline scripts and the ds entry point.
+
+Each group of options is defined once here and added to a parser by the
+scripts that accept it, so a standalone script and its ds subcommand cannot
+drift apart. This module only imports argparse, so ds can build its parser
+without loading the pipeline modules.
+
+Usage:
+    from cli_options import add_cache_arguments, add_profile_arguments
+"""
+
+import argparse
+from typing import Dict
+
+# Build cache directory the docs use; LazyTokens keeps its index below it
+DEFAULT_CACHE_DIR = '.token-cache'
+
+# Size a build cache may grow to before old entries are evicted
+DEFAULT_CACHE_SIZE_MB = 64
+
+# OKLab distance below which colors are near-duplicates: well below the
+# ~0.02 just-noticeable difference, so palette steps are kept
+DEFAULT_DELTA_E = 0.01
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --cache-dir/--cache-size options to a script's parser."""
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory for the incremental build cache (disabled if omitted)'
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=DEFAULT_CACHE_SIZE_MB,
+        help=f'Maximum cache size in MB before old entries are evicted (default: {DEFAULT_CACHE_SIZE_MB})'
+    )
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --profile/--profile-functions options to a script's parser."""
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='profile',
+        metavar='PREFIX',
+        help='Record per-stage timings and memory; writes PREFIX.json and PREFIX.trace.json (default: profile)'
+    )
+    parser.add_argument(
+        '--profile-functions',
+        action='store_true',
+        help='With --profile, also run cProfile and list the hottest functions'
+    )
+
+
+def add_validation_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the validator's check selection, --delta-e, --categories, --workers and --strict options."""
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Worker processes for multi-file validation (default: CPU count)'
+    )
+    parser.add_argument(
+        '--categories',
+        help='Comma-separated top-level categories to validate (single input file only)'
+    )
+    parser.add_argument(
+        '--check-naming',
+        action='store_true',
+        help='Check naming conventions'
+    )
+    parser.add_argument(
+        '--check-values',
+        action='store_true',
+        help='Validate token values'
+    )
+    parser.add_argument(
+        '--check-references',
+        action='store_true',
+        help='Check token references'
+    )
+    parser.add_argument(
+        '--check-duplicates',
+        action='store_true',
+        help='Check for duplicate values'
+    )
+    parser.add_argument(
+        '--check-contrast',
+        action='store_true',
+        help='Check WCAG contrast of text/fg colors against bg colors (requires NumPy)'
+    )
+    parser.add_argument(
+        '--check-near-duplicates',
+        action='store_true',
+        help='Find perceptually near-identical colors (requires NumPy)'
+    )
+    parser.add_argument(
+        '--delta-e',
+        type=float,
+        default=DEFAULT_DELTA_E,
+        help=f'OKLab distance for --check-near-duplicates (default: {DEFAULT_DELTA_E})'
+    )
+    parser.add_argument(
+        '--check-all',
+        action='store_true',
+        help='Run all checks except --check-contrast and --check-near-duplicates'
+    )
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Treat warnings as errors'
+    )
+
+
+def checks_from_args(args: argparse.Namespace) -> Dict[str, bool]:
+    """Return check name -> enabled from parsed validation options."""
+    return {
+        'naming': args.check_naming or args.check_all,
+        'values': args.check_values or args.check_all,
+        'references': args.check_references or args.check_all,
+        'duplicates': args.check_duplicates or args.check_all,
+        'contrast': args.check_contrast,
+        'near-duplicates': args.check_near_duplicates
+    }
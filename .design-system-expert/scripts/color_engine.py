@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Color Engine
+Vectorized color parsing and color-space conversion with NumPy.
+
+All colors of a token set are parsed in one batch into an (N, 4) array of
+sRGB channels plus alpha in [0, 1]. Hex values are decoded from a byte
+matrix and functional notations (rgb(), hsl(), oklch(), color(display-p3))
+with a single regex pass over the joined values, so there is no per-token
+Python loop. Conversions between sRGB, HSL, OKLab/OKLCH and Display-P3, and
+the string formats the platform emitters need, work on whole arrays.
+color_literals parses the same notations one value at a time without
+NumPy, from the same syntax and matrices, and the emitters' per-token
+transforms built on it format exactly as the batch does.
+
+Usage:
+    python color_engine.py --input tokens/color.json --format oklch
+    python color_engine.py --input tokens/color.json --format p3 --out-of-gamut
+"""
+
+import itertools
+import json
+import re
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Sequence, Tuple
+
+import numpy as np
+
+import color_literals
+from color_literals import function_syntax
+
+
+# Hex digit value of each code point below 256, 255 for non-hex characters
+HEX_DIGITS = np.full(256, 255, dtype=np.uint8)
+HEX_DIGITS[np.frombuffer(b'0123456789', dtype=np.uint8)] = np.arange(10)
+HEX_DIGITS[np.frombuffer(b'abcdef', dtype=np.uint8)] = np.arange(10, 16)
+HEX_DIGITS[np.frombuffer(b'ABCDEF', dtype=np.uint8)] = np.arange(10, 16)
+
+# String tables indexed by integer value, so formatting is a lookup
+HEX_BYTES = np.array([f"{i:02x}" for i in range(256)])
+DECIMAL_BYTES = np.array([str(i) for i in range(256)])
+ALPHA_PERCENTS = np.array([f"{i / 100:g}" for i in range(101)])
+FIXED_3 = np.array([f"{i / 1000:.3f}" for i in range(1001)])
+
+# One value per line, so whitespace excludes line breaks; other values match the empty fallback
+FUNCTION_PATTERN = re.compile('^' + function_syntax(r'[^\S\n]') + '$|^.*$', re.M | re.I)
+
+# Conversion matrices, shared with the scalar parser in color_literals
+SRGB_TO_LMS = np.array(color_literals.SRGB_TO_LMS)
+LMS_TO_OKLAB = np.array(color_literals.LMS_TO_OKLAB)
+OKLAB_TO_LMS = np.array(color_literals.OKLAB_TO_LMS)
+LMS_TO_SRGB = np.array(color_literals.LMS_TO_SRGB)
+SRGB_TO_XYZ = np.array(color_literals.SRGB_TO_XYZ)
+SRGB_TO_P3 = np.array(color_literals.SRGB_TO_P3)
+P3_TO_SRGB = np.array(color_literals.P3_TO_SRGB)
+
+GAMUT_EPSILON = 1e-6
+
+# OKLCH chroma below which the hue is meaningless and reported as 0
+ACHROMATIC_CHROMA = 1e-4
+
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """Undo the sRGB (and Display-P3) transfer function."""
+    magnitude = np.abs(rgb)
+    linear = np.where(magnitude <= 0.04045, magnitude / 12.92, ((magnitude + 0.055) / 1.055) ** 2.4)
+    return np.sign(rgb) * linear
+
+
+def linear_to_srgb(rgb: np.ndarray) -> np.ndarray:
+    """Apply the sRGB (and Display-P3) transfer function."""
+    magnitude = np.abs(rgb)
+    encoded = np.where(magnitude <= 0.0031308, magnitude * 12.92, 1.055 * magnitude ** (1 / 2.4) - 0.055)
+    return np.sign(rgb) * encoded
+
+
+def rgb_to_hsl(rgb: np.ndarray) -> np.ndarray:
+    """sRGB in [0, 1] -> HSL with hue in degrees and saturation/lightness in [0, 1]."""
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    high, low = rgb.max(axis=1), rgb.min(axis=1)
+    delta = high - low
+    lightness = (high + low) / 2
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        saturation = np.where(delta == 0, 0.0, delta / (1 - np.abs(2 * lightness - 1)))
+        hue = np.select(
+            [delta == 0, high == r, high == g],
+            [0.0, ((g - b) / delta) % 6, (b - r) / delta + 2],
+            (r - g) / delta + 4
+        ) * 60
+    
+    return np.stack([hue % 360, saturation, lightness], axis=1)
+
+
+def hsl_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    """HSL (hue in degrees, saturation/lightness in [0, 1]) -> sRGB."""
+    hue, saturation, lightness = hsl[:, 0:1], hsl[:, 1:2], hsl[:, 2:3]
+    k = (np.array([0, 8, 4]) + hue / 30) % 12
+    a = saturation * np.minimum(lightness, 1 - lightness)
+    return lightness - a * np.clip(np.minimum(k - 3, 9 - k), -1, 1)
+
+
+def rgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    lms = srgb_to_linear(rgb) @ SRGB_TO_LMS.T
+    return np.cbrt(lms) @ LMS_TO_OKLAB.T
+
+
+def oklab_to_rgb(lab: np.ndarray) -> np.ndarray:
+    lms = (lab @ OKLAB_TO_LMS.T) ** 3
+    return linear_to_srgb(lms @ LMS_TO_SRGB.T)
+
+
+def oklab_to_oklch(lab: np.ndarray) -> np.ndarray:
+    chroma = np.hypot(lab[:, 1], lab[:, 2])
+    hue = np.degrees(np.arctan2(lab[:, 2], lab[:, 1])) % 360
+    hue = np.where(chroma < ACHROMATIC_CHROMA, 0.0, hue)
+    return np.stack([lab[:, 0], chroma, hue], axis=1)
+
+
+def oklch_to_oklab(lch: np.ndarray) -> np.ndarray:
+    hue = np.radians(lch[:, 2])
+    return np.stack([lch[:, 0], lch[:, 1] * np.cos(hue), lch[:, 1] * np.sin(hue)], axis=1)
+
+
+def rgb_to_display_p3(rgb: np.ndarray) -> np.ndarray:
+    return linear_to_srgb(srgb_to_linear(rgb) @ SRGB_TO_P3.T)
+
+
+def display_p3_to_rgb(p3: np.ndarray) -> np.ndarray:
+    return linear_to_srgb(srgb_to_linear(p3) @ P3_TO_SRGB.T)
+
+
+def in_gamut(channels: np.ndarray) -> np.ndarray:
+    """Return which rows have all channels within [0, 1]."""
+    return np.all((channels >= -GAMUT_EPSILON) & (channels <= 1 + GAMUT_EPSILON), axis=1)
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """WCAG 2 relative luminance of sRGB colors, over the last axis."""
+    linear = srgb_to_linear(np.clip(rgb, 0, 1))
+    return linear @ SRGB_TO_XYZ[1]
+
+
+def contrast_matrix(foreground: np.ndarray, background: np.ndarray,
+                    backdrop: Sequence[float] = (1.0, 1.0, 1.0)) -> np.ndarray:
+    """WCAG contrast ratio of every foreground (N, 4) against every background (M, 4).
+    
+    Translucent backgrounds are composited over the backdrop and translucent
+    foregrounds over each background before comparing. Returns an (N, M) array.
+    """
+    bg_alpha = background[:, 3:4]
+    bg = background[:, :3] * bg_alpha + np.asarray(backdrop) * (1 - bg_alpha)
+    
+    fg_alpha = foreground[:, None, 3:4]
+    composited = foreground[:, None, :3] * fg_alpha + bg[None, :, :] * (1 - fg_alpha)
+    
+    fg_luminance = relative_luminance(composited)
+    bg_luminance = relative_luminance(bg)[None, :]
+    lighter = np.maximum(fg_luminance, bg_luminance)
+    darker = np.minimum(fg_luminance, bg_luminance)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def near_pairs(points: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (i, j, distance) for every pair of points with i < j within radius.
+    
+    Points are bucketed into a uniform grid with cells of the radius' size,
+    and only the 3^d neighbouring cells of each point are searched, through
+    binary search over the sorted cell keys: O(N log N) for bounded density
+    instead of comparing all N^2 pairs. For a tiny radius the cells are made
+    larger, so that the cell keys still fit in an int64; that only adds
+    candidates, which the distance test removes.
+    """
+    count, dims = points.shape
+    if count < 2 or radius <= 0:
+        empty = np.zeros(0, dtype=int)
+        return empty, empty, np.zeros(0)
+    
+    # Cells per axis, with the neighbour margin of 4 below, must multiply to at most 2^62
+    max_cells = int(2 ** (62 / dims)) - 4
+    span = float((points.max(axis=0) - points.min(axis=0)).max())
+    cell_size = max(radius, span / max_cells)
+    
+    # Cell coordinates from 1, so that every neighbour coordinate is >= 0
+    origin = points.min(axis=0)
+    cells = np.floor((points - origin) / cell_size).astype(np.int64) + 1
+    extent = cells.max(axis=0) + 2
+    strides = np.concatenate([np.cumprod(extent[::-1])[::-1][1:], [1]])
+    
+    keys = cells @ strides
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    
+    firsts, seconds = [], []
+    for offset in itertools.product((-1, 0, 1), repeat=dims):
+        neighbour = keys + np.asarray(offset) @ strides
+        start = np.searchsorted(sorted_keys, neighbour, 'left')
+        counts = np.searchsorted(sorted_keys, neighbour, 'right') - start
+        total = counts.sum()
+        if not total:
+            continue
+        first = np.repeat(np.arange(count), counts)
+        within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = order[np.repeat(start, counts) + within]
+        keep = first < second
+        firsts.append(first[keep])
+        seconds.append(second[keep])
+    
+    first = np.concatenate(firsts)
+    second = np.concatenate(seconds)
+    distance = np.linalg.norm(points[first] - points[second], axis=1)
+    close = distance <= radius
+    first, second, distance = first[close], second[close], distance[close]
+    
+    ordering = np.lexsort((second, first))
+    return first[ordering], second[ordering], distance[ordering]
+
+
+def to_numbers(texts: np.ndarray) -> np.ndarray:
+    """Convert an array of numeric strings to floats, empty strings to NaN."""
+    return np.where(texts == '', 'nan', texts).astype(float)
+
+
+class ColorBatch:
+    """N colors as an (N, 4) array of sRGB channels and alpha in [0, 1].
+
+    Rows whose source value is not a color literal (references, var(),
+    keywords) are marked invalid and hold zeros.
+    """
+    
+    def __init__(self, rgba: np.ndarray, valid: np.ndarray):
+        self.rgba = rgba
+        self.valid = valid
+    
+    def __len__(self) -> int:
+        return len(self.rgba)
+    
+    @classmethod
+    def parse(cls, values: Sequence[Any]) -> 'ColorBatch':
+        """Parse color strings in one batch."""
+        count = len(values)
+        rgba = np.zeros((count, 4))
+        valid = np.zeros(count, dtype=bool)
+        if count == 0:
+            return cls(rgba, valid)
+        
+        text = np.char.strip(np.asarray(values, dtype=str))
+        
+        # Hex: decode a fixed-width matrix of code points with a lookup table
+        length = np.char.str_len(text)
+        codes = text.astype('U9').view(np.uint32).reshape(count, 9)
+        digits = HEX_DIGITS[np.minimum(codes[:, 1:], 255)].astype(float)
+        used = np.arange(8) < (length - 1)[:, None]
+        is_hex = (
+            (codes[:, 0] == ord('#'))
+            & np.isin(length, [4, 5, 7, 9])
+            & np.all((digits < 16) | ~used, axis=1)
+        )
+        short = length <= 5
+        pairs = digits[:, 0:8:2] * 16 + digits[:, 1:8:2]
+        hex_rgba = np.where(short[:, None], digits[:, :4] * 17, pairs) / 255
+        hex_rgba[:, 3] = np.where(np.isin(length, [5, 9]), hex_rgba[:, 3], 1.0)
+        rgba[is_hex] = hex_rgba[is_hex]
+        valid |= is_hex
+        
+        rest = np.flatnonzero(~valid)
+        lowered = np.char.lower(text[rest])
+        valid[rest[lowered == 'transparent']] = True
+        
+        # Functional notations: one regex pass over the remaining values
+        functional = rest[np.char.find(lowered, '(') >= 0]
+        if len(functional):
+            joined = '\n'.join(np.char.replace(text[functional], '\n', ' ').tolist())
+            groups = np.char.lower(np.array(FUNCTION_PATTERN.findall(joined), dtype=str))
+            name, space = groups[:, 0], groups[:, 1]
+            channels = to_numbers(groups[:, [2, 4, 6]])
+            percent = groups[:, [3, 5, 7]] == '%'
+            alpha = to_numbers(groups[:, 8])
+            alpha = np.where(groups[:, 9] == '%', alpha / 100, alpha)
+            alpha = np.where(np.isnan(alpha), 1.0, alpha)
+            
+            result = np.zeros((len(functional), 3))
+            
+            is_rgb = np.isin(name, ['rgb', 'rgba'])
+            rgb = np.where(percent, channels / 100, channels / 255)
+            result[is_rgb] = rgb[is_rgb]
+            
+            is_hsl = np.isin(name, ['hsl', 'hsla'])
+            hsl = np.stack([channels[:, 0], channels[:, 1] / 100, channels[:, 2] / 100], axis=1)
+            result[is_hsl] = hsl_to_rgb(hsl[is_hsl])
+            
+            is_oklch = name == 'oklch'
+            lch = channels.copy()
+            lch[:, 0] = np.where(percent[:, 0], lch[:, 0] / 100, lch[:, 0])
+            result[is_oklch] = oklab_to_rgb(oklch_to_oklab(lch[is_oklch]))
+            
+            is_p3 = (name == 'color') & (space == 'display-p3')
+            p3 = np.where(percent, channels / 100, channels)
+            result[is_p3] = display_p3_to_rgb(p3[is_p3])
+            
+            is_srgb = (name == 'color') & (space == 'srgb')
+            result[is_srgb] = p3[is_srgb]
+            
+            parsed = (is_rgb | is_hsl | is_oklch | is_p3 | is_srgb) & ~np.isnan(channels).any(axis=1)
+            rows = functional[parsed]
+            rgba[rows, :3] = result[parsed]
+            rgba[rows, 3] = alpha[parsed]
+            valid[rows] = True
+        
+        return cls(rgba, valid)
+    
+    @property
+    def rgb(self) -> np.ndarray:
+        return self.rgba[:, :3]
+    
+    @property
+    def alpha(self) -> np.ndarray:
+        return self.rgba[:, 3]
+    
+    def to_hsl(self) -> np.ndarray:
+        return rgb_to_hsl(np.clip(self.rgb, 0, 1))
+    
+    def to_oklab(self) -> np.ndarray:
+        return rgb_to_oklab(self.rgb)
+    
+    def to_oklch(self) -> np.ndarray:
+        return oklab_to_oklch(self.to_oklab())
+    
+    def to_display_p3(self) -> np.ndarray:
+        return rgb_to_display_p3(self.rgb)
+    
+    def in_srgb_gamut(self) -> np.ndarray:
+        return in_gamut(self.rgb)
+    
+    def bytes(self) -> np.ndarray:
+        """Return the colors as (N, 4) integers in [0, 255]."""
+        return np.rint(np.clip(self.rgba, 0, 1) * 255).astype(int)
+    
+    def format(self, name: str) -> np.ndarray:
+        """Return the colors as strings in one of the FORMATS."""
+        return getattr(self, f"format_{name}")()
+    
+    def format_hex(self) -> np.ndarray:
+        """#rrggbb"""
+        channels = self.bytes()
+        return np.char.add(np.char.add(np.char.add('#', HEX_BYTES[channels[:, 0]]),
+                                       HEX_BYTES[channels[:, 1]]), HEX_BYTES[channels[:, 2]])
+    
+    def format_hex8_android(self) -> np.ndarray:
+        """#aarrggbb"""
+        alpha = HEX_BYTES[self.bytes()[:, 3]]
+        return np.char.add(np.char.add('#', alpha), np.char.replace(self.format_hex(), '#', ''))
+    
+    def format_compose(self) -> np.ndarray:
+        """Color(0xaarrggbb)"""
+        return np.char.add(np.char.add('Color(0x', np.char.replace(self.format_hex8_android(), '#', '')), ')')
+    
+    def format_rgb(self) -> np.ndarray:
+        """rgb(r, g, b) or rgba(r, g, b, a)"""
+        channels = DECIMAL_BYTES[self.bytes()]
+        body = np.char.add(np.char.add(np.char.add(np.char.add(channels[:, 0], ', '), channels[:, 1]), ', '),
+                           channels[:, 2])
+        alpha = ALPHA_PERCENTS[np.rint(np.clip(self.alpha, 0, 1) * 100).astype(int)]
+        opaque = np.char.add(np.char.add('rgb(', body), ')')
+        translucent = np.char.add(np.char.add(np.char.add(np.char.add('rgba(', body), ', '), alpha), ')')
+        return np.where(self.alpha == 1, opaque, translucent)
+    
+    def format_css(self) -> np.ndarray:
+        """#rrggbb when opaque, rgba() otherwise"""
+        result = self.format_hex().astype(object)
+        translucent = self.alpha != 1
+        if translucent.any():
+            result[translucent] = ColorBatch(self.rgba[translucent], self.valid[translucent]).format_rgb()
+        return result.astype(str)
+    
+    def format_ui_color(self) -> np.ndarray:
+        """Objective-C UIColor literal"""
+        parts = FIXED_3[np.rint(np.clip(self.rgba, 0, 1) * 1000).astype(int)]
+        labels = ['[UIColor colorWithRed:', 'f green:', 'f blue:', 'f alpha:']
+        result = np.full(len(self), '', dtype=str)
+        for i, label in enumerate(labels):
+            result = np.char.add(np.char.add(result, label), parts[:, i])
+        return np.char.add(result, 'f]')
+    
+    def with_alpha(self, prefix: np.ndarray) -> np.ndarray:
+        """Close a functional notation, adding ' / a' for translucent colors."""
+        alpha = np.char.add(' / ', np.char.mod('%g', np.round(self.alpha, 4)))
+        return np.char.add(np.char.add(prefix, np.where(self.alpha == 1, '', alpha)), ')')
+    
+    def format_hsl(self) -> np.ndarray:
+        """hsl(h s% l%)"""
+        hsl = self.to_hsl()
+        text = np.char.add('hsl(', np.char.mod('%.1f', np.round(hsl[:, 0], 1) % 360))
+        text = np.char.add(np.char.add(text, ' '), np.char.mod('%.1f%%', hsl[:, 1] * 100))
+        text = np.char.add(np.char.add(text, ' '), np.char.mod('%.1f%%', hsl[:, 2] * 100))
+        return self.with_alpha(text)
+    
+    def format_oklch(self) -> np.ndarray:
+        """oklch(L% C H)"""
+        lch = self.to_oklch()
+        text = np.char.add('oklch(', np.char.mod('%.2f%%', lch[:, 0] * 100))
+        text = np.char.add(np.char.add(text, ' '), np.char.mod('%.4f', lch[:, 1]))
+        text = np.char.add(np.char.add(text, ' '), np.char.mod('%.2f', np.round(lch[:, 2], 2) % 360))
+        return self.with_alpha(text)
+    
+    def format_p3(self) -> np.ndarray:
+        """color(display-p3 r g b)"""
+        p3 = self.to_display_p3()
+        text = np.char.add('color(display-p3 ', np.char.mod('%.4f', p3[:, 0]))
+        for i in (1, 2):
+            text = np.char.add(np.char.add(text, ' '), np.char.mod('%.4f', p3[:, i]))
+        return self.with_alpha(text)
+
+
+FORMATS = ['hex', 'rgb', 'css', 'hsl', 'oklch', 'p3', 'hex8_android', 'compose', 'ui_color']
+
+
+def convert_values(values: Sequence[Any], format_name: str) -> List[Any]:
+    """Convert color literals to a format, leaving every other value unchanged."""
+    if not len(values):
+        return []
+    batch = ColorBatch.parse(values)
+    formatted = batch.format(format_name).tolist()
+    if batch.valid.all():
+        return formatted
+    original = np.empty(len(values), dtype=object)
+    original[:] = values
+    return np.where(batch.valid, formatted, original).tolist()
+
+
+def collect_colors(node: Dict[str, Any], parts: List[str], paths: List[str], values: List[Any]) -> None:
+    """Collect the paths and values of every color token in a tree."""
+    if node.get('type') == 'color' and 'value' in node:
+        paths.append('.'.join(parts))
+        values.append(node['value'])
+    for key, child in node.items():
+        if isinstance(child, dict) and key not in ('value', 'type'):
+            collect_colors(child, parts + [key], paths, values)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Convert the color tokens of a file to another color format'
+    )
+    parser.add_argument(
+        '--input',
+        required=True,
+        help='Input JSON token file path'
+    )
+    parser.add_argument(
+        '--format',
+        choices=FORMATS,
+        default='hex',
+        help='Output color format (default: hex)'
+    )
+    parser.add_argument(
+        '--out-of-gamut',
+        action='store_true',
+        help='Only list colors outside the sRGB gamut'
+    )
+    
+    args = parser.parse_args()
+    
+    if not Path(args.input).exists():
+        print(f"Error: Input file '{args.input}' not found")
+        return 1
+    
+    try:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            tokens = json.load(f)
+        
+        paths, values = [], []
+        collect_colors(tokens, [], paths, values)
+        batch = ColorBatch.parse(values)
+        formatted = batch.format(args.format)
+        
+        show = batch.valid & ~batch.in_srgb_gamut() if args.out_of_gamut else batch.valid
+        for i in np.flatnonzero(show):
+            print(f"{paths[i]}: {values[i]} -> {formatted[i]}")
+        
+        print(f"\n✓ {int(batch.valid.sum())} of {len(values)} color tokens are color literals")
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
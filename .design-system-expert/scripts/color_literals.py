@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Color Literals
+Pure-Python parsing of CSS color literals, one value at a time.
+
+Accepts the same notations as color_engine.ColorBatch, and gives the same
+channels: hex (#rgb, #rgba, #rrggbb, #rrggbbaa), the transparent keyword,
+rgb()/rgba(), hsl()/hsla(), oklch() and color(display-p3 | srgb ...).
+Channels are sRGB in [0, 1] and are not clamped, so out-of-range and
+out-of-gamut values are clamped by whoever formats them, as the batch
+formats do. The conversion matrices live here, and color_engine builds its
+arrays from them, so both paths use the same numbers.
+
+This is the fallback when NumPy is not installed.
+
+Usage:
+    python color_literals.py 'hsl(0 100% 50%)' '#abcd' 'oklch(70% 0.1 200)'
+"""
+
+import math
+import re
+import argparse
+from typing import Any, Optional, Sequence, Tuple
+
+Matrix = Tuple[Tuple[float, float, float], ...]
+
+NUMBER = r'([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+
+
+def function_syntax(space: str = r'\s') -> str:
+    """Regex for a functional notation: name, color space, three channels with their units, optional alpha."""
+    separator = f"(?:{space}|,)+"
+    return (
+        rf'{space}*(rgba?|hsla?|oklch|color)\({space}*(?:(display-p3|srgb){space}+)?'
+        + NUMBER + r'(%|deg)?' + separator + NUMBER + r'(%)?' + separator + NUMBER + r'(%)?'
+        + rf'(?:{space}*[,/]{space}*' + NUMBER + rf'(%)?)?{space}*\){space}*'
+    )
+
+
+FUNCTION_PATTERN = re.compile(function_syntax(), re.I)
+
+HEX_PATTERN = re.compile(r'#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})')
+
+
+def invert(m: Matrix) -> Matrix:
+    """Invert a 3x3 matrix."""
+    (a, b, c), (d, e, f), (g, h, i) = m
+    cofactors = (
+        (e * i - f * h, c * h - b * i, b * f - c * e),
+        (f * g - d * i, a * i - c * g, c * d - a * f),
+        (d * h - e * g, b * g - a * h, a * e - b * d),
+    )
+    determinant = a * cofactors[0][0] + b * cofactors[1][0] + c * cofactors[2][0]
+    return tuple(tuple(value / determinant for value in row) for row in cofactors)
+
+
+def multiply(m: Matrix, n: Matrix) -> Matrix:
+    return tuple(
+        tuple(sum(m[row][k] * n[k][column] for k in range(3)) for column in range(3))
+        for row in range(3)
+    )
+
+
+def transform(m: Matrix, vector: Sequence[float]) -> Tuple[float, float, float]:
+    """Apply a matrix to a column vector."""
+    return tuple(row[0] * vector[0] + row[1] * vector[1] + row[2] * vector[2] for row in m)
+
+
+# Linear sRGB <-> OKLab (Björn Ottosson)
+SRGB_TO_LMS: Matrix = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+LMS_TO_OKLAB: Matrix = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+OKLAB_TO_LMS = invert(LMS_TO_OKLAB)
+LMS_TO_SRGB = invert(SRGB_TO_LMS)
+
+# Linear sRGB <-> linear Display-P3, both D65
+SRGB_TO_XYZ: Matrix = (
+    (0.4123907993, 0.3575843394, 0.1804807884),
+    (0.2126390059, 0.7151686788, 0.0721923154),
+    (0.0193308187, 0.1191947798, 0.9505321522),
+)
+XYZ_TO_P3: Matrix = (
+    (2.4934969119, -0.9313836179, -0.4027107845),
+    (-0.8294889696, 1.7626640603, 0.0236246858),
+    (0.0358458302, -0.0761723893, 0.9568845240),
+)
+SRGB_TO_P3 = multiply(XYZ_TO_P3, SRGB_TO_XYZ)
+P3_TO_SRGB = invert(SRGB_TO_P3)
+
+
+def srgb_to_linear(channel: float) -> float:
+    magnitude = abs(channel)
+    linear = magnitude / 12.92 if magnitude <= 0.04045 else ((magnitude + 0.055) / 1.055) ** 2.4
+    return math.copysign(linear, channel) if channel else 0.0
+
+
+def linear_to_srgb(channel: float) -> float:
+    magnitude = abs(channel)
+    encoded = magnitude * 12.92 if magnitude <= 0.0031308 else 1.055 * magnitude ** (1 / 2.4) - 0.055
+    return math.copysign(encoded, channel) if channel else 0.0
+
+
+def hsl_to_rgb(hue: float, saturation: float, lightness: float) -> Tuple[float, float, float]:
+    a = saturation * min(lightness, 1 - lightness)
+    channels = []
+    for n in (0, 8, 4):
+        k = (n + hue / 30) % 12
+        channels.append(lightness - a * min(max(min(k - 3, 9 - k), -1), 1))
+    return tuple(channels)
+
+
+def oklch_to_rgb(lightness: float, chroma: float, hue: float) -> Tuple[float, float, float]:
+    angle = math.radians(hue)
+    lab = (lightness, chroma * math.cos(angle), chroma * math.sin(angle))
+    lms = tuple(value ** 3 for value in transform(OKLAB_TO_LMS, lab))
+    return tuple(linear_to_srgb(value) for value in transform(LMS_TO_SRGB, lms))
+
+
+def display_p3_to_rgb(p3: Sequence[float]) -> Tuple[float, float, float]:
+    linear = transform(P3_TO_SRGB, [srgb_to_linear(value) for value in p3])
+    return tuple(linear_to_srgb(value) for value in linear)
+
+
+def parse_function(match: 're.Match') -> Optional[Tuple[float, float, float, float]]:
+    name, space = match.group(1).lower(), (match.group(2) or '').lower()
+    channels = [float(match.group(i)) for i in (3, 5, 7)]
+    percent = [match.group(i) == '%' for i in (4, 6, 8)]
+    alpha = 1.0 if match.group(9) is None else float(match.group(9))
+    if match.group(10) == '%':
+        alpha /= 100
+    
+    if name in ('rgb', 'rgba'):
+        rgb = tuple(value / 100 if is_percent else value / 255 for value, is_percent in zip(channels, percent))
+    elif name in ('hsl', 'hsla'):
+        rgb = hsl_to_rgb(channels[0], channels[1] / 100, channels[2] / 100)
+    elif name == 'oklch':
+        lightness = channels[0] / 100 if percent[0] else channels[0]
+        rgb = oklch_to_rgb(lightness, channels[1], channels[2])
+    elif space:
+        rgb = tuple(value / 100 if is_percent else value for value, is_percent in zip(channels, percent))
+        if space == 'display-p3':
+            rgb = display_p3_to_rgb(rgb)
+    else:
+        return None
+    return rgb + (alpha,)
+
+
+def parse_color(value: Any) -> Optional[Tuple[float, float, float, float]]:
+    """Parse a color literal into unclamped (r, g, b, alpha), or None if it is not one."""
+    if not isinstance(value, str):
+        return None
+    text = value.strip()
+    
+    match = HEX_PATTERN.fullmatch(text)
+    if match:
+        digits = match.group(1)
+        if len(digits) <= 4:
+            channels = [int(digit, 16) * 17 for digit in digits]
+        else:
+            channels = [int(digits[i:i + 2], 16) for i in range(0, len(digits), 2)]
+        alpha = channels[3] / 255 if len(channels) == 4 else 1.0
+        return channels[0] / 255, channels[1] / 255, channels[2] / 255, alpha
+    
+    if text.lower() == 'transparent':
+        return 0.0, 0.0, 0.0, 0.0
+    
+    match = FUNCTION_PATTERN.fullmatch(text)
+    return parse_function(match) if match else None
+
+
+def clamp(channel: float) -> float:
+    return min(max(channel, 0.0), 1.0)
+
+
+def to_bytes(color: Sequence[float]) -> Tuple[int, ...]:
+    """Clamp channels to [0, 1] and scale them to integers in [0, 255]."""
+    return tuple(round(clamp(channel) * 255) for channel in color)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Parse CSS color literals into sRGB channels'
+    )
+    parser.add_argument(
+        'values',
+        nargs='+',
+        help='Color values (e.g., "#abcd", "hsl(0 100% 50%)")'
+    )
+    
+    args = parser.parse_args()
+    
+    for value in args.values:
+        color = parse_color(value)
+        if color is None:
+            print(f"{value}: not a color literal")
+            continue
+        r, g, b, alpha = color
+        print(f"{value}: r={r:.4f} g={g:.4f} b={b:.4f} alpha={alpha:.4f} -> "
+              "#{:02x}{:02x}{:02x}{:02x}".format(*to_bytes(color)))
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
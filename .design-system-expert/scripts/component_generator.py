@@ -3,14 +3,79 @@
 Component Generator
 Generates component specifications and implementation code.
 
+In batch mode (--all, --brands) one generator is set up per brand, and the
+docs and CSS of every component for every brand are rendered across a pool
+of workers. Each brand gets its own subdirectory of
+the output directory. Files are only replaced when their content changes.
+
+Docs and CSS are rendered from templates/component.md.tmpl and
+templates/component.css.tmpl, compiled once by template_engine. The CSS
+reads design tokens through custom properties; the fallback of each var()
+is the value of the matching token (--spacing-3 is spacing.3) in the
+brand's tokens, looked up through a TokenIndex, or a default if there is
+none.
+
 Usage:
     python component_generator.py --components button,input,card --tokens tokens.json --output components/
+    python component_generator.py --all --brands acme=brands/acme.json globex=brands/globex.json --output components/
+    python component_generator.py --all --templates my_components.json --tokens tokens.json --output components/
 """
 
 import json
+import os
+import re
+import time
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+from build_cache import write_if_changed
+from lazy_tokens import LazyTokens
+from template_engine import get_template
+from token_index import TokenIndex
+
+# Keys every component template must define
+TEMPLATE_KEYS = ('purpose', 'variants', 'states', 'props')
+
+# Size variants written for components with a 'size' prop: vertical and
+# horizontal padding and font size tokens
+SIZE_SCALE = [
+    ('sm', '--spacing-2', '--spacing-3', '--font-size-sm'),
+    ('md', '--spacing-3', '--spacing-4', '--font-size-base'),
+    ('lg', '--spacing-4', '--spacing-6', '--font-size-lg')
+]
+
+# Fallbacks of the size tokens, in SIZE_SCALE order, when no token defines them
+SIZE_FALLBACKS = ('0.5rem', '1rem', '1rem')
+
+# Custom properties the CSS reads outside the variants and sizes, with their
+# fallbacks when no token defines them
+CSS_FALLBACKS = {
+    '--font-family-sans': 'sans-serif',
+    '--font-size-base': '1rem',
+    '--font-weight-medium': '500',
+    '--font-lineHeight-normal': '1.5',
+    '--spacing-3': '0.75rem',
+    '--spacing-4': '1rem',
+    '--border-radius-md': '0.375rem',
+    '--color-white': '#FFFFFF',
+    '--shadow-md': '0 4px 6px rgba(0,0,0,0.1)'
+}
+
+# Background fallback of a variant without a --color-<variant> token
+VARIANT_COLOR_FALLBACK = '#3B82F6'
+
+REFERENCE_PATTERN = re.compile(r'\{([^{}]+)\}')
+
+# Generators per brand shared with the workers of a process pool
+_shared_generators: Dict[str, 'ComponentGenerator'] = {}
+
+
+def init_worker(generators: Dict[str, 'ComponentGenerator']) -> None:
+    """Receive the generators of every brand once per worker process."""
+    global _shared_generators
+    _shared_generators = generators
 
 
 class ComponentGenerator:
@@ -96,200 +161,203 @@ class ComponentGenerator:
         }
     }
     
-    def __init__(self, tokens_file: str = None):
+    def __init__(self, tokens_file: str = None, templates: Optional[Dict[str, Dict[str, Any]]] = None):
+        # Categories are parsed only when a component looks them up
         self.tokens = {}
         if tokens_file and Path(tokens_file).exists():
-            with open(tokens_file, 'r', encoding='utf-8') as f:
-                self.tokens = json.load(f)
+            self.tokens = LazyTokens(tokens_file)
+        self.templates = dict(self.COMPONENT_TEMPLATES)
+        self.templates.update(templates or {})
+        self._index = None
+    
+    @property
+    def index(self) -> TokenIndex:
+        """Query index over the tokens for the CSS fallbacks, built on first use."""
+        if self._index is None:
+            self._index = TokenIndex.from_tree(self.tokens)
+        return self._index
     
     def generate_component_doc(self, component_name: str) -> str:
         """Generate component documentation."""
-        if component_name not in self.COMPONENT_TEMPLATES:
+        if component_name not in self.templates:
             raise ValueError(f"Unknown component: {component_name}")
         
-        template = self.COMPONENT_TEMPLATES[component_name]
-        
-        doc = f"""# {component_name.capitalize()} Component
-
-## Purpose
-
-{template['purpose']}
-
-## Variants
-
-"""
-        for variant in template['variants']:
-            doc += f"- **{variant}**: {variant.capitalize()} style\n"
-        
-        doc += "\n## States\n\n"
-        for state in template['states']:
-            doc += f"- {state.capitalize()}\n"
-        
-        doc += "\n## Props/Attributes\n\n"
-        for prop, prop_type in template['props'].items():
-            if isinstance(prop_type, list):
-                doc += f"- **{prop}**: {' | '.join(prop_type)}\n"
-            else:
-                doc += f"- **{prop}**: {prop_type}\n"
-        
-        doc += """
-## Accessibility
-
-- Use semantic HTML elements
-- Include ARIA labels where appropriate
-- Ensure keyboard navigation support
-- Maintain minimum 44x44px touch target
-- Provide visible focus indicators
-- Support screen readers
-
-## Usage Examples
-
-### Basic Usage
-
-```html
-<{component_name} variant="primary">
-  Click me
-</{component_name}>
-```
-
-### With Props
-
-```html
-<{component_name} 
-  variant="primary"
-  size="lg"
-  disabled="false">
-  Click me
-</{component_name}>
-```
-
-## Best Practices
-
-- Use appropriate variant for the context
-- Provide clear labels or content
-- Handle loading and error states
-- Ensure accessibility compliance
-- Test on multiple devices and browsers
-"""
+        return get_template('component.md.tmpl').render(
+            name=component_name,
+            component=self.templates[component_name]
+        )
+    
+    def token_value(self, property_name: str, default: str) -> str:
+        """Return the value of the token behind a custom property, following references.
         
-        return doc.replace("{component_name}", component_name)
+        Missing tokens, broken or circular references and composite values give default.
+        """
+        if not self.tokens:
+            return default
+        path = property_name.lstrip('-').replace('-', '.')
+        seen = set()
+        value = self.index.value(path)
+        while isinstance(value, str) and path not in seen:
+            match = REFERENCE_PATTERN.fullmatch(value.strip())
+            if not match:
+                break
+            seen.add(path)
+            path = match.group(1).strip()
+            value = self.index.value(path)
+        if value is None or isinstance(value, (dict, list)) or REFERENCE_PATTERN.search(str(value)):
+            return default
+        return str(value)
+    
+    def css_context(self, component_name: str) -> Dict[str, Any]:
+        """Return the context of the CSS template, with var() fallbacks from the tokens."""
+        component = self.templates[component_name]
+        return {
+            'name': component_name,
+            'component': component,
+            'fallbacks': {name.lstrip('-'): self.token_value(name, default)
+                          for name, default in CSS_FALLBACKS.items()},
+            'variant_colors': [(variant, self.token_value(f"--color-{variant}", VARIANT_COLOR_FALLBACK))
+                               for variant in component['variants']],
+            'sizes': [
+                (size,) + tuple(part for name, default in zip(names, SIZE_FALLBACKS)
+                                for part in (name, self.token_value(name, default)))
+                for size, *names in SIZE_SCALE
+            ]
+        }
     
     def generate_component_css(self, component_name: str) -> str:
         """Generate component CSS implementation."""
-        if component_name not in self.COMPONENT_TEMPLATES:
+        if component_name not in self.templates:
             raise ValueError(f"Unknown component: {component_name}")
         
-        template = self.COMPONENT_TEMPLATES[component_name]
-        
-        css = f"""/* {component_name.capitalize()} Component Styles */
+        return get_template('component.css.tmpl').render(self.css_context(component_name))
+    
+    def render_component(self, component_name: str, include_css: bool = True) -> Dict[str, str]:
+        """Return file name -> content of a component's documentation and optionally CSS."""
+        files = {f"{component_name}.md": self.generate_component_doc(component_name)}
+        if include_css:
+            files[f"{component_name}.css"] = self.generate_component_css(component_name)
+        return files
+    
+    def write_component(self, component_name: str, output_dir: Path,
+                        include_css: bool = True) -> List[Dict[str, Any]]:
+        """Render a component and write the files whose content changed.
+
+        Returns one {"file", "written"} record per file.
+        """
+        records = []
+        for file_name, content in self.render_component(component_name, include_css).items():
+            output_file = output_dir / file_name
+            records.append({"file": str(output_file), "written": write_if_changed(output_file, [content])})
+        return records
+    
+    def generate_component(self, component_name: str, output_dir: Path, include_css: bool = True) -> None:
+        """Generate component documentation and optionally CSS."""
+        for record in self.write_component(component_name, output_dir, include_css):
+            file_name = Path(record['file']).name
+            print(f"  ✓ Created {file_name}" if record['written'] else f"  = {file_name} unchanged")
 
-.{component_name} {{
-  /* Base styles */
-  display: inline-flex;
-  align-items: center;
-  justify-content: center;
-  font-family: var(--font-family-sans, sans-serif);
-  font-size: var(--font-size-base, 1rem);
-  font-weight: var(--font-weight-medium, 500);
-  line-height: var(--font-lineHeight-normal, 1.5);
-  border: none;
-  cursor: pointer;
-  transition: all 0.2s ease;
-  
-  /* Default spacing */
-  padding: var(--spacing-3, 0.75rem) var(--spacing-4, 1rem);
-  border-radius: var(--border-radius-md, 0.375rem);
-}}
 
-/* Variants */
-"""
-        
-        for variant in template['variants']:
-            css += f""".{component_name}--{variant} {{
-  background: var(--color-{variant}, #3B82F6);
-  color: var(--color-white, #FFFFFF);
-}}
+def generate_worker(brand: str, component_name: str, output_dir: str, include_css: bool,
+                    generator: Optional[ComponentGenerator] = None) -> Dict[str, Any]:
+    """Render one component for one brand and write the files whose content changed."""
+    start = time.perf_counter()
+    generator = _shared_generators[brand] if generator is None else generator
+    files = generator.write_component(component_name, Path(output_dir), include_css)
+    return {
+        "brand": brand,
+        "component": component_name,
+        "files": files,
+        "elapsed_ms": (time.perf_counter() - start) * 1000
+    }
 
-.{component_name}--{variant}:hover {{
-  opacity: 0.9;
-}}
 
-"""
-        
-        css += "/* States */\n"
-        for state in template['states']:
-            if state == 'disabled':
-                css += f""".{component_name}:disabled,
-.{component_name}--disabled {{
-  opacity: 0.5;
-  cursor: not-allowed;
-  pointer-events: none;
-}}
+def generate_batch(generators: Dict[str, ComponentGenerator], components: List[str], output_dir: Path,
+                   include_css: bool = True, workers: Optional[int] = None,
+                   executor: str = 'process') -> List[Dict[str, Any]]:
+    """Generate every component for every brand, concurrently unless workers is 1.
 
-"""
-            elif state == 'hover':
-                css += f""".{component_name}:hover {{
-  transform: translateY(-1px);
-  box-shadow: var(--shadow-md, 0 4px 6px rgba(0,0,0,0.1));
-}}
+    generators maps brand names to their generators; each brand writes to
+    its own subdirectory of output_dir, except a brand named '' which
+    writes to output_dir itself. Returns one result per component and brand.
+    """
+    output_dirs = {brand: output_dir / brand if brand else output_dir for brand in generators}
+    for path in output_dirs.values():
+        path.mkdir(parents=True, exist_ok=True)
+    
+    brands = [brand for brand in generators for _ in components]
+    names = [component for _ in generators for component in components]
+    dirs = [str(output_dirs[brand]) for brand in brands]
+    css = [include_css] * len(brands)
+    workers = min(workers or os.cpu_count() or 1, len(brands)) or 1
+    if workers == 1:
+        return [
+            generate_worker(brand, name, path, include_css, generators[brand])
+            for brand, name, path in zip(brands, names, dirs)
+        ]
+    if executor == 'thread':
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(generate_worker, brands, names, dirs, css,
+                                 [generators[brand] for brand in brands]))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(generators,)) as pool:
+        return list(pool.map(generate_worker, brands, names, dirs, css))
 
-"""
-            elif state == 'active':
-                css += f""".{component_name}:active {{
-  transform: translateY(0);
-}}
 
-"""
-        
-        # Add size variants if applicable
-        if 'size' in template['props']:
-            css += "/* Sizes */\n"
-            sizes = {
-                'sm': ('--spacing-2', '--spacing-3', '--font-size-sm'),
-                'md': ('--spacing-3', '--spacing-4', '--font-size-base'),
-                'lg': ('--spacing-4', '--spacing-6', '--font-size-lg')
-            }
-            for size, (pad_y, pad_x, font) in sizes.items():
-                css += f""".{component_name}--{size} {{
-  padding: var({pad_y}, 0.5rem) var({pad_x}, 1rem);
-  font-size: var({font}, 1rem);
-}}
+def parse_brands(specs: List[str]) -> Dict[str, str]:
+    """Return brand name -> tokens file from 'name=path' specs, or paths named after their file."""
+    brands = {}
+    for spec in specs:
+        name, separator, path = spec.partition('=')
+        if not separator:
+            name, path = Path(spec).stem, spec
+        if name in brands:
+            raise ValueError(f"Duplicate brand: {name}")
+        if not Path(path).exists():
+            raise ValueError(f"Tokens file for brand '{name}' not found: {path}")
+        brands[name] = path
+    return brands
 
-"""
-        
-        return css
-    
-    def generate_component(self, component_name: str, output_dir: Path, include_css: bool = True) -> None:
-        """Generate component documentation and optionally CSS."""
-        # Generate documentation
-        doc = self.generate_component_doc(component_name)
-        doc_file = output_dir / f"{component_name}.md"
-        with open(doc_file, 'w', encoding='utf-8') as f:
-            f.write(doc)
-        print(f"  ✓ Created {component_name}.md")
-        
-        # Generate CSS if requested
-        if include_css:
-            css = self.generate_component_css(component_name)
-            css_file = output_dir / f"{component_name}.css"
-            with open(css_file, 'w', encoding='utf-8') as f:
-                f.write(css)
-            print(f"  ✓ Created {component_name}.css")
+
+def load_templates(file_path: str) -> Dict[str, Dict[str, Any]]:
+    """Read extra component templates, shaped like COMPONENT_TEMPLATES, from a JSON file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        templates = json.load(f)
+    for name, template in templates.items():
+        missing = [key for key in TEMPLATE_KEYS if key not in template]
+        if missing:
+            raise ValueError(f"Template '{name}' is missing: {', '.join(missing)}")
+    return templates
 
 
 def main():
     parser = argparse.ArgumentParser(
         description='Generate component specifications and code'
     )
-    parser.add_argument(
+    selection = parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument(
         '--components',
-        required=True,
         help='Comma-separated list of components to generate (e.g., button,input,card)'
     )
+    selection.add_argument(
+        '--all',
+        action='store_true',
+        help='Generate every known component, including those from --templates'
+    )
     parser.add_argument(
         '--tokens',
         help='Path to tokens JSON file (optional)'
     )
+    parser.add_argument(
+        '--brands',
+        nargs='+',
+        help='Tokens file per brand, as NAME=PATH or a path named after the brand; '
+             'each brand is written to its own subdirectory'
+    )
+    parser.add_argument(
+        '--templates',
+        help='JSON file of extra component templates, shaped like the built-in ones'
+    )
     parser.add_argument(
         '--output',
         required=True,
@@ -307,38 +375,78 @@ def main():
         default=True,
         help='Include CSS implementation (default: true)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Components rendered in parallel (default: CPU count; 1 runs serially)'
+    )
+    parser.add_argument(
+        '--executor',
+        choices=['process', 'thread'],
+        default='process',
+        help='Worker pool type (default: process)'
+    )
     
     args = parser.parse_args()
     
-    # Parse components list
-    components = [c.strip() for c in args.components.split(',')]
+    if args.tokens and args.brands:
+        print("Error: Use either --tokens or --brands")
+        return 1
     
     # Create output directory
     output_path = Path(args.output)
     output_path.mkdir(parents=True, exist_ok=True)
     
     try:
-        # Initialize generator
-        generator = ComponentGenerator(args.tokens)
+        templates = load_templates(args.templates) if args.templates else None
+        
+        # Initialize one generator per brand, so each brand's tokens are loaded once
+        if args.brands:
+            generators = {
+                brand: ComponentGenerator(tokens_file, templates)
+                for brand, tokens_file in parse_brands(args.brands).items()
+            }
+        else:
+            generators = {'': ComponentGenerator(args.tokens, templates)}
+        known = next(iter(generators.values())).templates
         
-        print(f"Generating {len(components)} component(s)...")
+        # Parse components list
+        if args.all:
+            components = list(known)
+        else:
+            components = []
+            for component in (c.strip() for c in args.components.split(',')):
+                if component not in known:
+                    print(f"⚠️  Unknown component: {component} (skipping)")
+                    continue
+                components.append(component)
         
-        # Generate each component
-        for component in components:
-            if component not in ComponentGenerator.COMPONENT_TEMPLATES:
-                print(f"⚠️  Unknown component: {component} (skipping)")
-                continue
-            
-            generator.generate_component(
-                component,
-                output_path,
-                include_css=args.include_css
-            )
+        print(f"Generating {len(components)} component(s) for {len(generators)} brand(s)..."
+              if args.brands else f"Generating {len(components)} component(s)...")
         
-        print(f"\n✅ Components generated successfully in {output_path}")
+        start = time.perf_counter()
+        results = generate_batch(generators, components, output_path,
+                                 include_css=args.include_css,
+                                 workers=args.workers, executor=args.executor)
+        elapsed = time.perf_counter() - start
         
-        return 0
+        written = 0
+        unchanged = 0
+        for result in results:
+            for record in result['files']:
+                name = Path(record['file']).relative_to(output_path)
+                if record['written']:
+                    written += 1
+                    print(f"  ✓ Created {name}")
+                else:
+                    unchanged += 1
+                    print(f"  = {name} unchanged")
+        
+        print(f"\n✅ Components generated successfully in {output_path} "
+              f"({written} written, {unchanged} unchanged, {elapsed:.2f}s)")
         
+        return 0
+    
     except Exception as e:
         print(f"Error: {e}")
         return 1
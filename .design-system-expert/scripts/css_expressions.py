@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+CSS Expressions
+Compiles calc() and var() in token values and folds them to concrete values.
+
+A value is parsed once into a template of literal text and expression
+nodes: var() references (with their fallbacks) and calc() bodies, which are
+parsed into an AST of numbers, references and operations. Evaluating a
+template substitutes every var() with the evaluated value of the variable it
+names, or with its fallback when the variable is undefined or part of a
+cycle, and constant-folds every calc() to a single number with its unit.
+Lengths in px and rem fold together (as rem, at 16px per rem); anything
+that cannot be folded, such as calc(100% - 1rem), keeps its calc() with the
+foldable parts folded.
+
+Parsed templates, variable values and folded nodes are memoized, so a
+reference or sub-expression shared by many tokens is evaluated once.
+
+Usage:
+    python css_expressions.py --input tokens/*.json
+    python css_expressions.py --input tokens/*.json --expression 'calc(var(--spacing) * 3)'
+"""
+
+import json
+import re
+import argparse
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional, NamedTuple, Union, Tuple, Set
+
+from reference_graph import ReferenceGraph
+
+# Root font size px and rem lengths are converted with
+BASE_PX_FONT_SIZE = 16
+
+# Variables token.md takes from the Tailwind v4 theme rather than declaring them
+DEFAULT_VARIABLES = {'spacing': '0.25rem'}
+
+# Decimal places kept when a folded number is written out
+PRECISION = 4
+
+NUMBER_PATTERN = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(%|[a-zA-Z]+)?')
+NAME_PATTERN = re.compile(r'--[a-zA-Z0-9_-]+')
+SPACE_PATTERN = re.compile(r'\s*')
+FUNCTION_PATTERN = re.compile(r'(?<![\w-])(var|calc)\(')
+# Next function, parenthesis or quote in literal text
+SCAN_PATTERN = re.compile(r'(?<![\w-])(var|calc)\(|["\'()]')
+# A value that is a single plain reference, the common case
+PLAIN_VAR_PATTERN = re.compile(r'var\(\s*--([a-zA-Z0-9_-]+)\s*\)')
+
+
+class Number(NamedTuple):
+    value: float
+    unit: str
+
+
+class Var(NamedTuple):
+    name: str                         # Without the leading '--'
+    fallback: Optional['Template']
+
+
+class Calc(NamedTuple):
+    body: Any
+
+
+class Operation(NamedTuple):
+    op: str
+    left: Any
+    right: Any
+
+
+class Template(NamedTuple):
+    """A value as literal text interleaved with Var and Calc nodes."""
+    parts: Tuple[Union[str, Var, Calc], ...]
+
+
+Node = Union[Number, Var, Calc, Operation]
+
+PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2}
+
+
+class ExpressionError(ValueError):
+    """Raised for a calc() or var() that cannot be parsed."""
+
+
+class Parser:
+    """Recursive-descent parser over one value."""
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+    
+    def error(self, message: str) -> ExpressionError:
+        return ExpressionError(f"{message} at position {self.pos} of '{self.text}'")
+    
+    def skip_space(self) -> None:
+        self.pos = SPACE_PATTERN.match(self.text, self.pos).end()
+    
+    def expect(self, char: str) -> None:
+        self.skip_space()
+        if not self.text.startswith(char, self.pos):
+            raise self.error(f"Expected '{char}'")
+        self.pos += 1
+    
+    def template(self, nested: bool = False) -> Template:
+        """Parse literal text and functions, up to the ')' closing a var() if nested."""
+        parts: List[Union[str, Var, Calc]] = []
+        depth = 0
+        start = self.pos
+        text = self.text
+        while True:
+            match = SCAN_PATTERN.search(text, self.pos)
+            if match is None:
+                self.pos = len(text)
+                break
+            self.pos = match.end()
+            char = match.group(0)
+            if match.group(1):
+                if match.start() > start:
+                    parts.append(text[start:match.start()])
+                parts.append(self.var() if match.group(1) == 'var' else Calc(self.calc_body()))
+                start = self.pos
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                if depth == 0 and nested:
+                    self.pos -= 1
+                    break
+                depth -= 1
+            else:
+                end = text.find(char, self.pos)
+                self.pos = len(text) if end < 0 else end + 1
+        if self.pos > start:
+            parts.append(text[start:self.pos])
+        return Template(tuple(parts))
+    
+    def var(self) -> Var:
+        """Parse the rest of var( --name [, fallback] )."""
+        self.skip_space()
+        match = NAME_PATTERN.match(self.text, self.pos)
+        if not match:
+            raise self.error("Expected a custom property name")
+        self.pos = match.end()
+        self.skip_space()
+        fallback = None
+        if self.text.startswith(',', self.pos):
+            self.pos += 1
+            self.skip_space()
+            fallback = self.template(nested=True)
+        self.expect(')')
+        return Var(match.group(0)[2:], fallback)
+    
+    def calc_body(self) -> Node:
+        """Parse the rest of calc( expression )."""
+        node = self.sum()
+        self.expect(')')
+        return node
+    
+    def sum(self) -> Node:
+        node = self.product()
+        while True:
+            self.skip_space()
+            op = self.text[self.pos:self.pos + 1]
+            if op not in ('+', '-'):
+                return node
+            self.pos += 1
+            node = Operation(op, node, self.product())
+    
+    def product(self) -> Node:
+        node = self.operand()
+        while True:
+            self.skip_space()
+            op = self.text[self.pos:self.pos + 1]
+            if op not in ('*', '/'):
+                return node
+            self.pos += 1
+            node = Operation(op, node, self.operand())
+    
+    def operand(self) -> Node:
+        self.skip_space()
+        if self.text.startswith('(', self.pos):
+            self.pos += 1
+            return self.calc_body()
+        match = FUNCTION_PATTERN.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            return self.var() if match.group(1) == 'var' else Calc(self.calc_body())
+        match = NUMBER_PATTERN.match(self.text, self.pos)
+        if not match:
+            raise self.error("Expected a number, var() or '('")
+        self.pos = match.end()
+        number = match.group(0)
+        unit = match.group(1) or ''
+        return Number(float(number[:len(number) - len(unit)]), unit)
+    
+    def expression(self) -> Node:
+        """Parse a whole string as one calc() body."""
+        node = self.sum()
+        self.skip_space()
+        if self.pos != len(self.text):
+            raise self.error("Unexpected text")
+        return node
+
+
+@lru_cache(maxsize=None)
+def parse_value(text: str) -> Template:
+    """Parse a value into a template; a value that does not parse stays literal text."""
+    match = PLAIN_VAR_PATTERN.fullmatch(text)
+    if match:
+        return Template((Var(match.group(1), None),))
+    try:
+        return Parser(text).template()
+    except ExpressionError:
+        return Template((text,))
+
+
+@lru_cache(maxsize=None)
+def parse_expression(text: str) -> Optional[Node]:
+    """Parse substituted variable text as a calc() operand, or None if it is not one."""
+    try:
+        return Parser(text).expression()
+    except ExpressionError:
+        return None
+
+
+def format_number(number: Number) -> str:
+    text = f"{number.value:.{PRECISION}f}".rstrip('0').rstrip('.')
+    return ('0' if text == '-0' else text) + number.unit
+
+
+def fold_operation(op: str, left: Number, right: Number) -> Optional[Number]:
+    """Combine two folded operands, or return None if their units do not combine."""
+    if op in ('+', '-'):
+        if left.unit != right.unit:
+            units = {left.unit, right.unit}
+            if units != {'px', 'rem'}:
+                return None
+            if left.unit == 'px':
+                left = Number(left.value / BASE_PX_FONT_SIZE, 'rem')
+            else:
+                right = Number(right.value / BASE_PX_FONT_SIZE, 'rem')
+        value = left.value + right.value if op == '+' else left.value - right.value
+        return Number(value, left.unit)
+    if op == '*':
+        if left.unit and right.unit:
+            return None
+        return Number(left.value * right.value, left.unit or right.unit)
+    if right.unit or right.value == 0:
+        return None
+    return Number(left.value / right.value, left.unit)
+
+
+class ExpressionEvaluator:
+    """Evaluates values against a set of CSS custom properties.
+
+    variables maps property names without the leading '--' to their raw
+    values; DEFAULT_VARIABLES fill in the ones it does not define. As in CSS,
+    every variable on a reference cycle is invalid, so var() uses of it take
+    their fallbacks. Cycles are found with Tarjan's strongly connected
+    components, run along the depth-first search that lookups already make,
+    so every member of a cycle is invalid whichever variable is evaluated
+    first.
+    """
+    
+    def __init__(self, variables: Optional[Dict[str, Any]] = None,
+                 defaults: Optional[Dict[str, str]] = None):
+        self.variables = dict(DEFAULT_VARIABLES if defaults is None else defaults)
+        self.variables.update(variables or {})
+        self.results: Dict[str, str] = {}
+        self.var_values: Dict[str, Optional[str]] = {}
+        self.folded: Dict[Node, Optional[Number]] = {}
+        self.rendered: Dict[Any, str] = {}
+        self.unresolved: Dict[str, int] = {}
+        # Depth-first search state: variables being evaluated, innermost last,
+        # and the search index, low link and stack of Tarjan's algorithm
+        self.resolving: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.low: Dict[str, int] = {}
+        self.stack: List[str] = []
+        self.on_stack: Set[str] = set()
+        self.self_references: Set[str] = set()
+    
+    def evaluate(self, value: Any) -> Any:
+        """Return a value with its var() references substituted and calc() folded."""
+        if not isinstance(value, str) or ('var(' not in value and 'calc(' not in value):
+            return value
+        result = self.results.get(value)
+        if result is None:
+            result = self.results[value] = self.render(parse_value(value))
+        return result
+    
+    def lookup(self, name: str) -> Optional[str]:
+        """Return the evaluated value of a variable, or None if it is undefined or invalid."""
+        if name in self.on_stack:
+            # A variable still on the search stack is on a cycle with the one being evaluated
+            current = self.resolving[-1]
+            self.low[current] = min(self.low[current], self.index[name])
+            if name == current:
+                self.self_references.add(name)
+            return None
+        if name in self.var_values:
+            return self.var_values[name]
+        raw = self.variables.get(name)
+        if raw is None:
+            return None
+        if not isinstance(raw, str) or 'var(' not in raw:
+            # Without references a variable cannot be on a cycle
+            value = self.var_values[name] = str(self.evaluate(raw)).strip()
+            return value
+        
+        index = self.index[name] = self.low[name] = len(self.index)
+        self.stack.append(name)
+        self.on_stack.add(name)
+        self.resolving.append(name)
+        try:
+            value = str(self.evaluate(raw)).strip()
+        finally:
+            self.resolving.pop()
+        if self.resolving:
+            parent = self.resolving[-1]
+            self.low[parent] = min(self.low[parent], self.low[name])
+        
+        # As in CSS, a variable that depends on an unresolvable one is itself invalid
+        if 'var(' in value:
+            value = None
+        if self.low[name] < index:
+            # On a cycle through a variable further up the stack
+            value = None
+        else:
+            component = []
+            while not component or component[-1] != name:
+                component.append(self.stack.pop())
+                self.on_stack.discard(component[-1])
+            if len(component) > 1 or name in self.self_references:
+                value = None
+        self.var_values[name] = value
+        return value
+    
+    def render(self, template: Template) -> str:
+        parts = template.parts
+        if len(parts) == 1:
+            return parts[0] if type(parts[0]) is str else self.render_node(parts[0])
+        return ''.join(part if type(part) is str else self.render_node(part) for part in parts)
+    
+    def render_node(self, node: Node) -> str:
+        """Write a node out as CSS, folded as far as its units allow."""
+        text = self.rendered.get(node)
+        if text is not None:
+            return text
+        
+        if type(node) is Var:
+            text = self.lookup(node.name)
+            if text is None:
+                if node.fallback is not None:
+                    text = self.render(node.fallback).strip()
+                else:
+                    self.unresolved[node.name] = self.unresolved.get(node.name, 0) + 1
+                    text = f"var(--{node.name})"
+        elif type(node) is Number:
+            text = format_number(node)
+        else:
+            number = self.fold(node)
+            if number is not None:
+                text = format_number(number)
+            elif type(node) is Calc:
+                text = f"calc({self.render_node(node.body)})"
+            else:
+                text = f"{self.render_operand(node, node.left)} {node.op} {self.render_operand(node, node.right, True)}"
+        self.rendered[node] = text
+        return text
+    
+    def render_operand(self, parent: Operation, node: Node, right: bool = False) -> str:
+        text = self.render_node(node)
+        if type(node) is Operation and self.fold(node) is None:
+            precedence = PRECEDENCE[node.op]
+            if precedence < PRECEDENCE[parent.op] or (right and precedence == PRECEDENCE[parent.op]):
+                return f"({text})"
+        return text
+    
+    def fold(self, node: Node) -> Optional[Number]:
+        """Return a node as a single number with its unit, or None if it does not fold."""
+        if node in self.folded:
+            return self.folded[node]
+        
+        if type(node) is Number:
+            number = node
+        elif type(node) is Calc:
+            number = self.fold(node.body)
+        elif type(node) is Var:
+            text = self.render_node(node)
+            # An undefined variable without a fallback is written back as itself and does not fold
+            resolved = node.fallback is not None or self.lookup(node.name) is not None
+            expression = parse_expression(text) if resolved else None
+            number = None if expression is None else self.fold(expression)
+        else:
+            left = self.fold(node.left)
+            right = self.fold(node.right) if left is not None else None
+            number = None if right is None else fold_operation(node.op, left, right)
+        self.folded[node] = number
+        return number
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Fold calc() and var() in token values to concrete values'
+    )
+    parser.add_argument(
+        '--input',
+        nargs='+',
+        required=True,
+        help='JSON token files that define the variables'
+    )
+    parser.add_argument(
+        '--expression',
+        help='Evaluate one expression instead of every token value'
+    )
+    parser.add_argument(
+        '--var',
+        action='append',
+        default=[],
+        metavar='NAME=VALUE',
+        help='Define or override a variable (e.g., spacing=4px)'
+    )
+    
+    args = parser.parse_args()
+    
+    missing = [path for path in args.input if not Path(path).exists()]
+    if missing:
+        print(f"Error: Input file '{missing[0]}' not found")
+        return 1
+    
+    try:
+        graph = ReferenceGraph(follow_vars=False)
+        for path in args.input:
+            with open(path, 'r', encoding='utf-8') as f:
+                graph.collect(json.load(f), [])
+        graph.build()
+        
+        variables = {
+            name: graph.values[path] if graph.resolve(path) is None else graph.resolve(path)
+            for name, path in graph.var_names.items()
+        }
+        for definition in args.var:
+            name, _, value = definition.partition('=')
+            variables[name.lstrip('-')] = value
+        evaluator = ExpressionEvaluator(variables)
+        
+        if args.expression:
+            print(evaluator.evaluate(args.expression))
+            return 0
+        
+        folded = 0
+        for name in variables:
+            value = variables[name]
+            result = evaluator.evaluate(value)
+            if result != value:
+                folded += 1
+                print(f"--{name}: {value} → {result}")
+        
+        print(f"\n✓ Folded {folded} of {len(variables)} values "
+              f"({len(evaluator.results)} distinct expressions, {len(evaluator.folded)} calc nodes)")
+        for name, count in evaluator.unresolved.items():
+            print(f"⚠️  var(--{name}) is undefined and has no fallback ({count} use(s))")
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -3,6 +3,9 @@
 Design System Builder
 Generates a complete design system structure with tokens, config, and documentation.
 
+The README and getting started guide are rendered from templates/readme.md.tmpl
+and templates/getting_started.md.tmpl.
+
 Usage:
     python design_system_builder.py --name "My Design System" --brand-color "#3B82F6" --output design-system/
 """
@@ -10,7 +13,10 @@ Usage:
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from profiler import Profiler, NULL_PROFILER, count_tokens, add_profile_arguments, profiler_from_args, finish_profile
+from template_engine import get_template
 
 
 class DesignSystemBuilder:
@@ -19,7 +25,7 @@ class DesignSystemBuilder:
     def __init__(self, name: str, brand_color: str = "#3B82F6"):
         self.name = name
         self.brand_color = brand_color
-        
+    
     def create_directory_structure(self, output_dir: Path) -> None:
         """Create the design system directory structure."""
         directories = [
@@ -200,154 +206,16 @@ class DesignSystemBuilder:
     
     def generate_readme(self) -> str:
         """Generate README.md content."""
-        return f"""# {self.name}
-
-A comprehensive design system with design tokens and Style Dictionary integration.
-
-## Getting Started
-
-### Installation
-
-```bash
-npm install
-```
-
-### Build Tokens
-
-```bash
-npm run build
-```
-
-This will generate CSS and SCSS variables in the `build/` directory.
-
-## Structure
-
-```
-{self.name.lower().replace(" ", "-")}/
-├── tokens/           # Design tokens (JSON)
-├── build/            # Generated files
-│   ├── css/         # CSS variables
-│   └── scss/        # SCSS variables
-├── components/       # Component specifications
-├── docs/            # Documentation
-├── config.json      # Style Dictionary config
-└── package.json     # npm configuration
-```
-
-## Tokens
-
-Design tokens are organized by category:
-
-- **colors.json**: Color palette and semantic colors
-- **typography.json**: Font families, sizes, weights, line heights
-- **spacing.json**: Spacing scale
-- **shadows.json**: Shadow definitions
-- **borders.json**: Border radius and width
-
-## Usage
-
-### CSS
-
-```css
-@import 'build/css/variables.css';
-
-.button {{
-  background: var(--color-brand-primary);
-  padding: var(--spacing-4);
-  border-radius: var(--border-radius-md);
-}}
-```
-
-### SCSS
-
-```scss
-@import 'build/scss/variables';
-
-.button {{
-  background: $color-brand-primary;
-  padding: $spacing-4;
-  border-radius: $border-radius-md;
-}}
-```
-
-## Documentation
-
-See the `docs/` directory for detailed documentation.
-
-## License
-
-MIT
-"""
+        return get_template('readme.md.tmpl').render(name=self.name)
     
     def generate_getting_started_doc(self) -> str:
         """Generate getting started documentation."""
-        return f"""# Getting Started with {self.name}
-
-## Overview
-
-{self.name} is a design system built with design tokens and Style Dictionary.
-
-## Installation
-
-1. Clone or download this design system
-2. Install dependencies:
-   ```bash
-   npm install
-   ```
-
-## Building Tokens
-
-To generate CSS and SCSS variables from design tokens:
-
-```bash
-npm run build
-```
-
-This will create:
-- `build/css/variables.css` - CSS custom properties
-- `build/scss/_variables.scss` - SCSS variables
-
-## Using Tokens
-
-### In CSS
-
-```css
-@import 'build/css/variables.css';
-
-.my-component {{
-  color: var(--color-text-primary);
-  background: var(--color-background-primary);
-  padding: var(--spacing-4);
-}}
-```
-
-### In SCSS
-
-```scss
-@import 'build/scss/variables';
-
-.my-component {{
-  color: $color-text-primary;
-  background: $color-background-primary;
-  padding: $spacing-4;
-}}
-```
-
-## Modifying Tokens
-
-1. Edit token files in `tokens/` directory
-2. Run `npm run build` to regenerate variables
-3. Use the updated variables in your styles
-
-## Next Steps
-
-- Explore token categories in `tokens/`
-- Read component documentation in `components/`
-- Review design principles in `docs/`
-"""
+        return get_template('getting_started.md.tmpl').render(name=self.name)
     
-    def build(self, output_dir: str, include_examples: bool = True) -> None:
+    def build(self, output_dir: str, include_examples: bool = True,
+              profiler: Optional[Profiler] = None) -> None:
         """Build the complete design system."""
+        profiler = profiler or NULL_PROFILER
         output_path = Path(output_dir)
         
         print(f"Creating design system: {self.name}")
@@ -355,54 +223,60 @@ This will create:
         
         # Create directory structure
         print("Creating directory structure...")
-        self.create_directory_structure(output_path)
+        with profiler.stage('directories'):
+            self.create_directory_structure(output_path)
         
         # Generate and save tokens
         print("Generating tokens...")
-        tokens = {
-            "colors": self.generate_color_tokens(),
-            "typography": self.generate_typography_tokens(),
-            "spacing": self.generate_spacing_tokens(),
-            "shadows": self.generate_shadow_tokens(),
-            "borders": self.generate_border_tokens()
-        }
+        with profiler.stage('generate tokens') as stage:
+            tokens = {
+                "colors": self.generate_color_tokens(),
+                "typography": self.generate_typography_tokens(),
+                "spacing": self.generate_spacing_tokens(),
+                "shadows": self.generate_shadow_tokens(),
+                "borders": self.generate_border_tokens()
+            }
+            stage['tokens'] = count_tokens(tokens)
         
-        for name, token_data in tokens.items():
-            token_file = output_path / "tokens" / f"{name}.json"
-            with open(token_file, 'w', encoding='utf-8') as f:
-                json.dump(token_data, f, indent=2)
-            print(f"  ✓ Created {name}.json")
+        with profiler.stage('emit tokens', files=len(tokens)):
+            for name, token_data in tokens.items():
+                token_file = output_path / "tokens" / f"{name}.json"
+                with open(token_file, 'w', encoding='utf-8') as f:
+                    json.dump(token_data, f, indent=2)
+                print(f"  ✓ Created {name}.json")
         
         # Generate Style Dictionary config
         print("Generating Style Dictionary config...")
-        config = self.generate_style_dictionary_config()
-        config_file = output_path / "config.json"
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
-        print("  ✓ Created config.json")
-        
-        # Generate package.json
-        print("Generating package.json...")
-        package = self.generate_package_json()
-        package_file = output_path / "package.json"
-        with open(package_file, 'w', encoding='utf-8') as f:
-            json.dump(package, f, indent=2)
-        print("  ✓ Created package.json")
+        with profiler.stage('emit config', files=2):
+            config = self.generate_style_dictionary_config()
+            config_file = output_path / "config.json"
+            with open(config_file, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2)
+            print("  ✓ Created config.json")
+            
+            # Generate package.json
+            print("Generating package.json...")
+            package = self.generate_package_json()
+            package_file = output_path / "package.json"
+            with open(package_file, 'w', encoding='utf-8') as f:
+                json.dump(package, f, indent=2)
+            print("  ✓ Created package.json")
         
         # Generate README
         print("Generating documentation...")
-        readme = self.generate_readme()
-        readme_file = output_path / "README.md"
-        with open(readme_file, 'w', encoding='utf-8') as f:
-            f.write(readme)
-        print("  ✓ Created README.md")
-        
-        # Generate getting started doc
-        getting_started = self.generate_getting_started_doc()
-        docs_file = output_path / "docs" / "getting-started.md"
-        with open(docs_file, 'w', encoding='utf-8') as f:
-            f.write(getting_started)
-        print("  ✓ Created docs/getting-started.md")
+        with profiler.stage('emit docs', files=2):
+            readme = self.generate_readme()
+            readme_file = output_path / "README.md"
+            with open(readme_file, 'w', encoding='utf-8') as f:
+                f.write(readme)
+            print("  ✓ Created README.md")
+            
+            # Generate getting started doc
+            getting_started = self.generate_getting_started_doc()
+            docs_file = output_path / "docs" / "getting-started.md"
+            with open(docs_file, 'w', encoding='utf-8') as f:
+                f.write(getting_started)
+            print("  ✓ Created docs/getting-started.md")
         
         print(f"\n✅ Design system created successfully!")
         print(f"\nNext steps:")
@@ -435,16 +309,19 @@ def main():
         action='store_true',
         help='Include example components'
     )
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
     try:
         # Build design system
         builder = DesignSystemBuilder(args.name, args.brand_color)
-        builder.build(args.output, args.include_examples)
+        profiler = profiler_from_args(args)
+        builder.build(args.output, args.include_examples, profiler=profiler)
+        finish_profile(profiler, args)
         
         return 0
-        
+    
     except Exception as e:
         print(f"Error: {e}")
         return 1
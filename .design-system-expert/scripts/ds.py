@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Design System CLI
+Single entry point that runs the token pipeline steps in one process.
+
+Subcommands can be chained with '+'. Each step hands its result to the next
+one in memory: a converted token tree is validated, built and used for
+components without being written and parsed again, and a generated config
+supplies the platforms to build. Only argparse and cli_options, which
+defines the options shared with the standalone scripts, are imported at
+startup; each subcommand imports the modules it needs when it runs, and
+--importtime reports how long every import took, like `python -X importtime`.
+
+Usage:
+    python ds.py convert --input token.md --output tokens.json + validate --check-all
+    python ds.py convert --input token.md + config --platforms web,json + build --root out/
+    python ds.py --importtime validate --input tokens.json --check-all
+    python ds.py --profile build-profile convert --input token.md + build
+"""
+
+import builtins
+import sys
+import time
+import argparse
+from typing import Dict, List, Any, Optional
+
+from cli_options import add_cache_arguments, add_profile_arguments, add_validation_arguments, checks_from_args
+
+# Separates chained subcommands on the command line
+CHAIN_SEPARATOR = '+'
+
+
+class ImportTimer:
+    """Records self and cumulative time of every module imported while active."""
+    
+    def __init__(self):
+        self.records: List[tuple] = []   # (depth, module, self seconds, cumulative seconds)
+        self.stack: List[float] = []     # Time spent in nested imports, per open import
+        self.original_import = None
+    
+    def __enter__(self) -> 'ImportTimer':
+        self.original_import = builtins.__import__
+        builtins.__import__ = self.timed_import
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        builtins.__import__ = self.original_import
+    
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module = name
+        if level:
+            package = (globals or {}).get('__package__') or ''
+            module = package.rsplit('.', level - 1)[0] + ('.' + name if name else '')
+        if module in sys.modules:
+            return self.original_import(name, globals, locals, fromlist, level)
+        
+        depth = len(self.stack)
+        self.stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += elapsed
+            self.records.append((depth, module, elapsed - nested, elapsed))
+    
+    def report(self, min_ms: float = 1.0) -> str:
+        """Format the imports that took at least min_ms, nested as -X importtime does."""
+        lines = ["import time:    self [ms] | cumulative | imported module"]
+        for depth, module, own, cumulative in self.records:
+            if cumulative * 1000 >= min_ms:
+                lines.append(f"import time: {own * 1000:>12.1f} | {cumulative * 1000:>10.1f} | {'  ' * depth}{module}")
+        total = sum(cumulative for depth, _, _, cumulative in self.records if depth == 0)
+        lines.append(f"import time: {len(self.records)} module(s) in {total * 1000:.1f} ms")
+        return "\n".join(lines)
+
+
+class PipelineState:
+    """Results handed from one chained step to the next."""
+    
+    def __init__(self):
+        self.tokens: Optional[Dict[str, Any]] = None   # Token tree from convert
+        self.tokens_file: Optional[str] = None          # Where that tree was saved, if anywhere
+        self.config: Optional[Dict[str, Any]] = None   # Style Dictionary config from config
+        self.profiler = None                            # Profiler shared by all steps, with --profile
+
+
+def run_convert(args: argparse.Namespace, state: PipelineState) -> int:
+    from build_cache import cache_from_args
+    from token_converter import TokenConverter
+    
+    converter = TokenConverter()
+    cache = cache_from_args(args)
+    state.tokens = converter.convert(args.input, validate=args.validate, cache=cache,
+                                     profiler=state.profiler)
+    print(f"✓ Converted {args.input}: {len(state.tokens)} token categories")
+    
+    if args.output:
+        converter.save_json(state.tokens, args.output, pretty=args.format == 'pretty')
+        state.tokens_file = args.output
+        print(f"  ✓ Saved {args.output}")
+    return 0
+
+
+def run_validate(args: argparse.Namespace, state: PipelineState) -> int:
+    from build_cache import cache_from_args
+    from token_validator import TokenValidator, expand_inputs
+    
+    checks = checks_from_args(args)
+    if not any(checks.values()):
+        print("Error: No checks specified. Use --check-all or specific --check-* flags")
+        return 1
+    
+    categories = [c.strip() for c in args.categories.split(',')] if args.categories else None
+    validator = TokenValidator(options={'delta_e': args.delta_e}, profiler=state.profiler)
+    if args.input:
+        input_files = expand_inputs(args.input)
+        if not input_files:
+            print(f"Error: No input files found for {', '.join(args.input)}")
+            return 1
+        if categories and len(input_files) > 1:
+            print("Error: --categories needs a single input file")
+            return 1
+        cache = cache_from_args(args)
+        if len(input_files) == 1:
+            success, report = validator.validate_file(input_files[0], checks, cache=cache,
+                                                      categories=categories)
+        else:
+            success, report = validator.validate_files(input_files, checks, workers=args.workers,
+                                                       cache=cache)
+    elif categories:
+        print("Error: --categories needs a single input file")
+        return 1
+    elif state.tokens is not None:
+        validator.run_checks(state.tokens, [name for name, enabled in checks.items() if enabled])
+        success, report = not validator.errors, validator.generate_report()
+    else:
+        print("Error: validate needs --input or a preceding convert step")
+        return 1
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"✓ Report saved to {args.output}")
+    else:
+        print(report)
+    
+    print(f"✓ Validation: {len(validator.errors)} error(s), {len(validator.warnings)} warning(s)")
+    if args.strict and validator.warnings:
+        print("❌ Strict mode: Treating warnings as errors")
+        return 1
+    return 0 if success else 1
+
+
+def run_config(args: argparse.Namespace, state: PipelineState) -> int:
+    from style_dictionary_config_generator import StyleDictionaryConfigGenerator
+    
+    generator = StyleDictionaryConfigGenerator()
+    generator.set_source([args.source])
+    for platform in [p.strip() for p in args.platforms.split(',')]:
+        if platform not in StyleDictionaryConfigGenerator.PLATFORM_CONFIGS:
+            print(f"⚠️  Unknown platform: {platform} (skipping)")
+            continue
+        generator.add_platform(platform)
+    
+    if not generator.config["platforms"]:
+        print("Error: No valid platforms specified")
+        return 1
+    
+    state.config = generator.generate()
+    print(f"✓ Config with platforms: {', '.join(state.config['platforms'])}")
+    if args.output:
+        generator.save(args.output)
+        print(f"  ✓ Saved {args.output}")
+    return 0
+
+
+def run_build(args: argparse.Namespace, state: PipelineState) -> int:
+    from build_driver import BuildDriver, load_platforms, report_outputs
+    
+    platforms = state.config['platforms'] if state.config else load_platforms(args.config)
+    if args.platforms:
+        selected = [p.strip() for p in args.platforms.split(',')]
+        unknown = [p for p in selected if p not in platforms]
+        if unknown:
+            print(f"Error: Unknown platform(s): {', '.join(unknown)}")
+            return 1
+        platforms = {name: platforms[name] for name in selected}
+    
+    driver = BuildDriver(platforms, root=args.root, profiler=state.profiler)
+    if args.source or state.tokens is None:
+        sources = args.source or (state.config or {}).get('source') or ['tokens/**/*.json']
+        driver.load(sources)
+    else:
+        driver.load_tree(state.tokens)
+    if not driver.tokens:
+        print("Error: No tokens to build")
+        return 1
+    
+    results = driver.build(workers=args.workers, executor=args.executor, force=args.force)
+    for result in results:
+        written = sum(1 for output in result['outputs'] if output['status'] == 'written')
+        print(f"✓ {result['platform']}: {written} of {len(result['files'])} file(s) regenerated "
+              f"in {result['elapsed_ms']:.1f} ms")
+        for line in report_outputs(result['outputs']):
+            if not line.startswith('·'):
+                print(f"    {line}")
+    print(f"  Resolved {len(driver.tokens)} tokens in {driver.timings['resolve']:.1f} ms")
+    return 0
+
+
+def run_components(args: argparse.Namespace, state: PipelineState) -> int:
+    from pathlib import Path
+    from component_generator import ComponentGenerator
+    
+    generator = ComponentGenerator(args.tokens)
+    if not args.tokens and state.tokens is not None:
+        generator.tokens = state.tokens
+    
+    output_path = Path(args.output)
+    output_path.mkdir(parents=True, exist_ok=True)
+    for component in [c.strip() for c in args.components.split(',')]:
+        if component not in ComponentGenerator.COMPONENT_TEMPLATES:
+            print(f"⚠️  Unknown component: {component} (skipping)")
+            continue
+        generator.generate_component(component, output_path)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='ds',
+        description=f"Run design system pipeline steps; chain subcommands with '{CHAIN_SEPARATOR}'"
+    )
+    parser.add_argument(
+        '--importtime',
+        action='store_true',
+        help='Report module import times when done'
+    )
+    parser.add_argument(
+        '--importtime-min',
+        type=float,
+        default=1.0,
+        help='Only list imports taking at least this many ms (default: 1.0)'
+    )
+    add_profile_arguments(parser)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    convert = subparsers.add_parser('convert', help='Convert CSS custom properties to token JSON')
+    convert.add_argument('--input', required=True, help='Input CSS file path')
+    convert.add_argument('--output', help='Output JSON file path (optional when chained)')
+    convert.add_argument('--validate', action='store_true', help='Validate tokens after conversion')
+    convert.add_argument('--format', choices=['pretty', 'compact'], default='pretty',
+                         help='Output format (default: pretty)')
+    add_cache_arguments(convert)
+    convert.set_defaults(run=run_convert)
+    
+    validate = subparsers.add_parser('validate', help='Validate design tokens')
+    validate.add_argument('--input', nargs='+',
+                          help='Token files, directories or globs (default: tokens from convert)')
+    add_validation_arguments(validate)
+    validate.add_argument('--output', help='Output report file path (optional)')
+    add_cache_arguments(validate)
+    validate.set_defaults(run=run_validate)
+    
+    config = subparsers.add_parser('config', help='Generate a Style Dictionary configuration')
+    config.add_argument('--platforms', required=True,
+                        help='Comma-separated list of platforms (web, scss, ios, android, json)')
+    config.add_argument('--source', default='tokens/**/*.json',
+                        help='Source file pattern (default: tokens/**/*.json)')
+    config.add_argument('--output', help='Output configuration file path (optional when chained)')
+    config.set_defaults(run=run_config)
+    
+    build = subparsers.add_parser('build', help='Build platform outputs without Node')
+    build.add_argument('--source', nargs='+',
+                       help='Token source globs (default: tokens from convert, else tokens/**/*.json)')
+    build.add_argument('--config',
+                       help='Config JSON to take platforms from (default: from config, else sd.config.mjs)')
+    build.add_argument('--platforms', help='Comma-separated subset of platforms to build (default: all)')
+    build.add_argument('--root', default='.', help='Directory that build paths are relative to (default: .)')
+    build.add_argument('--workers', type=int, help='Number of parallel workers')
+    build.add_argument('--executor', choices=['process', 'thread'], default='process',
+                       help='Worker pool type (default: process)')
+    build.add_argument('--force', action='store_true',
+                       help='Render every output, even if its inputs are unchanged')
+    build.set_defaults(run=run_build)
+    
+    components = subparsers.add_parser('components', help='Generate component docs and CSS')
+    components.add_argument('--components', required=True,
+                            help='Comma-separated list of components (e.g., button,input,card)')
+    components.add_argument('--output', required=True, help='Output directory path')
+    components.add_argument('--tokens', help='Path to tokens JSON file (default: tokens from convert)')
+    components.set_defaults(run=run_components)
+    
+    return parser
+
+
+def split_chain(argv: List[str]) -> List[List[str]]:
+    """Split the command line into one argument list per chained subcommand."""
+    chain = [[]]
+    for arg in argv:
+        if arg == CHAIN_SEPARATOR:
+            chain.append([])
+        else:
+            chain[-1].append(arg)
+    return chain
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = build_parser()
+    segments = split_chain(sys.argv[1:] if argv is None else argv)
+    steps = [parser.parse_args(segment) for segment in segments]
+    
+    # Global options are taken from the first step
+    timer = ImportTimer() if steps[0].importtime else None
+    if timer:
+        timer.__enter__()
+    
+    state = PipelineState()
+    if steps[0].profile:
+        from profiler import profiler_from_args
+        state.profiler = profiler_from_args(steps[0])
+    
+    status = 0
+    start = time.perf_counter()
+    try:
+        for args in steps:
+            step_start = time.perf_counter()
+            print(f"▶ {args.command}")
+            try:
+                if state.profiler:
+                    with state.profiler.stage(args.command):
+                        status = args.run(args, state)
+                else:
+                    status = args.run(args, state)
+            except Exception as e:
+                print(f"Error: {e}")
+                status = 1
+            print(f"  ({(time.perf_counter() - step_start) * 1000:.1f} ms)")
+            if status:
+                print(f"❌ Stopped after {args.command}")
+                break
+    finally:
+        if timer:
+            timer.__exit__()
+    
+    if len(steps) > 1 and not status:
+        print(f"\n✅ Ran {len(steps)} steps in {(time.perf_counter() - start) * 1000:.1f} ms")
+    if timer:
+        print("\n" + timer.report(steps[0].importtime_min))
+    if state.profiler:
+        from profiler import finish_profile
+        finish_profile(state.profiler, steps[0])
+    return status
+
+
+if __name__ == '__main__':
+    exit(main())
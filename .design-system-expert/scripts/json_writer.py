@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON Writer
+Writes a token tree as JSON straight from (path, token) pairs.
+
+json.dump needs the whole nested tree in memory before the first byte is
+written. JSONTreeWriter instead takes tokens one at a time, in depth-first
+order, and only keeps the keys of the objects currently open, so its memory
+is bounded by the depth of the tree. Output is byte-for-byte what json.dump
+would write for the equivalent tree, in both pretty (indent) and compact
+mode. dump_store writes a TokenStore this way, without building the tree
+that TokenStore.to_dict would return.
+
+Usage:
+    python json_writer.py --input tokens.json --output tokens.out.json --indent 2
+"""
+
+import json
+import argparse
+from json.encoder import encode_basestring, encode_basestring_ascii
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Sequence, TextIO, Tuple, Union
+
+from token_store import TokenStore
+
+
+class JSONTreeWriter:
+    """Writes one JSON object from tokens given in depth-first order."""
+    
+    def __init__(self, stream: TextIO, indent: Optional[Union[int, str]] = None,
+                 ensure_ascii: bool = True):
+        self.stream = stream
+        self.indent = ' ' * indent if isinstance(indent, int) else indent
+        self.ensure_ascii = ensure_ascii
+        self.encode_string = encode_basestring_ascii if ensure_ascii else encode_basestring
+        # Same separators json.dump uses for the indent setting
+        self.item_separator = ',' if self.indent is not None else ', '
+        # Line break plus indentation per nesting level
+        self.newlines = [''] if self.indent is None else ['\n']
+        # Keys of the open objects below the root, and whether each open object has members
+        self.keys: List[str] = []
+        self.has_members: List[bool] = []
+    
+    def newline(self, level: int) -> str:
+        while len(self.newlines) <= level:
+            self.newlines.append(self.newlines[-1] + (self.indent or ''))
+        return self.newlines[level]
+    
+    def encode(self, value: Any) -> str:
+        """Encode a value as json.dump would at the current nesting level."""
+        if type(value) is str:
+            return self.encode_string(value)
+        text = json.dumps(value, indent=self.indent, ensure_ascii=self.ensure_ascii)
+        if self.indent and '\n' in text:
+            # Newlines only occur between members; strings have theirs escaped
+            text = text.replace('\n', self.newline(len(self.has_members)))
+        return text
+    
+    def start_member(self, key: str, chunks: List[str]) -> None:
+        if self.has_members[-1]:
+            chunks.append(self.item_separator)
+        self.has_members[-1] = True
+        chunks.append(self.newline(len(self.has_members)))
+        chunks.append(self.encode_string(key))
+        chunks.append(': ')
+    
+    def open(self, chunks: List[str], key: Optional[str] = None) -> None:
+        """Open the root object, or an object member of the innermost open object."""
+        if key is not None:
+            self.start_member(key, chunks)
+            self.keys.append(key)
+        chunks.append('{')
+        self.has_members.append(False)
+    
+    def close(self, chunks: List[str]) -> None:
+        if self.has_members.pop():
+            chunks.append(self.newline(len(self.has_members)))
+        chunks.append('}')
+        if self.has_members:
+            self.keys.pop()
+    
+    def write(self, parts: Sequence[str], token: Dict[str, Any]) -> None:
+        """Write one token at a path; tokens nested below it may follow.
+
+        Raises ValueError if the path is not after the previous one in
+        depth-first order (a token must come before the tokens nested in it).
+        """
+        chunks = []
+        if not self.has_members:
+            self.open(chunks)
+        
+        common = 0
+        while common < len(self.keys) and common < len(parts) and self.keys[common] == parts[common]:
+            common += 1
+        if common == len(parts):
+            raise ValueError(f"Token '{'.'.join(parts)}' is out of depth-first order")
+        
+        while len(self.keys) > common:
+            self.close(chunks)
+        for key in parts[common:]:
+            self.open(chunks, key)
+        for key, value in token.items():
+            self.start_member(key, chunks)
+            chunks.append(self.encode(value))
+        self.stream.write(''.join(chunks))
+    
+    def finish(self) -> None:
+        """Close every open object, writing '{}' if no token was written."""
+        chunks = []
+        if not self.has_members:
+            self.open(chunks)
+        while self.has_members:
+            self.close(chunks)
+        self.stream.write(''.join(chunks))
+
+
+def write_json(pairs: Iterable[Tuple[Union[str, Sequence[str]], Dict[str, Any]]], stream: TextIO,
+               indent: Optional[Union[int, str]] = None, ensure_ascii: bool = True) -> None:
+    """Write (path, token) pairs in depth-first order as one JSON object.
+
+    Paths are dotted strings or sequences of keys. Each branch must be
+    written in one go: once a path leaves a branch it cannot come back.
+    """
+    writer = JSONTreeWriter(stream, indent, ensure_ascii)
+    for path, token in pairs:
+        writer.write(path.split('.') if isinstance(path, str) else path, token)
+    writer.finish()
+
+
+def store_order(store: TokenStore) -> Sequence[int]:
+    """Return the store's token indexes in the depth-first order of store.to_dict().
+
+    to_dict places each key where it was first inserted, drops the tokens
+    below a token that is set later, and nests later tokens inside a token.
+    The order here reproduces all of that. Stores built from a tree are
+    already in order, which is checked without holding any sort keys.
+    Raises ValueError for a token nested under a key of its parent token's
+    own (e.g. 'a' and 'a.value'), which to_dict merges in a way no
+    depth-first order can express.
+    """
+    previous = None
+    kept = 0
+    for key, _ in iter_order_keys(store):
+        if previous is not None and key < previous:
+            break
+        previous = key
+        kept += 1
+    else:
+        if kept == len(store):
+            return range(len(store))
+    return [i for _, i in sorted(iter_order_keys(store))]
+
+
+def iter_order_keys(store: TokenStore) -> Iterator[Tuple[Tuple[int, ...], int]]:
+    """Yield (sort key, index) for every token that store.to_dict() keeps.
+
+    A token's sort key holds, for each key on its path, the index of the
+    token whose insertion created that key in its parent.
+    """
+    # Group prefix -> index of the token that created its key
+    rank: Dict[str, int] = {}
+    for i, path in enumerate(store.paths):
+        parts = path.split('.')
+        key = []
+        # Index of the last ancestor token; setting it replaced the branch
+        replaced = -1
+        parent = None
+        prefix = ''
+        for depth, part in enumerate(parts):
+            if parent is not None and is_token_key(store, parent, part):
+                raise ValueError(f"Token '{path}' collides with a key of token '{prefix}'")
+            prefix = f"{prefix}.{part}" if depth else part
+            parent = store.index.get(prefix)
+            first = rank.get(prefix)
+            if first is None or first < replaced:
+                # Not created since the last replacement: by the token itself, or by this one
+                first = parent if parent is not None and replaced < parent <= i else i
+                if depth < len(parts) - 1 and i > replaced:
+                    rank[prefix] = first
+            key.append(first)
+            if parent is not None and depth < len(parts) - 1:
+                replaced = max(replaced, parent)
+        if i > replaced:
+            yield tuple(key), i
+
+
+def is_token_key(store: TokenStore, i: int, key: str) -> bool:
+    """Return True if the token at index i has a member named key."""
+    if key == 'value':
+        return True
+    if key == 'type':
+        return store.type_codes[i] != TokenStore.NO_TYPE
+    return key in store.extras.get(i, ())
+
+
+def dump_store(store: TokenStore, stream: TextIO, indent: Optional[Union[int, str]] = None,
+               ensure_ascii: bool = True) -> None:
+    """Write a store exactly as json.dump(store.to_dict(), ...) would, without building the tree."""
+    try:
+        order = store_order(store)
+    except ValueError:
+        json.dump(store.to_dict(), stream, indent=indent, ensure_ascii=ensure_ascii)
+        return
+    writer = JSONTreeWriter(stream, indent, ensure_ascii)
+    for i in order:
+        writer.write(store.paths[i].split('.'), store.token(i))
+    writer.finish()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Re-write a token file through the streaming JSON writer'
+    )
+    parser.add_argument(
+        '--input',
+        required=True,
+        help='Input JSON token file path'
+    )
+    parser.add_argument(
+        '--output',
+        required=True,
+        help='Output JSON file path'
+    )
+    parser.add_argument(
+        '--indent',
+        type=int,
+        help='Indent width for pretty output (default: compact)'
+    )
+    
+    args = parser.parse_args()
+    
+    if not Path(args.input).exists():
+        print(f"Error: Input file '{args.input}' not found")
+        return 1
+    
+    try:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            store = TokenStore.from_tree(json.load(f))
+        with open(args.output, 'w', encoding='utf-8') as f:
+            dump_store(store, f, indent=args.indent, ensure_ascii=False)
+        print(f"✓ Wrote {len(store)} tokens to {args.output}")
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Lazy Tokens
+Read-only token file whose top-level categories are parsed on demand.
+
+The first time a file is opened, its top-level object is scanned once and
+the byte range of every category's value is recorded. The index is cached
+in the index directory, .token-cache/index by default (the validator uses
+its --cache-dir instead), and reused for as long as the file's size and
+modification time are unchanged; nothing is written next to the token
+file. If the directory cannot be written, the index is simply not cached.
+Later runs only seek to and parse the categories they actually access, so
+a command that needs a single category no longer pays for loading the
+whole file.
+
+Usage:
+    python lazy_tokens.py --input tokens.json
+    python lazy_tokens.py --input tokens.json --category color
+    python lazy_tokens.py --input tokens.json --index-dir .cache/index
+    python lazy_tokens.py --input tokens.json --index-dir ''
+"""
+
+import hashlib
+import json
+import os
+import argparse
+from collections.abc import Mapping
+from json.decoder import WHITESPACE, scanstring
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+
+from build_cache import make_temp_file
+from cli_options import DEFAULT_CACHE_DIR
+
+# Where the category index is cached unless told otherwise
+DEFAULT_INDEX_DIR = str(Path(DEFAULT_CACHE_DIR) / 'index')
+
+
+class LazyTokens(Mapping):
+    """Mapping of top-level category name to its parsed token subtree."""
+    
+    # Bump when the layout of index files changes
+    INDEX_VERSION = 1
+    
+    def __init__(self, file_path: str, index_dir: Optional[str] = DEFAULT_INDEX_DIR):
+        self.file_path = Path(file_path)
+        # With index_dir None or '' the index only lives as long as this object
+        self.index_path: Optional[Path] = None
+        if index_dir:
+            key = hashlib.sha256(str(self.file_path.resolve()).encode('utf-8')).hexdigest()[:16]
+            self.index_path = Path(index_dir) / f"{self.file_path.name}.{key}.index"
+        self.loaded: Dict[str, Any] = {}
+        self._ranges: Optional[Dict[str, Tuple[int, int]]] = None
+    
+    @property
+    def ranges(self) -> Dict[str, Tuple[int, int]]:
+        """Category name -> (start, end) byte offsets of its value, built on first use."""
+        if self._ranges is None:
+            self._ranges = self.read_index()
+            if self._ranges is None:
+                self._ranges = self.build_index()
+        return self._ranges
+    
+    def file_stamp(self) -> List[int]:
+        stat = self.file_path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def read_index(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Return the cached index if it still matches the file, else None."""
+        if self.index_path is None:
+            return None
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get('version') != self.INDEX_VERSION or index.get('stamp') != self.file_stamp():
+            return None
+        return {name: (start, end) for name, start, end in index['categories']}
+    
+    def build_index(self) -> Dict[str, Tuple[int, int]]:
+        """Scan the file once, keeping the categories it parses, and cache the index.
+
+        Raises json.JSONDecodeError for invalid JSON, as json.load would.
+        """
+        stamp = self.file_stamp()
+        data = self.file_path.read_bytes()
+        text = data.decode('utf-8')
+        ranges = {}
+        self.loaded = {}
+        
+        try:
+            for name, start, end, value in scan_object(text):
+                ranges[name] = (start, end)
+                self.loaded[name] = value
+        except ValueError:
+            # Let the full parser report the error with its usual message
+            tree = json.loads(text)
+            if not isinstance(tree, dict):
+                raise ValueError(f"Top level of {self.file_path} is not an object")
+            raise
+        
+        # Character offsets match byte offsets unless the file has non-ASCII text
+        if len(text) != len(data):
+            ranges = {
+                name: (len(text[:start].encode('utf-8')), len(text[:end].encode('utf-8')))
+                for name, (start, end) in ranges.items()
+            }
+        
+        if self.index_path is not None:
+            self.save_index(ranges, stamp)
+        return ranges
+    
+    def save_index(self, ranges: Dict[str, Tuple[int, int]], stamp: List[int]) -> None:
+        """Write the index atomically; an unwritable directory just means no cache."""
+        index = {
+            "version": self.INDEX_VERSION,
+            "stamp": stamp,
+            "categories": [[name, start, end] for name, (start, end) in ranges.items()]
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = make_temp_file(self.index_path.parent)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            os.unlink(tmp_path)
+    
+    def read_range(self, start: int, end: int) -> Any:
+        with open(self.file_path, 'rb') as f:
+            f.seek(start)
+            return json.loads(f.read(end - start))
+    
+    def __getitem__(self, name: str) -> Any:
+        if name in self.loaded:
+            return self.loaded[name]
+        start, end = self.ranges[name]
+        try:
+            value = self.read_range(start, end)
+        except ValueError:
+            # The file changed without changing size or mtime; index it again
+            self._ranges = self.build_index()
+            return self.loaded[name]
+        self.loaded[name] = value
+        return value
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ranges)
+    
+    def __len__(self) -> int:
+        return len(self.ranges)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self.ranges
+    
+    def subset(self, names: List[str]) -> Dict[str, Any]:
+        """Return a token tree holding only the named categories that exist, in file order."""
+        wanted = set(names)
+        return {name: self[name] for name in self.ranges if name in wanted}
+    
+    def load(self) -> Dict[str, Any]:
+        """Return the whole token tree."""
+        ranges = self.ranges
+        if len(self.loaded) < len(ranges):
+            # One parse of the file beats a seek per category
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                self.loaded = json.load(f)
+        return {name: self.loaded[name] for name in ranges}
+
+
+def scan_object(text: str) -> Iterator[Tuple[str, int, int, Any]]:
+    """Yield (key, start, end, value) for each member of a JSON object document.
+
+    Offsets are character offsets of the value in text. Duplicate keys are
+    yielded again; the caller keeps the last one, as json.loads does.
+    Raises ValueError if text is not exactly one JSON object.
+    """
+    decoder = json.JSONDecoder()
+    end = WHITESPACE.match(text, 0).end()
+    if text[end:end + 1] != '{':
+        raise ValueError("Expected object")
+    end = WHITESPACE.match(text, end + 1).end()
+    
+    if text[end:end + 1] == '}':
+        end += 1
+    else:
+        while True:
+            if text[end:end + 1] != '"':
+                raise ValueError("Expected property name")
+            key, end = scanstring(text, end + 1)
+            end = WHITESPACE.match(text, end).end()
+            if text[end:end + 1] != ':':
+                raise ValueError("Expected ':'")
+            start = WHITESPACE.match(text, end + 1).end()
+            value, end = decoder.raw_decode(text, start)
+            yield key, start, end, value
+            
+            end = WHITESPACE.match(text, end).end()
+            delimiter = text[end:end + 1]
+            end = WHITESPACE.match(text, end + 1).end()
+            if delimiter == '}':
+                break
+            if delimiter != ',':
+                raise ValueError("Expected ',' or '}'")
+    
+    if WHITESPACE.match(text, end).end() != len(text):
+        raise ValueError("Extra data")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Show the top-level category index of a token file'
+    )
+    parser.add_argument(
+        '--input',
+        required=True,
+        help='Input JSON token file path'
+    )
+    parser.add_argument(
+        '--category',
+        help='Print the parsed tokens of one category'
+    )
+    parser.add_argument(
+        '--index-dir',
+        default=DEFAULT_INDEX_DIR,
+        help=f"Directory to cache the category index in; '' to not cache it (default: {DEFAULT_INDEX_DIR})"
+    )
+    
+    args = parser.parse_args()
+    
+    if not Path(args.input).exists():
+        print(f"Error: Input file '{args.input}' not found")
+        return 1
+    
+    try:
+        tokens = LazyTokens(args.input, index_dir=args.index_dir)
+        
+        if args.category:
+            if args.category not in tokens:
+                print(f"Error: Unknown category '{args.category}'")
+                return 1
+            print(json.dumps(tokens[args.category], indent=2, ensure_ascii=False))
+            return 0
+        
+        index = f" (index: {tokens.index_path})" if tokens.index_path else ""
+        print(f"✓ {len(tokens)} categories in {args.input}{index}")
+        for name, (start, end) in tokens.ranges.items():
+            print(f"  {name}: {(end - start) / 1024:.1f} KB at byte {start}")
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+Platform Emitters
+Writes the platform outputs declared in sd.config.mjs without Node.
+
+Reproduces the Style Dictionary build (css, tailwind, android and compose
+platforms) byte-for-byte from the same token sources: the JSON files are
+merged in the same order, aliases are resolved, the same name and value
+transforms are applied, and each format is streamed to disk line by line.
+The formats used by StyleDictionaryConfigGenerator's platforms (web, scss,
+ios, json) are available as well.
+
+Native platforms have no CSS runtime, so their transform groups (android,
+compose, ios) first fold calc() and var() to concrete values (see
+css_expressions); this is where the output departs from Style Dictionary,
+which passes such values through.
+
+Usage:
+    python platform_emitters.py --source 'tokens/**/*.json'
+    python platform_emitters.py --source 'tokens/**/*.json' --check
+"""
+
+import glob
+import json
+import re
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, NamedTuple, Iterator, Callable, Sequence, Tuple
+
+from reference_graph import ReferenceGraph
+from css_expressions import ExpressionEvaluator
+from color_literals import parse_color, clamp, to_bytes
+
+try:
+    from color_engine import convert_values
+except ImportError:  # NumPy is optional; colors then go through the per-token transforms
+    convert_values = None
+
+
+class Token(NamedTuple):
+    """A flattened token as seen by the formats."""
+    path: tuple
+    value: Any
+    type: str
+    name: str = ''
+
+
+# Base font size used by Style Dictionary's rem -> dp/sp transforms
+BASE_PX_FONT_SIZE = 16
+
+NUMBER_PATTERN = re.compile(r'^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?')
+
+# change-case word splitting, as used by Style Dictionary's name transforms
+SPLIT_LOWER_UPPER = re.compile(r'([a-z\d])([A-Z])')
+SPLIT_UPPER_UPPER = re.compile(r'([A-Z])([A-Z][a-z])')
+STRIP_NON_WORD = re.compile(r'[^A-Za-z\d]+')
+
+FILE_HEADER = "Do not edit directly, this file was auto-generated."
+
+
+def split_words(text: str) -> List[str]:
+    """Split a string into words the way change-case does."""
+    text = SPLIT_LOWER_UPPER.sub('\\1\0\\2', text.strip())
+    text = SPLIT_UPPER_UPPER.sub('\\1\0\\2', text)
+    text = STRIP_NON_WORD.sub('\0', text)
+    return [word for word in text.split('\0') if word]
+
+
+def snake_name(path: tuple) -> str:
+    """name/snake transform."""
+    return '_'.join(word.lower() for word in split_words(' '.join(path)))
+
+
+def kebab_name(path: tuple) -> str:
+    """name/kebab transform."""
+    return '-'.join(word.lower() for word in split_words(' '.join(path)))
+
+
+def pascal_name(path: tuple) -> str:
+    """name/pascal transform."""
+    return ''.join(word[0].upper() + word[1:].lower() for word in split_words(' '.join(path)))
+
+
+def camel_name(path: tuple) -> str:
+    """name/camel transform."""
+    words = split_words(' '.join(path))
+    return ''.join(
+        word.lower() if i == 0 else word[0].upper() + word[1:].lower()
+        for i, word in enumerate(words)
+    )
+
+
+def format_alpha(alpha: float) -> str:
+    """Format an alpha channel like tinycolor (rounded, no trailing zeros)."""
+    return f"{round(clamp(alpha) * 100) / 100:g}"
+
+
+def color_css(value: Any) -> Any:
+    """color/css: hex when opaque, rgba() otherwise; non-literals pass through."""
+    color = parse_color(value)
+    if color is None:
+        return value
+    r, g, b, _ = to_bytes(color)
+    if color[3] == 1:
+        return f"#{r:02x}{g:02x}{b:02x}"
+    return f"rgba({r}, {g}, {b}, {format_alpha(color[3])})"
+
+
+def color_hex(value: Any) -> Any:
+    """color/hex: #rrggbb; non-literals pass through."""
+    color = parse_color(value)
+    if color is None:
+        return value
+    r, g, b, _ = to_bytes(color)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def color_hex8_android(value: Any) -> Any:
+    """color/hex8android: #aarrggbb; non-literals pass through."""
+    color = parse_color(value)
+    if color is None:
+        return value
+    r, g, b, alpha = to_bytes(color)
+    return f"#{alpha:02x}{r:02x}{g:02x}{b:02x}"
+
+
+def color_compose(value: Any) -> Any:
+    """color/composeColor: Color(0xaarrggbb); non-literals pass through."""
+    color = parse_color(value)
+    if color is None:
+        return value
+    r, g, b, alpha = to_bytes(color)
+    return f"Color(0x{alpha:02x}{r:02x}{g:02x}{b:02x})"
+
+
+def color_ui_color(value: Any) -> Any:
+    """color/UIColor: Objective-C UIColor literal; non-literals pass through."""
+    color = parse_color(value)
+    if color is None:
+        return value
+    r, g, b, alpha = (round(clamp(channel) * 1000) / 1000 for channel in color)
+    return f"[UIColor colorWithRed:{r:.3f}f green:{g:.3f}f blue:{b:.3f}f alpha:{alpha:.3f}f]"
+
+
+def rem_to_unit(value: Any, unit: str, separator: str = '') -> Any:
+    """size/remToDp and friends: scale the leading number by the base font size."""
+    match = NUMBER_PATTERN.match(str(value))
+    if not match:
+        return value
+    return f"{float(match.group(0)) * BASE_PX_FONT_SIZE:.2f}{separator}{unit}"
+
+
+# Value transforms per transform group, applied by token type
+TRANSFORM_GROUPS: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    'css': {'color': color_css},
+    'scss': {'color': color_css},
+    'js': {'color': color_hex},
+    'ios': {
+        'color': color_ui_color,
+        'dimension': lambda value: rem_to_unit(value, 'f'),
+        'fontSize': lambda value: rem_to_unit(value, 'f'),
+    },
+    'android': {
+        'color': color_hex8_android,
+        'dimension': lambda value: rem_to_unit(value, 'dp'),
+        'fontSize': lambda value: rem_to_unit(value, 'sp'),
+    },
+    'compose': {
+        'color': color_compose,
+        'dimension': lambda value: rem_to_unit(value, 'dp', '.'),
+        'fontSize': lambda value: rem_to_unit(value, 'sp', '.'),
+    },
+}
+
+# Transform groups whose values have calc() and var() folded before the value transforms
+FOLDED_GROUPS = {'ios', 'android', 'compose'}
+
+# Batch color format (see color_engine.FORMATS) matching each group's color transform
+COLOR_FORMATS = {
+    'css': 'css',
+    'scss': 'css',
+    'js': 'hex',
+    'ios': 'ui_color',
+    'android': 'hex8_android',
+    'compose': 'compose',
+}
+
+# Name transform per transform group
+NAME_TRANSFORMS: Dict[str, Callable[[tuple], str]] = {
+    'css': kebab_name,
+    'scss': kebab_name,
+    'js': pascal_name,
+    'ios': pascal_name,
+    'android': snake_name,
+    'compose': camel_name,
+}
+
+
+def js_key_order(obj: Any) -> Any:
+    """Reorder dict keys the way JavaScript enumerates object properties.
+
+    Integer-like keys come first in ascending order, then the remaining keys
+    in insertion order.
+    """
+    if not isinstance(obj, dict):
+        return obj
+    integer_keys = sorted(
+        (key for key in obj if key.isdigit() and (key == '0' or not key.startswith('0'))),
+        key=int
+    )
+    integer_set = set(integer_keys)
+    ordered = {key: js_key_order(obj[key]) for key in integer_keys}
+    ordered.update((key, js_key_order(value)) for key, value in obj.items() if key not in integer_set)
+    return ordered
+
+
+def deep_merge(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge source into target in place, later values winning."""
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            deep_merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def load_dictionary(source_patterns: List[str]) -> Dict[str, Any]:
+    """Load and deep-merge every source file, in glob order.
+
+    Keys are put in the order JavaScript enumerates them, which is the order
+    Style Dictionary emits tokens in.
+    """
+    tree = {}
+    for pattern in source_patterns:
+        for file_path in sorted(glob.glob(pattern, recursive=True)):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                deep_merge(tree, json.load(f))
+    return js_key_order(tree)
+
+
+def flatten_tokens(tree: Dict[str, Any]) -> Tuple[Token, ...]:
+    """Return all tokens in dictionary order with aliases resolved.
+
+    Like Style Dictionary, a node with a 'value' is a leaf; anything nested
+    below it is not a separate token. The result is immutable so one copy can
+    be shared by every platform.
+    """
+    graph = ReferenceGraph(follow_vars=False)
+    leaves = []
+    
+    def collect(node, parts):
+        for key, child in node.items():
+            if not isinstance(child, dict):
+                continue
+            parts.append(key)
+            if 'value' in child:
+                leaves.append((tuple(parts), child))
+                graph.add(parts, child)
+            else:
+                collect(child, parts)
+            parts.pop()
+    
+    collect(tree, [])
+    graph.build()
+    
+    tokens = []
+    for path, node in leaves:
+        value = graph.resolve('.'.join(path))
+        tokens.append(Token(path, node['value'] if value is None else value, node.get('type', '')))
+    return tuple(tokens)
+
+
+def fold_expressions(tokens: Sequence[Token], transform_group: str) -> Sequence[Token]:
+    """Fold calc() and var() in token values for the groups in FOLDED_GROUPS.
+
+    Variables are the tokens themselves, named by their dashed paths as in
+    token.md. Other groups get the tokens back unchanged.
+    """
+    if transform_group not in FOLDED_GROUPS:
+        return tokens
+    evaluate = ExpressionEvaluator({'-'.join(token.path): token.value for token in tokens}).evaluate
+    folded = []
+    for token in tokens:
+        value = evaluate(token.value)
+        folded.append(token if value is token.value else Token(token.path, value, token.type, token.name))
+    return folded
+
+
+def transform_tokens(tokens: Sequence[Token], transform_group: str) -> List[Token]:
+    """Apply a transform group's name and value transforms, returning new tokens."""
+    tokens = fold_expressions(tokens, transform_group)
+    transforms = TRANSFORM_GROUPS.get(transform_group, {})
+    name_transform = NAME_TRANSFORMS.get(transform_group, kebab_name)
+    values = [token.value for token in tokens]
+    
+    # Colors are converted in one batch when the color engine is available
+    color_format = COLOR_FORMATS.get(transform_group)
+    if convert_values is not None and color_format:
+        transforms = {key: value for key, value in transforms.items() if key != 'color'}
+        rows = [i for i, token in enumerate(tokens) if token.type == 'color']
+        for i, value in zip(rows, convert_values([values[i] for i in rows], color_format)):
+            values[i] = value
+    
+    return [
+        token._replace(
+            value=transforms[token.type](value) if token.type in transforms else value,
+            name=name_transform(token.path)
+        )
+        for token, value in zip(tokens, values)
+    ]
+
+
+def format_css_variables(tokens: List[Token], options: Dict[str, Any]) -> Iterator[str]:
+    """css/tailwind-variables"""
+    yield ':root {\n'
+    for token in tokens:
+        yield f"  --{'-'.join(token.path)}: {token.value};\n"
+    yield '}\n'
+
+
+def format_tailwind_preset(tokens: List[Token], options: Dict[str, Any]) -> Iterator[str]:
+    """tailwind/preset (the custom format registered in sd.config.mjs)"""
+    groups = {name: {} for name in [
+        'colors', 'fontFamily', 'fontSize', 'lineHeight', 'letterSpacing',
+        'borderRadius', 'boxShadow', 'animation', 'screens', 'spacing'
+    ]}
+    
+    for token in tokens:
+        path, value = token.path, token.value
+        
+        if token.type == 'color' and path[0] == 'color':
+            current = groups['colors']
+            for part in path[1:-1]:
+                current = current.setdefault(part, {})
+            current[path[-1]] = value
+        if token.type == 'fontFamily':
+            groups['fontFamily'][path[-1]] = value
+        if token.type == 'fontSize':
+            groups['fontSize']['-'.join(path[1:])] = value
+        if token.type == 'lineHeight':
+            groups['lineHeight']['-'.join(path[1:-1])] = value
+        if token.type == 'letterSpacing':
+            groups['letterSpacing']['-'.join(path[1:-1])] = value
+        if token.type == 'borderRadius':
+            groups['borderRadius'][path[-1]] = value
+        if token.type == 'boxShadow' and path[0] == 'shadow':
+            groups['boxShadow']['-'.join(path[1:])] = value
+        if token.type == 'animation':
+            groups['animation']['-'.join(path[1:])] = value
+        if path[0] == 'breakpoint':
+            groups['screens'][path[1]] = value
+        if len(path) > 2 and path[0] == 'max' and path[1] == 'width':
+            groups['spacing'][f"max-{path[2]}"] = value
+    
+    preset = js_key_order({"theme": {"extend": groups}})
+    
+    yield "/** @type {import('tailwindcss').Config} */\nmodule.exports = "
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    yield from encoder.iterencode(preset)
+    yield ";"
+
+
+def android_header() -> str:
+    return f'<?xml version="1.0" encoding="UTF-8"?>\n\n<!--\n  {FILE_HEADER}\n-->\n<resources>\n'
+
+
+def escape_xml(value: Any) -> str:
+    return str(value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def format_android_resources(tag: str, token_type: str) -> Callable[[List[Token], Dict[str, Any]], Iterator[str]]:
+    """android/colors, android/dimens and android/fontDimens"""
+    def format_resources(tokens: List[Token], options: Dict[str, Any]) -> Iterator[str]:
+        yield android_header()
+        for token in tokens:
+            if token.type == token_type:
+                yield f'  <{tag} name="{token.name}">{escape_xml(token.value)}</{tag}>\n'
+        yield '</resources>'
+    return format_resources
+
+
+def format_compose_object(tokens: List[Token], options: Dict[str, Any]) -> Iterator[str]:
+    """compose/object"""
+    yield (
+        f"\n\n// {FILE_HEADER}\n\n\n\n"
+        f"package {options['packageName']}\n\n"
+        "import androidx.compose.ui.graphics.Color\n"
+        "import androidx.compose.ui.unit.*\n\n"
+        f"object {options['className']} {{\n"
+    )
+    for token in sorted(tokens, key=lambda token: token.name):
+        yield f"  val {token.name} = {token.value}\n"
+    yield "}\n"
+
+
+def format_css_variables_sd(tokens: List[Token], options: Dict[str, Any]) -> Iterator[str]:
+    """css/variables"""
+    yield f"/**\n * {FILE_HEADER}\n */\n\n:root {{\n"
+    for token in tokens:
+        yield f"  --{token.name}: {token.value};\n"
+    yield "}\n"
+
+
+def format_scss_variables(tokens: List[Token], options: Dict[str, Any]) -> Iterator[str]:
+    """scss/variables"""
+    yield f"\n// {FILE_HEADER}\n\n"
+    for token in tokens:
+        yield f"${token.name}: {token.value};\n"
+
+
+def format_json_flat(tokens: List[Token], options: Dict[str, Any]) -> Iterator[str]:
+    """json/flat"""
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    yield from encoder.iterencode({token.name: token.value for token in tokens})
+    yield "\n"
+
+
+def objc_header(destination: str) -> str:
+    return f"\n//\n// {destination}\n//\n\n// {FILE_HEADER}\n\n"
+
+
+def format_ios_macros(tokens: List[Token], options: Dict[str, Any]) -> Iterator[str]:
+    """ios/macros"""
+    yield objc_header(options['destination'])
+    yield "#import <UIKit/UIKit.h>\n\n"
+    for token in tokens:
+        yield f"#define {token.name} {token.value}\n"
+
+
+def format_ios_strings(tokens: List[Token], options: Dict[str, Any]) -> Iterator[str]:
+    """ios/strings: string constants for font families and content tokens"""
+    yield objc_header(options['destination'])
+    yield f'#import "{Path(options["destination"]).stem}.h"\n\n'
+    for token in tokens:
+        if token.type in ('fontFamily', 'content'):
+            value = str(token.value).replace('\\', '\\\\').replace('"', '\\"')
+            yield f'NSString * const {token.name} = @"{value}";\n'
+
+
+FORMATS = {
+    'css/tailwind-variables': format_css_variables,
+    'tailwind/preset': format_tailwind_preset,
+    'android/colors': format_android_resources('color', 'color'),
+    'android/dimens': format_android_resources('dimen', 'dimension'),
+    'android/fontDimens': format_android_resources('dimen', 'fontSize'),
+    'compose/object': format_compose_object,
+    'css/variables': format_css_variables_sd,
+    'scss/variables': format_scss_variables,
+    'json/flat': format_json_flat,
+    'ios/macros': format_ios_macros,
+    'ios/strings': format_ios_strings,
+}
+
+
+COMPOSE_OPTIONS = {'packageName': 'com.example.designsystem.tokens'}
+
+# Mirrors the platforms declared in sd.config.mjs. Filters are objects, as in
+# Style Dictionary, except that a list matches any of its values; keeping the
+# configs plain data lets them be sent to worker processes.
+PLATFORMS = {
+    'css': {
+        'transformGroup': 'css',
+        'buildPath': 'build/css/',
+        'files': [
+            {'destination': 'tokens.css', 'format': 'css/tailwind-variables'},
+        ]
+    },
+    'tailwind': {
+        'transformGroup': 'js',
+        'buildPath': 'build/',
+        'files': [
+            {'destination': 'tailwind.preset.js', 'format': 'tailwind/preset'},
+        ]
+    },
+    'android': {
+        'transformGroup': 'android',
+        'buildPath': 'build/android/',
+        'files': [
+            {'destination': 'colors.xml', 'format': 'android/colors',
+             'filter': {'type': 'color'}},
+            {'destination': 'dimens.xml', 'format': 'android/dimens',
+             'filter': {'type': ['fontSize', 'dimension', 'borderRadius', 'spacing']}},
+            {'destination': 'font_dimens.xml', 'format': 'android/fontDimens',
+             'filter': {'type': 'fontSize'}},
+        ]
+    },
+    'compose': {
+        'transformGroup': 'compose',
+        'buildPath': 'build/compose/',
+        'files': [
+            {'destination': 'Color.kt', 'format': 'compose/object',
+             'filter': {'type': 'color'},
+             'options': dict(COMPOSE_OPTIONS, className='AppColors')},
+            {'destination': 'Typography.kt', 'format': 'compose/object',
+             'filter': {'type': ['fontSize', 'fontFamily', 'lineHeight', 'letterSpacing']},
+             'options': dict(COMPOSE_OPTIONS, className='AppTypography')},
+            {'destination': 'Dimension.kt', 'format': 'compose/object',
+             'filter': {'type': ['dimension', 'borderRadius', 'spacing']},
+             'options': dict(COMPOSE_OPTIONS, className='AppDimensions')},
+            {'destination': 'Shadow.kt', 'format': 'compose/object',
+             'filter': {'type': 'boxShadow'},
+             'options': dict(COMPOSE_OPTIONS, className='AppShadows')},
+        ]
+    },
+}
+
+
+def matches_filter(token: Token, file_filter: Dict[str, Any]) -> bool:
+    """Return whether a token matches every attribute of an object filter."""
+    for attribute, expected in file_filter.items():
+        actual = getattr(token, attribute, None)
+        if isinstance(expected, list):
+            if actual not in expected:
+                return False
+        elif actual != expected:
+            return False
+    return True
+
+
+def render_file(tokens: List[Token], file_config: Dict[str, Any]) -> Iterator[str]:
+    """Yield the chunks of one output file."""
+    file_filter = file_config.get('filter')
+    if file_filter:
+        tokens = [token for token in tokens if matches_filter(token, file_filter)]
+    options = dict(file_config.get('options', {}), destination=file_config['destination'])
+    return FORMATS[file_config['format']](tokens, options)
+
+
+def emit_platform(platform: Dict[str, Any], tokens: Sequence[Token], root: Path) -> List[Path]:
+    """Transform and write every file of one platform, streaming each to disk."""
+    transformed = transform_tokens(tokens, platform['transformGroup'])
+    output_dir = root / platform['buildPath']
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    written = []
+    for file_config in platform['files']:
+        output_file = output_dir / file_config['destination']
+        with open(output_file, 'w', encoding='utf-8', newline='') as f:
+            for chunk in render_file(transformed, file_config):
+                f.write(chunk)
+        written.append(output_file)
+    return written
+
+
+def check_platform(platform: Dict[str, Any], tokens: Sequence[Token], root: Path) -> List[Path]:
+    """Return the files of one platform whose content differs from what would be emitted."""
+    transformed = transform_tokens(tokens, platform['transformGroup'])
+    output_dir = root / platform['buildPath']
+    
+    mismatched = []
+    for file_config in platform['files']:
+        output_file = output_dir / file_config['destination']
+        expected = ''.join(render_file(transformed, file_config))
+        try:
+            with open(output_file, 'r', encoding='utf-8', newline='') as f:
+                actual = f.read()
+        except OSError:
+            actual = None
+        if actual != expected:
+            mismatched.append(output_file)
+    return mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Emit platform outputs from design tokens without Style Dictionary'
+    )
+    parser.add_argument(
+        '--source',
+        nargs='+',
+        default=['tokens/**/*.json'],
+        help='Token source glob patterns (default: tokens/**/*.json)'
+    )
+    parser.add_argument(
+        '--root',
+        default='.',
+        help='Directory that build paths are relative to (default: .)'
+    )
+    parser.add_argument(
+        '--platforms',
+        default=','.join(PLATFORMS),
+        help=f"Comma-separated platforms (default: {','.join(PLATFORMS)})"
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Compare with the existing files instead of writing them'
+    )
+    
+    args = parser.parse_args()
+    
+    platforms = [p.strip() for p in args.platforms.split(',')]
+    unknown = [p for p in platforms if p not in PLATFORMS]
+    if unknown:
+        print(f"Error: Unknown platform(s): {', '.join(unknown)}")
+        return 1
+    
+    try:
+        tokens = flatten_tokens(load_dictionary(args.source))
+        if not tokens:
+            print(f"Error: No tokens found in {', '.join(args.source)}")
+            return 1
+        
+        root = Path(args.root)
+        
+        if args.check:
+            mismatched = []
+            for platform in platforms:
+                mismatched.extend(check_platform(PLATFORMS[platform], tokens, root))
+            for path in mismatched:
+                print(f"✗ {path} is out of date")
+            if mismatched:
+                return 1
+            print("✓ All outputs match the token sources")
+            return 0
+        
+        for platform in platforms:
+            print(f"{platform}")
+            for path in emit_platform(PLATFORMS[platform], tokens, root):
+                print(f"  ✓ {path}")
+        
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Pipeline Profiler
+Per-stage wall time, token counts and peak memory for the token pipeline.
+
+Pipeline code wraps each stage (parse, hierarchy, references, checks, emit,
+...) in `with profiler.stage(name) as stage:` and may record counts such as
+`stage['tokens'] = n`. Stages nest. A disabled profiler (the default when
+--profile is not given) records nothing. Results are printed as a table and
+exported as JSON and in Chrome trace-event format, which chrome://tracing
+and Perfetto open directly. Peak memory comes from tracemalloc, which is
+only started when profiling and slows the run down accordingly. With
+--profile-functions, cProfile also runs during the stages and the hottest
+functions are listed.
+
+Usage:
+    python profiler.py --summary profile.json
+"""
+
+import io
+import json
+import os
+import threading
+import time
+import tracemalloc
+import argparse
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Iterator
+
+from cli_options import add_profile_arguments
+
+
+class Profiler:
+    """Records nested pipeline stages with timings, counts and peak memory."""
+    
+    # Number of functions listed from cProfile results
+    TOP_FUNCTIONS = 25
+    
+    def __init__(self, enabled: bool = True, functions: bool = False):
+        self.enabled = enabled
+        self.stages: List[Dict[str, Any]] = []
+        self.stack: List[Dict[str, Any]] = []
+        self.origin = time.perf_counter()
+        self.cprofile = None
+        if enabled and functions:
+            import cProfile
+            self.cprofile = cProfile.Profile()
+        self.started_tracemalloc = False
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracemalloc = True
+    
+    @contextmanager
+    def stage(self, name: str, **counts: Any) -> Iterator[Dict[str, Any]]:
+        """Time a stage; the yielded dict takes counts to record with it."""
+        if not self.enabled:
+            yield counts
+            return
+        
+        current, peak = tracemalloc.get_traced_memory()
+        if self.stack:
+            parent = self.stack[-1]
+            parent['peak'] = max(parent['peak'], peak)
+        elif self.cprofile:
+            self.cprofile.enable()
+        tracemalloc.reset_peak()
+        
+        record = {'name': name, 'depth': len(self.stack), 'counts': counts,
+                  'memory': current, 'peak': current, 'start': time.perf_counter()}
+        self.stages.append(record)
+        self.stack.append(record)
+        try:
+            yield counts
+        finally:
+            record['end'] = time.perf_counter()
+            current, peak = tracemalloc.get_traced_memory()
+            record['peak'] = max(record['peak'], peak)
+            record['memory'] = current - record['memory']
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1]['peak'] = max(self.stack[-1]['peak'], record['peak'])
+            elif self.cprofile:
+                self.cprofile.disable()
+            tracemalloc.reset_peak()
+    
+    def close(self) -> None:
+        """Stop tracemalloc if this profiler started it."""
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
+    
+    def functions(self) -> List[Dict[str, Any]]:
+        """Return the hottest functions seen by cProfile, by own time."""
+        if not self.cprofile:
+            return []
+        import pstats
+        stats = pstats.Stats(self.cprofile, stream=io.StringIO())
+        rows = []
+        for (file_name, line, function), (_, calls, own, cumulative, _) in stats.stats.items():
+            rows.append({
+                "function": f"{os.path.basename(file_name)}:{line}({function})",
+                "calls": calls,
+                "own_ms": own * 1000,
+                "cumulative_ms": cumulative * 1000
+            })
+        rows.sort(key=lambda row: -row['own_ms'])
+        return rows[:self.TOP_FUNCTIONS]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the recorded stages (times in ms, memory in bytes) as plain data."""
+        stages = [{
+            "name": record['name'],
+            "depth": record['depth'],
+            "start_ms": (record['start'] - self.origin) * 1000,
+            "elapsed_ms": (record['end'] - record['start']) * 1000,
+            "peak_memory": record['peak'],
+            "memory_delta": record['memory'],
+            "counts": record['counts']
+        } for record in self.stages if 'end' in record]
+        return {
+            "total_ms": sum(stage['elapsed_ms'] for stage in stages if stage['depth'] == 0),
+            "stages": stages,
+            "functions": self.functions()
+        }
+    
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Return the stages as Chrome trace events (complete events, times in µs)."""
+        pid, tid = os.getpid(), threading.get_ident() % 100000
+        events = [{
+            "name": record['name'],
+            "cat": "pipeline",
+            "ph": "X",
+            "ts": (record['start'] - self.origin) * 1e6,
+            "dur": (record['end'] - record['start']) * 1e6,
+            "pid": pid,
+            "tid": tid,
+            "args": dict(record['counts'], peak_memory=record['peak'], memory_delta=record['memory'])
+        } for record in self.stages if 'end' in record]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+    
+    def save(self, prefix: str) -> List[str]:
+        """Write <prefix>.json, <prefix>.trace.json and, with cProfile, <prefix>.prof."""
+        written = []
+        for path, data in ((f"{prefix}.json", self.to_dict()), (f"{prefix}.trace.json", self.chrome_trace())):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            written.append(path)
+        if self.cprofile:
+            self.cprofile.dump_stats(f"{prefix}.prof")
+            written.append(f"{prefix}.prof")
+        return written
+    
+    def summary(self) -> str:
+        return format_summary(self.to_dict())
+
+
+def count_tokens(node: Any) -> int:
+    """Return the number of token nodes (dicts with a 'value') in a tree."""
+    if not isinstance(node, dict):
+        return 0
+    return ('value' in node) + sum(count_tokens(child) for child in node.values())
+
+
+def format_summary(profile: Dict[str, Any]) -> str:
+    """Format profile data as a table of stages and, if present, hot functions."""
+    lines = [f"{'stage':<32} {'ms':>10} {'peak MB':>9} {'Δ MB':>8}  counts"]
+    for stage in profile['stages']:
+        counts = ', '.join(f"{key}={value}" for key, value in stage['counts'].items())
+        lines.append(
+            f"{'  ' * stage['depth'] + stage['name']:<32} {stage['elapsed_ms']:>10.1f} "
+            f"{stage['peak_memory'] / 1e6:>9.1f} {stage['memory_delta'] / 1e6:>8.1f}  {counts}"
+        )
+    lines.append(f"{'total':<32} {profile['total_ms']:>10.1f}")
+    
+    if profile.get('functions'):
+        lines.append(f"\n{'function':<60} {'calls':>8} {'own ms':>9} {'cum ms':>9}")
+        for row in profile['functions']:
+            lines.append(
+                f"{row['function'][-60:]:<60} {row['calls']:>8} "
+                f"{row['own_ms']:>9.1f} {row['cumulative_ms']:>9.1f}"
+            )
+    return "\n".join(lines)
+
+
+def profiler_from_args(args: argparse.Namespace) -> Optional[Profiler]:
+    """Create a Profiler from parsed --profile/--profile-functions options."""
+    if not args.profile:
+        return None
+    return Profiler(functions=args.profile_functions)
+
+
+def finish_profile(profiler: Optional[Profiler], args: argparse.Namespace) -> None:
+    """Print the profile summary and write its files."""
+    if not profiler:
+        return
+    profiler.close()
+    print("\n" + profiler.summary())
+    for path in profiler.save(args.profile):
+        print(f"✓ Profile saved to {path}")
+
+
+# Stands in for a profiler when profiling is off
+NULL_PROFILER = Profiler(enabled=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Show a saved pipeline profile'
+    )
+    parser.add_argument(
+        '--summary',
+        required=True,
+        help='Profile JSON written by --profile'
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        with open(args.summary, 'r', encoding='utf-8') as f:
+            print(format_summary(json.load(f)))
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Reference Graph
+Dependency-graph index over token references with topological resolution.
+
+Collects every token in a tree once, extracts both Style Dictionary aliases
+(`{color.brand.primary}`, including aliases embedded in composite values)
+and CSS `var(--color-brand-primary)` references, and resolves all of them
+in a single O(V+E) depth-first pass. Resolved values are memoized, cycles
+are detected during the same pass, and every token that cannot be resolved
+gets the full reference chain that leads to the missing target.
+
+Usage:
+    python reference_graph.py --input tokens.json --token color.bg.primary
+"""
+
+import json
+import re
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional, NamedTuple
+
+
+class Reference(NamedTuple):
+    """A single reference found in a token value."""
+    kind: str              # 'alias' for {a.b}, 'var' for var(--a-b)
+    raw: str               # Text of the reference as written
+    target: Optional[str]  # Dotted path of the referenced token, None if unknown
+    fallback: Optional[str] = None
+
+
+class ReferenceGraph:
+    """Index of token references, resolved once and queried many times."""
+    
+    ALIAS_PATTERN = re.compile(r'\{([^{}]+)\}')
+    VAR_PATTERN = re.compile(r'var\(\s*--([a-zA-Z0-9_-]+)\s*(?:,\s*((?:[^()]|\([^()]*\))*))?\)')
+    
+    # Keys of a token node that hold metadata rather than nested tokens
+    META_KEYS = {'value', 'type', 'description', 'comment'}
+    
+    def __init__(self, tokens: Optional[Dict[str, Any]] = None, follow_vars: bool = True):
+        self.follow_vars = follow_vars
+        self.values: Dict[str, Any] = {}
+        self.types: Dict[str, str] = {}
+        self.edges: Dict[str, List[Reference]] = {}
+        self.var_names: Dict[str, str] = {}
+        self.dependents: Dict[str, List[str]] = {}
+        
+        self.resolved: Dict[str, Any] = {}
+        self.unresolved: Dict[str, List[str]] = {}
+        self.cycles: List[List[str]] = []
+        self.order: List[str] = []
+        
+        if tokens is not None:
+            self.collect(tokens, [])
+            self.build()
+    
+    def add(self, parts: List[str], token: Dict[str, Any]) -> None:
+        """Record a single token; call build() once all tokens are added."""
+        path = '.'.join(parts)
+        self.values[path] = token['value']
+        self.types[path] = token.get('type', '')
+        self.var_names['-'.join(parts)] = path
+    
+    def update(self, tokens: Dict[str, Dict[str, Any]]) -> None:
+        """Record tokens collected elsewhere, given as 'values', 'types' and 'var_names' maps."""
+        self.values.update(tokens['values'])
+        self.types.update(tokens['types'])
+        self.var_names.update(tokens['var_names'])
+    
+    def collect(self, node: Dict[str, Any], parts: List[str]) -> None:
+        """Record every token in the tree, including tokens nested below tokens."""
+        if 'value' in node and parts:
+            self.add(parts, node)
+        
+        for key, child in node.items():
+            if key in self.META_KEYS or not isinstance(child, dict):
+                continue
+            parts.append(key)
+            self.collect(child, parts)
+            parts.pop()
+    
+    def build(self) -> None:
+        """Extract references from the recorded tokens and resolve all of them.
+
+        Safe to call again after more tokens are recorded: everything derived
+        from the tokens is rebuilt from scratch.
+        """
+        self.edges = {}
+        self.resolved = {}
+        self.unresolved = {}
+        self.cycles = []
+        self.order = []
+        for path, value in self.values.items():
+            self.edges[path] = self.extract_references(value)
+        
+        self.dependents = {path: [] for path in self.values}
+        for path, references in self.edges.items():
+            for reference in references:
+                if reference.target is not None:
+                    self.dependents[reference.target].append(path)
+        
+        self.resolve_all()
+    
+    def extract_references(self, value: Any) -> List[Reference]:
+        """Return the references contained in a token value."""
+        if not isinstance(value, str):
+            return []
+        
+        references = []
+        for match in self.ALIAS_PATTERN.finditer(value):
+            target = match.group(1).strip()
+            references.append(Reference('alias', match.group(0), target if target in self.values else None))
+        if not self.follow_vars:
+            return references
+        for match in self.VAR_PATTERN.finditer(value):
+            target = self.var_names.get(match.group(1))
+            references.append(Reference('var', match.group(0), target, match.group(2)))
+        return references
+    
+    def resolve_all(self) -> None:
+        """Resolve every token once in dependency order, detecting cycles on the way."""
+        VISITING, DONE = 1, 2
+        state: Dict[str, int] = {}
+        
+        for root in self.values:
+            if root in state:
+                continue
+            
+            state[root] = VISITING
+            stack = [(root, iter(self.edges[root]))]
+            while stack:
+                path, references = stack[-1]
+                advanced = False
+                for reference in references:
+                    target = reference.target
+                    if target is None:
+                        continue
+                    if state.get(target) == VISITING:
+                        chain = [entry[0] for entry in stack]
+                        self.cycles.append(chain[chain.index(target):] + [target])
+                    elif target not in state:
+                        state[target] = VISITING
+                        stack.append((target, iter(self.edges[target])))
+                        advanced = True
+                        break
+                if advanced:
+                    continue
+                
+                stack.pop()
+                state[path] = DONE
+                self.order.append(path)
+                self.resolve_node(path)
+    
+    def resolve_node(self, path: str) -> None:
+        """Resolve one token whose dependencies have already been visited."""
+        value = self.values[path]
+        references = self.edges[path]
+        
+        # Record the first chain that ends in a missing or unresolvable token
+        for reference in references:
+            if reference.target is None:
+                if reference.kind == 'alias' or reference.fallback is None:
+                    self.unresolved[path] = [path, reference.raw]
+                    break
+            elif reference.target in self.unresolved:
+                self.unresolved[path] = [path] + self.unresolved[reference.target]
+                break
+            elif reference.target not in self.resolved:
+                # Part of a cycle
+                self.unresolved[path] = [path, reference.target]
+                break
+        
+        if not references:
+            self.resolved[path] = value
+            return
+        if path in self.unresolved:
+            return
+        
+        # A value that is exactly one alias takes the target value as-is
+        if len(references) == 1 and references[0].raw == value and references[0].target is not None:
+            self.resolved[path] = self.resolved[references[0].target]
+            return
+        
+        def substitute_alias(match):
+            return str(self.resolved.get(match.group(1).strip(), match.group(0)))
+        
+        def substitute_var(match):
+            target = self.var_names.get(match.group(1))
+            if target is not None and target in self.resolved:
+                return str(self.resolved[target])
+            return match.group(2).strip() if match.group(2) is not None else match.group(0)
+        
+        resolved = self.ALIAS_PATTERN.sub(substitute_alias, value)
+        if self.follow_vars:
+            resolved = self.VAR_PATTERN.sub(substitute_var, resolved)
+        self.resolved[path] = resolved
+    
+    def resolve(self, path: str) -> Optional[Any]:
+        """Return the fully resolved value of a token, or None if it cannot be resolved."""
+        return self.resolved.get(path)
+    
+    def path_for_var(self, var_name: str) -> Optional[str]:
+        """Return the token path for a CSS custom property name such as '--color-white'."""
+        return self.var_names.get(var_name[2:] if var_name.startswith('--') else var_name)
+    
+    def references(self, path: str) -> List[Reference]:
+        """Return the references made directly by a token."""
+        return self.edges.get(path, [])
+    
+    def affected_by(self, paths: List[str]) -> List[str]:
+        """Return the given tokens plus every token that depends on them, transitively."""
+        seen = set()
+        pending = [path for path in paths if path in self.values]
+        while pending:
+            path = pending.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            pending.extend(self.dependents.get(path, []))
+        return [path for path in self.order if path in seen]
+
+
+def format_chain(chain: List[str]) -> str:
+    """Format a reference chain as 'a → b → c'."""
+    return ' → '.join(chain)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Resolve token references and report broken chains'
+    )
+    parser.add_argument(
+        '--input',
+        required=True,
+        help='Input JSON token file path'
+    )
+    parser.add_argument(
+        '--token',
+        help='Dotted token path to resolve (optional)'
+    )
+    
+    args = parser.parse_args()
+    
+    if not Path(args.input).exists():
+        print(f"Error: Input file '{args.input}' not found")
+        return 1
+    
+    try:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            graph = ReferenceGraph(json.load(f))
+        
+        if args.token:
+            if args.token not in graph.values:
+                print(f"Error: Unknown token '{args.token}'")
+                return 1
+            if args.token in graph.unresolved:
+                print(f"✗ {args.token}: {format_chain(graph.unresolved[args.token])}")
+                return 1
+            print(f"{args.token} = {graph.resolve(args.token)}")
+            return 0
+        
+        print(f"✓ {len(graph.values)} tokens, {len(graph.resolved)} resolved")
+        for cycle in graph.cycles:
+            print(f"  ✗ Circular reference: {format_chain(cycle)}")
+        for path, chain in graph.unresolved.items():
+            print(f"  ✗ Unresolved: {format_chain(chain)}")
+        
+        return 0 if not graph.unresolved else 1
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
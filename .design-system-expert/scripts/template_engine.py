@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Template Engine
+Compiles text templates into Python render functions, cached on disk.
+
+A template is parsed once into the source of a Python function that appends
+its constant text and substitutions to a list, and that source is compiled
+into a code object. Rendering is one call of that function: the constant
+text is never scanned again, and loops and conditions run as Python for
+and if statements. Compiled code is cached in a __pycache__ directory next
+to the templates, keyed by the template's content hash and the Python
+version, so a new process (e.g. a pool worker) loads a template without
+parsing it.
+
+Filters are inlined, and every context name and dotted key a template
+reads is looked up once, at the start of the render, so the context must
+hold them all, including those only used in branches not taken.
+
+Syntax:
+    {{ name }}                      substitution; dotted names read keys or attributes
+    {{ name | capitalize }}         filters: capitalize, lower, upper, slug, join(sep)
+    {% for item in items %}         loop; 'for key, value in mapping' iterates its items
+    {% endfor %}
+    {% if expr %} {% elif expr %} {% else %} {% endif %}
+                                    conditions: a value, not, ==, !=, in, not in
+    {# comment #}
+
+A line holding nothing but a {% %} tag or a comment is dropped along with
+its line break, so block tags can sit on lines of their own.
+
+Usage:
+    python template_engine.py --template templates/component.md.tmpl --context context.json
+    python template_engine.py --template templates/component.css.tmpl --source
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import re
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+# Bump when the generated code changes, so cached code is compiled again
+ENGINE_VERSION = 1
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / 'templates'
+
+TAG_PATTERN = re.compile(r'\{\{(.*?)\}\}|\{%(.*?)%\}|\{#.*?#\}', re.S)
+
+EXPRESSION_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<string>'[^']*'|"[^"]*")
+      | (?P<number>-?\d+(?:\.\d+)?)
+      | (?P<name>[A-Za-z_]\w*(?:\.[\w-]+)*)
+      | (?P<op>==|!=|[|(),])
+    )""", re.X)
+
+
+class TemplateError(ValueError):
+    """A template that cannot be compiled or rendered."""
+
+
+def get(value: Any, key: str) -> Any:
+    """Read a dotted-name part: a key of a dict, else an attribute."""
+    if isinstance(value, dict):
+        return value[key]
+    return getattr(value, key)
+
+
+def pairs(value: Any) -> Any:
+    """Iterate a dict's items, or any other iterable as it is."""
+    return value.items() if isinstance(value, dict) else value
+
+
+def join(value: Any, separator: str = ', ') -> str:
+    """Join the items of a list or tuple; other values are returned as text."""
+    if isinstance(value, (list, tuple)):
+        return separator.join(str(item) for item in value)
+    return str(value)
+
+
+# Filters, inlined as Python: code with the value and arguments in {}, and the most arguments taken
+FILTERS: Dict[str, Tuple[str, int]] = {
+    'capitalize': ('str({}).capitalize()', 0),
+    'lower': ('str({}).lower()', 0),
+    'upper': ('str({}).upper()', 0),
+    'slug': ("str({}).lower().replace(' ', '-')", 0),
+    'join': ('join({})', 1),
+}
+
+# Globals of every render function
+NAMESPACE: Dict[str, Any] = {'get': get, 'pairs': pairs, 'join': join}
+
+
+def tokenize(source: str) -> List[Tuple[str, str, int]]:
+    """Split a template into ('text' | 'var' | 'block', content, line) tokens."""
+    tokens = []
+    position = 0
+    line = 1
+    for match in TAG_PATTERN.finditer(source):
+        start, end = match.span()
+        variable, block = match.group(1), match.group(2)
+        text_end, next_position = start, end
+        if variable is None:
+            # A tag alone on its line takes the indentation and line break with it
+            line_start = source.rfind('\n', 0, start) + 1
+            line_end = source.find('\n', end)
+            line_end = len(source) if line_end == -1 else line_end
+            if (line_start >= position and not source[line_start:start].strip()
+                    and not source[end:line_end].strip()):
+                text_end, next_position = line_start, min(line_end + 1, len(source))
+        if text_end > position:
+            tokens.append(('text', source[position:text_end], line))
+        line += source.count('\n', position, start)
+        if variable is not None:
+            tokens.append(('var', variable.strip(), line))
+        elif block is not None:
+            tokens.append(('block', block.strip(), line))
+        line += source.count('\n', start, next_position)
+        position = next_position
+    if position < len(source):
+        tokens.append(('text', source[position:], line))
+    return tokens
+
+
+def escape_text(text: str) -> str:
+    """Escape text for the body of a double-quoted f-string."""
+    return json.dumps(text, ensure_ascii=False)[1:-1].replace('{', '{{').replace('}', '}}')
+
+
+class Compiler:
+    """Generates the Python source of a template's render function."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.lines: List[str] = []
+        self.uses_extend = False
+        self.depth = 1
+        # Context names and keys read by the template -> local holding them
+        self.hoisted: Dict[str, str] = {}
+        # Text and substitutions (as Python expressions) not yet emitted,
+        # written by a single append of one f-string
+        self.pieces: List[Tuple[str, str]] = []
+        # Open blocks as (tag, line, loop variables, has statements)
+        self.blocks: List[List[Any]] = []
+        self.line = 0
+    
+    def error(self, message: str) -> TemplateError:
+        return TemplateError(f"{self.name}, line {self.line}: {message}")
+    
+    def flush(self) -> None:
+        pieces, self.pieces = self.pieces, []
+        if not pieces:
+            return
+        if len(pieces) == 1:
+            kind, content = pieces[0]
+            self.emit(f"append({content!r})" if kind == 'text' else f"append(str({content}))")
+        elif any('"' in content or '\\' in content for kind, content in pieces if kind == 'var'):
+            # Before Python 3.12 an f-string expression cannot hold its quote or a backslash
+            self.uses_extend = True
+            self.emit('extend((' + ', '.join(
+                repr(content) if kind == 'text' else f"str({content})" for kind, content in pieces) + '))')
+        else:
+            body = ''.join(
+                escape_text(content) if kind == 'text' else f"{{{content}}}" for kind, content in pieces)
+            self.emit(f'append(f"{body}")')
+    
+    def emit(self, statement: str) -> None:
+        self.lines.append('    ' * self.depth + statement)
+        if self.blocks:
+            self.blocks[-1][3] = True
+    
+    def open_block(self, tag: str, statement: str, names: Tuple[str, ...] = ()) -> None:
+        self.emit(statement)
+        self.blocks.append([tag, self.line, names, False])
+        self.depth += 1
+    
+    def close_body(self) -> List[Any]:
+        block = self.blocks[-1]
+        if not block[3]:
+            self.lines.append('    ' * self.depth + 'pass')
+        self.depth -= 1
+        return block
+    
+    def compile(self, source: str) -> str:
+        for kind, content, line in tokenize(source):
+            self.line = line
+            if kind == 'text':
+                self.pieces.append(('text', content))
+            elif kind == 'var':
+                self.pieces.append(('var', self.expression(content)))
+            else:
+                self.flush()
+                self.block(content)
+        self.flush()
+        if self.blocks:
+            tag, line = self.blocks[-1][:2]
+            self.line = line
+            raise self.error(f"'{tag}' is never closed")
+        self.lines.append("    return ''.join(parts)")
+        prologue = [f"    {local} = {code}" for code, local in self.hoisted.items()]
+        prologue += ['    parts = []', '    append = parts.append']
+        if self.uses_extend:
+            prologue.append('    extend = parts.extend')
+        return '\n'.join(['def render(context):'] + prologue + self.lines) + '\n'
+    
+    def hoist(self, code: str) -> str:
+        """Read a context value once, at the start of the render function."""
+        if code not in self.hoisted:
+            self.hoisted[code] = f"c{len(self.hoisted)}"
+        return self.hoisted[code]
+    
+    def block(self, content: str) -> None:
+        keyword, _, rest = content.partition(' ')
+        rest = rest.strip()
+        if keyword == 'for':
+            match = re.fullmatch(r'(\w+(?:\s*,\s*\w+)*)\s+in\s+(.+)', rest, re.S)
+            if not match:
+                raise self.error(f"Invalid loop: {content}")
+            names = tuple(name.strip() for name in match.group(1).split(','))
+            iterable = self.expression(match.group(2))
+            targets = ', '.join(f"l_{name}" for name in names)
+            if len(names) > 1:
+                iterable = f"pairs({iterable})"
+            self.open_block('for', f"for {targets} in {iterable}:", names)
+        elif keyword == 'if':
+            self.open_block('if', f"if {self.condition(rest)}:")
+        elif keyword in ('elif', 'else'):
+            if not self.blocks or self.blocks[-1][0] not in ('if', 'elif'):
+                raise self.error(f"'{keyword}' outside of an if block")
+            self.close_body()
+            self.blocks.pop()
+            statement = f"elif {self.condition(rest)}:" if keyword == 'elif' else 'else:'
+            self.open_block(keyword, statement)
+        elif keyword in ('endfor', 'endif'):
+            opened = ('for',) if keyword == 'endfor' else ('if', 'elif', 'else')
+            if not self.blocks or self.blocks[-1][0] not in opened:
+                raise self.error(f"Unexpected '{keyword}'")
+            self.close_body()
+            self.blocks.pop()
+        else:
+            raise self.error(f"Unknown tag: {keyword}")
+    
+    def local_names(self) -> set:
+        return {name for block in self.blocks for name in block[2]}
+    
+    def condition(self, text: str) -> str:
+        parser = ExpressionParser(text, self)
+        code = parser.condition()
+        parser.end()
+        return code
+    
+    def expression(self, text: str) -> str:
+        parser = ExpressionParser(text, self)
+        code = parser.filtered()
+        parser.end()
+        return code
+
+
+class ExpressionParser:
+    """Translates one template expression into Python."""
+    
+    def __init__(self, text: str, compiler: Compiler):
+        self.text = text
+        self.compiler = compiler
+        self.local_names = compiler.local_names()
+        self.tokens: List[Tuple[str, str]] = []
+        position = 0
+        while text[position:].strip():
+            match = EXPRESSION_TOKEN.match(text, position)
+            if not match:
+                raise compiler.error(f"Invalid expression: {text}")
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        self.position = 0
+    
+    def peek(self) -> Tuple[Optional[str], Optional[str]]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None, None
+    
+    def take(self) -> Tuple[Optional[str], Optional[str]]:
+        token = self.peek()
+        self.position += 1
+        return token
+    
+    def end(self) -> None:
+        if self.position < len(self.tokens):
+            raise self.compiler.error(f"Unexpected '{self.tokens[self.position][1]}' in: {self.text}")
+    
+    def condition(self) -> str:
+        if self.peek() == ('name', 'not'):
+            self.take()
+            return f"not ({self.condition()})"
+        left = self.filtered()
+        kind, value = self.peek()
+        if kind == 'op' and value in ('==', '!='):
+            self.take()
+            return f"{left} {value} {self.filtered()}"
+        if (kind, value) == ('name', 'in'):
+            self.take()
+            return f"{left} in {self.filtered()}"
+        if (kind, value) == ('name', 'not') and self.tokens[self.position + 1:self.position + 2] == [('name', 'in')]:
+            self.position += 2
+            return f"{left} not in {self.filtered()}"
+        return left
+    
+    def filtered(self) -> str:
+        code = self.operand()
+        while self.peek() == ('op', '|'):
+            self.take()
+            kind, name = self.take()
+            if kind != 'name' or name not in FILTERS:
+                raise self.compiler.error(f"Unknown filter: {name}")
+            code_format, max_arguments = FILTERS[name]
+            arguments = [code]
+            if self.peek() == ('op', '('):
+                self.take()
+                while self.peek() != ('op', ')'):
+                    arguments.append(self.operand())
+                    if self.peek() == ('op', ','):
+                        self.take()
+                    elif self.peek() != ('op', ')'):
+                        raise self.compiler.error(f"Invalid filter arguments in: {self.text}")
+                self.take()
+            if len(arguments) - 1 > max_arguments:
+                raise self.compiler.error(f"Too many arguments for filter '{name}' in: {self.text}")
+            code = code_format.format(', '.join(arguments))
+        return code
+    
+    def operand(self) -> str:
+        kind, value = self.take()
+        if kind in ('string', 'number'):
+            return value
+        if kind != 'name' or value in ('not', 'in'):
+            raise self.compiler.error(f"Expected a value in: {self.text}")
+        first, *rest = value.split('.')
+        if first in self.local_names:
+            code = f"l_{first}"
+            for part in rest:
+                code = f"get({code}, {part!r})"
+            return code
+        code = self.compiler.hoist(f"context[{first!r}]")
+        for part in rest:
+            code = self.compiler.hoist(f"get({code}, {part!r})")
+        return code
+
+
+class Template:
+    """A compiled template; render() fills it in from a context of names."""
+    
+    def __init__(self, source: str, name: str = '<template>'):
+        self.name = name
+        self.python_source = Compiler(name).compile(source)
+        self.load(compile(self.python_source, name, 'exec'))
+    
+    @classmethod
+    def from_code(cls, code: Any, name: str) -> 'Template':
+        """Rebuild a template from the code object of an earlier compile."""
+        template = cls.__new__(cls)
+        template.name = name
+        template.python_source = None
+        template.load(code)
+        return template
+    
+    def load(self, code: Any) -> None:
+        namespace = dict(NAMESPACE)
+        exec(code, namespace)
+        self.code = code
+        self.function = namespace['render']
+    
+    def render(self, context: Optional[Dict[str, Any]] = None, **values: Any) -> str:
+        context = {**context, **values} if values and context else values or context or {}
+        try:
+            return self.function(context)
+        except (KeyError, AttributeError) as e:
+            raise TemplateError(f"{self.name}: undefined name {e}") from None
+
+
+class TemplateLoader:
+    """Loads templates from a directory, compiling each at most once.
+
+    Compiled templates are kept per process, and their code is cached on
+    disk; a cached entry is used while the template's content hash and the
+    engine version match.
+    """
+    
+    def __init__(self, directory: Path = TEMPLATE_DIR, cache_dir: Optional[Path] = None):
+        self.directory = Path(directory)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.directory / '__pycache__'
+        self.templates: Dict[str, Template] = {}
+        self.compiled = 0
+        self.cached = 0
+    
+    def get(self, name: str) -> Template:
+        template = self.templates.get(name)
+        if template is None:
+            template = self.templates[name] = self.load(name)
+        return template
+    
+    def cache_path(self, name: str) -> Path:
+        return self.cache_dir / f"{name}.{sys.implementation.cache_tag}.tplc"
+    
+    def load(self, name: str) -> Template:
+        path = self.directory / name
+        if not path.exists():
+            raise TemplateError(f"Template not found: {path}")
+        source = path.read_text(encoding='utf-8')
+        digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        cache_file = self.cache_path(name)
+        try:
+            version, cached_digest, code = marshal.loads(cache_file.read_bytes())
+            if version == ENGINE_VERSION and cached_digest == digest:
+                self.cached += 1
+                return Template.from_code(code, str(path))
+        except (OSError, ValueError, EOFError, TypeError):
+            pass
+        
+        template = Template(source, str(path))
+        self.compiled += 1
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{name}.", suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(marshal.dumps((ENGINE_VERSION, digest, template.code)))
+            os.replace(temp_path, cache_file)
+        except OSError:
+            # A read-only tree still renders; each process just compiles again
+            pass
+        return template
+
+
+DEFAULT_LOADER = TemplateLoader()
+
+
+def get_template(name: str) -> Template:
+    """Return a template from the templates directory, compiled once per process."""
+    return DEFAULT_LOADER.get(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Render a template or show its compiled Python source'
+    )
+    parser.add_argument(
+        '--template',
+        required=True,
+        help='Template file path'
+    )
+    parser.add_argument(
+        '--context',
+        help='JSON file with the names used by the template'
+    )
+    parser.add_argument(
+        '--source',
+        action='store_true',
+        help='Print the generated render function instead of rendering'
+    )
+    
+    args = parser.parse_args()
+    
+    template_path = Path(args.template)
+    if not template_path.exists():
+        print(f"Error: Template file '{args.template}' not found")
+        return 1
+    
+    try:
+        template = Template(template_path.read_text(encoding='utf-8'), str(template_path))
+        if args.source:
+            print(template.python_source, end='')
+            return 0
+        
+        context = {}
+        if args.context:
+            with open(args.context, 'r', encoding='utf-8') as f:
+                context = json.load(f)
+        print(template.render(context), end='')
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -11,22 +11,23 @@ import json
 import re
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
+
+from build_cache import BuildCache, add_cache_arguments, cache_from_args
+from json_writer import dump_store
+from profiler import Profiler, NULL_PROFILER, add_profile_arguments, profiler_from_args, finish_profile
+import token_store
+from token_store import TokenStore
+import type_inference
+from type_inference import CONVERTER_VALUE_TYPES
 
 
 class TokenConverter:
     """Converts CSS custom properties to Style Dictionary JSON tokens."""
     
-    # Token type detection patterns
-    COLOR_PATTERN = re.compile(r'^#[0-9A-Fa-f]{3,8}$|^rgb|^hsl|^var\(--color')
-    DIMENSION_PATTERN = re.compile(r'^\d+(\.\d+)?(px|rem|em|%|vh|vw)$')
-    FONT_FAMILY_PATTERN = re.compile(r'[a-zA-Z\s,\-]+')
-    FONT_WEIGHT_PATTERN = re.compile(r'^\d{3}$|^(normal|bold|lighter|bolder)$')
-    SHADOW_PATTERN = re.compile(r'^\d+.*\d+.*#[0-9A-Fa-f]')
-    
     def __init__(self):
         self.tokens = {}
-        
+    
     def parse_css_file(self, file_path: str) -> Dict[str, Any]:
         """Parse CSS file and extract custom properties."""
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -44,31 +45,8 @@ class TokenConverter:
         return css_tokens
     
     def detect_token_type(self, value: str) -> str:
-        """Detect the type of token based on its value."""
-        value = value.strip()
-        
-        # Check for color
-        if self.COLOR_PATTERN.match(value):
-            return "color"
-        
-        # Check for dimension (size, spacing, etc.)
-        if self.DIMENSION_PATTERN.match(value):
-            return "dimension"
-        
-        # Check for font weight
-        if self.FONT_WEIGHT_PATTERN.match(value):
-            return "fontWeight"
-        
-        # Check for shadow
-        if self.SHADOW_PATTERN.match(value):
-            return "shadow"
-        
-        # Check for font family (contains letters and spaces)
-        if ',' in value or 'sans' in value or 'serif' in value or 'mono' in value:
-            return "fontFamily"
-        
-        # Default to string
-        return "string"
+        """Detect the type of token based on its value (see type_inference.CONVERTER_VALUE_RULES)."""
+        return CONVERTER_VALUE_TYPES.infer_type('', value.strip())
     
     def parse_token_name(self, name: str) -> List[str]:
         """Parse token name into hierarchy.
@@ -77,29 +55,16 @@ class TokenConverter:
         """
         return name.split('-')
     
+    def build_token_store(self, css_tokens: Dict[str, str]) -> TokenStore:
+        """Build a compact token store from flat CSS tokens."""
+        store = TokenStore()
+        for name, value in css_tokens.items():
+            store.add('.'.join(self.parse_token_name(name)), value, self.detect_token_type(value))
+        return store
+    
     def build_token_hierarchy(self, css_tokens: Dict[str, str]) -> Dict[str, Any]:
         """Build hierarchical token structure from flat CSS tokens."""
-        tokens = {}
-        
-        for name, value in css_tokens.items():
-            parts = self.parse_token_name(name)
-            token_type = self.detect_token_type(value)
-            
-            # Navigate/create nested structure
-            current = tokens
-            for i, part in enumerate(parts[:-1]):
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-            
-            # Add the final token with value and type
-            final_key = parts[-1]
-            current[final_key] = {
-                "value": value,
-                "type": token_type
-            }
-        
-        return tokens
+        return self.build_token_store(css_tokens).to_dict()
     
     def convert_reference(self, value: str) -> str:
         """Convert CSS var() references to Style Dictionary references.
@@ -128,26 +93,70 @@ class TokenConverter:
         
         return process_value(tokens)
     
-    def convert(self, input_file: str, validate: bool = False) -> Dict[str, Any]:
-        """Convert CSS file to Style Dictionary JSON format."""
-        # Parse CSS file
-        css_tokens = self.parse_css_file(input_file)
+    def convert(self, input_file: str, validate: bool = False,
+                cache: Optional[BuildCache] = None,
+                profiler: Optional[Profiler] = None) -> Dict[str, Any]:
+        """Convert CSS file to Style Dictionary JSON format.
         
-        if not css_tokens:
-            raise ValueError(f"No CSS custom properties found in {input_file}")
-        
-        # Build hierarchical structure
-        tokens = self.build_token_hierarchy(css_tokens)
+        With a cache, the parsed and resolved trees are reused whenever the
+        input file content is unchanged. With a profiler, each stage is timed.
+        """
+        profiler = profiler or NULL_PROFILER
+        digest = cache.hash_file(input_file) if cache else None
+        # Cached trees are built by this module, token_store and type_inference; json_writer
+        # only writes them out, so it does not affect the entries
+        params = {"code": cache.hash_sources(__file__, token_store.__file__, type_inference.__file__)} \
+            if cache else None
+        tokens = cache.get('resolved', digest, params) if cache else None
         
-        # Process references
-        tokens = self.process_references(tokens)
+        if tokens is None:
+            # Parse CSS file
+            css_tokens = cache.get('parsed', digest, params) if cache else None
+            if css_tokens is None:
+                with profiler.stage('parse') as stage:
+                    css_tokens = self.parse_css_file(input_file)
+                    stage['tokens'] = len(css_tokens)
+                if cache and css_tokens:
+                    cache.put('parsed', digest, css_tokens, params)
+            
+            if not css_tokens:
+                raise ValueError(f"No CSS custom properties found in {input_file}")
+            
+            # Convert references on the flat store, then build the hierarchy
+            store = self.resolve_store(css_tokens, profiler)
+            with profiler.stage('hierarchy', tokens=len(store)):
+                tokens = store.to_dict()
+            
+            if cache:
+                cache.put('resolved', digest, tokens, params)
         
         # Validate if requested
         if validate:
-            self.validate_tokens(tokens)
+            with profiler.stage('validate'):
+                self.validate_tokens(tokens)
         
         return tokens
     
+    def resolve_store(self, css_tokens: Dict[str, str],
+                      profiler: Optional[Profiler] = None) -> TokenStore:
+        """Build a token store from flat CSS tokens with references converted."""
+        profiler = profiler or NULL_PROFILER
+        with profiler.stage('store', tokens=len(css_tokens)):
+            store = self.build_token_store(css_tokens)
+        with profiler.stage('references', tokens=len(store)):
+            store.map_values(self.convert_reference)
+        return store
+    
+    def convert_store(self, input_file: str, profiler: Optional[Profiler] = None) -> TokenStore:
+        """Convert a CSS file to a token store, without building the nested tree."""
+        profiler = profiler or NULL_PROFILER
+        with profiler.stage('parse') as stage:
+            css_tokens = self.parse_css_file(input_file)
+            stage['tokens'] = len(css_tokens)
+        if not css_tokens:
+            raise ValueError(f"No CSS custom properties found in {input_file}")
+        return self.resolve_store(css_tokens, profiler)
+    
     def validate_tokens(self, tokens: Dict[str, Any]) -> None:
         """Basic validation of token structure."""
         def validate_node(node, path=""):
@@ -166,10 +175,13 @@ class TokenConverter:
         
         validate_node(tokens)
     
-    def save_json(self, tokens: Dict[str, Any], output_file: str, pretty: bool = True) -> None:
-        """Save tokens to JSON file."""
+    def save_json(self, tokens: Union[Dict[str, Any], TokenStore], output_file: str,
+                  pretty: bool = True) -> None:
+        """Save a token tree, or a token store streamed as the same JSON, to a file."""
         with open(output_file, 'w', encoding='utf-8') as f:
-            if pretty:
+            if isinstance(tokens, TokenStore):
+                dump_store(tokens, f, indent=2 if pretty else None, ensure_ascii=False)
+            elif pretty:
                 json.dump(tokens, f, indent=2, ensure_ascii=False)
             else:
                 json.dump(tokens, f, ensure_ascii=False)
@@ -200,6 +212,13 @@ def main():
         default='pretty',
         help='Output format (default: pretty)'
     )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and re-convert when the input changes'
+    )
+    add_cache_arguments(parser)
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
@@ -208,23 +227,41 @@ def main():
         print(f"Error: Input file '{args.input}' not found")
         return 1
     
+    if args.watch:
+        from token_watcher import TokenWatcher
+        checks = ['values', 'references'] if args.validate else []
+        TokenWatcher([args.input], checks, output=args.output, pretty=args.format == 'pretty').run()
+        return 0
+    
     try:
         # Convert tokens
         converter = TokenConverter()
-        tokens = converter.convert(args.input, validate=args.validate)
+        cache = cache_from_args(args)
+        profiler = profiler_from_args(args)
+        if args.validate or cache:
+            tokens = converter.convert(args.input, validate=args.validate, cache=cache, profiler=profiler)
+            categories = len(tokens)
+        else:
+            # Nothing needs the nested tree, so stream the store straight to disk
+            tokens = converter.convert_store(args.input, profiler=profiler)
+            categories = len({path.partition('.')[0] for path in tokens})
         
         # Save to file
         pretty = args.format == 'pretty'
-        converter.save_json(tokens, args.output, pretty=pretty)
+        with (profiler or NULL_PROFILER).stage('emit', categories=categories):
+            converter.save_json(tokens, args.output, pretty=pretty)
         
         print(f"✓ Successfully converted {args.input} to {args.output}")
-        print(f"  Found {len(tokens)} token categories")
+        print(f"  Found {categories} token categories")
+        if cache:
+            print(f"  Cache: {cache.hits} hit(s), {cache.misses} miss(es)")
         
         if args.validate:
             print("✓ Validation passed")
         
+        finish_profile(profiler, args)
         return 0
-        
+    
     except Exception as e:
         print(f"Error: {e}")
         return 1
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Token Daemon
+Long-running token service answering queries over a Unix domain socket.
+
+The daemon loads and resolves the token sources once and keeps the tokens,
+their reference graph and the per-token validation results in memory. A
+TokenWatcher re-loads changed sources and re-validates only the affected
+tokens, so editor plugins and pre-commit hooks get answers without paying
+for interpreter startup or a full parse on every call.
+
+Clients send one JSON object per line and get one JSON object per line
+back, on any number of concurrent connections:
+
+    {"id": 1, "method": "validate", "params": {"source": "tokens/color.json"}}
+    {"id": 2, "method": "resolve", "params": {"reference": "{color.bg.primary}"}}
+    {"id": 3, "method": "lookup", "params": {"path": "color.bg.primary"}}
+    {"id": 4, "method": "lookup", "params": {"prefix": "color.bg"}}
+    {"id": 5, "method": "lookup", "params": {"glob": "color.brand.*", "type": "color"}}
+    {"id": 6, "method": "stats"}
+
+Responses carry the request id and either "result" or "error".
+
+Usage:
+    python token_daemon.py --input tokens/ --socket .token-daemon.sock --check-all
+    python token_daemon.py --socket .token-daemon.sock --send '{"method": "validate"}'
+"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set
+
+from reference_graph import ReferenceGraph, format_chain
+from token_index import TokenIndex
+from token_validator import expand_inputs
+from token_watcher import TokenWatcher, InotifyWatcher, create_watcher, BASE_SCOPE
+
+
+DEFAULT_SOCKET = '.token-daemon.sock'
+
+# Longest request line accepted from a client
+MAX_LINE = 16 * 1024 * 1024
+
+
+class TokenDaemon:
+    """Serves validate, resolve and lookup requests from an always-current TokenWatcher."""
+    
+    # Request method -> handler method
+    METHODS = {
+        'validate': 'handle_validate',
+        'resolve': 'handle_resolve',
+        'lookup': 'handle_lookup',
+        'stats': 'handle_stats'
+    }
+    
+    def __init__(self, watcher: TokenWatcher, socket_path: str, use_polling: bool = False,
+                 poll_interval: float = 0.25):
+        self.watcher = watcher
+        self.socket_path = socket_path
+        self.use_polling = use_polling
+        self.poll_interval = poll_interval
+        self.file_watcher = None
+        
+        # Merged token path -> token node of the base scope, later sources winning
+        self.tokens: Dict[str, Dict[str, Any]] = {}
+        self.index = TokenIndex.from_tokens({})
+        self.pending: Set[str] = set()
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.stats = {"requests": 0, "refreshes": 0, "clients": 0, "last_refresh_ms": 0.0}
+    
+    def refresh(self, sources: List[str]) -> None:
+        """Reload changed sources and rebuild the lookup index."""
+        stats = self.watcher.refresh(sources)
+        self.tokens = {}
+        for source in self.watcher.sources:
+            self.tokens.update(self.watcher.tokens.get(source, {}).get(BASE_SCOPE, {}))
+        self.index = TokenIndex.from_tokens(self.tokens)
+        self.stats["refreshes"] += 1
+        self.stats["last_refresh_ms"] = stats['elapsed_ms']
+        print(
+            f"⏱  Loaded {len(sources)} source(s) in {stats['elapsed_ms']:.1f} ms "
+            f"({stats['changed']} changed, {stats['removed']} removed, "
+            f"{stats['revalidated']} re-validated)"
+        )
+    
+    def on_files_changed(self) -> None:
+        """Collect file events and refresh once the burst of saves goes quiet."""
+        self.pending |= self.file_watcher.poll(0)
+        if not self.pending:
+            return
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = asyncio.get_running_loop().call_later(self.watcher.debounce, self.flush)
+    
+    def flush(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.pending:
+            changed = sorted(self.pending)
+            self.pending.clear()
+            self.refresh(changed)
+    
+    def sync(self) -> None:
+        """Apply changes that have not been picked up yet, so answers are never stale."""
+        self.pending |= self.file_watcher.poll(0)
+        self.flush()
+    
+    async def poll_files(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            self.on_files_changed()
+    
+    def dispatch(self, line: bytes) -> Dict[str, Any]:
+        """Answer one request line."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {"id": None, "error": f"Invalid JSON: {e}"}
+        if not isinstance(request, dict):
+            return {"id": None, "error": "Request must be a JSON object"}
+        
+        request_id = request.get('id')
+        handler = self.METHODS.get(request.get('method'))
+        if handler is None:
+            return {"id": request_id, "error": f"Unknown method: {request.get('method')}"}
+        
+        params = request.get('params') or {}
+        if not isinstance(params, dict):
+            return {"id": request_id, "error": "params must be a JSON object"}
+        
+        self.stats["requests"] += 1
+        try:
+            self.sync()
+            result = getattr(self, handler)(params)
+        except (KeyError, ValueError) as e:
+            return {"id": request_id, "error": str(e.args[0]) if e.args else str(e)}
+        except Exception as e:
+            # A failing request must not take down the connection or the daemon
+            return {"id": request_id, "error": f"{type(e).__name__}: {e}"}
+        return {"id": request_id, "result": result}
+    
+    def handle_validate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return current results for all tokens, some token paths, or one source file."""
+        paths = None
+        if 'source' in params:
+            source = str(Path(params['source']).resolve())
+            if source not in self.watcher.tokens:
+                raise ValueError(f"Not a watched source: {params['source']}")
+            paths = {path for tokens in self.watcher.tokens[source].values() for path in tokens}
+        elif 'paths' in params:
+            paths = set(params['paths'])
+        
+        validator = self.watcher.results(paths)
+        result = {
+            "valid": not validator.errors,
+            "errors": validator.errors,
+            "warnings": validator.warnings,
+            "info": validator.info
+        }
+        if params.get('report'):
+            result["report"] = validator.generate_report()
+        return result
+    
+    def resolve_path(self, reference: str) -> str:
+        """Return the token path named by '{a.b}', 'var(--a-b)', '--a-b' or 'a.b'."""
+        reference = reference.strip()
+        graph = self.watcher.graph
+        match = ReferenceGraph.ALIAS_PATTERN.fullmatch(reference)
+        if match:
+            path = match.group(1).strip()
+        elif reference.startswith('var(') or reference.startswith('--'):
+            name = reference[4:-1].split(',')[0].strip() if reference.startswith('var(') else reference
+            path = graph.path_for_var(name)
+            if path is None:
+                raise KeyError(f"Unknown CSS variable: {name}")
+        else:
+            path = reference
+        if path not in graph.values:
+            raise KeyError(f"Unknown token: {path}")
+        return path
+    
+    def handle_resolve(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        graph = self.watcher.graph
+        if 'reference' not in params:
+            raise ValueError("resolve needs a 'reference' parameter")
+        path = self.resolve_path(params['reference'])
+        chain = graph.unresolved.get(path)
+        return {
+            "path": path,
+            "value": graph.values[path],
+            "resolved": graph.resolve(path),
+            "unresolved": format_chain(chain) if chain else None
+        }
+    
+    def handle_lookup(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        graph = self.watcher.graph
+        if any(key in params for key in ('prefix', 'glob', 'type', 'value')):
+            if 'prefix' in params and 'glob' in params:
+                raise ValueError("lookup takes either a 'prefix' or a 'glob' parameter")
+            return {
+                "paths": self.index.find(params.get('glob', params.get('prefix')),
+                                         params.get('type'), params.get('value'))
+            }
+        
+        path = params.get('path')
+        if path is None:
+            raise ValueError("lookup needs a 'path', 'prefix', 'glob', 'type' or 'value' parameter")
+        if path not in self.tokens:
+            raise KeyError(f"Unknown token: {path}")
+        return {
+            "path": path,
+            "token": self.tokens[path],
+            "resolved": graph.resolve(path),
+            "dependents": graph.dependents.get(path, [])
+        }
+    
+    def handle_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(self.stats, tokens=len(self.tokens), sources=self.watcher.sources)
+    
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats["clients"] += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(b'{"id": null, "error": "Request line too long"}\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = self.dispatch(line)
+                writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def serve(self) -> None:
+        """Load the sources, then serve clients and watch files until cancelled."""
+        self.refresh(self.watcher.sources)
+        remove_stale_socket(self.socket_path)
+        
+        loop = asyncio.get_running_loop()
+        self.file_watcher = create_watcher(self.watcher.sources, self.use_polling)
+        poller = None
+        if isinstance(self.file_watcher, InotifyWatcher):
+            loop.add_reader(self.file_watcher.fd, self.on_files_changed)
+        else:
+            poller = asyncio.create_task(self.poll_files())
+        
+        server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path, limit=MAX_LINE)
+        print(
+            f"👂 Serving {len(self.tokens)} tokens on {self.socket_path} "
+            f"({type(self.file_watcher).__name__}, Ctrl+C to stop)"
+        )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if poller is not None:
+                poller.cancel()
+            else:
+                loop.remove_reader(self.file_watcher.fd)
+            self.file_watcher.close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+
+def remove_stale_socket(socket_path: str) -> None:
+    """Remove a socket file left behind by a daemon that is no longer running."""
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            os.unlink(socket_path)
+            return
+    raise OSError(f"A daemon is already listening on {socket_path}")
+
+
+def send_request(socket_path: str, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Send one request to a running daemon and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with client.makefile('rb') as responses:
+            return json.loads(responses.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve token validation and lookups over a Unix domain socket'
+    )
+    parser.add_argument(
+        '--input',
+        nargs='+',
+        help='CSS or JSON token files, directories or glob patterns to serve'
+    )
+    parser.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET,
+        help=f'Unix socket path (default: {DEFAULT_SOCKET})'
+    )
+    parser.add_argument(
+        '--check-all',
+        action='store_true',
+        help='Run all checks (default: naming, values and references)'
+    )
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=50,
+        help='Milliseconds to wait for further saves before updating (default: 50)'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='Use polling instead of inotify'
+    )
+    parser.add_argument(
+        '--send',
+        help='Send one JSON request to a running daemon and print the response'
+    )
+    
+    args = parser.parse_args()
+    
+    if args.send:
+        try:
+            request = json.loads(args.send)
+            if not isinstance(request, dict):
+                print("Error: request must be a JSON object")
+                return 1
+            request.setdefault('id', 1)
+            start = time.perf_counter()
+            response = send_request(args.socket, request)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            return 1
+        print(json.dumps(response, indent=2, ensure_ascii=False))
+        print(f"⏱  {(time.perf_counter() - start) * 1000:.2f} ms")
+        return 1 if 'error' in response or response['result'].get('valid') is False else 0
+    
+    if not args.input:
+        print("Error: --input is required unless --send is given")
+        return 1
+    
+    sources = []
+    try:
+        for pattern in args.input:
+            if Path(pattern).is_file():
+                sources.append(pattern)
+            else:
+                sources.extend(expand_inputs([pattern]))
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    
+    if not sources:
+        print(f"Error: No input files found for {', '.join(args.input)}")
+        return 1
+    
+    checks = ['naming', 'values', 'references']
+    if args.check_all:
+        checks.append('duplicates')
+    
+    watcher = TokenWatcher(sources, checks, debounce=args.debounce / 1000)
+    daemon = TokenDaemon(watcher, args.socket, use_polling=args.poll)
+    try:
+        asyncio.run(daemon.serve())
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
+    except OSError as e:
+        print(f"Error: {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Token Index
+Query index over a token set: path, prefix, glob, type and value lookups.
+
+Built once per load on top of a TokenStore, whose path -> index map already
+answers exact lookups in O(1). The index adds a sorted array of the paths,
+so every token below a group (color.brand) is one contiguous slice found by
+binary search, and globs only visit the groups their segments can match.
+Tokens are also grouped by type and by value, so "every fontSize" or "every
+token set to #ffffff" is a single dict lookup instead of a walk over the
+whole tree.
+
+In globs, '*' matches within one path segment, '?' matches one character
+of a segment, and '**' matches any number of segments, including none:
+'color.brand.*' is every shade of color.brand, and '**.button.**' every
+token with a 'button' segment.
+
+The index is a snapshot: rebuild it after changing the store.
+
+Usage:
+    python token_index.py --input tokens/*.json --glob 'color.brand.*'
+    python token_index.py --input tokens/*.json --prefix color.text --type color
+    python token_index.py --input tokens/*.json --value '#ffffff'
+"""
+
+import json
+import re
+import argparse
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Pattern, Tuple
+
+from token_store import TokenStore
+
+# Glob characters; the text before the first one is the pattern's literal prefix
+GLOB_CHARS = re.compile(r'[*?\[]')
+
+# Segment glob syntax: a '*', a '?', a [...] class, or a run of literal text
+SEGMENT_PART = re.compile(r'\*|\?|\[!?\]?[^\]]*\]|[^*?\[]+|\[')
+
+
+def translate_segment(segment: str) -> str:
+    parts = []
+    for part in SEGMENT_PART.findall(segment):
+        if part == '*':
+            parts.append('[^.]*')
+        elif part == '?':
+            parts.append('[^.]')
+        elif part.startswith('[') and len(part) > 1:
+            body = part[1:-1]
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            parts.append('[' + body.replace('\\', '\\\\') + ']')
+        else:
+            parts.append(re.escape(part))
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=256)
+def compile_segment(segment: str) -> Pattern:
+    return re.compile(translate_segment(segment))
+
+
+@lru_cache(maxsize=256)
+def compile_glob(pattern: str) -> Pattern:
+    """Compile a dotted-path glob into a regex matching whole paths."""
+    segments = pattern.split('.')
+    regex = []
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == '**':
+            if not last:
+                regex.append(r'(?:[^.]*\.)*')
+            else:
+                regex.append(r'(?:\.[^.]*)*' if i else '.*')
+            continue
+        regex.append(translate_segment(segment))
+        # A trailing '**' brings its own separator, so 'a.**' also matches 'a'
+        if not last and not (i == len(segments) - 2 and segments[-1] == '**'):
+            regex.append(r'\.')
+    return re.compile(''.join(regex))
+
+
+def value_key(value: Any) -> Any:
+    """Return a hashable key for a token value; composite values are keyed by their JSON."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+class TokenIndex:
+    """Read-only lookups over a TokenStore, by path, prefix, glob, type and value."""
+    
+    def __init__(self, store: TokenStore):
+        self.store = store
+        # Every path in sorted order, so the tokens below a group are one slice
+        self.sorted_paths: List[str] = sorted(store.paths)
+        self.by_type: Dict[Optional[str], List[int]] = {}
+        self.by_value: Dict[Any, List[int]] = {}
+        
+        type_names = store.type_names
+        for i, (code, value) in enumerate(zip(store.type_codes, store.values)):
+            self.by_type.setdefault(type_names[code], []).append(i)
+            self.by_value.setdefault(value_key(value), []).append(i)
+    
+    @classmethod
+    def from_tree(cls, tree: Dict[str, Any]) -> 'TokenIndex':
+        return cls(TokenStore.from_tree(tree))
+    
+    @classmethod
+    def from_tokens(cls, tokens: Dict[str, Dict[str, Any]]) -> 'TokenIndex':
+        """Index a flat map of dotted path -> token dict."""
+        store = TokenStore()
+        for path, token in tokens.items():
+            extra = {key: value for key, value in token.items() if key not in ('value', 'type')}
+            store.add(path, token['value'], token.get('type'), extra or None)
+        return cls(store)
+    
+    @classmethod
+    def from_files(cls, file_paths: Iterable[str]) -> 'TokenIndex':
+        """Index the tokens of several JSON files, later files winning on the same path."""
+        tokens: Dict[str, Dict[str, Any]] = {}
+        for file_path in file_paths:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                tokens.update(TokenStore.from_tree(json.load(f)).items())
+        return cls.from_tokens(tokens)
+    
+    def __len__(self) -> int:
+        return len(self.store)
+    
+    def __contains__(self, path: str) -> bool:
+        return path in self.store.index
+    
+    def get(self, path: str, default: Any = None) -> Any:
+        """Return the token at a path as a dict, in O(1)."""
+        return self.store.get(path, default)
+    
+    def value(self, path: str, default: Any = None) -> Any:
+        i = self.store.index.get(path)
+        return default if i is None else self.store.values[i]
+    
+    def children(self, group: str) -> Tuple[int, int]:
+        """Return the slice of sorted_paths holding every token below a group ('' for all)."""
+        paths = self.sorted_paths
+        if not group:
+            return 0, len(paths)
+        # '/' sorts right after '.', so the children of a group end where 'group/' would start
+        start = bisect_left(paths, group + '.')
+        return start, bisect_left(paths, group + '/', start)
+    
+    def prefix(self, prefix: str) -> List[str]:
+        """Return the token at prefix, if any, followed by every token below it, in sorted order."""
+        start, end = self.children(prefix)
+        children = self.sorted_paths[start:end]
+        return [prefix] + children if prefix in self.store.index else children
+    
+    def glob(self, pattern: str) -> List[str]:
+        """Return the paths matching a glob in sorted order.
+
+        Literal segments narrow the search to one group by binary search, and
+        a wildcard segment visits each child group once, skipping over its
+        tokens, so 'color.*.500' costs one lookup per color group rather than
+        a scan of every color. A '**' segment scans the group it appears in.
+        """
+        found: List[str] = []
+        self.match_segments('', pattern.split('.'), pattern, found)
+        found.sort()
+        return found
+    
+    def match_segments(self, group: str, segments: List[str], pattern: str, found: List[str]) -> None:
+        if not segments:
+            if group in self.store.index:
+                found.append(group)
+            return
+        
+        segment = segments[0]
+        if '**' in segment:
+            fullmatch = compile_glob(pattern).fullmatch
+            start, end = self.children(group)
+            found.extend(path for path in self.sorted_paths[start:end] if fullmatch(path))
+            if group and fullmatch(group) and group in self.store.index:
+                found.append(group)
+            return
+        
+        if not GLOB_CHARS.search(segment):
+            self.match_segments(f"{group}.{segment}" if group else segment, segments[1:], pattern, found)
+            return
+        
+        fullmatch = compile_segment(segment).fullmatch
+        paths = self.sorted_paths
+        skip = len(group) + 1 if group else 0
+        seen = set()
+        position, end = self.children(group)
+        while position < end:
+            path = paths[position]
+            child = path[skip:].split('.', 1)[0]
+            child_group = path[:skip] + child
+            if child not in seen:
+                seen.add(child)
+                if fullmatch(child):
+                    self.match_segments(child_group, segments[1:], pattern, found)
+            # Skip the rest of the child's tokens, which share the prefix 'child_group.'
+            if len(path) == len(child_group):
+                position += 1
+            else:
+                position = bisect_left(paths, child_group + '/', position)
+    
+    def of_type(self, token_type: Optional[str]) -> List[str]:
+        """Return the paths of every token of a type, in store order."""
+        paths = self.store.paths
+        return [paths[i] for i in self.by_type.get(token_type, ())]
+    
+    def with_value(self, value: Any) -> List[str]:
+        """Return the paths of every token whose raw value equals value, in store order."""
+        paths = self.store.paths
+        return [paths[i] for i in self.by_value.get(value_key(value), ())]
+    
+    def find(self, pattern: Optional[str] = None, token_type: Optional[str] = None,
+             value: Any = None) -> List[str]:
+        """Return the paths matching every given criterion: a glob or prefix, a type and a value.
+
+        Results are in sorted path order when a pattern is given, else in
+        store order.
+        """
+        if pattern is not None:
+            paths = self.glob(pattern) if GLOB_CHARS.search(pattern) else self.prefix(pattern)
+        elif value is not None:
+            paths = self.with_value(value)
+        elif token_type is not None:
+            return self.of_type(token_type)
+        else:
+            return list(self.store.paths)
+        
+        index = self.store.index
+        if token_type is not None:
+            code = self.store.type_ids.get(token_type)
+            type_codes = self.store.type_codes
+            paths = [path for path in paths if type_codes[index[path]] == code]
+        if value is not None and pattern is not None:
+            key = value_key(value)
+            values = self.store.values
+            paths = [path for path in paths if value_key(values[index[path]]) == key]
+        return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Query tokens by path, prefix, glob, type or value'
+    )
+    parser.add_argument(
+        '--input',
+        nargs='+',
+        required=True,
+        help='JSON token files; later files win on the same path'
+    )
+    parser.add_argument(
+        '--path',
+        help='Show one token (e.g., color.brand.600)'
+    )
+    parser.add_argument(
+        '--prefix',
+        help='Tokens at or below a group (e.g., color.text)'
+    )
+    parser.add_argument(
+        '--glob',
+        help="Tokens matching a path glob (e.g., 'color.brand.*', '**.button.**')"
+    )
+    parser.add_argument(
+        '--type',
+        help='Only tokens of this type'
+    )
+    parser.add_argument(
+        '--value',
+        help='Only tokens with this raw value'
+    )
+    
+    args = parser.parse_args()
+    
+    missing = [path for path in args.input if not Path(path).exists()]
+    if missing:
+        print(f"Error: Input file '{missing[0]}' not found")
+        return 1
+    
+    try:
+        index = TokenIndex.from_files(args.input)
+        
+        if args.path:
+            token = index.get(args.path)
+            if token is None:
+                print(f"Error: Unknown token: {args.path}")
+                return 1
+            print(json.dumps({args.path: token}, indent=2, ensure_ascii=False))
+            return 0
+        
+        if args.prefix and args.glob:
+            print("Error: Use either --prefix or --glob")
+            return 1
+        
+        paths = index.find(args.glob or args.prefix, args.type, args.value)
+        for path in paths:
+            print(f"{path}: {index.value(path)}")
+        print(f"\n✓ {len(paths)} of {len(index)} tokens")
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
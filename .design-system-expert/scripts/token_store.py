@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Token Store
+Compact array-backed storage for large token sets.
+
+Instead of one {"value": ..., "type": ...} dict per token inside nested
+dicts, a TokenStore keeps interned dotted paths, a parallel list of values
+and a parallel array of small integer type codes, plus a path -> index map.
+Rare metadata (description, comment, ...) is kept in a sparse side table.
+Tokens can be read back as dicts one at a time, or the whole store can be
+exported as the usual nested token tree.
+
+Usage:
+    python token_store.py --input tokens.json
+"""
+
+import json
+import sys
+import argparse
+from array import array
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator, Tuple, Callable
+
+
+class TokenStore:
+    """Tokens as parallel arrays indexed by dotted path."""
+    
+    __slots__ = ('paths', 'values', 'type_codes', 'index', 'type_names', 'type_ids', 'extras')
+    
+    # Keys of a token node that hold metadata rather than nested tokens
+    META_KEYS = {'value', 'type', 'description', 'comment'}
+    
+    # Type code of tokens without a 'type' key
+    NO_TYPE = 0
+    
+    def __init__(self):
+        self.paths: List[str] = []
+        self.values: List[Any] = []
+        self.type_codes = array('H')
+        self.index: Dict[str, int] = {}
+        self.type_names: List[Optional[str]] = [None]
+        self.type_ids: Dict[Optional[str], int] = {None: self.NO_TYPE}
+        # Token index -> metadata other than value and type
+        self.extras: Dict[int, Dict[str, Any]] = {}
+    
+    @classmethod
+    def from_tree(cls, tree: Dict[str, Any]) -> 'TokenStore':
+        """Build a store from a nested token tree, including tokens nested below tokens."""
+        store = cls()
+        
+        def collect(node, parts):
+            if 'value' in node and parts:
+                extra = {key: value for key, value in node.items()
+                         if key not in ('value', 'type') and not isinstance(value, dict)}
+                store.add('.'.join(parts), node['value'], node.get('type'), extra or None)
+            for key, child in node.items():
+                if key in cls.META_KEYS or not isinstance(child, dict):
+                    continue
+                parts.append(key)
+                collect(child, parts)
+                parts.pop()
+        
+        collect(tree, [])
+        return store
+    
+    def type_code(self, token_type: Optional[str]) -> int:
+        """Return the code for a type name, assigning a new one if needed."""
+        code = self.type_ids.get(token_type)
+        if code is None:
+            code = len(self.type_names)
+            self.type_names.append(sys.intern(token_type))
+            self.type_ids[self.type_names[code]] = code
+        return code
+    
+    def add(self, path: str, value: Any, token_type: Optional[str] = None,
+            extra: Optional[Dict[str, Any]] = None) -> int:
+        """Add a token, or replace the one at the same path, and return its index."""
+        if isinstance(value, str):
+            value = sys.intern(value)
+        
+        i = self.index.get(path)
+        if i is None:
+            i = len(self.paths)
+            path = sys.intern(path)
+            self.paths.append(path)
+            self.values.append(value)
+            self.type_codes.append(self.type_code(token_type))
+            self.index[path] = i
+        else:
+            self.values[i] = value
+            self.type_codes[i] = self.type_code(token_type)
+            self.extras.pop(i, None)
+        
+        if extra:
+            self.extras[i] = extra
+        return i
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def __contains__(self, path: str) -> bool:
+        return path in self.index
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths)
+    
+    def __getitem__(self, path: str) -> Dict[str, Any]:
+        return self.token(self.index[path])
+    
+    def get(self, path: str, default: Any = None) -> Any:
+        i = self.index.get(path)
+        return default if i is None else self.token(i)
+    
+    def token(self, i: int) -> Dict[str, Any]:
+        """Return the token at an index as a {"value", "type", ...} dict."""
+        token = {"value": self.values[i]}
+        token_type = self.type_names[self.type_codes[i]]
+        if token_type is not None:
+            token["type"] = token_type
+        if i in self.extras:
+            token.update(self.extras[i])
+        return token
+    
+    def value(self, path: str) -> Any:
+        return self.values[self.index[path]]
+    
+    def token_type(self, path: str) -> Optional[str]:
+        return self.type_names[self.type_codes[self.index[path]]]
+    
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (path, token dict) pairs in insertion order."""
+        for i, path in enumerate(self.paths):
+            yield path, self.token(i)
+    
+    def map_values(self, func: Callable[[Any], Any]) -> None:
+        """Replace every value with func(value)."""
+        self.values = [func(value) for value in self.values]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the tokens as a nested token tree.
+
+        Tokens are placed in insertion order; a token whose path is a prefix
+        of an earlier token's path replaces that branch, as assigning into a
+        nested dict would.
+        """
+        tree = {}
+        for i, path in enumerate(self.paths):
+            parts = path.split('.')
+            current = tree
+            for part in parts[:-1]:
+                if part not in current:
+                    current[part] = {}
+                current = current[part]
+            current[parts[-1]] = self.token(i)
+        return tree
+    
+    def type_counts(self) -> Dict[str, int]:
+        """Return the number of tokens per type."""
+        counts = [0] * len(self.type_names)
+        for code in self.type_codes:
+            counts[code] += 1
+        return {
+            name if name is not None else '(none)': count
+            for name, count in zip(self.type_names, counts) if count
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Load a token file into a TokenStore and show a summary'
+    )
+    parser.add_argument(
+        '--input',
+        required=True,
+        help='Input JSON token file path'
+    )
+    
+    args = parser.parse_args()
+    
+    if not Path(args.input).exists():
+        print(f"Error: Input file '{args.input}' not found")
+        return 1
+    
+    try:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            store = TokenStore.from_tree(json.load(f))
+        
+        print(f"✓ {len(store)} tokens, {len(store.type_names) - 1} types")
+        for name, count in sorted(store.type_counts().items(), key=lambda item: -item[1]):
+            print(f"  {name}: {count}")
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -5,121 +5,572 @@ Validates design token structure, naming, and values.
 
 Usage:
     python token_validator.py --input tokens.json --check-all --output report.md
+    python token_validator.py --input tokens.json --categories color --check-all
+    python token_validator.py --input tokens/ 'brands/**/*.json' --check-all --workers 8
+    python token_validator.py --input tokens.json tokens.dark-mode.json --check-contrast
+    python token_validator.py --input tokens/color.json --check-near-duplicates --delta-e 0.01
 """
 
+import glob
 import json
 import re
 import argparse
 from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
 
+from build_cache import BuildCache, add_cache_arguments, cache_from_args
+import cli_options
+from cli_options import add_validation_arguments, checks_from_args
+from lazy_tokens import DEFAULT_INDEX_DIR, LazyTokens
+from profiler import Profiler, NULL_PROFILER, add_profile_arguments, profiler_from_args, finish_profile
+import reference_graph
+from reference_graph import ReferenceGraph, format_chain
+
+
+# Patterns are compiled once and shared by every check
+NAMING_PATTERN = re.compile(r'^[a-z][a-z0-9\-]*$')
+HEX_COLOR_PATTERN = re.compile(r'^#[0-9A-Fa-f]{3}$|^#[0-9A-Fa-f]{6}$|^#[0-9A-Fa-f]{8}$')
+RGB_COLOR_PATTERN = re.compile(r'^rgba?\(')
+HSL_COLOR_PATTERN = re.compile(r'^hsla?\(')
+DIMENSION_PATTERN = re.compile(r'^\d+(\.\d+)?(px|rem|em|%|vh|vw|pt)$')
+SHADOW_PATTERN = re.compile(r'\d+.*\d+')
+
+ALLOWED_SHORT_NAMES = frozenset(['xs', 'sm', 'md', 'lg', 'xl'])
+VALID_FONT_WEIGHTS = frozenset(['100', '200', '300', '400', '500', '600', '700', '800', '900'])
+VALID_FONT_WEIGHT_KEYWORDS = frozenset(['normal', 'bold', 'lighter', 'bolder'])
+
+# Keys of a token node that hold metadata rather than nested tokens
+TOKEN_META_KEYS = ReferenceGraph.META_KEYS
+
+# Source files whose changes invalidate cached validation results
+CODE_FILES = [
+    __file__,
+    reference_graph.__file__,
+    str(Path(__file__).with_name('color_engine.py')),
+    str(Path(__file__).with_name('lazy_tokens.py'))
+]
+
+
+def is_reference(value: Any) -> bool:
+    """Return True if a value is a single {alias} reference."""
+    return isinstance(value, str) and value.startswith('{') and value.endswith('}')
+
+
+class ValidationRule:
+    """A check run by the single-pass rule engine.
+    
+    Rules override any of visit_key (called for every key in the tree),
+    visit_token (called for every token node) and finish (called once after
+    the traversal) and report through the validator's message lists.
+    """
+    
+    def __init__(self, validator: 'TokenValidator'):
+        self.validator = validator
+    
+    def visit_key(self, path: str, key: str) -> None:
+        pass
+    
+    def visit_token(self, path: str, parts: List[str], token: Dict[str, Any]) -> None:
+        pass
+    
+    def finish(self) -> None:
+        pass
+
+
+class NamingRule(ValidationRule):
+    """Check that token names follow conventions."""
+    
+    def visit_key(self, path: str, key: str) -> None:
+        # Check key naming (should be lowercase, kebab-case or camelCase)
+        if not NAMING_PATTERN.match(key):
+            self.validator.warnings.append(
+                f"Non-standard naming at '{path}': '{key}' "
+                f"(should be lowercase kebab-case)"
+            )
+        
+        # Check for abbreviations (potential issue)
+        if len(key) <= 2 and key not in ALLOWED_SHORT_NAMES:
+            self.validator.warnings.append(
+                f"Possible abbreviation at '{path}': '{key}' "
+                f"(consider using full words)"
+            )
+
+
+class ValueRule(ValidationRule):
+    """Validate token values against their type via the type dispatch table."""
+    
+    def __init__(self, validator: 'TokenValidator'):
+        super().__init__(validator)
+        self.dispatch = {
+            token_type: getattr(validator, method)
+            for token_type, method in validator.VALUE_VALIDATORS.items()
+        }
+    
+    def visit_token(self, path: str, parts: List[str], token: Dict[str, Any]) -> None:
+        if 'type' not in token:
+            return
+        
+        value = token['value']
+        if is_reference(value):
+            return
+        
+        validate = self.dispatch.get(token['type'])
+        if validate:
+            validate(path, value)
+
+
+class ReferenceRule(ValidationRule):
+    """Feed every token into a ReferenceGraph and report broken references."""
+    
+    def __init__(self, validator: 'TokenValidator'):
+        super().__init__(validator)
+        self.graph = ReferenceGraph()
+    
+    def visit_token(self, path: str, parts: List[str], token: Dict[str, Any]) -> None:
+        self.graph.add(parts, token)
+    
+    def finish(self) -> None:
+        scope = None
+        if self.validator.token_source is not None:
+            # Only some categories were checked; load the ones they reference
+            scope = set(self.graph.values)
+            self.collect_referenced(self.validator.token_source, self.validator.categories)
+        self.graph.build()
+        self.validator.report_references(self.graph, scope)
+    
+    def collect_referenced(self, source: LazyTokens, categories: List[str]) -> None:
+        """Add the categories that the collected tokens reference, transitively."""
+        loaded = set(categories)
+        pending = list(self.graph.values.values())
+        while pending:
+            needed = set()
+            for value in pending:
+                if not isinstance(value, str):
+                    continue
+                for match in ReferenceGraph.ALIAS_PATTERN.finditer(value):
+                    needed.add(match.group(1).strip().split('.', 1)[0])
+                for match in ReferenceGraph.VAR_PATTERN.finditer(value):
+                    name = match.group(1)
+                    needed.update(category for category in source
+                                  if name == category or name.startswith(category + '-'))
+            
+            pending = []
+            for category in source:
+                if category in needed and category not in loaded:
+                    loaded.add(category)
+                    extra = ReferenceGraph()
+                    extra.collect(source[category], [category])
+                    self.graph.update({
+                        'values': extra.values,
+                        'types': extra.types,
+                        'var_names': extra.var_names
+                    })
+                    pending.extend(extra.values.values())
+
+
+class DuplicateRule(ValidationRule):
+    """Report literal values shared by several tokens."""
+    
+    def __init__(self, validator: 'TokenValidator'):
+        super().__init__(validator)
+        self.values_map = {}
+    
+    def visit_token(self, path: str, parts: List[str], token: Dict[str, Any]) -> None:
+        value = token['value']
+        # Skip references
+        if not is_reference(value):
+            self.values_map.setdefault(value, []).append(path)
+    
+    def finish(self) -> None:
+        for value, paths in self.values_map.items():
+            if len(paths) > 1:
+                self.validator.info.append(
+                    f"Duplicate value '{value}' found in: {', '.join(paths)} "
+                    f"(consider using references)"
+                )
+
+
+class ContrastRule(ValidationRule):
+    """Check WCAG contrast of every text/fg color against every bg color.
+    
+    Each file is one theme scope (e.g. tokens.json and tokens.dark-mode.json),
+    so light and dark themes are checked against their own backgrounds.
+    """
+    
+    FOREGROUND_GROUPS = frozenset(['text', 'fg'])
+    BACKGROUND_GROUPS = frozenset(['bg'])
+    AA = 4.5
+    AAA = 7.0
+    
+    # Worst pairs listed per foreground before summarizing the rest
+    MAX_LISTED = 5
+    
+    def __init__(self, validator: 'TokenValidator'):
+        super().__init__(validator)
+        self.graph = ReferenceGraph()
+        self.foregrounds = []
+        self.backgrounds = []
+    
+    @staticmethod
+    def color_group(parts: List[str]) -> str:
+        """Return the color group of a path: 'text' for color.text.primary."""
+        return parts[1] if parts[0] == 'color' and len(parts) > 2 else parts[0]
+    
+    def visit_token(self, path: str, parts: List[str], token: Dict[str, Any]) -> None:
+        self.graph.add(parts, token)
+        if token.get('type') != 'color':
+            return
+        group = self.color_group(parts)
+        if group in self.FOREGROUND_GROUPS:
+            self.foregrounds.append(path)
+        elif group in self.BACKGROUND_GROUPS:
+            self.backgrounds.append(path)
+    
+    def finish(self) -> None:
+        if not self.foregrounds or not self.backgrounds:
+            return
+        try:
+            from color_engine import ColorBatch, contrast_matrix
+        except ImportError:
+            self.validator.errors.append("Contrast check requires NumPy (pip install numpy)")
+            return
+        
+        self.graph.build()
+        foreground = ColorBatch.parse([str(self.graph.resolve(path)) for path in self.foregrounds])
+        background = ColorBatch.parse([str(self.graph.resolve(path)) for path in self.backgrounds])
+        fg_paths = [path for path, ok in zip(self.foregrounds, foreground.valid) if ok]
+        bg_paths = [path for path, ok in zip(self.backgrounds, background.valid) if ok]
+        if not fg_paths or not bg_paths:
+            return
+        
+        ratios = contrast_matrix(foreground.rgba[foreground.valid], background.rgba[background.valid])
+        self.validator.report_contrast(fg_paths, bg_paths, ratios, self.AA, self.AAA, self.MAX_LISTED)
+
+
+class NearDuplicateRule(ValidationRule):
+    """Report literal colors that are perceptually near-identical.
+    
+    Colors are compared in OKLab (plus alpha); pairs within the configured
+    ΔE are found through a grid spatial index. Tokens with the same value
+    are grouped first, and each group is represented by its preferred token:
+    the one with the most dependents, then the shortest path, then the one
+    defined first. Near pairs chain (a near b, b near c), so groups are
+    joined into connected components, and every token of a component is
+    pointed at its preferred token; no suggested target is itself flagged.
+    """
+    
+    # Well below the ~0.02 just-noticeable difference, so palette steps are kept
+    DEFAULT_DELTA_E = cli_options.DEFAULT_DELTA_E
+    
+    def __init__(self, validator: 'TokenValidator'):
+        super().__init__(validator)
+        self.delta_e = validator.options.get('delta_e', self.DEFAULT_DELTA_E)
+        self.graph = ReferenceGraph()
+        self.colors = []
+    
+    def visit_token(self, path: str, parts: List[str], token: Dict[str, Any]) -> None:
+        self.graph.add(parts, token)
+        value = token['value']
+        if token.get('type') == 'color' and isinstance(value, str) and '{' not in value and 'var(' not in value:
+            self.colors.append(path)
+    
+    def finish(self) -> None:
+        if len(self.colors) < 2:
+            return
+        try:
+            import numpy as np
+            from color_engine import ColorBatch, near_pairs
+        except ImportError:
+            self.validator.errors.append("Near-duplicate check requires NumPy (pip install numpy)")
+            return
+        
+        self.graph.build()
+        batch = ColorBatch.parse([self.graph.values[path] for path in self.colors])
+        paths = [path for path, ok in zip(self.colors, batch.valid) if ok]
+        if len(paths) < 2:
+            return
+        values = np.array([self.graph.values[path] for path in paths], dtype=str)
+        points = np.column_stack([batch.to_oklab()[batch.valid], batch.alpha[batch.valid]])
+        
+        # Lower rank = better reference target
+        dependents = np.array([len(self.graph.dependents.get(path, [])) for path in paths])
+        depth = np.array([path.count('.') for path in paths])
+        rank = np.empty(len(paths), dtype=int)
+        by_rank = np.lexsort((np.arange(len(paths)), depth, -dependents))
+        rank[by_rank] = np.arange(len(paths))
+        
+        # One representative per distinct value; exact duplicates are the duplicates check's job
+        _, group = np.unique(np.char.lower(values), return_inverse=True)
+        _, first_in_group = np.unique(group[by_rank], return_index=True)
+        representative = by_rank[first_in_group]
+        
+        first, second, distance = near_pairs(points[representative], self.delta_e)
+        if not len(first):
+            return
+        
+        # Union-find over the pairs; every root is its component's best ranked group
+        parent = {}
+        
+        def find(i):
+            root = parent.setdefault(i, i)
+            while root != parent[root]:
+                root = parent[root]
+            while parent[i] != root:
+                parent[i], i = root, parent[i]
+            return root
+        
+        for a, b in zip(representative[first].tolist(), representative[second].tolist()):
+            a, b = find(a), find(b)
+            if a != b:
+                if rank[a] > rank[b]:
+                    a, b = b, a
+                parent[b] = a
+        
+        for source in sorted(parent):
+            target = find(source)
+            if source == target:
+                continue
+            distance = np.linalg.norm(points[source] - points[target])
+            tgt = paths[target]
+            for member in np.flatnonzero(group == group[source]):
+                self.validator.info.append(
+                    f"Near-duplicate color at '{paths[member]}' ('{values[member]}') is within "
+                    f"ΔE {distance:.4f} of '{tgt}' ('{values[target]}'); consider referencing {{{tgt}}}"
+                )
+
 
 class TokenValidator:
     """Validates design tokens for correctness and best practices."""
     
-    def __init__(self):
+    # Checks available to run_checks, in reporting order
+    RULES = {
+        'naming': NamingRule,
+        'values': ValueRule,
+        'references': ReferenceRule,
+        'duplicates': DuplicateRule,
+        'contrast': ContrastRule,
+        'near-duplicates': NearDuplicateRule
+    }
+    
+    # Token type -> value validator method
+    VALUE_VALIDATORS = {
+        'color': 'validate_color',
+        'dimension': 'validate_dimension',
+        'fontWeight': 'validate_font_weight',
+        'fontFamily': 'validate_font_family',
+        'shadow': 'validate_shadow'
+    }
+    
+    def __init__(self, options: Optional[Dict[str, Any]] = None,
+                 profiler: Optional[Profiler] = None):
+        # Rule settings such as 'delta_e' for near-duplicates
+        self.options = options or {}
+        self.profiler = profiler or NULL_PROFILER
         self.errors = []
         self.warnings = []
         self.info = []
+        self.reference_graph = None
+        self.file_results = None
+        # Set when only some categories of a file are validated
+        self.token_source: Optional[LazyTokens] = None
+        self.categories: List[str] = []
+    
+    def validate_file(self, file_path: str, checks: Dict[str, bool],
+                      cache: Optional[BuildCache] = None,
+                      categories: Optional[List[str]] = None) -> Tuple[bool, str]:
+        """Validate a token file and return results.
+        
+        With a cache, results for unchanged file content are replayed without
+        loading or checking the tokens again. With categories, only those
+        top-level categories are parsed and checked, plus whatever other
+        categories their references point into.
+        """
+        enabled = sorted(name for name, enabled in checks.items() if enabled)
+        digest = None
+        params = None
+        if cache:
+            params = {
+                "checks": enabled,
+                "options": self.options,
+                "categories": categories,
+                "code": cache.hash_sources(*CODE_FILES)
+            }
+            try:
+                digest = cache.hash_file(file_path)
+            except OSError as e:
+                return False, f"Error reading file: {e}"
+            
+            cached = cache.get('validation', digest, params)
+            if cached is not None:
+                self.errors.extend(cached['errors'])
+                self.warnings.extend(cached['warnings'])
+                self.info.extend(cached['info'])
+                return not self.errors, self.generate_report()
         
-    def validate_file(self, file_path: str, checks: Dict[str, bool]) -> Tuple[bool, str]:
-        """Validate a token file and return results."""
-        # Load tokens
+        first_error, first_warning, first_info = len(self.errors), len(self.warnings), len(self.info)
+        
+        # Load tokens, parsing only the requested categories
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                tokens = json.load(f)
+            with self.profiler.stage('parse') as stage:
+                source = LazyTokens(file_path, index_dir=cache.cache_dir / 'index' if cache else DEFAULT_INDEX_DIR)
+                if categories:
+                    unknown = [name for name in categories if name not in source]
+                    if unknown:
+                        return False, f"Unknown categories in {file_path}: {', '.join(unknown)}"
+                    tokens = source.subset(categories)
+                    self.token_source = source
+                    self.categories = categories
+                else:
+                    tokens = source.load()
+                stage['categories'] = len(tokens)
         except json.JSONDecodeError as e:
             return False, f"Invalid JSON: {e}"
         except Exception as e:
             return False, f"Error reading file: {e}"
         
-        # Run checks
-        if checks.get('naming', False):
-            self.check_naming_conventions(tokens)
-        
-        if checks.get('values', False):
-            self.check_token_values(tokens)
+        # Run all enabled checks in one traversal
+        with self.profiler.stage('checks', checks=len(enabled)):
+            self.run_checks(tokens, enabled)
         
-        if checks.get('references', False):
-            self.check_references(tokens)
-        
-        if checks.get('duplicates', False):
-            self.check_duplicates(tokens)
+        if cache:
+            cache.put('validation', digest, {
+                "errors": self.errors[first_error:],
+                "warnings": self.warnings[first_warning:],
+                "info": self.info[first_info:]
+            }, params)
         
         # Determine overall result
         has_errors = len(self.errors) > 0
         
         return not has_errors, self.generate_report()
     
-    def check_naming_conventions(self, tokens: Dict[str, Any], path: str = "") -> None:
-        """Check that token names follow conventions."""
-        for key, value in tokens.items():
-            current_path = f"{path}.{key}" if path else key
-            
-            # Check key naming (should be lowercase, kebab-case or camelCase)
-            if not re.match(r'^[a-z][a-z0-9\-]*$', key):
-                self.warnings.append(
-                    f"Non-standard naming at '{current_path}': '{key}' "
-                    f"(should be lowercase kebab-case)"
-                )
+    def validate_files(self, file_paths: List[str], checks: Dict[str, bool],
+                       workers: Optional[int] = None,
+                       cache: Optional[BuildCache] = None) -> Tuple[bool, str]:
+        """Validate several token files in a process pool and return one report.
+        
+        Per-file checks run in the workers. References are resolved afterwards
+        over the tokens of all files together, so aliases may point across
+        files; each problem is reported in the section of the file that
+        defines the referencing token. A token path defined in more than one
+        file is an error, reported in each later file's section. Sections
+        follow the order of file_paths.
+        """
+        enabled = sorted(name for name, enabled in checks.items() if enabled)
+        local_checks = [name for name in enabled if name != 'references']
+        collect = 'references' in enabled
+        jobs = [(file_path, local_checks, collect, cache, self.options) for file_path in file_paths]
+        
+        with self.profiler.stage('file checks', files=len(jobs)):
+            if workers == 1 or len(jobs) == 1:
+                results = [validate_file_worker(*job) for job in jobs]
+            else:
+                # Imported here so single-file runs don't pay for multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(validate_file_worker, *zip(*jobs)))
+        
+        self.file_results = {}
+        combined = ReferenceGraph()
+        owners = {}
+        for result in results:
+            self.file_results[result['file']] = {
+                'errors': result['errors'],
+                'warnings': result['warnings'],
+                'info': result['info']
+            }
+            if result['tokens'] is not None:
+                # A token defined in two files would silently take the later value
+                for path in result['tokens']['values']:
+                    if path in owners:
+                        self.file_results[result['file']]['errors'].append(
+                            f"Token '{path}' is already defined in {owners[path]}"
+                        )
+                    owners[path] = result['file']
+                combined.update(result['tokens'])
+        
+        # Cross-file reference resolution once every worker has finished
+        if collect:
+            with self.profiler.stage('references', tokens=len(combined.values)):
+                combined.build()
+                self.reference_graph = combined
+                for level, path, message in self.reference_problems(combined):
+                    self.file_results[owners[path]][level].append(message)
+        
+        for messages in self.file_results.values():
+            self.errors.extend(messages['errors'])
+            self.warnings.extend(messages['warnings'])
+            self.info.extend(messages['info'])
+        
+        return not self.errors, self.generate_report()
+    
+    def run_checks(self, tokens: Dict[str, Any], names: List[str]) -> None:
+        """Run the named checks over the token tree in a single traversal."""
+        rules = {name: rule_class(self) for name, rule_class in self.RULES.items() if name in names}
+        
+        # Only dispatch to the hooks a rule actually implements
+        key_visitors = [rule.visit_key for rule in rules.values()
+                        if type(rule).visit_key is not ValidationRule.visit_key]
+        token_visitors = [rule.visit_token for rule in rules.values()
+                          if type(rule).visit_token is not ValidationRule.visit_token]
+        
+        with self.profiler.stage('traverse', rules=len(rules)) as stage:
+            if self.profiler.enabled:
+                visited = []
+                token_visitors.append(lambda path, parts, token: visited.append(path))
+            self.walk(tokens, [], "", key_visitors, token_visitors)
+            if self.profiler.enabled:
+                stage['tokens'] = len(visited)
+        
+        for name, rule in rules.items():
+            with self.profiler.stage(f'check {name}'):
+                rule.finish()
+    
+    def walk(self, node: Dict[str, Any], parts: List[str], path: str,
+             key_visitors: List[Any], token_visitors: List[Any]) -> None:
+        """Visit every key and every token (including nested tokens) once."""
+        is_token = 'value' in node
+        for key, child in node.items():
+            if is_token and key in TOKEN_META_KEYS:
+                continue
             
-            # Check for abbreviations (potential issue)
-            if len(key) <= 2 and key not in ['xs', 'sm', 'md', 'lg', 'xl']:
-                self.warnings.append(
-                    f"Possible abbreviation at '{current_path}': '{key}' "
-                    f"(consider using full words)"
-                )
+            current_path = f"{path}.{key}" if path else key
+            for visit in key_visitors:
+                visit(current_path, key)
             
-            # Recurse if not a leaf node
-            if isinstance(value, dict) and 'value' not in value:
-                self.check_naming_conventions(value, current_path)
+            if isinstance(child, dict):
+                parts.append(key)
+                if 'value' in child:
+                    for visit in token_visitors:
+                        visit(current_path, parts, child)
+                self.walk(child, parts, current_path, key_visitors, token_visitors)
+                parts.pop()
+    
+    def check_naming_conventions(self, tokens: Dict[str, Any]) -> None:
+        """Check that token names follow conventions."""
+        self.run_checks(tokens, ['naming'])
     
-    def check_token_values(self, tokens: Dict[str, Any], path: str = "") -> None:
+    def check_token_values(self, tokens: Dict[str, Any]) -> None:
         """Validate token values are correct for their type."""
-        for key, value in tokens.items():
-            current_path = f"{path}.{key}" if path else key
-            
-            if isinstance(value, dict):
-                if 'value' in value and 'type' in value:
-                    # This is a token leaf node
-                    self.validate_token_value(current_path, value)
-                else:
-                    # Recurse
-                    self.check_token_values(value, current_path)
+        self.run_checks(tokens, ['values'])
     
     def validate_token_value(self, path: str, token: Dict[str, Any]) -> None:
         """Validate a single token's value matches its type."""
         value = token.get('value', '')
-        token_type = token.get('type', '')
         
         # Skip references
-        if isinstance(value, str) and value.startswith('{') and value.endswith('}'):
+        if is_reference(value):
             return
         
         # Validate based on type
-        if token_type == 'color':
-            self.validate_color(path, value)
-        elif token_type == 'dimension':
-            self.validate_dimension(path, value)
-        elif token_type == 'fontWeight':
-            self.validate_font_weight(path, value)
-        elif token_type == 'fontFamily':
-            self.validate_font_family(path, value)
-        elif token_type == 'shadow':
-            self.validate_shadow(path, value)
+        validator = self.VALUE_VALIDATORS.get(token.get('type', ''))
+        if validator:
+            getattr(self, validator)(path, value)
     
     def validate_color(self, path: str, value: str) -> None:
         """Validate color value."""
-        # Hex color
-        if re.match(r'^#[0-9A-Fa-f]{3}$|^#[0-9A-Fa-f]{6}$|^#[0-9A-Fa-f]{8}$', value):
-            return
-        
-        # RGB/RGBA
-        if re.match(r'^rgba?\(', value):
-            return
-        
-        # HSL/HSLA
-        if re.match(r'^hsla?\(', value):
+        # Hex, RGB/RGBA or HSL/HSLA
+        if HEX_COLOR_PATTERN.match(value) or RGB_COLOR_PATTERN.match(value) or HSL_COLOR_PATTERN.match(value):
             return
         
         self.errors.append(
@@ -129,7 +580,7 @@ class TokenValidator:
     
     def validate_dimension(self, path: str, value: str) -> None:
         """Validate dimension value."""
-        if not re.match(r'^\d+(\.\d+)?(px|rem|em|%|vh|vw|pt)$', str(value)):
+        if not DIMENSION_PATTERN.match(str(value)):
             self.errors.append(
                 f"Invalid dimension value at '{path}': '{value}' "
                 f"(should be number with unit: px, rem, em, %, vh, vw, pt)"
@@ -137,10 +588,7 @@ class TokenValidator:
     
     def validate_font_weight(self, path: str, value: str) -> None:
         """Validate font weight value."""
-        valid_weights = ['100', '200', '300', '400', '500', '600', '700', '800', '900']
-        valid_keywords = ['normal', 'bold', 'lighter', 'bolder']
-        
-        if str(value) not in valid_weights and value not in valid_keywords:
+        if str(value) not in VALID_FONT_WEIGHTS and value not in VALID_FONT_WEIGHT_KEYWORDS:
             self.errors.append(
                 f"Invalid font weight at '{path}': '{value}' "
                 f"(should be 100-900 or normal/bold/lighter/bolder)"
@@ -157,75 +605,89 @@ class TokenValidator:
     def validate_shadow(self, path: str, value: str) -> None:
         """Validate shadow value."""
         # Basic check for shadow format (offset-x offset-y blur spread color)
-        if not re.search(r'\d+.*\d+', value):
+        if not SHADOW_PATTERN.search(value):
             self.warnings.append(
                 f"Possibly invalid shadow at '{path}': '{value}' "
                 f"(should contain offset and blur values)"
             )
     
     def check_references(self, tokens: Dict[str, Any]) -> None:
-        """Check that all token references resolve correctly."""
-        # Collect all token paths
-        all_paths = set()
-        
-        def collect_paths(obj, path=""):
-            if isinstance(obj, dict):
-                if 'value' in obj:
-                    all_paths.add(path)
-                else:
-                    for key, value in obj.items():
-                        new_path = f"{path}.{key}" if path else key
-                        collect_paths(value, new_path)
-        
-        collect_paths(tokens)
-        
-        # Check all references
-        def check_refs(obj, path=""):
-            if isinstance(obj, dict):
-                if 'value' in obj:
-                    value = obj['value']
-                    if isinstance(value, str) and value.startswith('{') and value.endswith('}'):
-                        # This is a reference
-                        ref = value[1:-1]  # Remove { }
-                        if ref not in all_paths:
-                            self.errors.append(
-                                f"Unresolved reference at '{path}': '{value}' "
-                                f"(token '{ref}' does not exist)"
-                            )
-                else:
-                    for key, value in obj.items():
-                        new_path = f"{path}.{key}" if path else key
-                        check_refs(value, new_path)
+        """Check that all token references resolve correctly.
+        
+        Aliases (including ones embedded in composite values) and var()
+        references are resolved once through a ReferenceGraph; broken
+        references are reported with the full chain to the missing token.
+        """
+        self.run_checks(tokens, ['references'])
+    
+    def reference_problems(self, graph: ReferenceGraph):
+        """Yield (level, token path, message) for cycles and unresolved references."""
+        for cycle in graph.cycles:
+            yield 'errors', cycle[0], f"Circular reference: {format_chain(cycle)}"
+        
+        for path, chain in graph.unresolved.items():
+            missing = chain[-1]
+            value = graph.values[path]
+            if missing in graph.values:
+                # Covered by the circular reference report
+                continue
+            if missing.startswith('var('):
+                yield 'warnings', path, (
+                    f"Unresolved CSS variable at '{path}': '{value}' "
+                    f"(chain: {format_chain(chain)})"
+                )
+            elif len(chain) == 2:
+                yield 'errors', path, (
+                    f"Unresolved reference at '{path}': '{value}' "
+                    f"(token '{missing[1:-1]}' does not exist)"
+                )
+            else:
+                yield 'errors', path, (
+                    f"Unresolved reference at '{path}': '{value}' "
+                    f"(chain: {format_chain(chain)})"
+                )
+    
+    def report_references(self, graph: ReferenceGraph, scope: Optional[set] = None) -> None:
+        """Report cycles and unresolved references found by a ReferenceGraph.
+        
+        With a scope, only problems of tokens in that set of paths are reported.
+        """
+        self.reference_graph = graph
         
-        check_refs(tokens)
+        for level, path, message in self.reference_problems(graph):
+            if scope is None or path in scope:
+                getattr(self, level).append(message)
     
     def check_duplicates(self, tokens: Dict[str, Any]) -> None:
         """Check for duplicate token values."""
-        values_map = {}
-        
-        def collect_values(obj, path=""):
-            if isinstance(obj, dict):
-                if 'value' in obj:
-                    value = obj['value']
-                    # Skip references
-                    if not (isinstance(value, str) and value.startswith('{') and value.endswith('}')):
-                        if value not in values_map:
-                            values_map[value] = []
-                        values_map[value].append(path)
-                else:
-                    for key, val in obj.items():
-                        new_path = f"{path}.{key}" if path else key
-                        collect_values(val, new_path)
-        
-        collect_values(tokens)
+        self.run_checks(tokens, ['duplicates'])
+    
+    def report_contrast(self, fg_paths: List[str], bg_paths: List[str], ratios: Any,
+                        aa: float, aaa: float, max_listed: int) -> None:
+        """Report foregrounds that fall below AA (warning) or only AAA (info) on some backgrounds."""
+        below_aa = ratios < aa
+        below_aaa = (ratios < aaa) & ~below_aa
         
-        # Report duplicates
-        for value, paths in values_map.items():
-            if len(paths) > 1:
-                self.info.append(
-                    f"Duplicate value '{value}' found in: {', '.join(paths)} "
-                    f"(consider using references)"
+        for i, fg_path in enumerate(fg_paths):
+            for level, failing, threshold, label in (
+                (self.warnings, below_aa[i], aa, 'AA'),
+                (self.info, below_aaa[i], aaa, 'AAA')
+            ):
+                columns = failing.nonzero()[0]
+                if not len(columns):
+                    continue
+                worst = columns[ratios[i, columns].argsort(kind='stable')]
+                listed = ', '.join(f"{bg_paths[j]} ({ratios[i, j]:.2f}:1)" for j in worst[:max_listed])
+                more = f" and {len(worst) - max_listed} more" if len(worst) > max_listed else ""
+                level.append(
+                    f"Contrast below {label} ({threshold:g}:1) for '{fg_path}' on "
+                    f"{len(worst)} background(s): {listed}{more}"
                 )
+        
+        self.info.append(
+            f"Contrast checked for {len(fg_paths)} foreground x {len(bg_paths)} background colors: "
+            f"{int(below_aa.sum())} pair(s) below AA, {int(below_aaa.sum())} more below AAA"
+        )
     
     def generate_report(self) -> str:
         """Generate validation report."""
@@ -238,22 +700,39 @@ class TokenValidator:
         report.append(f"- Warnings: {len(self.warnings)}")
         report.append(f"- Info: {len(self.info)}\n")
         
+        if self.file_results is not None:
+            for file_path, messages in self.file_results.items():
+                report.append(f"## {file_path}\n")
+                report.append(
+                    f"- Errors: {len(messages['errors'])}, "
+                    f"Warnings: {len(messages['warnings'])}, "
+                    f"Info: {len(messages['info'])}\n"
+                )
+                for error in messages['errors']:
+                    report.append(f"❌ {error}")
+                for warning in messages['warnings']:
+                    report.append(f"⚠️  {warning}")
+                for info in messages['info']:
+                    report.append(f"ℹ️  {info}")
+                if messages['errors'] or messages['warnings'] or messages['info']:
+                    report.append("")
+        
         # Errors
-        if self.errors:
+        if self.errors and self.file_results is None:
             report.append("## Errors\n")
             for error in self.errors:
                 report.append(f"❌ {error}")
             report.append("")
         
         # Warnings
-        if self.warnings:
+        if self.warnings and self.file_results is None:
             report.append("## Warnings\n")
             for warning in self.warnings:
                 report.append(f"⚠️  {warning}")
             report.append("")
         
         # Info
-        if self.info:
+        if self.info and self.file_results is None:
             report.append("## Information\n")
             for info in self.info:
                 report.append(f"ℹ️  {info}")
@@ -270,6 +749,86 @@ class TokenValidator:
         return "\n".join(report)
 
 
+def validate_file_worker(file_path: str, checks: List[str], collect_tokens: bool,
+                         cache: Optional[BuildCache] = None,
+                         options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run per-file checks in a worker process.
+    
+    Returns the file's messages and, when collect_tokens is set, the tokens it
+    defines so references can be resolved across all files afterwards.
+    """
+    result = {'file': file_path, 'errors': [], 'warnings': [], 'info': [], 'tokens': None}
+    params = {
+        "checks": checks,
+        "tokens": collect_tokens,
+        "options": options or {},
+        "code": BuildCache.hash_sources(*CODE_FILES)
+    }
+    
+    digest = None
+    if cache:
+        try:
+            digest = cache.hash_file(file_path)
+        except OSError as e:
+            result['errors'].append(f"Error reading file: {e}")
+            return result
+        cached = cache.get('file-validation', digest, params)
+        if cached is not None:
+            cached['file'] = file_path
+            return cached
+    
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            tokens = json.load(f)
+    except json.JSONDecodeError as e:
+        result['errors'].append(f"Invalid JSON: {e}")
+        return result
+    except Exception as e:
+        result['errors'].append(f"Error reading file: {e}")
+        return result
+    
+    validator = TokenValidator(options)
+    validator.run_checks(tokens, checks)
+    result['errors'] = validator.errors
+    result['warnings'] = validator.warnings
+    result['info'] = validator.info
+    
+    if collect_tokens:
+        graph = ReferenceGraph()
+        graph.collect(tokens, [])
+        result['tokens'] = {
+            'values': graph.values,
+            'types': graph.types,
+            'var_names': graph.var_names
+        }
+    
+    if cache:
+        cache.put('file-validation', digest, result, params)
+    
+    return result
+
+
+def expand_inputs(patterns: List[str]) -> List[str]:
+    """Expand files, directories (all *.json below them) and glob patterns.
+    
+    Returns a sorted, de-duplicated list so results come out in a stable order.
+    A glob pattern may match nothing, but a file or directory that does not
+    exist raises ValueError.
+    """
+    files = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            files.update(str(p) for p in path.rglob('*.json'))
+        elif glob.has_magic(pattern):
+            files.update(p for p in glob.glob(pattern, recursive=True) if Path(p).is_file())
+        elif path.exists():
+            files.add(pattern)
+        else:
+            raise ValueError(f"Input not found: {pattern}")
+    return sorted(files)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Validate design tokens'
@@ -277,66 +836,66 @@ def main():
     parser.add_argument(
         '--input',
         required=True,
-        help='Input JSON token file path'
-    )
-    parser.add_argument(
-        '--check-naming',
-        action='store_true',
-        help='Check naming conventions'
-    )
-    parser.add_argument(
-        '--check-values',
-        action='store_true',
-        help='Validate token values'
-    )
-    parser.add_argument(
-        '--check-references',
-        action='store_true',
-        help='Check token references'
+        nargs='+',
+        help='Input JSON token files, directories or glob patterns'
     )
+    add_validation_arguments(parser)
     parser.add_argument(
-        '--check-duplicates',
-        action='store_true',
-        help='Check for duplicate values'
-    )
-    parser.add_argument(
-        '--check-all',
-        action='store_true',
-        help='Run all checks'
+        '--output',
+        help='Output report file path (optional)'
     )
     parser.add_argument(
-        '--strict',
+        '--watch',
         action='store_true',
-        help='Treat warnings as errors'
-    )
-    parser.add_argument(
-        '--output',
-        help='Output report file path (optional)'
+        help='Keep running and re-validate affected tokens when inputs change'
     )
+    add_cache_arguments(parser)
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
-    # Check input file exists
-    if not Path(args.input).exists():
-        print(f"Error: Input file '{args.input}' not found")
+    # Check input files exist
+    try:
+        input_files = expand_inputs(args.input)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    if not input_files:
+        print(f"Error: No input files found for {', '.join(args.input)}")
         return 1
     
     # Determine which checks to run
-    checks = {
-        'naming': args.check_naming or args.check_all,
-        'values': args.check_values or args.check_all,
-        'references': args.check_references or args.check_all,
-        'duplicates': args.check_duplicates or args.check_all
-    }
+    checks = checks_from_args(args)
     
     if not any(checks.values()):
         print("Error: No checks specified. Use --check-all or specific --check-* flags")
         return 1
     
+    categories = [c.strip() for c in args.categories.split(',')] if args.categories else None
+    if categories and (len(input_files) > 1 or args.watch):
+        print("Error: --categories needs a single input file and cannot be used with --watch")
+        return 1
+    
+    if args.watch:
+        from token_watcher import TokenWatcher
+        watcher = TokenWatcher(input_files, [name for name, enabled in checks.items() if enabled],
+                               options={'delta_e': args.delta_e})
+        watcher.run(report_file=args.output)
+        return 0
+    
     try:
         # Validate tokens
-        validator = TokenValidator()
-        success, report = validator.validate_file(args.input, checks)
+        profiler = profiler_from_args(args)
+        validator = TokenValidator(options={'delta_e': args.delta_e}, profiler=profiler)
+        cache = cache_from_args(args)
+        if len(input_files) == 1:
+            success, report = validator.validate_file(
+                input_files[0], checks, cache=cache, categories=categories
+            )
+        else:
+            success, report = validator.validate_files(
+                input_files, checks, workers=args.workers, cache=cache
+            )
         
         # Print report
         print(report)
@@ -347,13 +906,15 @@ def main():
                 f.write(report)
             print(f"\n✓ Report saved to {args.output}")
         
+        finish_profile(profiler, args)
+        
         # Check strict mode
         if args.strict and validator.warnings:
             print("\n❌ Strict mode: Treating warnings as errors")
             return 1
         
         return 0 if success else 1
-        
+    
     except Exception as e:
         print(f"Error: {e}")
         return 1
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Token Watcher
+Watches token sources and incrementally re-converts and re-validates them.
+
+CSS sources are split into their scopes (@theme, .dark-mode, ...) and only
+the scopes whose declarations changed are rebuilt; JSON sources are
+reloaded on save. Within each scope, only tokens whose value changed, plus
+every token that depends on them through references, are re-validated;
+results for all other tokens are kept from the previous run. Checks that
+compare tokens with each other (contrast, near-duplicates) run over the
+whole of every changed scope. With an
+output file, a changed CSS source is converted with TokenConverter, so the
+file is the same as a one-shot token_converter.py run writes. Bursts of
+saves are debounced into a single update. File events come from inotify on
+Linux, with a polling fallback elsewhere.
+
+Usage:
+    python token_watcher.py --input token.md --output tokens.json --check-all
+    python token_watcher.py --input tokens/ --check-all --poll
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set
+
+from reference_graph import ReferenceGraph
+from token_converter import TokenConverter
+from token_validator import TokenValidator, NamingRule, expand_inputs
+
+# CSS sources are parsed scope by scope with convert_tokens.py at the repository root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from convert_tokens import BASE_SCOPE, build_scope_tree, group_scoped_declarations  # noqa: E402
+
+
+class PollingWatcher:
+    """Detects file changes by comparing modification times."""
+    
+    def __init__(self, paths: List[str], interval: float = 0.05):
+        self.paths = [str(Path(p).resolve()) for p in paths]
+        self.interval = interval
+        self.stamps = {path: self.stamp(path) for path in self.paths}
+    
+    @staticmethod
+    def stamp(path: str):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def poll(self, timeout: Optional[float]) -> Set[str]:
+        """Return the paths that changed, waiting up to timeout seconds for one."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path in self.paths:
+                stamp = self.stamp(path)
+                if stamp != self.stamps[path]:
+                    self.stamps[path] = stamp
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+    
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Detects file changes with Linux inotify, watching the parent directories."""
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    EVENT_HEADER = struct.Struct('iIII')
+    
+    def __init__(self, paths: List[str]):
+        libc_name = ctypes.util.find_library('c')
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify is not available")
+        
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        
+        self.directories = {}
+        self.files = {str(Path(p).resolve()) for p in paths}
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        for directory in sorted({os.path.dirname(path) for path in self.files}):
+            wd = libc.inotify_add_watch(self.fd, directory.encode(), mask)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"Cannot watch {directory}")
+            self.directories[wd] = directory
+    
+    def poll(self, timeout: Optional[float]) -> Set[str]:
+        """Return the paths that changed, waiting up to timeout seconds for one."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        
+        changed = set()
+        data = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            wd, _, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode()
+            offset += length
+            path = os.path.join(self.directories.get(wd, ''), name)
+            if path in self.files:
+                changed.add(path)
+        return changed
+    
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def create_watcher(paths: List[str], use_polling: bool = False):
+    """Return an inotify watcher where available, otherwise a polling one."""
+    if not use_polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(paths)
+        except OSError:
+            pass
+    return PollingWatcher(paths)
+
+
+class TokenWatcher:
+    """Keeps converted tokens and validation results up to date as sources change.
+    
+    Tokens are kept per scope: JSON sources and the @theme block of CSS
+    sources form the base scope, and every other CSS scope (e.g. .dark-mode)
+    is the base overlaid with that scope's declarations. Each scope has its
+    own reference graph and results, and is only rebuilt when its own
+    declarations, or those of the base, changed.
+    """
+    
+    # Checks whose results depend on the whole scope rather than on each token
+    SCOPE_CHECKS = ('contrast', 'near-duplicates')
+    
+    def __init__(self, sources: List[str], checks: List[str], output: Optional[str] = None,
+                 debounce: float = 0.05, pretty: bool = True, options: Optional[Dict[str, Any]] = None):
+        self.sources = [str(Path(p).resolve()) for p in sources]
+        self.checks = checks
+        self.output = output
+        self.debounce = debounce
+        self.pretty = pretty
+        # Rule settings passed to TokenValidator, such as 'delta_e'
+        self.options = options or {}
+        
+        # Per source and scope: raw CSS declarations, token tree and token path -> token node
+        self.declarations: Dict[str, Dict[str, List[Any]]] = {}
+        self.trees: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.tokens: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        # Per scope: token path -> token node over all sources, reference graph and
+        # per token path [(level, message)]
+        self.scope_tokens: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.graphs: Dict[str, ReferenceGraph] = {BASE_SCOPE: ReferenceGraph()}
+        self.messages: Dict[str, Dict[str, List[Any]]] = {}
+        # Per scope: [(level, message)] of the SCOPE_CHECKS
+        self.scope_messages: Dict[str, List[Any]] = {}
+    
+    @property
+    def graph(self) -> ReferenceGraph:
+        """Reference graph of the base scope."""
+        return self.graphs[BASE_SCOPE]
+    
+    @staticmethod
+    def flatten(tree: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Return a flat token path -> token node map of a token tree."""
+        flat = {}
+        
+        def collect(node, parts):
+            if 'value' in node and parts:
+                flat['.'.join(parts)] = node
+            for key, child in node.items():
+                if key in ReferenceGraph.META_KEYS or not isinstance(child, dict):
+                    continue
+                collect(child, parts + [key])
+        
+        collect(tree, [])
+        return flat
+    
+    def load(self, source: str) -> Set[str]:
+        """Load one source, rebuilding only the scopes whose declarations changed.
+        
+        Returns the scopes that were rebuilt or removed.
+        """
+        old_tokens = self.tokens.get(source, {})
+        
+        if source.endswith('.json'):
+            with open(source, 'r', encoding='utf-8') as f:
+                tree = json.load(f)
+            self.trees[source] = {BASE_SCOPE: tree}
+            self.tokens[source] = {BASE_SCOPE: self.flatten(tree)}
+            return {BASE_SCOPE} | set(old_tokens)
+        
+        with open(source, 'r', encoding='utf-8') as f:
+            declarations = group_scoped_declarations(f)
+        old_declarations = self.declarations.get(source, {})
+        old_trees = self.trees.get(source, {})
+        
+        base_changed = (BASE_SCOPE not in old_trees or
+                        declarations.get(BASE_SCOPE, []) != old_declarations.get(BASE_SCOPE, []))
+        trees, tokens, changed = {}, {}, set()
+        for scope in [BASE_SCOPE] + [scope for scope in declarations if scope != BASE_SCOPE]:
+            scope_declarations = declarations.get(scope, [])
+            if (scope in old_trees and scope_declarations == old_declarations.get(scope, []) and
+                    (scope == BASE_SCOPE or not base_changed)):
+                trees[scope] = old_trees[scope]
+                tokens[scope] = old_tokens[scope]
+                continue
+            base = None if scope == BASE_SCOPE else trees[BASE_SCOPE]
+            trees[scope] = build_scope_tree(scope_declarations, base)
+            tokens[scope] = self.flatten(trees[scope])
+            changed.add(scope)
+        changed.update(scope for scope in old_tokens if scope not in tokens)
+        
+        self.declarations[source] = declarations
+        self.trees[source] = trees
+        self.tokens[source] = tokens
+        if self.output:
+            self.save(source)
+        return changed
+    
+    def save(self, source: str) -> None:
+        """Convert a CSS source to the output file, as token_converter.py does."""
+        converter = TokenConverter()
+        converter.save_json(converter.convert_store(source), self.output, pretty=self.pretty)
+    
+    def merge_scope(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        """Return the tokens of one scope over all sources, later sources winning.
+        
+        Sources without that scope contribute their base scope.
+        """
+        merged = {}
+        for source in self.sources:
+            source_tokens = self.tokens.get(source, {})
+            merged.update(source_tokens.get(scope, source_tokens.get(BASE_SCOPE, {})))
+        return merged
+    
+    def refresh(self, changed_sources: List[str]) -> Dict[str, Any]:
+        """Reload changed sources and re-validate the tokens they affect, scope by scope."""
+        start = time.perf_counter()
+        dirty = set()
+        
+        for source in changed_sources:
+            try:
+                dirty |= self.load(source)
+            except Exception as e:
+                print(f"⚠️  Skipping {source}: {e}")
+        
+        # A scope declared nowhere any more is dropped with its results
+        scopes = {scope for tokens in self.tokens.values() for scope in tokens} | {BASE_SCOPE}
+        for scope in list(self.scope_tokens):
+            if scope not in scopes:
+                del self.scope_tokens[scope], self.graphs[scope], self.messages[scope]
+                self.scope_messages.pop(scope, None)
+        
+        changed_count = removed_count = revalidated = 0
+        for scope in sorted(dirty & scopes, key=lambda scope: (scope != BASE_SCOPE, scope)):
+            old_tokens = self.scope_tokens.get(scope, {})
+            new_tokens = self.merge_scope(scope)
+            changed, removed = set(), set()
+            for path, token in new_tokens.items():
+                old = old_tokens.get(path)
+                if old is None or old.get('value') != token.get('value') or old.get('type') != token.get('type'):
+                    changed.add(path)
+            removed.update(path for path in old_tokens if path not in new_tokens)
+            self.scope_tokens[scope] = new_tokens
+            
+            # Dependents of removed tokens are found through the previous graph
+            old_graph = self.graphs.get(scope, ReferenceGraph())
+            graph = self.graphs[scope] = ReferenceGraph()
+            for path, token in new_tokens.items():
+                graph.add(path.split('.'), token)
+            graph.build()
+            
+            affected = set(graph.affected_by(sorted(changed)))
+            affected.update(path for path in old_graph.affected_by(sorted(removed)) if path in graph.values)
+            messages = self.messages.setdefault(scope, {})
+            for path in removed:
+                messages.pop(path, None)
+            
+            self.validate_tokens(scope, affected)
+            self.validate_scope(scope)
+            changed_count += len(changed)
+            removed_count += len(removed)
+            revalidated += len(affected)
+        
+        return {
+            "changed": changed_count,
+            "removed": removed_count,
+            "revalidated": revalidated,
+            "elapsed_ms": (time.perf_counter() - start) * 1000
+        }
+    
+    def validate_tokens(self, scope: str, paths: Set[str]) -> None:
+        """Recompute per-token results of one scope for the given token paths."""
+        token_nodes = self.scope_tokens[scope]
+        graph = self.graphs[scope]
+        messages = self.messages[scope]
+        
+        reference_messages = {}
+        if 'references' in self.checks:
+            scratch = TokenValidator()
+            for level, path, message in scratch.reference_problems(graph):
+                if path in paths:
+                    reference_messages.setdefault(path, []).append((level, message))
+        
+        for path in paths:
+            scratch = TokenValidator()
+            if 'naming' in self.checks:
+                rule = NamingRule(scratch)
+                parts = path.split('.')
+                for i, key in enumerate(parts):
+                    rule.visit_key('.'.join(parts[:i + 1]), key)
+            if 'values' in self.checks and 'type' in token_nodes[path]:
+                scratch.validate_token_value(path, token_nodes[path])
+            
+            token_messages = [('errors', m) for m in scratch.errors]
+            token_messages += [('warnings', m) for m in scratch.warnings]
+            token_messages += reference_messages.get(path, [])
+            messages[path] = token_messages
+    
+    def validate_scope(self, scope: str) -> None:
+        """Run the SCOPE_CHECKS over every token of one scope."""
+        names = [name for name in self.SCOPE_CHECKS if name in self.checks]
+        if not names:
+            return
+        
+        # Rebuild the tree from token fields only, so nested tokens of other sources are not touched
+        tree = {}
+        for path, token in self.scope_tokens[scope].items():
+            node = tree
+            *parents, key = path.split('.')
+            for part in parents:
+                node = node.setdefault(part, {})
+            node.setdefault(key, {}).update(
+                (field, value) for field, value in token.items() if not isinstance(value, dict)
+            )
+        
+        scratch = TokenValidator(options=self.options)
+        scratch.run_checks(tree, names)
+        self.scope_messages[scope] = [
+            (level, message) for level in ('errors', 'warnings', 'info') for message in getattr(scratch, level)
+        ]
+    
+    def report(self) -> str:
+        """Build a validation report from the current per-token results."""
+        return self.results().generate_report()
+    
+    def results(self, paths: Optional[Set[str]] = None) -> TokenValidator:
+        """Collect the current results, optionally only those of some token paths.
+        
+        The base scope is reported first. Problems another scope shares with
+        it are reported once; those only found in another scope are prefixed
+        with that scope.
+        """
+        validator = TokenValidator()
+        seen = set()
+        
+        def add(scope, level, message):
+            # Naming warnings for shared parent keys are reported once
+            if message not in seen:
+                seen.add(message)
+                prefix = '' if scope == BASE_SCOPE else f"[{scope}] "
+                getattr(validator, level).append(prefix + message)
+        
+        for scope in sorted(self.graphs, key=lambda scope: (scope != BASE_SCOPE, scope)):
+            graph = self.graphs[scope]
+            messages = self.messages.get(scope, {})
+            for path in graph.order:
+                if paths is not None and path not in paths:
+                    continue
+                for level, message in messages.get(path, []):
+                    add(scope, level, message)
+            
+            if 'duplicates' in self.checks:
+                values_map = {}
+                for path in graph.order:
+                    value = graph.values[path]
+                    if not (isinstance(value, str) and value.startswith('{') and value.endswith('}')):
+                        values_map.setdefault(value, []).append(path)
+                for value, shared in values_map.items():
+                    if len(shared) > 1 and (paths is None or any(path in paths for path in shared)):
+                        add(scope, 'info',
+                            f"Duplicate value '{value}' found in: {', '.join(shared)} "
+                            f"(consider using references)")
+            
+            # Scope-wide results are kept when they name one of the paths
+            for level, message in self.scope_messages.get(scope, []):
+                if paths is None or any(f"'{path}'" in message for path in paths):
+                    add(scope, level, message)
+        
+        return validator
+    
+    def run(self, use_polling: bool = False, report_file: Optional[str] = None) -> None:
+        """Watch the sources until interrupted, printing a report after each update."""
+        stats = self.refresh(self.sources)
+        self.publish(stats, report_file)
+        
+        watcher = create_watcher(self.sources, use_polling)
+        print(f"👀 Watching {len(self.sources)} file(s) with {type(watcher).__name__} (Ctrl+C to stop)")
+        try:
+            while True:
+                changed = watcher.poll(None)
+                # Debounce: keep collecting until the burst of saves goes quiet
+                while True:
+                    more = watcher.poll(self.debounce)
+                    if not more:
+                        break
+                    changed |= more
+                stats = self.refresh(sorted(changed))
+                self.publish(stats, report_file)
+        except KeyboardInterrupt:
+            print("\n✓ Stopped watching")
+        finally:
+            watcher.close()
+    
+    def publish(self, stats: Dict[str, Any], report_file: Optional[str]) -> None:
+        report = self.report()
+        if report_file:
+            with open(report_file, 'w', encoding='utf-8') as f:
+                f.write(report)
+        else:
+            print(report)
+        print(
+            f"\n⏱  Updated in {stats['elapsed_ms']:.1f} ms "
+            f"({stats['changed']} changed, {stats['removed']} removed, "
+            f"{stats['revalidated']} re-validated)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Watch token sources and re-convert/re-validate on change'
+    )
+    parser.add_argument(
+        '--input',
+        required=True,
+        nargs='+',
+        help='CSS or JSON token files, directories or glob patterns'
+    )
+    parser.add_argument(
+        '--output',
+        help='JSON file to write converted CSS tokens to (optional)'
+    )
+    parser.add_argument(
+        '--check-all',
+        action='store_true',
+        help='Run all checks (default: naming, values and references)'
+    )
+    parser.add_argument(
+        '--report',
+        help='Write the report to this file instead of printing it'
+    )
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=50,
+        help='Milliseconds to wait for further saves before updating (default: 50)'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='Use polling instead of inotify'
+    )
+    
+    args = parser.parse_args()
+    
+    sources = []
+    try:
+        for pattern in args.input:
+            if Path(pattern).is_file():
+                sources.append(pattern)
+            else:
+                sources.extend(expand_inputs([pattern]))
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    
+    if not sources:
+        print(f"Error: No input files found for {', '.join(args.input)}")
+        return 1
+    
+    checks = ['naming', 'values', 'references']
+    if args.check_all:
+        checks.append('duplicates')
+    
+    watcher = TokenWatcher(sources, checks, output=args.output, debounce=args.debounce / 1000)
+    watcher.run(use_polling=args.poll, report_file=args.report)
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Token Type Inference
+Infers Style Dictionary token types from CSS custom property names and values.
+
+Types are declared as rules rather than written as if-chains. Each rule has
+a type, a weight and a pattern. Name patterns are sequences of segment
+regexes joined by '-' (text-(?:xs|sm) matches the segments 'text', 'xs'),
+with '|' between alternatives. They are compiled into a segment automaton:
+every distinct name segment is classified once by the segment regexes it
+matches, and every distinct sequence of segment classes is scanned once, so
+the thousands of names of a palette (color-brand-600, color-gray-700, ...)
+share one scan. At each segment the first rule listed wins, so specific
+rules come first (text-xs before text). Value rules are compiled into one
+anchored alternation and read the value once; a var() value counts as
+evidence for the type of the token it refers to.
+
+Every matching rule adds its weight to its type. The type with the highest
+score wins, and its share of the total score is the confidence. Length
+values support whichever length type the name points at (fontSize,
+lineHeight, ...). When rules disagree, the token is reported as a conflict
+with the competing types and the rules behind them.
+
+Usage:
+    python type_inference.py --input token.md
+    python type_inference.py --input token.md --conflicts --min-confidence 0.8
+"""
+
+import re
+import argparse
+from pathlib import Path
+from typing import Dict, List, Any, Optional, NamedTuple, Iterable, Sequence, Tuple
+
+
+class Rule(NamedTuple):
+    """A name or value pattern that is evidence for one token type."""
+    type: str
+    pattern: str
+    weight: float = 1.0
+    label: str = ''
+
+
+class TypeGuess(NamedTuple):
+    """An inferred type, its confidence, and the evidence for it."""
+    type: str
+    confidence: float
+    scores: Dict[str, float]
+    rules: Tuple[str, ...]
+
+
+# Font size names: xs, sm, md, lg, xl, 2xl, ...
+SIZE = r'(?:\d*x[sl]|xxs|sm|md|lg|base)'
+
+# Name rules, matched against the segments of the lowercased name.
+# At each segment the first rule listed wins, so specific rules come first.
+NAME_RULES = [
+    # Modifiers of a font size token (text-xs--line-height) decide its type
+    Rule('lineHeight', r'line-height|leading', 10, 'line-height'),
+    Rule('letterSpacing', r'letter-spacing|tracking', 10, 'letter-spacing'),
+    Rule('fontSize', rf'text-display-{SIZE}|text-{SIZE}|font-size', 4, 'text-<size>'),
+    Rule('fontFamily', r'font-family', 4, 'font-family'),
+    Rule('fontWeight', r'font-weight|weight', 4, 'font-weight'),
+    Rule('boxShadow', r'shadow', 4, 'shadow'),
+    Rule('borderRadius', r'radius|rounded', 4, 'radius'),
+    Rule('animation', r'animate|animation', 4, 'animate'),
+    Rule('color', r'color', 3, 'color'),
+    Rule('dimension', r'spacing|width|height|size|breakpoint|gap', 3, 'dimension name'),
+    Rule('color', r'bg|fg|border|ring|outline|fill|stroke', 2, 'color role'),
+    Rule('fontFamily', r'font', 1, 'font'),
+    Rule('color', r'text', 1, 'text'),
+]
+
+# Value rules, matched at the start of the value; the first rule listed wins
+VALUE_RULES = [
+    Rule('color', r'#[0-9a-fA-F]{3,8}$|(?:rgba?|hsla?|oklch|color-mix)\(|(?:transparent|currentColor|currentcolor)$',
+         2, 'color value'),
+    Rule('boxShadow', r'(?:inset\s+)?-?[\d.]+(?:px)?\s+-?[\d.]+(?:px)?\s+-?[\d.]+px', 3, 'shadow value'),
+    Rule('fontFamily', r'[^,]*(?:sans|serif|mono)', 3, 'font stack'),
+    Rule('animation', r'[\w-]+\s+[\d.]+m?s\b', 2, 'animation value'),
+    Rule('dimension', r'-?[\d.]+(?:px|rem|em|%|vh|vw)$|calc\(', 1, 'length value'),
+    Rule('fontWeight', r'(?:[1-9]00|normal|bold|lighter|bolder)$', 1, 'font weight value'),
+]
+
+# TokenConverter's value-only detection, with its own type names
+CONVERTER_VALUE_RULES = [
+    Rule('color', r'#[0-9A-Fa-f]{3,8}$|rgb|hsl|var\(--color', label='color value'),
+    Rule('dimension', r'\d+(?:\.\d+)?(?:px|rem|em|%|vh|vw)$', label='length value'),
+    Rule('fontWeight', r'\d{3}$|(?:normal|bold|lighter|bolder)$', label='font weight value'),
+    Rule('shadow', r'\d+.*\d+.*#[0-9A-Fa-f]', label='shadow value'),
+    Rule('fontFamily', r'(?s:.*?)(?:,|sans|serif|mono)', label='font stack'),
+]
+
+# Value evidence for a type also supports the more specific types in its family
+TYPE_FAMILIES = {
+    'dimension': ('fontSize', 'lineHeight', 'letterSpacing', 'borderRadius', 'dimension'),
+}
+
+REFERENCE_PATTERN = r'var\(\s*--(?P<target>[a-zA-Z0-9_-]+)'
+
+# Declarations as read by TokenConverter
+DECLARATION_PATTERN = re.compile(r'--([a-zA-Z0-9_-]+)\s*:\s*([^;]+);')
+
+
+def split_top_level(pattern: str, separator: str) -> List[str]:
+    """Split a regex at a separator character outside groups, classes and escapes."""
+    parts = ['']
+    depth = 0
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append('')
+            continue
+        parts[-1] += char
+    return parts
+
+
+def compile_value_rules(rules: Sequence[Rule], reference: bool = False) -> Optional['re.Pattern']:
+    """Compile rules into one alternation with a group per rule (r0, r1, ...).
+
+    With reference, a var() alternative named 'reference' comes first.
+    """
+    alternatives = [f"(?P<r{i}>{rule.pattern})" for i, rule in enumerate(rules)]
+    if reference:
+        alternatives.insert(0, f"(?P<reference>{REFERENCE_PATTERN})")
+    return re.compile('|'.join(alternatives)) if alternatives else None
+
+
+class TypeInferrer:
+    """Infers token types from compiled name and value rules."""
+    
+    def __init__(self, name_rules: Sequence[Rule] = (), value_rules: Sequence[Rule] = (),
+                 default: str = 'other', follow_references: bool = True,
+                 reference_weight: float = 0.5):
+        self.name_rules = list(name_rules)
+        self.value_rules = list(value_rules)
+        self.default = default
+        self.reference_weight = reference_weight
+        
+        # Per rule, its alternatives as (alternative id, segment count), and per
+        # alternative segment, its regex
+        self.alternatives: List[List[Tuple[int, int]]] = []
+        self.segment_patterns: List[Tuple[Tuple[int, int], 're.Pattern']] = []
+        for rule in self.name_rules:
+            alternatives = []
+            for alternative in split_top_level(rule.pattern, '|'):
+                alternative_id = len(self.segment_patterns)
+                segments = split_top_level(alternative, '-')
+                for position, segment in enumerate(segments):
+                    self.segment_patterns.append(((alternative_id, position), re.compile(segment)))
+                alternatives.append((alternative_id, len(segments)))
+            self.alternatives.append(alternatives)
+        
+        self.value_pattern = compile_value_rules(self.value_rules, follow_references)
+        self.value_groups = {f"r{i}": rule for i, rule in enumerate(self.value_rules)}
+        
+        # Segment -> class id, class id -> the (alternative, position) pairs it matches
+        self.segment_classes: Dict[str, int] = {}
+        self.stem_keys: Dict[str, Tuple[int, ...]] = {}
+        self.class_members: List[frozenset] = []
+        self.class_ids: Dict[frozenset, int] = {}
+        # Name class sequence -> (scores, rule labels); (name classes, value evidence) -> guess
+        self.scans: Dict[Tuple[int, ...], Tuple[Dict[str, float], Tuple[str, ...]]] = {}
+        # Name class sequence -> its type when no value evidence can outweigh the name
+        self.decided: Dict[Tuple[int, ...], Optional[str]] = {}
+        self.max_value_weight = max([rule.weight for rule in self.value_rules] + [reference_weight])
+        self.guesses: Dict[Tuple[Tuple[int, ...], Any], TypeGuess] = {}
+        # Referenced names repeat a lot; their type is inferred once
+        self.reference_types: Dict[str, Optional[str]] = {}
+    
+    def classify_segment(self, segment: str) -> int:
+        """Return the class of a name segment: which rule segments it matches."""
+        if segment in self.segment_classes:
+            return self.segment_classes[segment]
+        members = frozenset(
+            key for key, pattern in self.segment_patterns if pattern.fullmatch(segment)
+        )
+        class_id = self.class_ids.setdefault(members, len(self.class_members))
+        if class_id == len(self.class_members):
+            self.class_members.append(members)
+        self.segment_classes[segment] = class_id
+        return class_id
+    
+    def name_key(self, name: str) -> Tuple[int, ...]:
+        """Return the class sequence of a name, which determines its name rule matches."""
+        # Sibling names (color-brand-600, color-brand-700) share everything but the last segment
+        stem, _, last = name.lower().rpartition('-')
+        stem_key = self.stem_keys.get(stem)
+        if stem_key is None:
+            stem_key = self.stem_keys[stem] = tuple(map(self.classify_segment, stem.split('-'))) if stem else ()
+        last_class = self.segment_classes.get(last)
+        if last_class is None:
+            last_class = self.classify_segment(last)
+        return stem_key + (last_class,)
+    
+    def scan(self, key: Tuple[int, ...]) -> Tuple[Dict[str, float], Tuple[str, ...]]:
+        """Return the name rule scores and labels of a class sequence, scanning it once."""
+        result = self.scans.get(key)
+        if result is not None:
+            return result
+        
+        members = [self.class_members[class_id] for class_id in key]
+        scores: Dict[str, float] = {}
+        fired = []
+        position = 0
+        while position < len(members):
+            length = self.match_rule(members, position, scores, fired)
+            position += length or 1
+        result = self.scans[key] = (scores, tuple(fired))
+        self.decided[key] = self.decide(scores)
+        return result
+    
+    def decide(self, scores: Dict[str, float]) -> Optional[str]:
+        """Return the winning type if no value evidence could change it, else None.
+
+        Value evidence adds at most max_value_weight to one type (or equally to
+        several of a family). A sole name type keeps ties, as it was scored first.
+        """
+        if not scores:
+            return None
+        ranked = sorted(scores.values(), reverse=True)
+        best = max(scores, key=scores.get)
+        if len(ranked) == 1:
+            return best if ranked[0] >= self.max_value_weight else None
+        return best if ranked[0] - ranked[1] > self.max_value_weight else None
+    
+    def match_rule(self, members: List[frozenset], position: int,
+                   scores: Dict[str, float], fired: List[str]) -> int:
+        """Score the first rule matching at a segment; return how many segments it spans."""
+        for rule, alternatives in zip(self.name_rules, self.alternatives):
+            for alternative_id, length in alternatives:
+                if position + length <= len(members) and all(
+                    (alternative_id, offset) in members[position + offset] for offset in range(length)
+                ):
+                    scores[rule.type] = scores.get(rule.type, 0) + rule.weight
+                    fired.append(rule.label or rule.pattern)
+                    return length
+        return 0
+    
+    def reference_type(self, target: str) -> Optional[str]:
+        """Return the type a referenced name points at, from the name rules alone."""
+        try:
+            return self.reference_types[target]
+        except KeyError:
+            scores, _ = self.scan(self.name_key(target))
+            token_type = self.reference_types[target] = max(scores, key=scores.get) if scores else None
+            return token_type
+    
+    def value_evidence(self, value: Any) -> Any:
+        """Return the value rule group matching a value, ('reference', type) for a var(), or None."""
+        if self.value_pattern is None or not isinstance(value, str):
+            return None
+        match = self.value_pattern.match(value)
+        if match is None:
+            return None
+        group = match.lastgroup
+        if group == 'reference':
+            token_type = self.reference_type(match['target'])
+            return ('reference', token_type) if token_type else None
+        return group
+    
+    def combine(self, key: Tuple[int, ...], evidence: Any) -> TypeGuess:
+        """Add the value evidence to a name's scores and pick the winning type."""
+        name_scores, fired = self.scan(key) if key else ({}, ())
+        scores = dict(name_scores)
+        if evidence is not None:
+            if isinstance(evidence, tuple):
+                token_type, weight = evidence[1], self.reference_weight
+                label = f"var() to {token_type}"
+            else:
+                rule = self.value_groups[evidence]
+                token_type, weight, label = rule.type, rule.weight, rule.label or rule.pattern
+            family = [t for t in TYPE_FAMILIES.get(token_type, ()) if t in scores]
+            for t in family or [token_type]:
+                scores[t] = scores.get(t, 0) + weight
+            fired += (label,)
+        
+        if not scores:
+            return TypeGuess(self.default, 0.0, {}, ())
+        best = max(scores, key=scores.get)
+        return TypeGuess(best, scores[best] / sum(scores.values()), scores, fired)
+    
+    def infer(self, name: str, value: Any) -> TypeGuess:
+        """Return the most likely type with its confidence and the rules that matched.
+
+        Guesses are shared between tokens with the same evidence; treat them as read-only.
+        """
+        return self.guess(self.name_key(name) if self.name_rules else (), value)
+    
+    def guess(self, key: Tuple[int, ...], value: Any) -> TypeGuess:
+        evidence = (key, self.value_evidence(value))
+        guess = self.guesses.get(evidence)
+        if guess is None:
+            guess = self.guesses[evidence] = self.combine(*evidence)
+        return guess
+    
+    def infer_type(self, name: str, value: Any) -> str:
+        """Return the most likely type of a token (the default if no rule matches)."""
+        if self.name_rules:
+            key = self.name_key(name)
+            decided = self.decided.get(key, False)
+            if decided is False:
+                self.scan(key)
+                decided = self.decided[key]
+            return decided or self.guess(key, value).type
+        # Without name rules the value rule alone decides, and there is nothing to score
+        evidence = self.value_evidence(value)
+        if evidence is None:
+            return self.default
+        return evidence[1] if isinstance(evidence, tuple) else self.value_groups[evidence].type
+    
+    def conflicts(self, declarations: Iterable[Tuple[str, Any]],
+                  min_confidence: float = 0.0) -> List[Dict[str, Any]]:
+        """Return the tokens whose rules disagree, or whose confidence is below min_confidence."""
+        report = []
+        for name, value in declarations:
+            guess = self.infer(name, value)
+            if len(guess.scores) > 1 or guess.confidence < min_confidence:
+                report.append({
+                    "name": name,
+                    "value": value,
+                    "type": guess.type,
+                    "confidence": round(guess.confidence, 3),
+                    "candidates": dict(sorted(guess.scores.items(), key=lambda item: -item[1])),
+                    "rules": list(guess.rules)
+                })
+        return report
+
+
+# Style Dictionary types from name and value, as used by convert_tokens.py
+STYLE_DICTIONARY_TYPES = TypeInferrer(NAME_RULES, VALUE_RULES, default='other')
+
+# TokenConverter's value-only types
+CONVERTER_VALUE_TYPES = TypeInferrer(value_rules=CONVERTER_VALUE_RULES, default='string',
+                                     follow_references=False)
+
+RULE_SETS = {
+    'style-dictionary': STYLE_DICTIONARY_TYPES,
+    'converter': CONVERTER_VALUE_TYPES,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Infer token types from CSS custom properties and report rule conflicts'
+    )
+    parser.add_argument(
+        '--input',
+        required=True,
+        help='CSS file (or token.md) with custom property declarations'
+    )
+    parser.add_argument(
+        '--rules',
+        choices=list(RULE_SETS),
+        default='style-dictionary',
+        help='Rule set to apply (default: style-dictionary)'
+    )
+    parser.add_argument(
+        '--conflicts',
+        action='store_true',
+        help='List every token whose rules disagree'
+    )
+    parser.add_argument(
+        '--min-confidence',
+        type=float,
+        default=0.0,
+        help='Also report tokens below this confidence, 0 for no rule match (default: 0.0)'
+    )
+    
+    args = parser.parse_args()
+    
+    if not Path(args.input).exists():
+        print(f"Error: Input file '{args.input}' not found")
+        return 1
+    
+    try:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            declarations = [(name, value.strip()) for name, value in DECLARATION_PATTERN.findall(f.read())]
+        
+        inferrer = RULE_SETS[args.rules]
+        guesses = [inferrer.infer(name, value) for name, value in declarations]
+        counts: Dict[str, int] = {}
+        for guess in guesses:
+            counts[guess.type] = counts.get(guess.type, 0) + 1
+        
+        print(f"Inferred types of {len(declarations)} declarations:")
+        for token_type, count in sorted(counts.items(), key=lambda item: -item[1]):
+            print(f"  {token_type:<16} {count:>6}")
+        if guesses:
+            print(f"Mean confidence: {sum(guess.confidence for guess in guesses) / len(guesses):.3f}")
+        
+        conflicts = inferrer.conflicts(declarations, args.min_confidence)
+        print(f"{'⚠️ ' if conflicts else '✓'} {len(conflicts)} token(s) with conflicting rules"
+              + (f" or confidence below {args.min_confidence}" if args.min_confidence else ""))
+        if args.conflicts:
+            for conflict in conflicts:
+                candidates = ', '.join(f"{t} {s:g}" for t, s in conflict['candidates'].items())
+                evidence = f"[{candidates}] via {', '.join(conflict['rules'])}" if candidates else "no rule matched"
+                print(f"  --{conflict['name']}: {conflict['type']} ({conflict['confidence']:.2f}) {evidence}")
+        return 0
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(main())
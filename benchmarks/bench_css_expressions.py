@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark for calc()/var() folding
+Times css_expressions.ExpressionEvaluator on the values of a synthetic corpus
+(see corpus.py), with one shared evaluator (every parsed value, reference and calc() node
+memoized across tokens) against one whose memos are cleared before each
+token (nothing shared), and checks that both fold to the same values.
+
+Usage:
+    python benchmarks/bench_css_expressions.py --tokens 100k
+"""
+
+import argparse
+import gc
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from corpus import generate_tokens, iter_sizes  # noqa: E402
+from css_expressions import ExpressionEvaluator, parse_value, parse_expression  # noqa: E402
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of several runs, with the cyclic GC off."""
+    best = float('inf')
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark calc()/var() folding')
+    parser.add_argument('--tokens', default='100k',
+                        help='Corpus size, e.g. 100000 or 100k (default: 100k)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement, best is reported (default: 3)')
+    args = parser.parse_args()
+    
+    variables = {'-'.join(path): value for path, value, _ in generate_tokens(next(iter_sizes(args.tokens)))}
+    values = list(variables.values())
+    expressions = [value for value in values if 'var(' in value or 'calc(' in value]
+    
+    def shared():
+        evaluate = ExpressionEvaluator(variables).evaluate
+        return [evaluate(value) for value in values]
+    
+    def unshared():
+        evaluator = ExpressionEvaluator(variables)
+        folded = []
+        for value in values:
+            for memo in (evaluator.results, evaluator.var_values, evaluator.folded, evaluator.rendered):
+                memo.clear()
+            parse_value.cache_clear()
+            parse_expression.cache_clear()
+            folded.append(evaluator.evaluate(value))
+        return folded
+    
+    def cold(func):
+        def run():
+            parse_value.cache_clear()
+            parse_expression.cache_clear()
+            return func()
+        return run
+    
+    evaluator = ExpressionEvaluator(variables)
+    folded = [evaluator.evaluate(value) for value in values]
+    print(f"Corpus of {len(values)} values, {len(expressions)} with calc() or var():")
+    print(f"  distinct expressions:      {len(evaluator.results)}")
+    print(f"  variables resolved:        {len(evaluator.var_values)}")
+    print(f"  calc nodes folded:         {len(evaluator.folded)}")
+    print(f"  unresolved references:     {sum(evaluator.unresolved.values())}")
+    
+    for label, func in (('shared evaluator', cold(shared)), ('nothing shared', cold(unshared))):
+        elapsed = best_of(func, args.repeat)
+        print(f"  {label:<26} {elapsed * 1000:>9.1f} ms  {elapsed / len(values) * 1e6:>6.2f} µs/value")
+    
+    same = folded == unshared()
+    print(f"  Identical results:         {same}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    exit(main())
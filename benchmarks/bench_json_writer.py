@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the streaming JSON writer
+Compares writing a TokenStore with json.dump(store.to_dict()) against
+json_writer.dump_store on a synthetic corpus (see corpus.py), reporting wall
+time and the peak memory allocated while writing.
+
+Usage:
+    python benchmarks/bench_json_writer.py --tokens 1000000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from corpus import generate_tokens, to_tree, iter_sizes  # noqa: E402
+from json_writer import dump_store  # noqa: E402
+from token_store import TokenStore  # noqa: E402
+
+
+def measure(func):
+    """Return (seconds, peak bytes allocated) of one run."""
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark streaming JSON output')
+    parser.add_argument('--tokens', default='100k',
+                        help='Corpus size, e.g. 100000 or 100k (default: 100k)')
+    parser.add_argument('--indent', type=int, default=2,
+                        help='Indent width, 0 for compact output (default: 2)')
+    args = parser.parse_args()
+    
+    tokens = generate_tokens(next(iter_sizes(args.tokens)))
+    indent = args.indent or None
+    
+    # Declaration order (as converted from CSS) needs sorting; tree order streams as is
+    css_order = TokenStore()
+    for path, value, token_type in tokens:
+        css_order.add('.'.join(path), value, token_type)
+    stores = [('CSS order', css_order), ('tree order', TokenStore.from_tree(to_tree(tokens)))]
+    del tokens
+    
+    print(f"Tokens:  {len(css_order)}")
+    identical = True
+    with tempfile.TemporaryDirectory() as work_dir:
+        tree_file = os.path.join(work_dir, 'tree.json')
+        stream_file = os.path.join(work_dir, 'stream.json')
+        for label, store in stores:
+            def write_tree():
+                with open(tree_file, 'w', encoding='utf-8') as f:
+                    json.dump(store.to_dict(), f, indent=indent, ensure_ascii=False)
+            
+            def write_stream():
+                with open(stream_file, 'w', encoding='utf-8') as f:
+                    dump_store(store, f, indent=indent, ensure_ascii=False)
+            
+            tree_time, tree_peak = measure(write_tree)
+            stream_time, stream_peak = measure(write_stream)
+            same = Path(tree_file).read_bytes() == Path(stream_file).read_bytes()
+            identical = identical and same
+            
+            print(f"\n{label}:")
+            print(f"  json.dump(tree):   {tree_time:.3f}s  peak {tree_peak / 1e6:.1f} MB")
+            print(f"  dump_store:        {stream_time:.3f}s  peak {stream_peak / 1e6:.1f} MB")
+            print(f"  Memory reduction:  {tree_peak / max(stream_peak, 1):.1f}x")
+            print(f"  Identical output:  {same}")
+    return 0 if identical else 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark for convert_tokens.parse_css_tokens
+Compares the streaming trie parser with the legacy findall + merge_dicts
+approach on synthetic token.md-shaped inputs and reports per-declaration cost.
+
+Usage:
+    python benchmarks/bench_parse_css_tokens.py --max-declarations 100000
+"""
+
+import argparse
+import io
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import convert_tokens  # noqa: E402
+
+GROUPS = ['gray', 'brand', 'error', 'warning', 'success', 'blue', 'indigo', 'purple']
+SHADES = ['25', '50', '100', '200', '300', '400', '500', '600', '700', '800', '900', '950']
+
+
+def generate_css(declarations: int) -> str:
+    """Generate a token.md-like @theme block with the given number of declarations."""
+    lines = ["@theme {"]
+    for i in range(declarations):
+        kind = i % 4
+        group = GROUPS[i % len(GROUPS)]
+        shade = SHADES[i % len(SHADES)]
+        block = i // (len(GROUPS) * len(SHADES))
+        if kind == 0:
+            lines.append(f"    --color-{group}{block}-{shade}: rgb({i % 256} {(i * 7) % 256} {(i * 13) % 256});")
+        elif kind == 1:
+            lines.append(f"    --color-bg-{group}{block}-{shade}: var(--color-{group}{block}-{shade});")
+        elif kind == 2:
+            lines.append(f"    --text-{group}{block}-{shade}: calc(var(--spacing) * {i % 20});")
+            lines.append(f"    --text-{group}{block}-{shade}--line-height: calc(var(--spacing) * {i % 24});")
+        else:
+            lines.append(f"    /* {group} {shade} */")
+            lines.append(f"    --radius-{group}{block}-{shade}: {i % 32}px;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def legacy_parse_css_tokens(css_content: str) -> dict:
+    """The previous findall + create_nested_dict + merge_dicts implementation."""
+    tokens = {}
+    for var_name, value in re.findall(r'--([a-zA-Z0-9_-]+):\s*([^;]+);', css_content):
+        parsed_value = convert_tokens.parse_css_value(value)
+        token_type = convert_tokens.determine_token_type(var_name, parsed_value)
+        parts, _ = convert_tokens.parse_token_name(f"--{var_name}")
+        nested = convert_tokens.create_nested_dict(parts, parsed_value, token_type)
+        tokens = convert_tokens.merge_dicts(tokens, nested)
+    return tokens
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of several runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CSS token parsing')
+    parser.add_argument('--max-declarations', type=int, default=100000,
+                        help='Largest input size (default: 100000)')
+    parser.add_argument('--steps', type=int, default=4,
+                        help='Number of doubling steps below the maximum (default: 4)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement, best is reported (default: 3)')
+    args = parser.parse_args()
+    
+    sizes = [args.max_declarations >> shift for shift in range(args.steps - 1, -1, -1)]
+    
+    print(f"{'declarations':>12}  {'legacy (s)':>10}  {'stream (s)':>10}  {'stream µs/decl':>14}")
+    for size in sizes:
+        css = generate_css(size)
+        declarations = len(convert_tokens.DECLARATION_PATTERN.findall(css))
+        
+        legacy = best_of(lambda: legacy_parse_css_tokens(css), args.repeat)
+        stream = best_of(lambda: convert_tokens.parse_css_stream(io.StringIO(css)), args.repeat)
+        
+        print(f"{declarations:>12}  {legacy:>10.3f}  {stream:>10.3f}  {stream / declarations * 1e6:>14.2f}")
+    
+    print("\nLinear scaling shows up as a flat µs/decl column.")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the token pipeline
+Times every public pipeline stage, from CSS parsing through validation to
+platform emission, on synthetic corpora of 10k, 100k and 1M tokens (see
+corpus.py), and records each stage's peak memory.
+
+Each stage builds its own inputs, with a fresh TokenConverter, right before
+it is measured, so no state is shared with the stages before it. It then
+runs once to warm up, once under tracemalloc for its peak allocation above
+what was already live (after a full collection, with the cyclic GC off so
+collections cannot move the peak), and is timed as the median of N runs
+with tracemalloc off. Each timed run is followed by a short calibration
+workload, so every stage carries its own measure of how fast the machine
+was while it ran. Stages over the tolerance are re-measured, time and
+memory, once before the run fails.
+With --baseline, the tests in tests/ (golden files for every platform) run
+first, then results are compared with a stored baseline JSON and the run
+fails if a test fails or a stage got slower or hungrier than the tolerance
+allows, so CI catches regressions. Baseline times are scaled by the ratio of
+the calibration timed next to the stage on both runs, which absorbs speed
+differences between machines and the drift of a shared machine during a
+run; refresh the baseline with --update-baseline when the CI hardware or
+Python changes.
+
+Usage:
+    python benchmarks/bench_pipeline.py --sizes 10k,100k
+    python benchmarks/bench_pipeline.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_pipeline.py --baseline benchmarks/baseline.json --update-baseline
+"""
+
+import argparse
+import gc
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import unittest
+from pathlib import Path
+from typing import Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+import convert_tokens  # noqa: E402
+from corpus import generate_tokens, dark_overrides, to_css, to_tree, iter_sizes  # noqa: E402
+from lazy_tokens import LazyTokens  # noqa: E402
+from platform_emitters import PLATFORMS, js_key_order, flatten_tokens, emit_platform  # noqa: E402
+from token_converter import TokenConverter  # noqa: E402
+from token_store import TokenStore  # noqa: E402
+from token_validator import TokenValidator  # noqa: E402
+
+DEFAULT_SIZES = '10k,100k,1M'
+
+# Contrast compares every foreground with every background color, which is
+# quadratic in corpus size; run it explicitly with --checks
+DEFAULT_CHECKS = ['naming', 'values', 'references', 'duplicates', 'near-duplicates']
+
+# Differences below these are noise, whatever the ratio; shared CI machines
+# make even medians of short stages swing by several milliseconds
+MIN_MS = 10.0
+MIN_BYTES = 256 * 1024
+
+# Size of the calibration workload run after each timed run of a stage
+STAGE_CALIBRATION_SIZE = 5000
+
+
+def median_of(func, repeat: int) -> float:
+    """Return the median wall time of several runs, with the cyclic GC off as in timeit."""
+    times = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return statistics.median(times)
+
+
+def median_with_calibration(func, repeat: int) -> Tuple[float, float]:
+    """Return the median wall times of func and of a short calibration run after each of its runs.
+
+    Both medians are taken under the same machine load, so their ratio is
+    steadier than either time on its own.
+    """
+    times, calibrations = [], []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            calibration_workload(STAGE_CALIBRATION_SIZE)
+            calibrations.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return statistics.median(times), statistics.median(calibrations)
+
+
+def calibration_workload(size: int = 50000) -> None:
+    """Fixed pure-Python work (string building, dicts, JSON) used to gauge machine speed."""
+    tree = {}
+    for i in range(size):
+        tree.setdefault(f"group{i % 97}", {})[f"token-{i}"] = {"value": f"#{i:06x}", "type": "color"}
+    json.loads(json.dumps(tree))
+
+
+def peak_memory(func) -> int:
+    """Return the peak bytes allocated by one warm run above what was live before it.
+    
+    The stage runs once first, so caches it fills on first use are not
+    counted, and that run's result stays alive during the measured run: the
+    strings it interned are then shared instead of re-inserted into the
+    interpreter's intern table, whose occasional resize (a single 2 MB block
+    at 10k tokens) would otherwise land in the peak or not depending on
+    everything that ran before. The measured run starts after a full
+    collection and runs with the cyclic GC off, for the same reason.
+    """
+    warm = func()
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        func()
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+        del warm
+
+
+def run_tests() -> bool:
+    """Run the unittest modules in tests/ and return whether they all passed."""
+    suite = unittest.defaultTestLoader.discover(str(ROOT / 'tests'), top_level_dir=str(ROOT / 'tests'))
+    return unittest.TextTestRunner(verbosity=1).run(suite).wasSuccessful()
+
+
+def pipeline_stages(count: int, work_dir: Path, checks):
+    """Yield (stage, prepare) for every pipeline stage on a corpus of count tokens.
+
+    prepare() builds the inputs only that stage uses, with a fresh
+    TokenConverter, and returns a self-contained func that can be repeated.
+    Only the corpus itself is shared, and no stage modifies it.
+    """
+    tokens = generate_tokens(count)
+    css = to_css(tokens, dark_overrides(tokens))
+    tree = to_tree(tokens)
+    del tokens
+    css_file = work_dir / 'corpus.css'
+    css_file.write_text(css, encoding='utf-8')
+    json_file = work_dir / 'corpus.json'
+    with open(json_file, 'w', encoding='utf-8') as f:
+        json.dump(tree, f, indent=2)
+    
+    def inputless(func):
+        """Return prepare for a stage that only reads the corpus."""
+        return lambda: func
+    
+    def with_css_tokens(func):
+        """Return prepare for a stage run as func(converter, css_tokens)."""
+        def prepare():
+            converter = TokenConverter()
+            css_tokens = converter.parse_css_file(str(css_file))
+            return lambda: func(converter, css_tokens)
+        return prepare
+    
+    def with_converted(func):
+        """Return prepare for a stage run as func(converter, converted tree)."""
+        def prepare():
+            converter = TokenConverter()
+            converted = converter.process_references(
+                converter.build_token_hierarchy(converter.parse_css_file(str(css_file)))
+            )
+            return lambda: func(converter, converted)
+        return prepare
+    
+    def with_index():
+        """Prepare a category load with the index already cached."""
+        LazyTokens(str(json_file), index_dir=str(work_dir)).ranges
+        return lambda: LazyTokens(str(json_file), index_dir=str(work_dir))['shadow']
+    
+    def with_flat(config):
+        """Return prepare for emitting one platform from freshly flattened tokens."""
+        def prepare():
+            flat = flatten_tokens(js_key_order(tree))
+            return lambda: emit_platform(config, flat, work_dir)
+        return prepare
+    
+    yield 'convert_tokens.parse_css_tokens', inputless(lambda: convert_tokens.parse_css_tokens(css))
+    yield 'convert_tokens.parse_css_scopes', inputless(lambda: convert_tokens.parse_css_scopes(io.StringIO(css)))
+    
+    yield 'TokenConverter.parse_css_file', inputless(lambda: TokenConverter().parse_css_file(str(css_file)))
+    yield 'TokenConverter.build_token_store', \
+        with_css_tokens(lambda converter, css_tokens: converter.build_token_store(css_tokens))
+    yield 'TokenConverter.build_token_hierarchy', \
+        with_css_tokens(lambda converter, css_tokens: converter.build_token_hierarchy(css_tokens))
+    yield 'TokenConverter.process_references', with_css_tokens(
+        lambda converter, css_tokens: converter.process_references(converter.build_token_hierarchy(css_tokens))
+    )
+    yield 'TokenConverter.validate_tokens', \
+        with_converted(lambda converter, converted: converter.validate_tokens(converted))
+    yield 'TokenConverter.save_json', with_converted(
+        lambda converter, converted: converter.save_json(converted, str(work_dir / 'converted.json'))
+    )
+    
+    yield 'json.loads', inputless(lambda: json.loads(json_file.read_text(encoding='utf-8')))
+    yield 'LazyTokens.build_index', inputless(lambda: LazyTokens(str(json_file), index_dir=None).build_index())
+    yield 'LazyTokens category', with_index
+    yield 'TokenStore.from_tree', inputless(lambda: TokenStore.from_tree(tree))
+    
+    for name in checks:
+        yield f'TokenValidator {name}', inputless(lambda name=name: TokenValidator().run_checks(tree, [name]))
+    yield 'TokenValidator all', inputless(lambda: TokenValidator().run_checks(tree, checks))
+    
+    yield 'flatten_tokens', inputless(lambda: flatten_tokens(js_key_order(tree)))
+    for name, config in PLATFORMS.items():
+        yield f'emit {name}', with_flat(config)
+
+
+def run_size(count: int, repeat: int, checks, memory: bool, wanted=None) -> dict:
+    """Measure every stage, or those for which wanted(stage) is true, on one corpus size."""
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for stage, prepare in pipeline_stages(count, Path(work_dir), checks):
+            if wanted and not wanted(stage):
+                continue
+            func = prepare()
+            # The memory runs (or a plain one) double as warm-up for the timed runs
+            peak = peak_memory(func) if memory else func()
+            elapsed, calibration = median_with_calibration(func, repeat)
+            result = {"ms": round(elapsed * 1000, 3), "calibration_ms": round(calibration * 1000, 3)}
+            # Release this stage's inputs before the next stage prepares its own
+            del func
+            if memory:
+                result["peak_bytes"] = peak
+            results[stage] = result
+            print(f"  {stage:<40} {result['ms']:>10.1f} ms"
+                  + (f" {result['peak_bytes'] / 1e6:>9.1f} MB" if memory else ""))
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float, memory_tolerance: float,
+            speed: float = 1.0) -> list:
+    """Return (size, stage, message) for every stage slower or larger than the baseline allows.
+
+    Baseline times are scaled by the stage's calibration time over the
+    baseline's, or by speed, the ratio of the whole run's calibrations, for
+    baselines without per-stage calibrations, so a slower machine is not
+    mistaken for a regression.
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, result in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if not base:
+                continue
+            if 'calibration_ms' in result and 'calibration_ms' in base:
+                expected = base['ms'] * result['calibration_ms'] / base['calibration_ms']
+            else:
+                expected = base['ms'] * speed
+            if result['ms'] > expected * (1 + tolerance) and result['ms'] - expected > MIN_MS:
+                regressions.append((size, stage, (
+                    f"{stage} @ {size} tokens: {result['ms']:.1f} ms vs baseline {expected:.1f} ms "
+                    f"(+{(result['ms'] / expected - 1) * 100:.0f}%)"
+                )))
+            if 'peak_bytes' in result and 'peak_bytes' in base \
+                    and result['peak_bytes'] > base['peak_bytes'] * (1 + memory_tolerance) \
+                    and result['peak_bytes'] - base['peak_bytes'] > MIN_BYTES:
+                regressions.append((size, stage, (
+                    f"{stage} @ {size} tokens: peak {result['peak_bytes'] / 1e6:.1f} MB "
+                    f"vs baseline {base['peak_bytes'] / 1e6:.1f} MB"
+                )))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every token pipeline stage')
+    parser.add_argument('--sizes',
+                        help=f'Comma-separated corpus sizes (default: those in --baseline, else {DEFAULT_SIZES})')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Timed runs per stage, the median is reported (default: 5)')
+    parser.add_argument('--checks', default=','.join(DEFAULT_CHECKS),
+                        help='Comma-separated validator checks to time (default: all but contrast)')
+    parser.add_argument('--stages',
+                        help='Only run stages whose name contains one of these comma-separated strings')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Skip the tracemalloc run of each stage')
+    parser.add_argument('--output', help='Write results JSON to this path')
+    parser.add_argument('--baseline', help='Baseline JSON to compare against')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Write the results to --baseline instead of comparing')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='Allowed slowdown per stage as a fraction (default: 0.5)')
+    parser.add_argument('--memory-tolerance', type=float, default=0.10,
+                        help='Allowed peak memory growth per stage as a fraction (default: 0.10)')
+    args = parser.parse_args()
+    
+    if args.update_baseline and not args.baseline:
+        print("Error: --update-baseline needs --baseline")
+        return 1
+    
+    baseline = None
+    if args.baseline and not args.update_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    sizes = args.sizes or (','.join(baseline['sizes']) if baseline else DEFAULT_SIZES)
+    
+    # Timings of wrong output are not worth comparing
+    if baseline and not run_tests():
+        print("\n❌ Tests failed")
+        return 1
+    
+    checks = [check.strip() for check in args.checks.split(',')]
+    stage_filter = [part.strip() for part in args.stages.split(',')] if args.stages else None
+    wanted = (lambda stage: any(part in stage for part in stage_filter)) if stage_filter else None
+    # Sampled around every size, since the speed of shared machines drifts during a run
+    calibrations = [median_of(calibration_workload, args.repeat)]
+    results = {}
+    for count in iter_sizes(sizes):
+        print(f"Corpus of {count} tokens:")
+        results[str(count)] = run_size(count, args.repeat, checks, not args.no_memory, wanted)
+        calibrations.append(median_of(calibration_workload, args.repeat))
+    calibration = statistics.median(calibrations) * 1000
+    print(f"Calibration: {calibration:.1f} ms")
+    
+    report = {
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "repeat": args.repeat,
+        "calibration_ms": round(calibration, 3),
+        "sizes": results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Results saved to {args.output}")
+    
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"✓ Baseline saved to {args.baseline}")
+        return 0
+    if not baseline:
+        return 0
+    
+    if baseline.get('machine') != report['machine'] or baseline.get('python') != report['python']:
+        print(f"⚠️  Baseline was recorded on {baseline.get('machine')}, Python {baseline.get('python')}")
+    
+    speed = calibration / baseline['calibration_ms']
+    print(f"\nMachine speed relative to baseline: {1 / speed:.2f}x")
+    regressions = compare(results, baseline['sizes'], args.tolerance, args.memory_tolerance, speed)
+    if regressions:
+        # A stage that was only unlucky once gets a second chance before failing the run
+        print(f"\nRe-measuring {len(regressions)} stage(s) over the tolerance...")
+        for size in sorted({size for size, _, _ in regressions}, key=int):
+            flagged = {stage for flagged_size, stage, _ in regressions if flagged_size == size}
+            retry = run_size(int(size), args.repeat, checks, not args.no_memory, flagged.__contains__)
+            for stage, result in retry.items():
+                first = results[size][stage]
+                # A time only means something next to the calibration it was measured with
+                if result['ms'] / result['calibration_ms'] < first['ms'] / first['calibration_ms']:
+                    first['ms'], first['calibration_ms'] = result['ms'], result['calibration_ms']
+                if 'peak_bytes' in result:
+                    first['peak_bytes'] = min(first['peak_bytes'], result['peak_bytes'])
+        regressions = compare(results, baseline['sizes'], args.tolerance, args.memory_tolerance, speed)
+    
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+        for _, _, message in regressions:
+            print(f"  - {message}")
+        return 1
+    print(f"\n✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark for compiled templates
+Renders the component doc and CSS templates for many synthetic components
+(each with several variants, states and a size prop), once with templates
+compiled a single time and once parsing and compiling them for every
+render, and checks both produce the same text. Also times loading the
+templates by compiling them against loading their code from the disk cache,
+as a new worker process would.
+
+Usage:
+    python benchmarks/bench_templates.py --components 1000 --variants 8
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from component_generator import ComponentGenerator, SIZE_SCALE  # noqa: E402
+from template_engine import Template, TemplateLoader, TEMPLATE_DIR  # noqa: E402
+
+TEMPLATES = ('component.md.tmpl', 'component.css.tmpl')
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of several runs, with the cyclic GC off."""
+    best = float('inf')
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def make_contexts(components: int, variants: int):
+    """Return one render context per synthetic component, as the generator builds it for the CSS."""
+    states = ['default', 'hover', 'active', 'focus', 'disabled']
+    generator = ComponentGenerator(templates={
+        f"component{i}": {
+            'purpose': f"Synthetic component {i}",
+            'variants': [f"variant{v}" for v in range(variants)],
+            'states': states,
+            'props': {'variant': [f"variant{v}" for v in range(variants)],
+                      'size': [size for size, *_ in SIZE_SCALE], 'disabled': 'boolean'}
+        }
+        for i in range(components)
+    })
+    return [generator.css_context(f"component{i}") for i in range(components)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compiled templates')
+    parser.add_argument('--components', type=int, default=1000,
+                        help='Synthetic components to render (default: 1000)')
+    parser.add_argument('--variants', type=int, default=8,
+                        help='Variants per component (default: 8)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs per measurement, best is reported (default: 5)')
+    args = parser.parse_args()
+
+    sources = {name: (TEMPLATE_DIR / name).read_text(encoding='utf-8') for name in TEMPLATES}
+    compiled = [Template(source, name) for name, source in sources.items()]
+    contexts = make_contexts(args.components, args.variants)
+
+    def once():
+        return [template.render(context) for context in contexts for template in compiled]
+
+    def every_render():
+        return [Template(source, name).render(context)
+                for context in contexts for name, source in sources.items()]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        TemplateLoader(TEMPLATE_DIR, cache_dir).get(TEMPLATES[0])
+
+        def load(loader_cache):
+            def run():
+                loader = TemplateLoader(TEMPLATE_DIR, loader_cache)
+                for name in TEMPLATES:
+                    loader.get(name)
+            return run
+
+        compile_time = best_of(load(Path(cache_dir) / 'none'), 1)
+        for name in TEMPLATES:
+            TemplateLoader(TEMPLATE_DIR, cache_dir).get(name)
+        cached_time = best_of(load(cache_dir), args.repeat)
+
+    renders = len(contexts) * len(TEMPLATES)
+    output = once()
+    print(f"{args.components} components x {args.variants} variants, {renders} renders, "
+          f"{sum(map(len, output)) / 1024:.0f} KB of output:")
+    for label, func in (('compiled once', once), ('compiled every render', every_render)):
+        elapsed = best_of(func, args.repeat)
+        print(f"  {label:<24} {elapsed * 1000:>9.1f} ms  {elapsed / renders * 1e6:>7.1f} µs/render")
+    print(f"  {'load, compiling':<24} {compile_time * 1000:>9.2f} ms")
+    print(f"  {'load, from disk cache':<24} {cached_time * 1000:>9.2f} ms")
+
+    same = output == every_render()
+    print(f"  Identical results:       {same}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    exit(main())
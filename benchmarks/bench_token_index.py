@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the token query index
+Compares token_index.TokenIndex queries with the recursive walks and linear
+scans they replace, on a synthetic token tree (see corpus.py): exact path
+lookup, prefix query (as token_daemon used to scan), glob query (fnmatch
+over every path), and lookups by type and by value. Every query is checked
+to return the same paths either way.
+
+Usage:
+    python benchmarks/bench_token_index.py --tokens 100k
+"""
+
+import argparse
+import gc
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from corpus import generate_tokens, to_tree, iter_sizes  # noqa: E402
+from token_index import TokenIndex, compile_glob  # noqa: E402
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of several runs, with the cyclic GC off."""
+    best = float('inf')
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def walk(node, path=''):
+    """Yield (path, token) for every token, building the dotted path at every level."""
+    for key, child in node.items():
+        if not isinstance(child, dict):
+            continue
+        current_path = f"{path}.{key}" if path else key
+        if 'value' in child:
+            yield current_path, child
+        else:
+            yield from walk(child, current_path)
+
+
+def descend(tree, path):
+    node = tree
+    for part in path.split('.'):
+        node = node.get(part) if isinstance(node, dict) else None
+        if node is None:
+            return None
+    return node
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark token index queries')
+    parser.add_argument('--tokens', default='100k',
+                        help='Corpus size, e.g. 100000 or 100k (default: 100k)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs per measurement, best is reported (default: 5)')
+    args = parser.parse_args()
+
+    tree = to_tree(generate_tokens(next(iter_sizes(args.tokens))))
+    build = best_of(lambda: TokenIndex.from_tree(tree), args.repeat)
+    index = TokenIndex.from_tree(tree)
+    paths = index.store.paths
+    sample = paths[::max(1, len(paths) // 1000)]
+    group = '.'.join(paths[len(paths) // 2].split('.')[:2])
+    pattern = f"{group.split('.')[0]}.*.500"
+    token_type = index.store.type_names[index.store.type_codes[0]]
+    value = index.store.values[len(paths) // 3]
+
+    queries = [
+        (f"{len(sample)} path lookups",
+         lambda: [descend(tree, path) for path in sample],
+         lambda: [index.get(path) for path in sample],
+         lambda: [path for path in sample if descend(tree, path) is not None],
+         lambda: [path for path in sample if path in index]),
+        (f"prefix {group}",
+         lambda: sorted(path for path, _ in walk(tree) if path == group or path.startswith(group + '.')),
+         lambda: index.prefix(group), None, None),
+        (f"glob {pattern}",
+         lambda: sorted(path for path, _ in walk(tree) if compile_glob(pattern).fullmatch(path)),
+         lambda: index.glob(pattern), None, None),
+        (f"type {token_type}",
+         lambda: [path for path, token in walk(tree) if token.get('type') == token_type],
+         lambda: index.of_type(token_type), None, None),
+        (f"value {value}",
+         lambda: [path for path, token in walk(tree) if token['value'] == value],
+         lambda: index.with_value(value), None, None),
+    ]
+
+    print(f"Index of {len(index)} tokens built in {build * 1000:.1f} ms")
+    print(f"  {'query':<32} {'tree walk':>12} {'index':>12}")
+    same = True
+    for label, slow, fast, slow_paths, fast_paths in queries:
+        slow_time = best_of(slow, args.repeat)
+        fast_time = best_of(fast, args.repeat)
+        same = same and (slow_paths or slow)() == (fast_paths or fast)()
+        print(f"  {label:<32} {slow_time * 1000:>9.2f} ms {fast_time * 1000:>9.3f} ms"
+              f"  {slow_time / max(fast_time, 1e-9):>8.0f}x")
+    print(f"  Same results:  {same}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    exit(main())
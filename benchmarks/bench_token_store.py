@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for TokenStore
+Compares the memory held by nested token dicts (as json.load produces them)
+with a TokenStore holding the same tokens. The corpus is tokens.json plus
+tokens/*.json (~180 KB), replicated under distinct top-level keys until it
+reaches the requested token count.
+
+Usage:
+    python benchmarks/bench_token_store.py --tokens 1000000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from token_store import TokenStore  # noqa: E402
+
+
+def load_corpus():
+    """Return the corpus files' text and the number of tokens in one copy."""
+    texts = [(ROOT / 'tokens.json').read_text(encoding='utf-8')]
+    texts += [path.read_text(encoding='utf-8') for path in sorted((ROOT / 'tokens').glob('*.json'))]
+    count = sum(len(TokenStore.from_tree(json.loads(text))) for text in texts)
+    return texts, count
+
+
+def add_tree(store, node, parts):
+    """Add every token of a parsed tree to a store under a path prefix."""
+    if 'value' in node and parts:
+        store.add('.'.join(parts), node['value'], node.get('type'))
+    for key, child in node.items():
+        if key in TokenStore.META_KEYS or not isinstance(child, dict):
+            continue
+        parts.append(key)
+        add_tree(store, child, parts)
+        parts.pop()
+
+
+def build_nested(texts, copies):
+    tree = {}
+    for n in range(copies):
+        tree[f"copy{n}"] = [json.loads(text) for text in texts]
+    return tree
+
+
+def build_store(texts, copies):
+    store = TokenStore()
+    for n in range(copies):
+        for i, text in enumerate(texts):
+            add_tree(store, json.loads(text), [f"copy{n}", f"file{i}"])
+    return store
+
+
+def measure(build, *args):
+    """Return (result, retained bytes, peak bytes, seconds) for one build."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(*args)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark TokenStore memory use')
+    parser.add_argument('--tokens', type=int, default=1_000_000,
+                        help='Approximate number of tokens (default: 1000000)')
+    args = parser.parse_args()
+    
+    texts, per_copy = load_corpus()
+    copies = max(1, -(-args.tokens // per_copy))
+    print(f"Corpus: {sum(len(t) for t in texts) / 1024:.0f} KB, {per_copy} tokens per copy, "
+          f"{copies} copies = {per_copy * copies} tokens")
+    
+    tree, tree_bytes, tree_peak, tree_time = measure(build_nested, texts, copies)
+    del tree
+    store, store_bytes, store_peak, store_time = measure(build_store, texts, copies)
+    
+    per_token = per_copy * copies
+    print(f"{'structure':<14} {'retained MB':>12} {'peak MB':>10} {'B/token':>9} {'build s':>9}")
+    print(f"{'nested dicts':<14} {tree_bytes / 1e6:>12.1f} {tree_peak / 1e6:>10.1f} "
+          f"{tree_bytes / per_token:>9.0f} {tree_time:>9.2f}")
+    print(f"{'TokenStore':<14} {store_bytes / 1e6:>12.1f} {store_peak / 1e6:>10.1f} "
+          f"{store_bytes / per_token:>9.0f} {store_time:>9.2f}")
+    print(f"\nTokenStore holds {len(store)} tokens in {store_bytes / tree_bytes:.0%} of the nested-dict memory")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark for TokenValidator --check-all
+Compares the single-traversal rule engine with the previous four-pass
+approach (one recursive walk per check, uncompiled patterns) on tokens.json
+replicated to a larger corpus.
+
+Usage:
+    python benchmarks/bench_token_validator.py --scale 100
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from reference_graph import ReferenceGraph  # noqa: E402
+from token_validator import TokenValidator  # noqa: E402
+
+
+class FourPassValidator(TokenValidator):
+    """The previous implementation: four recursive walks with uncompiled patterns."""
+    
+    def run_all(self, tokens):
+        self.naming_pass(tokens)
+        self.values_pass(tokens)
+        self.references_pass(tokens)
+        self.duplicates_pass(tokens)
+    
+    def naming_pass(self, tokens, path=""):
+        for key, value in tokens.items():
+            current_path = f"{path}.{key}" if path else key
+            if not re.match(r'^[a-z][a-z0-9\-]*$', key):
+                self.warnings.append(f"Non-standard naming at '{current_path}': '{key}'")
+            if len(key) <= 2 and key not in ['xs', 'sm', 'md', 'lg', 'xl']:
+                self.warnings.append(f"Possible abbreviation at '{current_path}': '{key}'")
+            if isinstance(value, dict) and 'value' not in value:
+                self.naming_pass(value, current_path)
+    
+    def values_pass(self, tokens, path=""):
+        for key, value in tokens.items():
+            current_path = f"{path}.{key}" if path else key
+            if isinstance(value, dict):
+                if 'value' in value and 'type' in value:
+                    self.legacy_validate_value(current_path, value)
+                else:
+                    self.values_pass(value, current_path)
+    
+    def legacy_validate_value(self, path, token):
+        value = token.get('value', '')
+        token_type = token.get('type', '')
+        if isinstance(value, str) and value.startswith('{') and value.endswith('}'):
+            return
+        if token_type == 'color':
+            if not (re.match(r'^#[0-9A-Fa-f]{3}$|^#[0-9A-Fa-f]{6}$|^#[0-9A-Fa-f]{8}$', value)
+                    or re.match(r'^rgba?\(', value) or re.match(r'^hsla?\(', value)):
+                self.errors.append(f"Invalid color value at '{path}': '{value}'")
+        elif token_type == 'dimension':
+            if not re.match(r'^\d+(\.\d+)?(px|rem|em|%|vh|vw|pt)$', str(value)):
+                self.errors.append(f"Invalid dimension value at '{path}': '{value}'")
+        elif token_type == 'shadow':
+            if not re.search(r'\d+.*\d+', value):
+                self.warnings.append(f"Possibly invalid shadow at '{path}': '{value}'")
+    
+    def references_pass(self, tokens):
+        self.report_references(ReferenceGraph(tokens))
+    
+    def duplicates_pass(self, tokens):
+        values_map = {}
+        
+        def collect_values(obj, path=""):
+            if isinstance(obj, dict):
+                if 'value' in obj:
+                    value = obj['value']
+                    if not (isinstance(value, str) and value.startswith('{') and value.endswith('}')):
+                        values_map.setdefault(value, []).append(path)
+                else:
+                    for key, val in obj.items():
+                        collect_values(val, f"{path}.{key}" if path else key)
+        
+        collect_values(tokens)
+        for value, paths in values_map.items():
+            if len(paths) > 1:
+                self.info.append(f"Duplicate value '{value}' found in: {', '.join(paths)}")
+
+
+def scale_tokens(tokens: dict, factor: int) -> dict:
+    """Replicate every top-level category factor times under suffixed names."""
+    scaled = {}
+    for i in range(factor):
+        suffix = '' if i == 0 else str(i)
+        for key, value in tokens.items():
+            scaled[f"{key}{suffix}"] = value
+    return scaled
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of several runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark token validation passes')
+    parser.add_argument('--input', default=str(ROOT / 'tokens.json'),
+                        help='Token file to scale up (default: tokens.json)')
+    parser.add_argument('--scale', type=int, default=100,
+                        help='Replication factor (default: 100)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement, best is reported (default: 3)')
+    args = parser.parse_args()
+    
+    with open(args.input, 'r', encoding='utf-8') as f:
+        tokens = scale_tokens(json.load(f), args.scale)
+    
+    checks = list(TokenValidator.RULES)
+    four_pass = best_of(lambda: FourPassValidator().run_all(tokens), args.repeat)
+    single_pass = best_of(lambda: TokenValidator().run_checks(tokens, checks), args.repeat)
+    
+    token_count = len(ReferenceGraph(tokens).values)
+    print(f"Tokens:       {token_count}")
+    print(f"Four-pass:    {four_pass:.3f}s")
+    print(f"Single-pass:  {single_pass:.3f}s")
+    print(f"Speedup:      {four_pass / single_pass:.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark for rule-based token type inference
+Compares type_inference's compiled rules with the if-chains they replaced
+(convert_tokens.determine_token_type and TokenConverter.detect_token_type)
+for speed on a synthetic corpus (see corpus.py), and for accuracy against
+the hand-curated types of tokens/*.json on the declarations of token.md.
+
+Usage:
+    python benchmarks/bench_type_inference.py --tokens 100k
+"""
+
+import argparse
+import gc
+import json
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+import convert_tokens  # noqa: E402
+from corpus import generate_tokens, iter_sizes  # noqa: E402
+from type_inference import STYLE_DICTIONARY_TYPES, CONVERTER_VALUE_TYPES, DECLARATION_PATTERN  # noqa: E402
+
+LEGACY_COLOR_PATTERN = re.compile(r'^#[0-9A-Fa-f]{3,8}$|^rgb|^hsl|^var\(--color')
+LEGACY_DIMENSION_PATTERN = re.compile(r'^\d+(\.\d+)?(px|rem|em|%|vh|vw)$')
+LEGACY_FONT_WEIGHT_PATTERN = re.compile(r'^\d{3}$|^(normal|bold|lighter|bolder)$')
+LEGACY_SHADOW_PATTERN = re.compile(r'^\d+.*\d+.*#[0-9A-Fa-f]')
+
+
+def legacy_determine_token_type(name, value):
+    """The previous convert_tokens.determine_token_type if-chain."""
+    name_lower = name.lower()
+    
+    if 'color' in name_lower or 'bg' in name_lower or 'fg' in name_lower or 'border' in name_lower or 'text' in name_lower:
+        return 'color'
+    elif 'shadow' in name_lower:
+        return 'boxShadow'
+    elif 'radius' in name_lower:
+        return 'borderRadius'
+    elif 'font-family' in name_lower or 'font' in name_lower and ('inter' in value.lower() or 'mono' in value.lower()):
+        return 'fontFamily'
+    elif 'spacing' in name_lower or 'width' in name_lower or 'height' in name_lower or 'breakpoint' in name_lower:
+        return 'dimension'
+    elif 'line-height' in name_lower:
+        return 'lineHeight'
+    elif 'letter-spacing' in name_lower:
+        return 'letterSpacing'
+    elif 'text-' in name_lower and ('xs' in name_lower or 'sm' in name_lower or 'md' in name_lower or 'lg' in name_lower or 'xl' in name_lower or 'display' in name_lower):
+        return 'fontSize'
+    elif 'animate' in name_lower:
+        return 'animation'
+    else:
+        return 'other'
+
+
+def legacy_detect_token_type(value):
+    """The previous TokenConverter.detect_token_type regex sequence."""
+    value = value.strip()
+    if LEGACY_COLOR_PATTERN.match(value):
+        return "color"
+    if LEGACY_DIMENSION_PATTERN.match(value):
+        return "dimension"
+    if LEGACY_FONT_WEIGHT_PATTERN.match(value):
+        return "fontWeight"
+    if LEGACY_SHADOW_PATTERN.match(value):
+        return "shadow"
+    if ',' in value or 'sans' in value or 'serif' in value or 'mono' in value:
+        return "fontFamily"
+    return "string"
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of several runs, with the cyclic GC off."""
+    best = float('inf')
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def curated_types():
+    """Return CSS variable name -> type from tokens/*.json (token.md's '--' separators dropped)."""
+    types = {}
+    
+    def collect(node, parts):
+        if 'value' in node and not isinstance(node['value'], dict):
+            types['-'.join(parts)] = node.get('type')
+        for key, child in node.items():
+            if isinstance(child, dict):
+                collect(child, parts + [key])
+    
+    for path in sorted((ROOT / 'tokens').glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            collect(json.load(f), [])
+    return types
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark rule-based token type inference')
+    parser.add_argument('--tokens', default='100k',
+                        help='Corpus size, e.g. 100000 or 100k (default: 100k)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs per measurement, best is reported (default: 5)')
+    args = parser.parse_args()
+    
+    declarations = [('-'.join(path), value) for path, value, _ in generate_tokens(next(iter_sizes(args.tokens)))]
+    values = [value for _, value in declarations]
+    infer_type = STYLE_DICTIONARY_TYPES.infer_type
+    detect_type = CONVERTER_VALUE_TYPES.infer_type
+    
+    timings = [
+        ('determine_token_type (if-chain)', lambda: [legacy_determine_token_type(n, v) for n, v in declarations]),
+        ('STYLE_DICTIONARY_TYPES.infer_type', lambda: [infer_type(n, v) for n, v in declarations]),
+        ('detect_token_type (regex sequence)', lambda: [legacy_detect_token_type(v) for v in values]),
+        ('CONVERTER_VALUE_TYPES.infer_type', lambda: [detect_type('', v.strip()) for v in values]),
+    ]
+    print(f"Corpus of {len(declarations)} declarations:")
+    for label, func in timings:
+        elapsed = best_of(func, args.repeat)
+        print(f"  {label:<36} {elapsed * 1000:>9.1f} ms  {elapsed / len(declarations) * 1e6:>6.2f} µs/token")
+    
+    same = sum(1 for v in values if legacy_detect_token_type(v) == detect_type('', v.strip()))
+    print(f"  TokenConverter types unchanged:      {same}/{len(values)}")
+    
+    # Accuracy on the real sources, whose types were curated by hand
+    truth = curated_types()
+    css = (ROOT / 'token.md').read_text(encoding='utf-8')
+    real = [(name, convert_tokens.parse_css_value(value)) for name, value in DECLARATION_PATTERN.findall(css)]
+    real = [(name, value, truth[name.replace('--', '')]) for name, value in real if name.replace('--', '') in truth]
+    legacy_misses = Counter((t, legacy_determine_token_type(n, v)) for n, v, t in real
+                            if legacy_determine_token_type(n, v) != t)
+    rule_misses = Counter((t, infer_type(n, v)) for n, v, t in real if infer_type(n, v) != t)
+    print(f"\ntoken.md declarations typed as in tokens/*.json ({len(real)}):")
+    print(f"  if-chain: {len(real) - sum(legacy_misses.values())}  rules: {len(real) - sum(rule_misses.values())}")
+    for label, misses in (('if-chain', legacy_misses), ('rules', rule_misses)):
+        for (expected, actual), count in misses.most_common():
+            print(f"  {label} typed {count} {expected} token(s) as {actual}")
+    return 0 if same == len(values) else 1
+
+
+if __name__ == '__main__':
+    exit(main())
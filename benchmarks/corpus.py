@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Synthetic token corpus
+Deterministic generator of token.md- and tokens/*.json-shaped corpora of any
+size, for the benchmarks.
+
+The shape is taken from the real sources (777 tokens): the share of each
+top-level category, the path depth distribution within it, its token types,
+the fraction of values that are var() references, and the .dark-mode block
+that overrides about half of the declarations, mostly references. Reference
+targets are earlier tokens of the same type, so alias chains form as they do
+in the real palette -> semantic -> component layering. The same seed and
+size always produce the same corpus.
+
+Usage:
+    python benchmarks/corpus.py --tokens 100000 --css corpus.css --json corpus.json
+    python benchmarks/corpus.py --tokens 100000 --describe
+"""
+
+import argparse
+import json
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from token_store import TokenStore  # noqa: E402
+
+# Measured from tokens/*.json: (category, tokens, {type: tokens}, {depth: tokens}, references)
+CATEGORIES = [
+    ('color', 623, {'color': 623}, {2: 3, 3: 264, 4: 306, 5: 43, 6: 7}, 268),
+    ('text', 49, {'color': 23, 'fontSize': 11, 'lineHeight': 11, 'letterSpacing': 4},
+     {2: 5, 3: 20, 4: 23, 5: 1}, 45),
+    ('background', 35, {'color': 35}, {3: 13, 4: 22}, 35),
+    ('shadow', 14, {'boxShadow': 14}, {2: 8, 3: 1, 5: 5}, 1),
+    ('ring', 13, {'color': 13}, {3: 10, 4: 2, 5: 1}, 13),
+    ('border', 12, {'color': 12}, {3: 10, 4: 2}, 12),
+    ('outline', 12, {'color': 12}, {3: 10, 4: 2}, 12),
+    ('radius', 10, {'borderRadius': 10}, {2: 10}, 0),
+    ('font', 3, {'fontFamily': 3}, {2: 3}, 2),
+    ('breakpoint', 2, {'dimension': 2}, {2: 2}, 0),
+    ('animate', 2, {'animation': 2}, {2: 1, 3: 1}, 0),
+    ('max', 1, {'dimension': 1}, {3: 1}, 0),
+    ('drop', 1, {'boxShadow': 1}, {4: 1}, 0)
+]
+SOURCE_TOKENS = sum(category[1] for category in CATEGORIES)
+
+# Share of @theme declarations that .dark-mode overrides (382 of 779 in token.md)
+DARK_FRACTION = 0.49
+
+GROUPS = ['gray', 'brand', 'error', 'warning', 'success', 'blue', 'indigo', 'purple',
+          'utility', 'bg', 'fg', 'border', 'button', 'featured', 'nav', 'tooltip']
+ROLES = ['primary', 'secondary', 'tertiary', 'quaternary', 'brand', 'error', 'warning', 'success']
+LEAVES = {
+    'color': ['25', '50', '100', '200', '300', '400', '500', '600', '700', '800', '900', '950'],
+    'fontSize': ['xs', 'sm', 'md', 'lg', 'xl'],
+    'lineHeight': ['xsline', 'smline', 'mdline', 'lgline', 'xlline'],
+    'letterSpacing': ['tight', 'normal', 'wide', 'wider'],
+    'boxShadow': ['xs', 'sm', 'md', 'lg', 'xl', 'skeumorphic'],
+    'borderRadius': ['none', 'xs', 'sm', 'md', 'lg', 'xl', 'full'],
+    'fontFamily': ['body', 'display', 'mono'],
+    'dimension': ['sm', 'md', 'lg', 'xl'],
+    'animation': ['marquee', 'blink', 'spin']
+}
+
+# A generated token: path segments, value, Style Dictionary type
+Token = Tuple[Tuple[str, ...], str, str]
+
+
+def literal_value(rng: random.Random, token_type: str) -> str:
+    """Return a realistic literal value of a token type."""
+    if token_type == 'color':
+        if rng.random() < 0.1:
+            return f"rgba({rng.randrange(256)}, {rng.randrange(256)}, {rng.randrange(256)}, {rng.randrange(1, 100) / 100})"
+        return f"#{rng.randrange(1 << 24):06x}"
+    if token_type in ('fontSize', 'lineHeight'):
+        return f"calc(var(--spacing) * {rng.randrange(6, 40) / 2})"
+    if token_type == 'letterSpacing':
+        return f"{rng.choice(['-0.02', '-0.01', '0', '0.01'])}em"
+    if token_type == 'boxShadow':
+        y, blur = rng.randrange(1, 32), rng.randrange(1, 64)
+        return (f"0px {y}px {blur}px -{y // 4}px rgba(10, 13, 18, {rng.randrange(3, 19) / 100}), "
+                f"0px {y // 2}px {blur // 2}px -{y // 8}px rgba(10, 13, 18, 0.04)")
+    if token_type in ('borderRadius', 'dimension'):
+        return f"{rng.randrange(0, 1600, 2)}px"
+    if token_type == 'fontFamily':
+        return '"Inter", -apple-system, "Segoe UI", Roboto, Arial, sans-serif'
+    return f"{rng.choice(LEAVES['animation'])} {rng.randrange(1, 60)}s linear infinite"
+
+
+def weighted(rng: random.Random, counts: Dict[Any, int]) -> Any:
+    return rng.choices(list(counts), weights=list(counts.values()))[0]
+
+
+def token_path(category: str, token_type: str, depth: int, serial: int) -> Tuple[str, ...]:
+    """Return the serial-th distinct path of a depth within a category."""
+    leaves = LEAVES[token_type]
+    leaf = leaves[serial % len(leaves)]
+    block = serial // len(leaves)
+    if depth == 2:
+        return (category, f"{leaf}{block or ''}")
+    group = f"{GROUPS[block % len(GROUPS)]}{block // len(GROUPS) or ''}"
+    roles = [ROLES[(block + level) % len(ROLES)] for level in range(depth - 3)]
+    return (category, group, *roles, leaf)
+
+
+def generate_tokens(count: int, seed: int = 0) -> List[Token]:
+    """Generate count tokens shaped like the real sources, category by category."""
+    rng = random.Random(seed)
+    tokens = []
+    # Token type -> CSS names of earlier tokens, the candidate reference targets
+    targets: Dict[str, List[str]] = {}
+    
+    for category, size, types, depths, references in CATEGORIES:
+        share = max(1, round(count * size / SOURCE_TOKENS))
+        serials = Counter()
+        for _ in range(share):
+            token_type = weighted(rng, types)
+            depth = weighted(rng, depths)
+            path = token_path(category, token_type, depth, serials[token_type, depth])
+            serials[token_type, depth] += 1
+            
+            candidates = targets.setdefault(token_type, [])
+            if candidates and rng.random() < references / size:
+                value = f"var(--{rng.choice(candidates)})"
+            else:
+                value = literal_value(rng, token_type)
+            candidates.append('-'.join(path))
+            tokens.append((path, value, token_type))
+    return tokens
+
+
+def dark_overrides(tokens: List[Token], seed: int = 0) -> List[Token]:
+    """Pick the tokens a .dark-mode block overrides, with their dark values."""
+    rng = random.Random(seed + 1)
+    colors = [token for token in tokens if token[2] == 'color']
+    names = ['-'.join(path) for path, _, _ in colors]
+    overrides = []
+    for i, (path, value, token_type) in enumerate(colors):
+        if rng.random() >= DARK_FRACTION * len(tokens) / len(colors):
+            continue
+        if value.startswith('var('):
+            # Earlier targets only, so dark aliases cannot form cycles either
+            value = f"var(--{names[rng.randrange(i)]})"
+        else:
+            value = literal_value(rng, token_type)
+        overrides.append((path, value, token_type))
+    return overrides
+
+
+def to_css(tokens: List[Token], dark: List[Token]) -> str:
+    """Render tokens as a token.md-style @theme block followed by a .dark-mode block."""
+    lines = ["@theme {"]
+    previous = None
+    for path, value, _ in tokens:
+        if path[0] != previous:
+            lines.append(f"    /* {path[0]} */")
+            previous = path[0]
+        lines.append(f"    --{'-'.join(path)}: {value};")
+    lines.append("}\n")
+    lines.append(".dark-mode {")
+    lines.extend(f"    --{'-'.join(path)}: {value};" for path, value, _ in dark)
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def to_tree(tokens: List[Token]) -> Dict[str, Any]:
+    """Render tokens as a tokens/*.json-style nested tree."""
+    tree = {}
+    for path, value, token_type in tokens:
+        node = tree
+        for part in path:
+            node = node.setdefault(part, {})
+        node['value'] = value
+        node['type'] = token_type
+    return tree
+
+
+def describe(tree: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the shape statistics the generator reproduces."""
+    store = TokenStore.from_tree(tree)
+    depths = [path.count('.') + 1 for path in store]
+    references = sum(1 for path in store if 'var(' in str(store.value(path)) or '{' in str(store.value(path)))
+    return {
+        "tokens": len(store),
+        "categories": len(tree),
+        "mean_depth": round(sum(depths) / len(depths), 2),
+        "max_depth": max(depths),
+        "reference_fraction": round(references / len(store), 3),
+        "color_fraction": round(store.type_counts().get('color', 0) / len(store), 3)
+    }
+
+
+def load_sources() -> Dict[str, Any]:
+    """Return the real tokens/*.json sources merged into one tree."""
+    tree = {}
+    for path in sorted((ROOT / 'tokens').glob('*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            tree.update(json.load(f))
+    return tree
+
+
+def iter_sizes(spec: str) -> Iterator[int]:
+    """Parse '10k,100k,1M' into token counts."""
+    for size in spec.split(','):
+        size = size.strip().lower()
+        scale = {'k': 1000, 'm': 1000000}.get(size[-1:], 1)
+        yield int(float(size.rstrip('km')) * scale)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic token corpus')
+    parser.add_argument('--tokens', default='10k',
+                        help='Number of tokens, e.g. 10000 or 10k (default: 10k)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed (default: 0)')
+    parser.add_argument('--css', help='Write token.md-style CSS to this path')
+    parser.add_argument('--json', help='Write tokens/*.json-style JSON to this path')
+    parser.add_argument('--describe', action='store_true',
+                        help='Compare the corpus shape with the real sources')
+    args = parser.parse_args()
+    
+    count = next(iter_sizes(args.tokens))
+    tokens = generate_tokens(count, args.seed)
+    if args.css:
+        Path(args.css).write_text(to_css(tokens, dark_overrides(tokens, args.seed)), encoding='utf-8')
+        print(f"✓ Wrote {args.css}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(to_tree(tokens), f, indent=2)
+        print(f"✓ Wrote {args.json}")
+    if args.describe or not (args.css or args.json):
+        print(f"{'':<20} {'sources':>10} {'corpus':>10}")
+        source, corpus = describe(load_sources()), describe(to_tree(tokens))
+        for key in source:
+            print(f"{key:<20} {source[key]:>10} {corpus[key]:>10}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
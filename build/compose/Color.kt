@@ -10,86 +10,86 @@ import androidx.compose.ui.graphics.Color
 import androidx.compose.ui.unit.*
 
 object AppColors {
-  val backgroundColorActive = var(--color-bg-active)
-  val backgroundColorBorderBrand = var(--color-border-brand)
-  val backgroundColorBorderBrandAlt = var(--color-border-brand_alt)
-  val backgroundColorBorderTertiary = var(--color-border-tertiary)
-  val backgroundColorBrandPrimary = var(--color-bg-brand-primary)
-  val backgroundColorBrandPrimaryAlt = var(--color-bg-brand-primary_alt)
-  val backgroundColorBrandSecondary = var(--color-bg-brand-secondary)
-  val backgroundColorBrandSection = var(--color-bg-brand-section)
-  val backgroundColorBrandSectionSubtle = var(--color-bg-brand-section_subtle)
-  val backgroundColorBrandSolid = var(--color-bg-brand-solid)
-  val backgroundColorBrandSolidHover = var(--color-bg-brand-solid_hover)
-  val backgroundColorDisabled = var(--color-bg-disabled)
-  val backgroundColorDisabledSubtle = var(--color-bg-disabled_subtle)
-  val backgroundColorErrorPrimary = var(--color-bg-error-primary)
-  val backgroundColorErrorSecondary = var(--color-bg-error-secondary)
-  val backgroundColorErrorSolid = var(--color-bg-error-solid)
-  val backgroundColorErrorSolidHover = var(--color-bg-error-solid_hover)
-  val backgroundColorOverlay = var(--color-bg-overlay)
-  val backgroundColorPrimary = var(--color-bg-primary)
-  val backgroundColorPrimaryAlt = var(--color-bg-primary_alt)
-  val backgroundColorPrimaryHover = var(--color-bg-primary_hover)
-  val backgroundColorQuaternary = var(--color-bg-quaternary)
-  val backgroundColorSecondary = var(--color-bg-secondary)
-  val backgroundColorSecondaryAlt = var(--color-bg-secondary_alt)
-  val backgroundColorSecondaryHover = var(--color-bg-secondary_hover)
-  val backgroundColorSecondarySubtle = var(--color-bg-secondary_subtle)
-  val backgroundColorSuccessPrimary = var(--color-bg-success-primary)
-  val backgroundColorSuccessSecondary = var(--color-bg-success-secondary)
-  val backgroundColorSuccessSolid = var(--color-bg-success-solid)
-  val backgroundColorTertiary = var(--color-bg-tertiary)
-  val backgroundColorWarningPrimary = var(--color-bg-warning-primary)
-  val backgroundColorWarningSecondary = var(--color-bg-warning-secondary)
-  val backgroundColorWarningSolid = var(--color-bg-warning-solid)
-  val borderColorBrand = var(--color-border-brand)
-  val borderColorBrandAlt = var(--color-border-brand_alt)
-  val borderColorDisabled = var(--color-border-disabled)
-  val borderColorDisabledSubtle = var(--color-border-disabled_subtle)
-  val borderColorError = var(--color-border-error)
-  val borderColorErrorSubtle = var(--color-border-error_subtle)
-  val borderColorPrimary = var(--color-border-primary)
-  val borderColorSecondary = var(--color-border-secondary)
-  val borderColorSecondaryAlt = var(--color-border-secondary_alt)
-  val borderColorTertiary = var(--color-border-tertiary)
+  val backgroundColorActive = Color(0xff22262f)
+  val backgroundColorBorderBrand = Color(0xffb692f6)
+  val backgroundColorBorderBrandAlt = Color(0xff373a41)
+  val backgroundColorBorderTertiary = Color(0xff22262f)
+  val backgroundColorBrandPrimary = Color(0xff9e77ed)
+  val backgroundColorBrandPrimaryAlt = Color(0xff13161b)
+  val backgroundColorBrandSecondary = Color(0xff7f56d9)
+  val backgroundColorBrandSection = Color(0xff13161b)
+  val backgroundColorBrandSectionSubtle = Color(0xff0c0e12)
+  val backgroundColorBrandSolid = Color(0xff7f56d9)
+  val backgroundColorBrandSolidHover = Color(0xff9e77ed)
+  val backgroundColorDisabled = Color(0xff22262f)
+  val backgroundColorDisabledSubtle = Color(0xff13161b)
+  val backgroundColorErrorPrimary = Color(0xff55160c)
+  val backgroundColorErrorSecondary = Color(0xffd92d20)
+  val backgroundColorErrorSolid = Color(0xffd92d20)
+  val backgroundColorErrorSolidHover = Color(0xfff04438)
+  val backgroundColorOverlay = Color(0xff22262f)
+  val backgroundColorPrimary = Color(0xff0c0e12)
+  val backgroundColorPrimaryAlt = Color(0xff13161b)
+  val backgroundColorPrimaryHover = Color(0xff22262f)
+  val backgroundColorQuaternary = Color(0xff373a41)
+  val backgroundColorSecondary = Color(0xff13161b)
+  val backgroundColorSecondaryAlt = Color(0xff0c0e12)
+  val backgroundColorSecondaryHover = Color(0xff22262f)
+  val backgroundColorSecondarySubtle = Color(0xff13161b)
+  val backgroundColorSuccessPrimary = Color(0xff053321)
+  val backgroundColorSuccessSecondary = Color(0xff079455)
+  val backgroundColorSuccessSolid = Color(0xff079455)
+  val backgroundColorTertiary = Color(0xff22262f)
+  val backgroundColorWarningPrimary = Color(0xff4e1d09)
+  val backgroundColorWarningSecondary = Color(0xffdc6803)
+  val backgroundColorWarningSolid = Color(0xffdc6803)
+  val borderColorBrand = Color(0xffb692f6)
+  val borderColorBrandAlt = Color(0xff373a41)
+  val borderColorDisabled = Color(0xff373a41)
+  val borderColorDisabledSubtle = Color(0xff22262f)
+  val borderColorError = Color(0xfff97066)
+  val borderColorErrorSubtle = Color(0xfff04438)
+  val borderColorPrimary = Color(0xff373a41)
+  val borderColorSecondary = Color(0xff22262f)
+  val borderColorSecondaryAlt = Color(0xff22262f)
+  val borderColorTertiary = Color(0xff22262f)
   val colorAlphaBlack = Color(0xffffffff)
   val colorAlphaWhite = Color(0xff0c0e12)
-  val colorAppStoreBadgeBorder = var(--color-white)
-  val colorAvatarBg = var(--color-gray-800)
+  val colorAppStoreBadgeBorder = Color(0xffffffff)
+  val colorAvatarBg = Color(0xff22262f)
   val colorAvatarContrastBorder = Color(0xffffffff)
-  val colorAvatarProfilePhotoBorder = var(--color-gray-950)
+  val colorAvatarProfilePhotoBorder = Color(0xff0c0e12)
   val colorAvatarStylesBgNeutral = Color(0xffe0e0e0)
-  val colorBgActive = var(--color-gray-800)
-  val colorBgBrandPrimary = var(--color-brand-500)
-  val colorBgBrandPrimaryAlt = var(--color-bg-secondary)
-  val colorBgBrandSecondary = var(--color-brand-600)
-  val colorBgBrandSection = var(--color-bg-secondary)
-  val colorBgBrandSectionSubtle = var(--color-bg-primary)
-  val colorBgBrandSolid = var(--color-brand-600)
-  val colorBgBrandSolidHover = var(--color-brand-500)
-  val colorBgDisabled = var(--color-gray-800)
-  val colorBgDisabledSubtle = var(--color-gray-900)
-  val colorBgErrorPrimary = var(--color-error-950)
-  val colorBgErrorSecondary = var(--color-error-600)
-  val colorBgErrorSolid = var(--color-error-600)
-  val colorBgErrorSolidHover = var(--color-error-500)
-  val colorBgOverlay = var(--color-gray-800)
-  val colorBgPrimary = var(--color-gray-950)
-  val colorBgPrimaryAlt = var(--color-bg-secondary)
-  val colorBgPrimaryHover = var(--color-gray-800)
-  val colorBgQuaternary = var(--color-gray-700)
-  val colorBgSecondary = var(--color-gray-900)
-  val colorBgSecondaryAlt = var(--color-bg-primary)
-  val colorBgSecondaryHover = var(--color-gray-800)
-  val colorBgSecondarySubtle = var(--color-gray-900)
-  val colorBgSuccessPrimary = var(--color-success-950)
-  val colorBgSuccessSecondary = var(--color-success-600)
-  val colorBgSuccessSolid = var(--color-success-600)
-  val colorBgTertiary = var(--color-gray-800)
-  val colorBgWarningPrimary = var(--color-warning-950)
-  val colorBgWarningSecondary = var(--color-warning-600)
-  val colorBgWarningSolid = var(--color-warning-600)
+  val colorBgActive = Color(0xff22262f)
+  val colorBgBrandPrimary = Color(0xff9e77ed)
+  val colorBgBrandPrimaryAlt = Color(0xff13161b)
+  val colorBgBrandSecondary = Color(0xff7f56d9)
+  val colorBgBrandSection = Color(0xff13161b)
+  val colorBgBrandSectionSubtle = Color(0xff0c0e12)
+  val colorBgBrandSolid = Color(0xff7f56d9)
+  val colorBgBrandSolidHover = Color(0xff9e77ed)
+  val colorBgDisabled = Color(0xff22262f)
+  val colorBgDisabledSubtle = Color(0xff13161b)
+  val colorBgErrorPrimary = Color(0xff55160c)
+  val colorBgErrorSecondary = Color(0xffd92d20)
+  val colorBgErrorSolid = Color(0xffd92d20)
+  val colorBgErrorSolidHover = Color(0xfff04438)
+  val colorBgOverlay = Color(0xff22262f)
+  val colorBgPrimary = Color(0xff0c0e12)
+  val colorBgPrimaryAlt = Color(0xff13161b)
+  val colorBgPrimaryHover = Color(0xff22262f)
+  val colorBgQuaternary = Color(0xff373a41)
+  val colorBgSecondary = Color(0xff13161b)
+  val colorBgSecondaryAlt = Color(0xff0c0e12)
+  val colorBgSecondaryHover = Color(0xff22262f)
+  val colorBgSecondarySubtle = Color(0xff13161b)
+  val colorBgSuccessPrimary = Color(0xff053321)
+  val colorBgSuccessSecondary = Color(0xff079455)
+  val colorBgSuccessSolid = Color(0xff079455)
+  val colorBgTertiary = Color(0xff22262f)
+  val colorBgWarningPrimary = Color(0xff4e1d09)
+  val colorBgWarningSecondary = Color(0xffdc6803)
+  val colorBgWarningSolid = Color(0xffdc6803)
   val colorBlack = Color(0xff000000)
   val colorBlue100 = Color(0xffd1e9ff)
   val colorBlue200 = Color(0xffb2ddff)
@@ -127,16 +127,16 @@ object AppColors {
   val colorBlueLight800 = Color(0xff065986)
   val colorBlueLight900 = Color(0xff0b4a6f)
   val colorBlueLight950 = Color(0xff062c41)
-  val colorBorderBrand = var(--color-brand-400)
-  val colorBorderBrandAlt = var(--color-gray-700)
-  val colorBorderDisabled = var(--color-gray-700)
-  val colorBorderDisabledSubtle = var(--color-gray-800)
-  val colorBorderError = var(--color-error-400)
-  val colorBorderErrorSubtle = var(--color-error-500)
-  val colorBorderPrimary = var(--color-gray-700)
-  val colorBorderSecondary = var(--color-gray-800)
-  val colorBorderSecondaryAlt = var(--color-gray-800)
-  val colorBorderTertiary = var(--color-gray-800)
+  val colorBorderBrand = Color(0xffb692f6)
+  val colorBorderBrandAlt = Color(0xff373a41)
+  val colorBorderDisabled = Color(0xff373a41)
+  val colorBorderDisabledSubtle = Color(0xff22262f)
+  val colorBorderError = Color(0xfff97066)
+  val colorBorderErrorSubtle = Color(0xfff04438)
+  val colorBorderPrimary = Color(0xff373a41)
+  val colorBorderSecondary = Color(0xff22262f)
+  val colorBorderSecondaryAlt = Color(0xff22262f)
+  val colorBorderTertiary = Color(0xff22262f)
   val colorBrand100 = Color(0xfff4ebff)
   val colorBrand200 = Color(0xffe9d7fe)
   val colorBrand25 = Color(0xfffcfaff)
@@ -149,10 +149,10 @@ object AppColors {
   val colorBrand800 = Color(0xff53389e)
   val colorBrand900 = Color(0xff42307d)
   val colorBrand950 = Color(0xff2c1c5f)
-  val colorButtonDestructivePrimaryIcon = var(--color-error-300)
-  val colorButtonDestructivePrimaryIconHover = var(--color-error-200)
-  val colorButtonPrimaryIcon = var(--color-brand-300)
-  val colorButtonPrimaryIconHover = var(--color-brand-200)
+  val colorButtonDestructivePrimaryIcon = Color(0xfffda29b)
+  val colorButtonDestructivePrimaryIconHover = Color(0xfffecdca)
+  val colorButtonPrimaryIcon = Color(0xffd6bbfb)
+  val colorButtonPrimaryIconHover = Color(0xffe9d7fe)
   val colorCyan100 = Color(0xffcff9fe)
   val colorCyan200 = Color(0xffa5f0fc)
   val colorCyan25 = Color(0xfff5feff)
@@ -177,35 +177,35 @@ object AppColors {
   val colorError800 = Color(0xff912018)
   val colorError900 = Color(0xff7a271a)
   val colorError950 = Color(0xff55160c)
-  val colorFeaturedIconLightFgBrand = var(--color-brand-200)
-  val colorFeaturedIconLightFgError = var(--color-error-200)
-  val colorFeaturedIconLightFgGray = var(--color-gray-200)
-  val colorFeaturedIconLightFgSuccess = var(--color-success-200)
-  val colorFeaturedIconLightFgWarning = var(--color-warning-200)
-  val colorFgBrandPrimary = var(--color-brand-500)
-  val colorFgBrandPrimaryAlt = var(--color-gray-300)
-  val colorFgBrandSecondary = var(--color-brand-500)
-  val colorFgBrandSecondaryAlt = var(--color-gray-600)
-  val colorFgBrandSecondaryHover = var(--color-gray-500)
-  val colorFgDisabled = var(--color-gray-500)
-  val colorFgDisabledSubtle = var(--color-gray-600)
-  val colorFgErrorPrimary = var(--color-error-500)
-  val colorFgErrorSecondary = var(--color-error-400)
-  val colorFgPrimary = var(--color-white)
-  val colorFgQuaternary = var(--color-gray-600)
-  val colorFgQuaternaryHover = var(--color-gray-500)
-  val colorFgSecondary = var(--color-gray-300)
-  val colorFgSecondaryHover = var(--color-gray-200)
-  val colorFgSuccessPrimary = var(--color-success-500)
-  val colorFgSuccessSecondary = var(--color-success-400)
-  val colorFgTertiary = var(--color-gray-400)
-  val colorFgTertiaryHover = var(--color-gray-300)
-  val colorFgWarningPrimary = var(--color-warning-500)
-  val colorFgWarningSecondary = var(--color-warning-400)
-  val colorFgWhite = var(--color-white)
-  val colorFocusRing = var(--color-brand-500)
-  val colorFooterButtonFg = var(--color-gray-300)
-  val colorFooterButtonFgHover = var(--color-gray-100)
+  val colorFeaturedIconLightFgBrand = Color(0xffe9d7fe)
+  val colorFeaturedIconLightFgError = Color(0xfffecdca)
+  val colorFeaturedIconLightFgGray = Color(0xffececed)
+  val colorFeaturedIconLightFgSuccess = Color(0xffabefc6)
+  val colorFeaturedIconLightFgWarning = Color(0xfffedf89)
+  val colorFgBrandPrimary = Color(0xff9e77ed)
+  val colorFgBrandPrimaryAlt = Color(0xffcecfd2)
+  val colorFgBrandSecondary = Color(0xff9e77ed)
+  val colorFgBrandSecondaryAlt = Color(0xff61656c)
+  val colorFgBrandSecondaryHover = Color(0xff85888e)
+  val colorFgDisabled = Color(0xff85888e)
+  val colorFgDisabledSubtle = Color(0xff61656c)
+  val colorFgErrorPrimary = Color(0xfff04438)
+  val colorFgErrorSecondary = Color(0xfff97066)
+  val colorFgPrimary = Color(0xffffffff)
+  val colorFgQuaternary = Color(0xff61656c)
+  val colorFgQuaternaryHover = Color(0xff85888e)
+  val colorFgSecondary = Color(0xffcecfd2)
+  val colorFgSecondaryHover = Color(0xffececed)
+  val colorFgSuccessPrimary = Color(0xff17b26a)
+  val colorFgSuccessSecondary = Color(0xff47cd89)
+  val colorFgTertiary = Color(0xff94979c)
+  val colorFgTertiaryHover = Color(0xffcecfd2)
+  val colorFgWarningPrimary = Color(0xfff79009)
+  val colorFgWarningSecondary = Color(0xfffdb022)
+  val colorFgWhite = Color(0xffffffff)
+  val colorFocusRing = Color(0xff9e77ed)
+  val colorFooterButtonFg = Color(0xffcecfd2)
+  val colorFooterButtonFgHover = Color(0xfff0f0f1)
   val colorFuchsia100 = Color(0xfffbe8ff)
   val colorFuchsia200 = Color(0xfff6d0fe)
   val colorFuchsia25 = Color(0xfffefaff)
@@ -338,8 +338,8 @@ object AppColors {
   val colorGreenLight800 = Color(0xff326212)
   val colorGreenLight900 = Color(0xff2b5314)
   val colorGreenLight950 = Color(0xff15290a)
-  val colorIconFgBrand = var(--color-gray-400)
-  val colorIconFgBrandOnBrand = var(--color-gray-400)
+  val colorIconFgBrand = Color(0xff94979c)
+  val colorIconFgBrandOnBrand = Color(0xff94979c)
   val colorIndigo100 = Color(0xffe0eaff)
   val colorIndigo200 = Color(0xffc7d7fe)
   val colorIndigo25 = Color(0xfff5f8ff)
@@ -364,10 +364,10 @@ object AppColors {
   val colorMoss800 = Color(0xff335015)
   val colorMoss900 = Color(0xff2b4212)
   val colorMoss950 = Color(0xff1a280b)
-  val colorNavItemButtonIconFg = var(--color-gray-400)
-  val colorNavItemButtonIconFgActive = var(--color-gray-300)
-  val colorNavItemIconFg = var(--color-gray-400)
-  val colorNavItemIconFgActive = var(--color-gray-300)
+  val colorNavItemButtonIconFg = Color(0xff94979c)
+  val colorNavItemButtonIconFgActive = Color(0xffcecfd2)
+  val colorNavItemIconFg = Color(0xff94979c)
+  val colorNavItemIconFgActive = Color(0xffcecfd2)
   val colorOrange100 = Color(0xfffdead7)
   val colorOrange200 = Color(0xfff9dbaf)
   val colorOrange25 = Color(0xfffefaf5)
@@ -428,9 +428,9 @@ object AppColors {
   val colorRose800 = Color(0xffa11043)
   val colorRose900 = Color(0xff89123e)
   val colorRose950 = Color(0xff510b24)
-  val colorScreenMockupBorder = var(--color-gray-700)
-  val colorSliderHandleBg = var(--color-fg-brand-primary)
-  val colorSliderHandleBorder = var(--color-bg-primary)
+  val colorScreenMockupBorder = Color(0xff373a41)
+  val colorSliderHandleBg = Color(0xff9e77ed)
+  val colorSliderHandleBorder = Color(0xff0c0e12)
   val colorSuccess100 = Color(0xffdcfae6)
   val colorSuccess200 = Color(0xffabefc6)
   val colorSuccess25 = Color(0xfff6fef9)
@@ -455,186 +455,186 @@ object AppColors {
   val colorTeal800 = Color(0xff125d56)
   val colorTeal900 = Color(0xff134e48)
   val colorTeal950 = Color(0xff0a2926)
-  val colorTextBrandPrimary = var(--color-gray-50)
-  val colorTextBrandSecondary = var(--color-gray-300)
-  val colorTextBrandSecondaryHover = var(--color-gray-200)
-  val colorTextBrandTertiary = var(--color-gray-400)
-  val colorTextBrandTertiaryAlt = var(--color-gray-50)
-  val colorTextDisabled = var(--color-gray-500)
-  val colorTextEditorIconFg = var(--color-gray-400)
-  val colorTextEditorIconFgActive = var(--color-white)
-  val colorTextErrorPrimary = var(--color-error-400)
-  val colorTextErrorPrimaryHover = var(--color-error-300)
-  val colorTextPlaceholder = var(--color-gray-500)
-  val colorTextPlaceholderSubtle = var(--color-gray-700)
-  val colorTextPrimary = var(--color-gray-50)
-  val colorTextPrimaryOnBrand = var(--color-gray-50)
-  val colorTextQuaternary = var(--color-gray-400)
-  val colorTextQuaternaryOnBrand = var(--color-gray-400)
-  val colorTextSecondary = var(--color-gray-300)
-  val colorTextSecondaryHover = var(--color-gray-200)
-  val colorTextSecondaryOnBrand = var(--color-gray-300)
-  val colorTextSuccessPrimary = var(--color-success-400)
-  val colorTextTertiary = var(--color-gray-400)
-  val colorTextTertiaryHover = var(--color-gray-300)
-  val colorTextTertiaryOnBrand = var(--color-gray-400)
-  val colorTextWarningPrimary = var(--color-warning-400)
-  val colorTextWhite = var(--color-white)
-  val colorToggleBorder = var(--color-transparent)
-  val colorToggleButtonFgDisabled = var(--color-gray-600)
-  val colorToggleSlimBorderPressed = var(--color-transparent)
-  val colorTooltipSupportingText = var(--color-gray-300)
+  val colorTextBrandPrimary = Color(0xfff7f7f7)
+  val colorTextBrandSecondary = Color(0xffcecfd2)
+  val colorTextBrandSecondaryHover = Color(0xffececed)
+  val colorTextBrandTertiary = Color(0xff94979c)
+  val colorTextBrandTertiaryAlt = Color(0xfff7f7f7)
+  val colorTextDisabled = Color(0xff85888e)
+  val colorTextEditorIconFg = Color(0xff94979c)
+  val colorTextEditorIconFgActive = Color(0xffffffff)
+  val colorTextErrorPrimary = Color(0xfff97066)
+  val colorTextErrorPrimaryHover = Color(0xfffda29b)
+  val colorTextPlaceholder = Color(0xff85888e)
+  val colorTextPlaceholderSubtle = Color(0xff373a41)
+  val colorTextPrimary = Color(0xfff7f7f7)
+  val colorTextPrimaryOnBrand = Color(0xfff7f7f7)
+  val colorTextQuaternary = Color(0xff94979c)
+  val colorTextQuaternaryOnBrand = Color(0xff94979c)
+  val colorTextSecondary = Color(0xffcecfd2)
+  val colorTextSecondaryHover = Color(0xffececed)
+  val colorTextSecondaryOnBrand = Color(0xffcecfd2)
+  val colorTextSuccessPrimary = Color(0xff47cd89)
+  val colorTextTertiary = Color(0xff94979c)
+  val colorTextTertiaryHover = Color(0xffcecfd2)
+  val colorTextTertiaryOnBrand = Color(0xff94979c)
+  val colorTextWarningPrimary = Color(0xfffdb022)
+  val colorTextWhite = Color(0xffffffff)
+  val colorToggleBorder = Color(0xff000000)
+  val colorToggleButtonFgDisabled = Color(0xff61656c)
+  val colorToggleSlimBorderPressed = Color(0xff000000)
+  val colorTooltipSupportingText = Color(0xffcecfd2)
   val colorTransparent = Color(0xff000000)
-  val colorUtilityBlue100 = var(--color-blue-900)
-  val colorUtilityBlue200 = var(--color-blue-800)
-  val colorUtilityBlue300 = var(--color-blue-700)
-  val colorUtilityBlue400 = var(--color-blue-600)
-  val colorUtilityBlue50 = var(--color-blue-950)
-  val colorUtilityBlue500 = var(--color-blue-500)
-  val colorUtilityBlue600 = var(--color-blue-400)
-  val colorUtilityBlue700 = var(--color-blue-300)
-  val colorUtilityBlueDark100 = var(--color-blue-dark-900)
-  val colorUtilityBlueDark200 = var(--color-blue-dark-800)
-  val colorUtilityBlueDark300 = var(--color-blue-dark-700)
-  val colorUtilityBlueDark400 = var(--color-blue-dark-600)
-  val colorUtilityBlueDark50 = var(--color-blue-dark-950)
-  val colorUtilityBlueDark500 = var(--color-blue-dark-500)
-  val colorUtilityBlueDark600 = var(--color-blue-dark-400)
-  val colorUtilityBlueDark700 = var(--color-blue-dark-300)
-  val colorUtilityBlueLight100 = var(--color-blue-light-900)
-  val colorUtilityBlueLight200 = var(--color-blue-light-800)
-  val colorUtilityBlueLight300 = var(--color-blue-light-700)
-  val colorUtilityBlueLight400 = var(--color-blue-light-600)
-  val colorUtilityBlueLight50 = var(--color-blue-light-950)
-  val colorUtilityBlueLight500 = var(--color-blue-light-500)
-  val colorUtilityBlueLight600 = var(--color-blue-light-400)
-  val colorUtilityBlueLight700 = var(--color-blue-light-300)
-  val colorUtilityBrand100 = var(--color-brand-900)
-  val colorUtilityBrand100Alt = var(--color-utility-gray-100)
-  val colorUtilityBrand200 = var(--color-brand-800)
-  val colorUtilityBrand200Alt = var(--color-utility-gray-200)
-  val colorUtilityBrand300 = var(--color-brand-700)
-  val colorUtilityBrand300Alt = var(--color-utility-gray-300)
-  val colorUtilityBrand400 = var(--color-brand-600)
-  val colorUtilityBrand400Alt = var(--color-utility-gray-400)
-  val colorUtilityBrand50 = var(--color-brand-950)
-  val colorUtilityBrand500 = var(--color-brand-500)
-  val colorUtilityBrand500Alt = var(--color-utility-gray-500)
-  val colorUtilityBrand50Alt = var(--color-utility-gray-50)
-  val colorUtilityBrand600 = var(--color-brand-400)
-  val colorUtilityBrand600Alt = var(--color-utility-gray-600)
-  val colorUtilityBrand700 = var(--color-brand-300)
-  val colorUtilityBrand700Alt = var(--color-utility-gray-700)
-  val colorUtilityBrand800 = var(--color-brand-200)
-  val colorUtilityBrand800Alt = var(--color-utility-gray-800)
-  val colorUtilityBrand900 = var(--color-brand-100)
-  val colorUtilityBrand900Alt = var(--color-utility-gray-900)
-  val colorUtilityError100 = var(--color-error-900)
-  val colorUtilityError200 = var(--color-error-800)
-  val colorUtilityError300 = var(--color-error-700)
-  val colorUtilityError400 = var(--color-error-600)
-  val colorUtilityError50 = var(--color-error-950)
-  val colorUtilityError500 = var(--color-error-500)
-  val colorUtilityError600 = var(--color-error-400)
-  val colorUtilityError700 = var(--color-error-300)
-  val colorUtilityFuchsia100 = var(--color-fuchsia-900)
-  val colorUtilityFuchsia200 = var(--color-fuchsia-800)
-  val colorUtilityFuchsia300 = var(--color-fuchsia-700)
-  val colorUtilityFuchsia400 = var(--color-fuchsia-600)
-  val colorUtilityFuchsia50 = var(--color-fuchsia-950)
-  val colorUtilityFuchsia500 = var(--color-fuchsia-500)
-  val colorUtilityFuchsia600 = var(--color-fuchsia-400)
-  val colorUtilityFuchsia700 = var(--color-fuchsia-300)
-  val colorUtilityGray100 = var(--color-gray-800)
-  val colorUtilityGray200 = var(--color-gray-700)
-  val colorUtilityGray300 = var(--color-gray-700)
-  val colorUtilityGray400 = var(--color-gray-600)
-  val colorUtilityGray50 = var(--color-gray-900)
-  val colorUtilityGray500 = var(--color-gray-500)
-  val colorUtilityGray600 = var(--color-gray-400)
-  val colorUtilityGray700 = var(--color-gray-300)
-  val colorUtilityGray800 = var(--color-gray-200)
-  val colorUtilityGray900 = var(--color-gray-100)
-  val colorUtilityGrayBlue100 = var(--color-gray-blue-900)
-  val colorUtilityGrayBlue200 = var(--color-gray-blue-800)
-  val colorUtilityGrayBlue300 = var(--color-gray-blue-700)
-  val colorUtilityGrayBlue400 = var(--color-gray-blue-600)
-  val colorUtilityGrayBlue50 = var(--color-gray-blue-950)
-  val colorUtilityGrayBlue500 = var(--color-gray-blue-500)
-  val colorUtilityGrayBlue600 = var(--color-gray-blue-400)
-  val colorUtilityGrayBlue700 = var(--color-gray-blue-300)
-  val colorUtilityGreen100 = var(--color-green-900)
-  val colorUtilityGreen200 = var(--color-green-800)
-  val colorUtilityGreen300 = var(--color-green-700)
-  val colorUtilityGreen400 = var(--color-green-600)
-  val colorUtilityGreen50 = var(--color-green-950)
-  val colorUtilityGreen500 = var(--color-green-500)
-  val colorUtilityGreen600 = var(--color-green-400)
-  val colorUtilityGreen700 = var(--color-green-300)
-  val colorUtilityIndigo100 = var(--color-indigo-900)
-  val colorUtilityIndigo200 = var(--color-indigo-800)
-  val colorUtilityIndigo300 = var(--color-indigo-700)
-  val colorUtilityIndigo400 = var(--color-indigo-600)
-  val colorUtilityIndigo50 = var(--color-indigo-950)
-  val colorUtilityIndigo500 = var(--color-indigo-500)
-  val colorUtilityIndigo600 = var(--color-indigo-400)
-  val colorUtilityIndigo700 = var(--color-indigo-300)
-  val colorUtilityOrange100 = var(--color-orange-900)
-  val colorUtilityOrange200 = var(--color-orange-800)
-  val colorUtilityOrange300 = var(--color-orange-700)
-  val colorUtilityOrange400 = var(--color-orange-600)
-  val colorUtilityOrange50 = var(--color-orange-950)
-  val colorUtilityOrange500 = var(--color-orange-500)
-  val colorUtilityOrange600 = var(--color-orange-400)
-  val colorUtilityOrange700 = var(--color-orange-300)
-  val colorUtilityOrangeDark100 = var(--color-orange-dark-900)
-  val colorUtilityOrangeDark200 = var(--color-orange-dark-800)
-  val colorUtilityOrangeDark300 = var(--color-orange-dark-700)
-  val colorUtilityOrangeDark400 = var(--color-orange-dark-600)
-  val colorUtilityOrangeDark50 = var(--color-orange-dark-950)
-  val colorUtilityOrangeDark500 = var(--color-orange-dark-500)
-  val colorUtilityOrangeDark600 = var(--color-orange-dark-400)
-  val colorUtilityOrangeDark700 = var(--color-orange-dark-300)
-  val colorUtilityPink100 = var(--color-pink-900)
-  val colorUtilityPink200 = var(--color-pink-800)
-  val colorUtilityPink300 = var(--color-pink-700)
-  val colorUtilityPink400 = var(--color-pink-600)
-  val colorUtilityPink50 = var(--color-pink-950)
-  val colorUtilityPink500 = var(--color-pink-500)
-  val colorUtilityPink600 = var(--color-pink-400)
-  val colorUtilityPink700 = var(--color-pink-300)
-  val colorUtilityPurple100 = var(--color-purple-900)
-  val colorUtilityPurple200 = var(--color-purple-800)
-  val colorUtilityPurple300 = var(--color-purple-700)
-  val colorUtilityPurple400 = var(--color-purple-600)
-  val colorUtilityPurple50 = var(--color-purple-950)
-  val colorUtilityPurple500 = var(--color-purple-500)
-  val colorUtilityPurple600 = var(--color-purple-400)
-  val colorUtilityPurple700 = var(--color-purple-300)
-  val colorUtilitySuccess100 = var(--color-success-900)
-  val colorUtilitySuccess200 = var(--color-success-800)
-  val colorUtilitySuccess300 = var(--color-success-700)
-  val colorUtilitySuccess400 = var(--color-success-600)
-  val colorUtilitySuccess50 = var(--color-success-950)
-  val colorUtilitySuccess500 = var(--color-success-500)
-  val colorUtilitySuccess600 = var(--color-success-400)
-  val colorUtilitySuccess700 = var(--color-success-300)
-  val colorUtilityWarning100 = var(--color-warning-900)
-  val colorUtilityWarning200 = var(--color-warning-800)
-  val colorUtilityWarning300 = var(--color-warning-700)
-  val colorUtilityWarning400 = var(--color-warning-600)
-  val colorUtilityWarning50 = var(--color-warning-950)
-  val colorUtilityWarning500 = var(--color-warning-500)
-  val colorUtilityWarning600 = var(--color-warning-400)
-  val colorUtilityWarning700 = var(--color-warning-300)
-  val colorUtilityYellow100 = var(--color-yellow-900)
-  val colorUtilityYellow200 = var(--color-yellow-800)
-  val colorUtilityYellow300 = var(--color-yellow-700)
-  val colorUtilityYellow400 = var(--color-yellow-600)
-  val colorUtilityYellow50 = var(--color-yellow-950)
-  val colorUtilityYellow500 = var(--color-yellow-500)
-  val colorUtilityYellow600 = var(--color-yellow-400)
-  val colorUtilityYellow700 = var(--color-yellow-300)
+  val colorUtilityBlue100 = Color(0xff194185)
+  val colorUtilityBlue200 = Color(0xff1849a9)
+  val colorUtilityBlue300 = Color(0xff175cd3)
+  val colorUtilityBlue400 = Color(0xff1570ef)
+  val colorUtilityBlue50 = Color(0xff102a56)
+  val colorUtilityBlue500 = Color(0xff2e90fa)
+  val colorUtilityBlue600 = Color(0xff53b1fd)
+  val colorUtilityBlue700 = Color(0xff84caff)
+  val colorUtilityBlueDark100 = Color(0xff00359e)
+  val colorUtilityBlueDark200 = Color(0xff0040c1)
+  val colorUtilityBlueDark300 = Color(0xff004eeb)
+  val colorUtilityBlueDark400 = Color(0xff155eef)
+  val colorUtilityBlueDark50 = Color(0xff002266)
+  val colorUtilityBlueDark500 = Color(0xff2970ff)
+  val colorUtilityBlueDark600 = Color(0xff528bff)
+  val colorUtilityBlueDark700 = Color(0xff84adff)
+  val colorUtilityBlueLight100 = Color(0xff0b4a6f)
+  val colorUtilityBlueLight200 = Color(0xff065986)
+  val colorUtilityBlueLight300 = Color(0xff026aa2)
+  val colorUtilityBlueLight400 = Color(0xff0086c9)
+  val colorUtilityBlueLight50 = Color(0xff062c41)
+  val colorUtilityBlueLight500 = Color(0xff0ba5ec)
+  val colorUtilityBlueLight600 = Color(0xff36bffa)
+  val colorUtilityBlueLight700 = Color(0xff7cd4fd)
+  val colorUtilityBrand100 = Color(0xff42307d)
+  val colorUtilityBrand100Alt = Color(0xff22262f)
+  val colorUtilityBrand200 = Color(0xff53389e)
+  val colorUtilityBrand200Alt = Color(0xff373a41)
+  val colorUtilityBrand300 = Color(0xff6941c6)
+  val colorUtilityBrand300Alt = Color(0xff373a41)
+  val colorUtilityBrand400 = Color(0xff7f56d9)
+  val colorUtilityBrand400Alt = Color(0xff61656c)
+  val colorUtilityBrand50 = Color(0xff2c1c5f)
+  val colorUtilityBrand500 = Color(0xff9e77ed)
+  val colorUtilityBrand500Alt = Color(0xff85888e)
+  val colorUtilityBrand50Alt = Color(0xff13161b)
+  val colorUtilityBrand600 = Color(0xffb692f6)
+  val colorUtilityBrand600Alt = Color(0xff94979c)
+  val colorUtilityBrand700 = Color(0xffd6bbfb)
+  val colorUtilityBrand700Alt = Color(0xffcecfd2)
+  val colorUtilityBrand800 = Color(0xffe9d7fe)
+  val colorUtilityBrand800Alt = Color(0xffececed)
+  val colorUtilityBrand900 = Color(0xfff4ebff)
+  val colorUtilityBrand900Alt = Color(0xfff0f0f1)
+  val colorUtilityError100 = Color(0xff7a271a)
+  val colorUtilityError200 = Color(0xff912018)
+  val colorUtilityError300 = Color(0xffb42318)
+  val colorUtilityError400 = Color(0xffd92d20)
+  val colorUtilityError50 = Color(0xff55160c)
+  val colorUtilityError500 = Color(0xfff04438)
+  val colorUtilityError600 = Color(0xfff97066)
+  val colorUtilityError700 = Color(0xfffda29b)
+  val colorUtilityFuchsia100 = Color(0xff6f1877)
+  val colorUtilityFuchsia200 = Color(0xff821890)
+  val colorUtilityFuchsia300 = Color(0xff9f1ab1)
+  val colorUtilityFuchsia400 = Color(0xffba24d5)
+  val colorUtilityFuchsia50 = Color(0xff47104c)
+  val colorUtilityFuchsia500 = Color(0xffd444f1)
+  val colorUtilityFuchsia600 = Color(0xffe478fa)
+  val colorUtilityFuchsia700 = Color(0xffeeaafd)
+  val colorUtilityGray100 = Color(0xff22262f)
+  val colorUtilityGray200 = Color(0xff373a41)
+  val colorUtilityGray300 = Color(0xff373a41)
+  val colorUtilityGray400 = Color(0xff61656c)
+  val colorUtilityGray50 = Color(0xff13161b)
+  val colorUtilityGray500 = Color(0xff85888e)
+  val colorUtilityGray600 = Color(0xff94979c)
+  val colorUtilityGray700 = Color(0xffcecfd2)
+  val colorUtilityGray800 = Color(0xffececed)
+  val colorUtilityGray900 = Color(0xfff0f0f1)
+  val colorUtilityGrayBlue100 = Color(0xff101323)
+  val colorUtilityGrayBlue200 = Color(0xff293056)
+  val colorUtilityGrayBlue300 = Color(0xff363f72)
+  val colorUtilityGrayBlue400 = Color(0xff3e4784)
+  val colorUtilityGrayBlue50 = Color(0xff0d0f1c)
+  val colorUtilityGrayBlue500 = Color(0xff4e5ba6)
+  val colorUtilityGrayBlue600 = Color(0xff717bbc)
+  val colorUtilityGrayBlue700 = Color(0xffb3b8db)
+  val colorUtilityGreen100 = Color(0xff084c2e)
+  val colorUtilityGreen200 = Color(0xff095c37)
+  val colorUtilityGreen300 = Color(0xff087443)
+  val colorUtilityGreen400 = Color(0xff099250)
+  val colorUtilityGreen50 = Color(0xff052e1c)
+  val colorUtilityGreen500 = Color(0xff16b364)
+  val colorUtilityGreen600 = Color(0xff3ccb7f)
+  val colorUtilityGreen700 = Color(0xff73e2a3)
+  val colorUtilityIndigo100 = Color(0xff2d3282)
+  val colorUtilityIndigo200 = Color(0xff2d31a6)
+  val colorUtilityIndigo300 = Color(0xff3538cd)
+  val colorUtilityIndigo400 = Color(0xff444ce7)
+  val colorUtilityIndigo50 = Color(0xff1f235b)
+  val colorUtilityIndigo500 = Color(0xff6172f3)
+  val colorUtilityIndigo600 = Color(0xff8098f9)
+  val colorUtilityIndigo700 = Color(0xffa4bcfd)
+  val colorUtilityOrange100 = Color(0xff772917)
+  val colorUtilityOrange200 = Color(0xff932f19)
+  val colorUtilityOrange300 = Color(0xffb93815)
+  val colorUtilityOrange400 = Color(0xffe04f16)
+  val colorUtilityOrange50 = Color(0xff511c10)
+  val colorUtilityOrange500 = Color(0xffef6820)
+  val colorUtilityOrange600 = Color(0xfff38744)
+  val colorUtilityOrange700 = Color(0xfff7b27a)
+  val colorUtilityOrangeDark100 = Color(0xff771a0d)
+  val colorUtilityOrangeDark200 = Color(0xff97180c)
+  val colorUtilityOrangeDark300 = Color(0xffbc1b06)
+  val colorUtilityOrangeDark400 = Color(0xffe62e05)
+  val colorUtilityOrangeDark50 = Color(0xff57130a)
+  val colorUtilityOrangeDark500 = Color(0xffff4405)
+  val colorUtilityOrangeDark600 = Color(0xffff692e)
+  val colorUtilityOrangeDark700 = Color(0xffff9c66)
+  val colorUtilityPink100 = Color(0xff851651)
+  val colorUtilityPink200 = Color(0xff9e165f)
+  val colorUtilityPink300 = Color(0xffc11574)
+  val colorUtilityPink400 = Color(0xffdd2590)
+  val colorUtilityPink50 = Color(0xff4e0d30)
+  val colorUtilityPink500 = Color(0xffee46bc)
+  val colorUtilityPink600 = Color(0xfff670c7)
+  val colorUtilityPink700 = Color(0xfffaa7e0)
+  val colorUtilityPurple100 = Color(0xff3e1c96)
+  val colorUtilityPurple200 = Color(0xff4a1fb8)
+  val colorUtilityPurple300 = Color(0xff5925dc)
+  val colorUtilityPurple400 = Color(0xff6938ef)
+  val colorUtilityPurple50 = Color(0xff27115f)
+  val colorUtilityPurple500 = Color(0xff7a5af8)
+  val colorUtilityPurple600 = Color(0xff9b8afb)
+  val colorUtilityPurple700 = Color(0xffbdb4fe)
+  val colorUtilitySuccess100 = Color(0xff074d31)
+  val colorUtilitySuccess200 = Color(0xff085d3a)
+  val colorUtilitySuccess300 = Color(0xff067647)
+  val colorUtilitySuccess400 = Color(0xff079455)
+  val colorUtilitySuccess50 = Color(0xff053321)
+  val colorUtilitySuccess500 = Color(0xff17b26a)
+  val colorUtilitySuccess600 = Color(0xff47cd89)
+  val colorUtilitySuccess700 = Color(0xff75e0a7)
+  val colorUtilityWarning100 = Color(0xff7a2e0e)
+  val colorUtilityWarning200 = Color(0xff93370d)
+  val colorUtilityWarning300 = Color(0xffb54708)
+  val colorUtilityWarning400 = Color(0xffdc6803)
+  val colorUtilityWarning50 = Color(0xff4e1d09)
+  val colorUtilityWarning500 = Color(0xfff79009)
+  val colorUtilityWarning600 = Color(0xfffdb022)
+  val colorUtilityWarning700 = Color(0xfffec84b)
+  val colorUtilityYellow100 = Color(0xff713b12)
+  val colorUtilityYellow200 = Color(0xff854a0e)
+  val colorUtilityYellow300 = Color(0xffa15c07)
+  val colorUtilityYellow400 = Color(0xffca8504)
+  val colorUtilityYellow50 = Color(0xff542c0d)
+  val colorUtilityYellow500 = Color(0xffeaaa08)
+  val colorUtilityYellow600 = Color(0xfffac515)
+  val colorUtilityYellow700 = Color(0xfffde272)
   val colorViolet100 = Color(0xffece9fe)
   val colorViolet200 = Color(0xffddd6fe)
   val colorViolet25 = Color(0xfffbfaff)
@@ -672,48 +672,48 @@ object AppColors {
   val colorYellow800 = Color(0xff854a0e)
   val colorYellow900 = Color(0xff713b12)
   val colorYellow950 = Color(0xff542c0d)
-  val outlineColorBrand = var(--color-border-brand)
-  val outlineColorBrandAlt = var(--color-border-brand_alt)
-  val outlineColorDisabled = var(--color-border-disabled)
-  val outlineColorDisabledSubtle = var(--color-border-disabled_subtle)
-  val outlineColorError = var(--color-border-error)
-  val outlineColorErrorSubtle = var(--color-border-error_subtle)
-  val outlineColorPrimary = var(--color-border-primary)
-  val outlineColorSecondary = var(--color-border-secondary)
-  val outlineColorSecondaryAlt = var(--color-border-secondary_alt)
-  val outlineColorTertiary = var(--color-border-tertiary)
-  val ringColorBgBrandSolid = var(--color-bg-brand-solid)
-  val ringColorBrand = var(--color-border-brand)
-  val ringColorBrandAlt = var(--color-border-brand_alt)
-  val ringColorDisabled = var(--color-border-disabled)
-  val ringColorDisabledSubtle = var(--color-border-disabled_subtle)
-  val ringColorError = var(--color-border-error)
-  val ringColorErrorSubtle = var(--color-border-error_subtle)
-  val ringColorPrimary = var(--color-border-primary)
-  val ringColorSecondary = var(--color-border-secondary)
-  val ringColorSecondaryAlt = var(--color-border-secondary_alt)
-  val ringColorTertiary = var(--color-border-tertiary)
-  val textColorBrandPrimary = var(--color-text-brand-primary)
-  val textColorBrandSecondary = var(--color-text-brand-secondary)
-  val textColorBrandSecondaryHover = var(--color-text-brand-secondary_hover)
-  val textColorBrandTertiary = var(--color-text-brand-tertiary)
-  val textColorBrandTertiaryAlt = var(--color-text-brand-tertiary_alt)
-  val textColorDisabled = var(--color-text-disabled)
-  val textColorErrorPrimary = var(--color-text-error-primary)
-  val textColorErrorPrimaryHover = var(--color-text-error-primary_hover)
-  val textColorPlaceholder = var(--color-text-placeholder)
-  val textColorPlaceholderSubtle = var(--color-text-placeholder_subtle)
-  val textColorPrimary = var(--color-text-primary)
-  val textColorPrimaryOnBrand = var(--color-text-primary_on-brand)
-  val textColorQuaternary = var(--color-text-quaternary)
-  val textColorQuaternaryOnBrand = var(--color-text-quaternary_on-brand)
-  val textColorSecondary = var(--color-text-secondary)
-  val textColorSecondaryHover = var(--color-text-secondary_hover)
-  val textColorSecondaryOnBrand = var(--color-text-secondary_on-brand)
-  val textColorSuccessPrimary = var(--color-text-success-primary)
-  val textColorTertiary = var(--color-text-tertiary)
-  val textColorTertiaryHover = var(--color-text-tertiary_hover)
-  val textColorTertiaryOnBrand = var(--color-text-tertiary_on-brand)
-  val textColorTooltipSupportingText = var(--color-tooltip-supporting-text)
-  val textColorWarningPrimary = var(--color-text-warning-primary)
+  val outlineColorBrand = Color(0xffb692f6)
+  val outlineColorBrandAlt = Color(0xff373a41)
+  val outlineColorDisabled = Color(0xff373a41)
+  val outlineColorDisabledSubtle = Color(0xff22262f)
+  val outlineColorError = Color(0xfff97066)
+  val outlineColorErrorSubtle = Color(0xfff04438)
+  val outlineColorPrimary = Color(0xff373a41)
+  val outlineColorSecondary = Color(0xff22262f)
+  val outlineColorSecondaryAlt = Color(0xff22262f)
+  val outlineColorTertiary = Color(0xff22262f)
+  val ringColorBgBrandSolid = Color(0xff7f56d9)
+  val ringColorBrand = Color(0xffb692f6)
+  val ringColorBrandAlt = Color(0xff373a41)
+  val ringColorDisabled = Color(0xff373a41)
+  val ringColorDisabledSubtle = Color(0xff22262f)
+  val ringColorError = Color(0xfff97066)
+  val ringColorErrorSubtle = Color(0xfff04438)
+  val ringColorPrimary = Color(0xff373a41)
+  val ringColorSecondary = Color(0xff22262f)
+  val ringColorSecondaryAlt = Color(0xff22262f)
+  val ringColorTertiary = Color(0xff22262f)
+  val textColorBrandPrimary = Color(0xfff7f7f7)
+  val textColorBrandSecondary = Color(0xffcecfd2)
+  val textColorBrandSecondaryHover = Color(0xffececed)
+  val textColorBrandTertiary = Color(0xff94979c)
+  val textColorBrandTertiaryAlt = Color(0xfff7f7f7)
+  val textColorDisabled = Color(0xff85888e)
+  val textColorErrorPrimary = Color(0xfff97066)
+  val textColorErrorPrimaryHover = Color(0xfffda29b)
+  val textColorPlaceholder = Color(0xff85888e)
+  val textColorPlaceholderSubtle = Color(0xff373a41)
+  val textColorPrimary = Color(0xfff7f7f7)
+  val textColorPrimaryOnBrand = Color(0xfff7f7f7)
+  val textColorQuaternary = Color(0xff94979c)
+  val textColorQuaternaryOnBrand = Color(0xff94979c)
+  val textColorSecondary = Color(0xffcecfd2)
+  val textColorSecondaryHover = Color(0xffececed)
+  val textColorSecondaryOnBrand = Color(0xffcecfd2)
+  val textColorSuccessPrimary = Color(0xff47cd89)
+  val textColorTertiary = Color(0xff94979c)
+  val textColorTertiaryHover = Color(0xffcecfd2)
+  val textColorTertiaryOnBrand = Color(0xff94979c)
+  val textColorTooltipSupportingText = Color(0xffcecfd2)
+  val textColorWarningPrimary = Color(0xfffdb022)
 }
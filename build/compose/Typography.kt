@@ -10,33 +10,33 @@ import androidx.compose.ui.graphics.Color
 import androidx.compose.ui.unit.*
 
 object AppTypography {
-  val fontBody = var(--font-inter, "Inter"), -apple-system, "Segoe UI", Roboto, Arial, sans-serif
-  val fontDisplay = var(--font-inter, "Inter"), -apple-system, "Segoe UI", Roboto, Arial, sans-serif
+  val fontBody = "Inter", -apple-system, "Segoe UI", Roboto, Arial, sans-serif
+  val fontDisplay = "Inter", -apple-system, "Segoe UI", Roboto, Arial, sans-serif
   val fontMono = ui-monospace, "Roboto Mono", SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace
-  val textDisplay2xl = calc(var(--spacing) * 18)
+  val textDisplay2xl = 72.00.sp
   val textDisplay2xlletterSpacing = -1.44px
-  val textDisplay2xllineHeight = calc(var(--spacing) * 22.5)
-  val textDisplayLg = calc(var(--spacing) * 12)
+  val textDisplay2xllineHeight = 5.625rem
+  val textDisplayLg = 48.00.sp
   val textDisplayLgletterSpacing = -0.96px
-  val textDisplayLglineHeight = calc(var(--spacing) * 15)
-  val textDisplayMd = calc(var(--spacing) * 9)
+  val textDisplayLglineHeight = 3.75rem
+  val textDisplayMd = 36.00.sp
   val textDisplayMdletterSpacing = -0.72px
-  val textDisplayMdlineHeight = calc(var(--spacing) * 11)
-  val textDisplaySm = calc(var(--spacing) * 7.5)
-  val textDisplaySmlineHeight = calc(var(--spacing) * 9.5)
-  val textDisplayXl = calc(var(--spacing) * 15)
+  val textDisplayMdlineHeight = 2.75rem
+  val textDisplaySm = 30.00.sp
+  val textDisplaySmlineHeight = 2.375rem
+  val textDisplayXl = 60.00.sp
   val textDisplayXlletterSpacing = -1.2px
-  val textDisplayXllineHeight = calc(var(--spacing) * 18)
-  val textDisplayXs = calc(var(--spacing) * 6)
-  val textDisplayXslineHeight = calc(var(--spacing) * 8)
-  val textLg = calc(var(--spacing) * 4.5)
-  val textLglineHeight = calc(var(--spacing) * 7)
-  val textMd = calc(var(--spacing) * 4)
-  val textMdlineHeight = calc(var(--spacing) * 6)
-  val textSm = calc(var(--spacing) * 3.5)
-  val textSmlineHeight = calc(var(--spacing) * 5)
-  val textXl = calc(var(--spacing) * 5)
-  val textXllineHeight = calc(var(--spacing) * 7.5)
-  val textXs = calc(var(--spacing) * 3)
-  val textXslineHeight = calc(var(--spacing) * 4.5)
+  val textDisplayXllineHeight = 4.5rem
+  val textDisplayXs = 24.00.sp
+  val textDisplayXslineHeight = 2rem
+  val textLg = 18.00.sp
+  val textLglineHeight = 1.75rem
+  val textMd = 16.00.sp
+  val textMdlineHeight = 1.5rem
+  val textSm = 14.00.sp
+  val textSmlineHeight = 1.25rem
+  val textXl = 20.00.sp
+  val textXllineHeight = 1.875rem
+  val textXs = 12.00.sp
+  val textXslineHeight = 1.125rem
 }
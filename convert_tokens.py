@@ -3,10 +3,35 @@
 Convert CSS custom properties from token.md to Style Dictionary JSON format
 """
 
+import io
 import json
 import re
+import sys
 from pathlib import Path
 
+# Type inference rules are shared with the design system scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent / '.design-system-expert' / 'scripts'))
+
+from type_inference import STYLE_DICTIONARY_TYPES  # noqa: E402
+
+# CSS custom property declaration: --name: value;
+DECLARATION_PATTERN = re.compile(r'--([a-zA-Z0-9_-]+):\s*([^;]+);')
+
+# Block-structure tokens for scope-aware parsing: comments (possibly still
+# open at the end of a chunk), declarations, braces and plain statements
+SCOPE_TOKEN_PATTERN = re.compile(
+    r'(/\*.*?(?:\*/|\Z))'
+    r'|--([a-zA-Z0-9_-]+):\s*([^;{}]+);'
+    r'|([{};])',
+    re.S
+)
+
+# Characters read from the input per chunk when streaming
+CHUNK_SIZE = 64 * 1024
+
+# Scope whose tree the other scopes are overlaid on
+BASE_SCOPE = '@theme'
+
 def parse_css_value(value):
     """Parse CSS value and convert to appropriate format"""
     value = value.strip().rstrip(';')
@@ -74,62 +99,191 @@ def merge_dicts(dict1, dict2):
     return dict1
 
 def determine_token_type(name, value):
-    """Determine the token type based on name and value"""
-    name_lower = name.lower()
-    
-    if 'color' in name_lower or 'bg' in name_lower or 'fg' in name_lower or 'border' in name_lower or 'text' in name_lower:
-        return 'color'
-    elif 'shadow' in name_lower:
-        return 'boxShadow'
-    elif 'radius' in name_lower:
-        return 'borderRadius'
-    elif 'font-family' in name_lower or 'font' in name_lower and ('inter' in value.lower() or 'mono' in value.lower()):
-        return 'fontFamily'
-    elif 'spacing' in name_lower or 'width' in name_lower or 'height' in name_lower or 'breakpoint' in name_lower:
-        return 'dimension'
-    elif 'line-height' in name_lower:
-        return 'lineHeight'
-    elif 'letter-spacing' in name_lower:
-        return 'letterSpacing'
-    elif 'text-' in name_lower and ('xs' in name_lower or 'sm' in name_lower or 'md' in name_lower or 'lg' in name_lower or 'xl' in name_lower or 'display' in name_lower):
-        return 'fontSize'
-    elif 'animate' in name_lower:
-        return 'animation'
+    """Determine the token type based on name and value (rules in type_inference.py)"""
+    return STYLE_DICTIONARY_TYPES.infer_type(name, value)
+
+def insert_token(tokens, parts, value, token_type):
+    """Insert a single token into the tree in place, creating branches as needed"""
+    current = tokens
+    
+    for part in parts[:-1]:
+        child = current.get(part)
+        if not isinstance(child, dict):
+            child = current[part] = {}
+        current = child
+    
+    # Update an existing node in place so nested tokens below it are kept
+    leaf = current.get(parts[-1])
+    if isinstance(leaf, dict):
+        leaf["value"] = value
+        leaf["type"] = token_type
     else:
-        return 'other'
+        current[parts[-1]] = {
+            "value": value,
+            "type": token_type
+        }
+    
+    return tokens
 
-def parse_css_tokens(css_content):
-    """Parse CSS custom properties and convert to JSON structure"""
-    tokens = {}
+def iter_css_declarations(stream, chunk_size=CHUNK_SIZE):
+    """Yield (name, value) pairs for CSS custom properties, reading the stream chunk by chunk"""
+    buffer = ''
     
-    # Find all CSS custom property declarations
-    pattern = r'--([a-zA-Z0-9_-]+):\s*([^;]+);'
-    matches = re.findall(pattern, css_content)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+        
+        consumed = 0
+        for match in DECLARATION_PATTERN.finditer(buffer):
+            yield match.group(1), match.group(2)
+            consumed = match.end()
+        
+        # Nothing before the last ';' can still start a declaration, so only
+        # the unterminated tail is carried over into the next chunk
+        buffer = buffer[max(consumed, buffer.rfind(';') + 1):]
+
+def parse_css_stream(stream, chunk_size=CHUNK_SIZE):
+    """Parse CSS custom properties from a text stream into a JSON structure"""
+    tokens = {}
     
-    for var_name, value in matches:
-        full_name = f"--{var_name}"
+    for var_name, value in iter_css_declarations(stream, chunk_size):
         parsed_value = parse_css_value(value)
         token_type = determine_token_type(var_name, parsed_value)
         
-        parts, original_name = parse_token_name(full_name)
-        
-        # Create nested structure
-        nested = create_nested_dict(parts, parsed_value, token_type)
+        parts, original_name = parse_token_name(f"--{var_name}")
         
-        # Merge into main tokens dict
-        tokens = merge_dicts(tokens, nested)
+        insert_token(tokens, parts, parsed_value, token_type)
     
     return tokens
 
+def overlay_token(tree, parts, value, token_type, copied):
+    """Insert a token into an overlay tree, copying only the branches on its path"""
+    current = tree
+    
+    for part in parts[:-1]:
+        child = current.get(part)
+        if not isinstance(child, dict):
+            child = current[part] = {}
+            copied.add(id(child))
+        elif id(child) not in copied:
+            child = current[part] = dict(child)
+            copied.add(id(child))
+        current = child
+    
+    leaf = current.get(parts[-1])
+    if isinstance(leaf, dict) and id(leaf) in copied:
+        leaf["value"] = value
+        leaf["type"] = token_type
+    else:
+        leaf = dict(leaf) if isinstance(leaf, dict) else {}
+        leaf["value"] = value
+        leaf["type"] = token_type
+        current[parts[-1]] = leaf
+        copied.add(id(leaf))
+    
+    return tree
+
+def iter_scoped_declarations(stream, chunk_size=CHUNK_SIZE):
+    """Yield (scope, name, value) for CSS custom properties, tracking brace depth
+    
+    The scope is the whitespace-normalized prelude of the innermost block, such
+    as '@theme' or '.dark-mode'. Declarations outside any block get scope ''.
+    """
+    buffer = ''
+    scopes = []
+    prelude_start = 0
+    eof = False
+    
+    while not eof:
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+        
+        consumed = 0
+        for match in SCOPE_TOKEN_PATTERN.finditer(buffer):
+            comment, name, value, punct = match.groups()
+            if comment is not None:
+                # Wait for the rest of a comment cut off by the chunk boundary
+                if not comment.endswith('*/') and not eof:
+                    break
+            elif name is not None:
+                yield (scopes[-1] if scopes else ''), name, value
+            elif punct == '{':
+                prelude = buffer[prelude_start:match.start()]
+                scopes.append(' '.join(SCOPE_TOKEN_PATTERN.sub(' ', prelude).split()))
+            elif punct == '}':
+                if scopes:
+                    scopes.pop()
+            consumed = prelude_start = match.end()
+        
+        buffer = buffer[consumed:]
+        prelude_start = 0
+
+def group_scoped_declarations(stream, chunk_size=CHUNK_SIZE):
+    """Collect the (name, value) declarations of each scope, in source order"""
+    declarations = {}
+    
+    for scope, var_name, value in iter_scoped_declarations(stream, chunk_size):
+        declarations.setdefault(scope, []).append((var_name, value))
+    
+    return declarations
+
+def build_scope_tree(declarations, base=None):
+    """Build the token tree of one scope from its (name, value) declarations
+    
+    With a base tree, the declarations are overlaid on it: branches they do
+    not override are shared with the base tree and must be treated as read-only.
+    """
+    tree = {} if base is None else dict(base)
+    copied = {id(tree)}
+    
+    for var_name, value in declarations:
+        parsed_value = parse_css_value(value)
+        token_type = determine_token_type(var_name, parsed_value)
+        parts, original_name = parse_token_name(f"--{var_name}")
+        
+        if base is None:
+            insert_token(tree, parts, parsed_value, token_type)
+        else:
+            overlay_token(tree, parts, parsed_value, token_type, copied)
+    
+    return tree
+
+def parse_css_scopes(stream, chunk_size=CHUNK_SIZE, base_scope=BASE_SCOPE):
+    """Parse CSS custom properties into one token tree per selector or at-rule scope
+    
+    Every scope other than base_scope is overlaid on the base tree, so it holds
+    the full effective token set for that scope. Branches a scope does not
+    override are shared with the base tree and must be treated as read-only.
+    """
+    declarations = group_scoped_declarations(stream, chunk_size)
+    
+    base = build_scope_tree(declarations.pop(base_scope, []))
+    trees = {base_scope: base}
+    for scope, scope_declarations in declarations.items():
+        trees[scope] = build_scope_tree(scope_declarations, base)
+    
+    return trees
+
+def scope_file_suffix(scope):
+    """Turn a scope prelude such as '.dark-mode' into a file name suffix"""
+    return re.sub(r'[^a-zA-Z0-9]+', '-', scope).strip('-') or 'global'
+
+def parse_css_tokens(css_content):
+    """Parse CSS custom properties and convert to JSON structure"""
+    return parse_css_stream(io.StringIO(css_content))
+
 def main():
     # Read the token.md file
     token_file = Path('/Users/tatrunghieu/Desktop/Vibe_coding/design system/token.md')
     
+    # Parse tokens, one tree per scope
     with open(token_file, 'r', encoding='utf-8') as f:
-        css_content = f.read()
+        scopes = parse_css_scopes(f)
     
-    # Parse tokens
-    tokens = parse_css_tokens(css_content)
+    tokens = scopes[BASE_SCOPE]
     
     # Write to JSON file
     output_file = Path('/Users/tatrunghieu/Desktop/Vibe_coding/design system/tokens.json')
@@ -139,6 +293,15 @@ def main():
     
     print(f"✅ Successfully converted {len(tokens)} token categories to {output_file}")
     print(f"📊 Token categories: {', '.join(sorted(tokens.keys()))}")
+    
+    # Write the other scopes (e.g. .dark-mode) next to it
+    for scope, scope_tokens in scopes.items():
+        if scope == BASE_SCOPE:
+            continue
+        scope_file = output_file.with_name(f"{output_file.stem}.{scope_file_suffix(scope)}.json")
+        with open(scope_file, 'w', encoding='utf-8') as f:
+            json.dump(scope_tokens, f, indent=4, ensure_ascii=False)
+        print(f"🌗 Scope '{scope}' written to {scope_file}")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the file permissions of generated files
+Files moved into place from a temporary file must get the permissions
+open() would give them under the current umask, not mkstemp's 0600.
+
+Usage:
+    python -m unittest discover -s tests
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from build_cache import write_if_changed  # noqa: E402
+from lazy_tokens import LazyTokens  # noqa: E402
+
+
+@unittest.skipIf(os.name != 'posix', 'POSIX file modes only')
+class GeneratedFileModeTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.umask = os.umask(0o027)
+    
+    def tearDown(self):
+        os.umask(self.umask)
+        self.work_dir.cleanup()
+    
+    def mode(self, path: Path) -> int:
+        return stat.S_IMODE(path.stat().st_mode)
+    
+    def test_write_if_changed_applies_umask(self):
+        output = Path(self.work_dir.name) / 'out' / 'tokens.css'
+        self.assertTrue(write_if_changed(output, [':root {}\n']))
+        self.assertEqual(self.mode(output), 0o640)
+        self.assertEqual(sorted(path.name for path in output.parent.iterdir()), ['tokens.css'])
+    
+    def test_index_applies_umask(self):
+        tokens_file = Path(self.work_dir.name) / 'tokens.json'
+        tokens_file.write_text('{"color": {}}', encoding='utf-8')
+        tokens = LazyTokens(str(tokens_file), index_dir=str(Path(self.work_dir.name) / 'index'))
+        self.assertEqual(list(tokens), ['color'])
+        self.assertEqual(self.mode(tokens.index_path), 0o640)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the color transforms
+The emitters convert colors in one NumPy batch (color_engine) when NumPy is
+installed and one token at a time (color_literals) when it is not; both
+must give the same output for every transform group, on a fixed set of
+colors covering each notation, out-of-range channels and non-colors.
+
+Usage:
+    python -m unittest discover -s tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from platform_emitters import COLOR_FORMATS, TRANSFORM_GROUPS, convert_values  # noqa: E402
+
+COLORS = [
+    '#fff', '#FFF', '#abcd', '#4f46e5', '#4F46E580', '#00000000', ' #123456 ',
+    'transparent', 'Transparent',
+    'rgb(255, 0, 0)', 'rgb(255 0 0)', 'rgba(0, 0, 0, 0.5)', 'rgb(0 0 0 / 25%)',
+    'rgb(50% 25% 100%)', 'rgb(300 0 0)', 'rgb(-20, 128, 256)', 'rgba(0, 0, 0, 1.5)',
+    'RGB(10, 20, 30)', 'rgb(1.5 2.5 3.5)', 'rgba(12, 34, 56, .333)',
+    'hsl(0 100% 50%)', 'hsl(210, 40%, 96%)', 'hsla(120deg 60% 40% / 0.3)', 'hsl(-90 50% 50%)',
+    'oklch(70% 0.1 200)', 'oklch(0.5 0.3 30)', 'oklch(62.8% 0.2577 29.23 / 50%)',
+    'color(display-p3 1 0 0)', 'color(display-p3 50% 50% 50% / 0.8)', 'color(srgb 0.2 0.4 0.6)',
+    'var(--color-brand-600)', '{color.brand.600}', 'red', '#ggg', '#12345', 'rgb(1 2)',
+    'color(1 2 3)', 'calc(1px + 2px)', '', 12, 0.5, None,
+]
+
+
+@unittest.skipIf(convert_values is None, 'NumPy is not installed')
+class ColorPathsTest(unittest.TestCase):
+    
+    def test_scalar_and_batch_agree(self):
+        for group, color_format in COLOR_FORMATS.items():
+            transform = TRANSFORM_GROUPS[group]['color']
+            batch = convert_values(COLORS, color_format)
+            for value, converted in zip(COLORS, batch):
+                with self.subTest(group=group, value=value):
+                    self.assertEqual(transform(value), converted)
+
+
+if __name__ == '__main__':
+    unittest.main()
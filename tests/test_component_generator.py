@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for brand tokens in the generated component CSS
+The var() fallbacks of the CSS come from each brand's tokens, so brands
+with different tokens get different CSS, and a generator without tokens
+keeps the template's defaults.
+
+Usage:
+    python -m unittest discover -s tests
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from component_generator import ComponentGenerator  # noqa: E402
+
+BRANDS = {
+    'acme': {
+        'color': {
+            'primary': {'value': '{color.red.600}', 'type': 'color'},
+            'red': {'600': {'value': '#d92d20', 'type': 'color'}}
+        },
+        'spacing': {'3': {'value': '12px', 'type': 'dimension'}}
+    },
+    'globex': {
+        'color': {'primary': {'value': '#079455', 'type': 'color'}}
+    }
+}
+
+
+class BrandTokensTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.generators = {}
+        for brand, tokens in BRANDS.items():
+            tokens_file = Path(self.work_dir.name) / f"{brand}.json"
+            tokens_file.write_text(json.dumps(tokens), encoding='utf-8')
+            self.generators[brand] = ComponentGenerator(str(tokens_file))
+    
+    def tearDown(self):
+        self.work_dir.cleanup()
+    
+    def test_fallbacks_come_from_each_brand(self):
+        acme = self.generators['acme'].generate_component_css('button')
+        globex = self.generators['globex'].generate_component_css('button')
+        self.assertIn('background: var(--color-primary, #d92d20);', acme)
+        self.assertIn('padding: var(--spacing-3, 12px) var(--spacing-4, 1rem);', acme)
+        self.assertIn('background: var(--color-primary, #079455);', globex)
+        self.assertIn('padding: var(--spacing-3, 0.75rem) var(--spacing-4, 1rem);', globex)
+    
+    def test_defaults_without_tokens(self):
+        css = ComponentGenerator().generate_component_css('button')
+        self.assertIn('background: var(--color-primary, #3B82F6);', css)
+        self.assertIn('color: var(--color-white, #FFFFFF);', css)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for var() cycles in css_expressions
+Every variable on a reference cycle is invalid, so var() uses of it take
+their fallbacks, and the folded values must not depend on which variable
+is evaluated first.
+
+Usage:
+    python -m unittest discover -s tests
+"""
+
+import itertools
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from css_expressions import ExpressionEvaluator  # noqa: E402
+
+# a, b and c form one cycle; d and e only depend on it; f refers to itself
+VARIABLES = {
+    'a': 'var(--b, 1px) var(--c, 1px)',
+    'b': 'var(--a, 2px)',
+    'c': 'var(--b, 3px)',
+    'd': 'var(--c, 4px)',
+    'e': 'calc(var(--d) * 2)',
+    'f': 'var(--f, 5px)',
+}
+
+EXPECTED = {
+    'a': ('1px 1px', None),
+    'b': ('2px', None),
+    'c': ('3px', None),
+    'd': ('4px', '4px'),
+    'e': ('8px', '8px'),
+    'f': ('5px', None),
+}
+
+
+class CycleTest(unittest.TestCase):
+    
+    def test_two_variable_cycle_takes_fallbacks(self):
+        evaluator = ExpressionEvaluator({'a': 'var(--b, 1px)', 'b': 'var(--a, 2px)'})
+        self.assertEqual(evaluator.evaluate('var(--b, 1px)'), '1px')
+        self.assertEqual(evaluator.evaluate('var(--a, 2px)'), '2px')
+    
+    def test_result_does_not_depend_on_evaluation_order(self):
+        for order in itertools.permutations(VARIABLES):
+            evaluator = ExpressionEvaluator(VARIABLES)
+            results = {name: (evaluator.evaluate(VARIABLES[name]), evaluator.lookup(name)) for name in order}
+            self.assertEqual(results, EXPECTED, msg=f"evaluated in order {''.join(order)}")
+    
+    def test_undefined_variable_in_calc_is_kept(self):
+        evaluator = ExpressionEvaluator({})
+        self.assertEqual(evaluator.evaluate('calc(var(--missing) + 1px)'), 'calc(var(--missing) + 1px)')
+
+
+if __name__ == '__main__':
+    unittest.main()
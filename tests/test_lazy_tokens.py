@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached category index of lazy_tokens.py
+By default the index is cached in the build cache location, and a location
+that cannot be written just means the index is not cached.
+
+Usage:
+    python -m unittest discover -s tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from lazy_tokens import DEFAULT_INDEX_DIR, LazyTokens  # noqa: E402
+
+TOKENS = {
+    'color': {'primary': {'value': '#3b82f6', 'type': 'color'}},
+    'spacing': {'4': {'value': '16px', 'type': 'dimension'}}
+}
+
+
+class IndexCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.work_dir.name)
+        Path('tokens.json').write_text(json.dumps(TOKENS), encoding='utf-8')
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.work_dir.cleanup()
+    
+    def test_index_cached_in_build_cache_by_default(self):
+        tokens = LazyTokens('tokens.json')
+        self.assertEqual(tokens['spacing'], TOKENS['spacing'])
+        self.assertEqual(tokens.index_path.parent, Path(DEFAULT_INDEX_DIR))
+        self.assertTrue(tokens.index_path.exists())
+        self.assertEqual(LazyTokens('tokens.json').read_index(), tokens.ranges)
+    
+    def test_unwritable_index_dir_is_not_cached(self):
+        Path('blocked').write_text('', encoding='utf-8')
+        tokens = LazyTokens('tokens.json', index_dir='blocked/index')
+        self.assertEqual(tokens.load(), TOKENS)
+        self.assertFalse(tokens.index_path.exists())
+    
+    def test_no_index_dir(self):
+        tokens = LazyTokens('tokens.json', index_dir=None)
+        self.assertEqual(tokens['color'], TOKENS['color'])
+        self.assertIsNone(tokens.index_path)
+        self.assertFalse(Path(DEFAULT_INDEX_DIR).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
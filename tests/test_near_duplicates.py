@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the near-duplicate color check
+Near pairs chain, so every color of a chain must be pointed at the same
+token, which is never itself flagged; and the grid search must stay exact
+for any radius, however small.
+
+Usage:
+    python -m unittest discover -s tests
+"""
+
+import re
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from token_validator import TokenValidator  # noqa: E402
+
+try:
+    import numpy as np
+    from color_engine import near_pairs
+except ImportError:
+    np = None
+
+# Neighbouring grays are ~0.0067 apart in OKLab, the ends ~0.0135
+CHAIN = {
+    'color': {
+        'gray': {
+            'a': {'value': '#808080', 'type': 'color'},
+            'b': {'value': '#828282', 'type': 'color'},
+            'c': {'value': '#848484', 'type': 'color'}
+        }
+    }
+}
+
+MESSAGE = re.compile(r"Near-duplicate color at '([^']+)'.* of '([^']+)'")
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class NearDuplicateTest(unittest.TestCase):
+    
+    def test_chain_points_at_one_token(self):
+        validator = TokenValidator(options={'delta_e': 0.01})
+        validator.run_checks(CHAIN, ['near-duplicates'])
+        suggestions = dict(MESSAGE.match(message).groups() for message in validator.info)
+        self.assertEqual(suggestions, {'color.gray.b': 'color.gray.a', 'color.gray.c': 'color.gray.a'})
+    
+    def test_tiny_radius_matches_brute_force(self):
+        points = np.random.default_rng(1).random((500, 4))
+        points[7] = points[3] + 1e-13
+        distances = np.linalg.norm(points[:, None] - points[None], axis=2)
+        for radius in (0.05, 1e-9, 1e-15, 1e-300):
+            first, second, _ = near_pairs(points, radius)
+            expected_first, expected_second = np.nonzero(np.triu(distances <= radius, 1))
+            self.assertEqual(first.tolist(), expected_first.tolist(), msg=f"radius {radius}")
+            self.assertEqual(second.tolist(), expected_second.tolist(), msg=f"radius {radius}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Golden-file tests for the platform emitters
+Emits every platform in platform_emitters.PLATFORMS from tokens/ and fails
+on any difference from the files checked in under build/. After an
+intended change to the tokens or the emitters, regenerate build/ with
+platform_emitters.py and commit it with the change.
+
+Usage:
+    python -m unittest discover -s tests
+"""
+
+import difflib
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from platform_emitters import (  # noqa: E402
+    PLATFORMS, check_platform, flatten_tokens, load_dictionary, render_file, transform_tokens
+)
+
+SOURCES = [str(ROOT / 'tokens' / '**' / '*.json')]
+
+# Lines of unified diff shown for a mismatched file
+DIFF_LINES = 40
+
+
+def describe_mismatch(platform, tokens, output_file: Path) -> str:
+    """Return a unified diff between a checked-in output and what would be emitted."""
+    transformed = transform_tokens(tokens, platform['transformGroup'])
+    file_config = next(file_config for file_config in platform['files']
+                       if file_config['destination'] == output_file.name)
+    expected = ''.join(render_file(transformed, file_config)).splitlines(keepends=True)
+    try:
+        actual = output_file.read_text(encoding='utf-8').splitlines(keepends=True)
+    except OSError:
+        return f"{output_file} is missing"
+    diff = list(difflib.unified_diff(actual, expected, str(output_file), 'emitted'))
+    return ''.join(diff[:DIFF_LINES])
+
+
+class GoldenFileTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.tokens = flatten_tokens(load_dictionary(SOURCES))
+    
+    def test_sources_have_tokens(self):
+        self.assertTrue(self.tokens, f"No tokens found in {SOURCES[0]}")
+    
+    def test_every_platform_matches_build(self):
+        for name, platform in PLATFORMS.items():
+            with self.subTest(platform=name):
+                mismatched = check_platform(platform, self.tokens, ROOT)
+                self.assertFalse(mismatched, '\n'.join(
+                    describe_mismatch(platform, self.tokens, path) for path in mismatched
+                ))
+    
+    def test_every_platform_matches_build_without_numpy(self):
+        # Colors then go through the per-token transforms instead of color_engine
+        with mock.patch('platform_emitters.convert_values', None):
+            self.test_every_platform_matches_build()
+
+
+if __name__ == '__main__':
+    unittest.main()
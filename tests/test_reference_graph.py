@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for rebuilding a reference graph
+Calling build() again, after more tokens are recorded, must give the same
+graph as building once from all the tokens.
+
+Usage:
+    python -m unittest discover -s tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from reference_graph import ReferenceGraph  # noqa: E402
+
+TOKENS = {
+    'color': {
+        'blue': {'value': '#3b82f6', 'type': 'color'},
+        'primary': {'value': '{color.accent}', 'type': 'color'},
+        'loop': {'a': {'value': '{color.loop.b}'}, 'b': {'value': '{color.loop.a}'}}
+    }
+}
+
+
+class RebuildTest(unittest.TestCase):
+    
+    def test_build_twice_matches_one_build(self):
+        once = ReferenceGraph(TOKENS)
+        
+        graph = ReferenceGraph(TOKENS)
+        graph.build()
+        self.assertEqual(graph.order, once.order)
+        self.assertEqual(graph.cycles, once.cycles)
+        self.assertEqual(graph.unresolved, once.unresolved)
+        self.assertEqual(graph.resolved, once.resolved)
+    
+    def test_added_token_resolves_after_rebuild(self):
+        graph = ReferenceGraph(TOKENS)
+        self.assertIn('color.primary', graph.unresolved)
+        
+        graph.add(['color', 'accent'], {'value': '{color.blue}', 'type': 'color'})
+        graph.build()
+        self.assertNotIn('color.primary', graph.unresolved)
+        self.assertEqual(graph.resolve('color.primary'), '#3b82f6')
+        self.assertEqual(len(graph.order), len(graph.values))
+        self.assertEqual(len(graph.cycles), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
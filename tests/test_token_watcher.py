@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the watch modes of token_converter.py and token_validator.py
+The file the watcher writes for a CSS source must be byte-identical to the
+one a one-shot token_converter.py run writes for the same source, and the
+checks that compare tokens with each other must report what a one-shot
+validation does.
+
+Usage:
+    python -m unittest discover -s tests
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / '.design-system-expert' / 'scripts'))
+
+from token_converter import TokenConverter  # noqa: E402
+from token_validator import TokenValidator  # noqa: E402
+from token_watcher import TokenWatcher  # noqa: E402
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SOURCE = ROOT / 'token.md'
+COLORS = ROOT / 'tokens' / 'color.json'
+
+
+class WatchOutputTest(unittest.TestCase):
+    
+    def test_watch_output_matches_one_shot_conversion(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            for pretty in (True, False):
+                one_shot = Path(work_dir) / 'one-shot.json'
+                watched = Path(work_dir) / 'watched.json'
+                converter = TokenConverter()
+                converter.save_json(converter.convert(str(SOURCE)), str(one_shot), pretty=pretty)
+                
+                watcher = TokenWatcher([str(SOURCE)], ['values', 'references'], output=str(watched), pretty=pretty)
+                watcher.refresh(watcher.sources)
+                
+                self.assertEqual(watched.read_bytes(), one_shot.read_bytes(), msg=f"pretty={pretty}")
+                self.assertEqual(sorted(path.name for path in Path(work_dir).iterdir()),
+                                 ['one-shot.json', 'watched.json'])
+
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class WatchScopeChecksTest(unittest.TestCase):
+    
+    def test_contrast_and_near_duplicates_match_one_shot_validation(self):
+        checks = ['contrast', 'near-duplicates']
+        options = {'delta_e': 0.02}
+        watcher = TokenWatcher([str(COLORS)], checks, options=options)
+        watcher.refresh(watcher.sources)
+        watched = watcher.results()
+        
+        with open(COLORS, 'r', encoding='utf-8') as f:
+            tokens = json.load(f)
+        one_shot = TokenValidator(options=options)
+        one_shot.run_checks(tokens, checks)
+        
+        self.assertTrue(one_shot.warnings and one_shot.info)
+        self.assertEqual(watched.warnings, one_shot.warnings)
+        self.assertEqual(watched.info, one_shot.info)
+
+
+if __name__ == '__main__':
+    unittest.main()